@@ -99,5 +99,29 @@ def dev(
     )
 
 
+@app.command()
+def reencode(
+    dimensions: Annotated[
+        Optional[int],
+        typer.Option(help="Truncate stored vectors to this many dimensions."),
+    ] = None,
+    quantize: Annotated[
+        bool,
+        typer.Option(help="Rebuild vector indexes with the quantization settings."),
+    ] = False,
+):
+    """Re-encode stored vectors after changing the vector storage settings."""
+    from open_webui.config import RAG_EMBEDDING_DIMENSIONS
+    from open_webui.retrieval.vector.reencode import reencode_vectors
+
+    dimensions = dimensions or RAG_EMBEDDING_DIMENSIONS
+    if dimensions and dimensions != RAG_EMBEDDING_DIMENSIONS:
+        typer.echo(
+            f"Warning: RAG_EMBEDDING_DIMENSIONS is {RAG_EMBEDDING_DIMENSIONS}; "
+            "new embeddings will not match the re-encoded vectors."
+        )
+    reencode_vectors(dimensions=dimensions, quantize=quantize)
+
+
 if __name__ == "__main__":
     app()
@@ -2287,6 +2287,27 @@ Ensure that the tools are effectively utilized to achieve the highest-quality an
 
 VECTOR_DB = os.environ.get("VECTOR_DB", "chroma")
 
+# Shared thread pool used to run blocking vector DB calls off the event loop
+VECTOR_DB_EXECUTOR_MAX_WORKERS = os.environ.get("VECTOR_DB_EXECUTOR_MAX_WORKERS", "16")
+try:
+    VECTOR_DB_EXECUTOR_MAX_WORKERS = max(1, int(VECTOR_DB_EXECUTOR_MAX_WORKERS))
+except Exception:
+    VECTOR_DB_EXECUTOR_MAX_WORKERS = 16
+
+# Write batches sent concurrently by the HTTP vector DBs (Pinecone, S3 Vectors),
+# and how often a throttled or failed batch is retried with backoff
+VECTOR_DB_BATCH_CONCURRENCY = os.environ.get("VECTOR_DB_BATCH_CONCURRENCY", "4")
+try:
+    VECTOR_DB_BATCH_CONCURRENCY = max(1, int(VECTOR_DB_BATCH_CONCURRENCY))
+except Exception:
+    VECTOR_DB_BATCH_CONCURRENCY = 4
+
+VECTOR_DB_BATCH_MAX_RETRIES = os.environ.get("VECTOR_DB_BATCH_MAX_RETRIES", "3")
+try:
+    VECTOR_DB_BATCH_MAX_RETRIES = max(0, int(VECTOR_DB_BATCH_MAX_RETRIES))
+except Exception:
+    VECTOR_DB_BATCH_MAX_RETRIES = 3
+
 # Chroma
 CHROMA_DATA_PATH = f"{DATA_DIR}/vector_db"
 
@@ -2344,6 +2365,19 @@ ENABLE_QDRANT_MULTITENANCY_MODE = (
 )
 QDRANT_COLLECTION_PREFIX = os.environ.get("QDRANT_COLLECTION_PREFIX", "open-webui")
 
+# Quantize vectors in new collections ("scalar" or "binary"); searches rescore
+# the oversampled candidates with the original vectors
+QDRANT_QUANTIZATION = os.environ.get("QDRANT_QUANTIZATION", "").strip().lower()
+if QDRANT_QUANTIZATION not in ("scalar", "binary", ""):
+    QDRANT_QUANTIZATION = ""
+
+try:
+    QDRANT_QUANTIZATION_OVERSAMPLING = float(
+        os.environ.get("QDRANT_QUANTIZATION_OVERSAMPLING", "2.0")
+    )
+except Exception:
+    QDRANT_QUANTIZATION_OVERSAMPLING = 2.0
+
 WEAVIATE_HTTP_HOST = os.environ.get("WEAVIATE_HTTP_HOST", "")
 WEAVIATE_HTTP_PORT = int(os.environ.get("WEAVIATE_HTTP_PORT", "8080"))
 WEAVIATE_GRPC_PORT = int(os.environ.get("WEAVIATE_GRPC_PORT", "50051"))
@@ -2472,6 +2506,56 @@ else:
     except Exception:
         PGVECTOR_IVFFLAT_LISTS = 100
 
+PGVECTOR_INSERT_BATCH_SIZE = os.environ.get("PGVECTOR_INSERT_BATCH_SIZE", 500)
+
+if PGVECTOR_INSERT_BATCH_SIZE == "":
+    PGVECTOR_INSERT_BATCH_SIZE = 500
+else:
+    try:
+        PGVECTOR_INSERT_BATCH_SIZE = int(PGVECTOR_INSERT_BATCH_SIZE)
+    except Exception:
+        PGVECTOR_INSERT_BATCH_SIZE = 500
+
+# Bulk load unencrypted chunks with COPY instead of INSERT statements
+PGVECTOR_USE_COPY = os.getenv("PGVECTOR_USE_COPY", "true").lower() == "true"
+
+# Build the vector index over a compact copy of each vector ("halfvec" or
+# "bit"); searches rescore the oversampled candidates with the full vectors
+PGVECTOR_INDEX_QUANTIZATION = (
+    os.getenv("PGVECTOR_INDEX_QUANTIZATION", "").strip().lower()
+)
+if PGVECTOR_INDEX_QUANTIZATION not in ("halfvec", "bit", ""):
+    PGVECTOR_INDEX_QUANTIZATION = ""
+
+PGVECTOR_QUANTIZATION_OVERSAMPLING = os.environ.get(
+    "PGVECTOR_QUANTIZATION_OVERSAMPLING", 4
+)
+
+if PGVECTOR_QUANTIZATION_OVERSAMPLING == "":
+    PGVECTOR_QUANTIZATION_OVERSAMPLING = 4
+else:
+    try:
+        PGVECTOR_QUANTIZATION_OVERSAMPLING = int(PGVECTOR_QUANTIZATION_OVERSAMPLING)
+    except Exception:
+        PGVECTOR_QUANTIZATION_OVERSAMPLING = 4
+
+# Hash-partition document_chunk by collection_name into this many partitions,
+# each with its own vector index (0 disables partitioning)
+PGVECTOR_PARTITION_COUNT = os.environ.get("PGVECTOR_PARTITION_COUNT", 0)
+
+if PGVECTOR_PARTITION_COUNT == "":
+    PGVECTOR_PARTITION_COUNT = 0
+else:
+    try:
+        PGVECTOR_PARTITION_COUNT = int(PGVECTOR_PARTITION_COUNT)
+    except Exception:
+        PGVECTOR_PARTITION_COUNT = 0
+
+# Move an existing unpartitioned document_chunk table into partitions on startup
+PGVECTOR_PARTITION_MIGRATE = (
+    os.getenv("PGVECTOR_PARTITION_MIGRATE", "false").lower() == "true"
+)
+
 # openGauss
 OPENGAUSS_DB_URL = os.environ.get("OPENGAUSS_DB_URL", DATABASE_URL)
 
@@ -2538,6 +2622,8 @@ ORACLE_VECTOR_LENGTH = os.environ.get("ORACLE_VECTOR_LENGTH", 768)
 ORACLE_DB_POOL_MIN = int(os.environ.get("ORACLE_DB_POOL_MIN", 2))
 ORACLE_DB_POOL_MAX = int(os.environ.get("ORACLE_DB_POOL_MAX", 10))
 ORACLE_DB_POOL_INCREMENT = int(os.environ.get("ORACLE_DB_POOL_INCREMENT", 1))
+# Rows bound per executemany() call for inserts, upserts and deletes by id
+ORACLE_DB_BATCH_SIZE = int(os.environ.get("ORACLE_DB_BATCH_SIZE", 500))
 
 
 if VECTOR_DB == "oracle23ai":
@@ -2621,6 +2707,18 @@ CONTENT_EXTRACTION_ENGINE = PersistentConfig(
     os.environ.get("CONTENT_EXTRACTION_ENGINE", "").lower(),
 )
 
+# Documents extracted from files are kept on disk, keyed by the file's hash and
+# the extraction settings, so reprocessing a file skips extraction. Least
+# recently used entries are evicted beyond this size (0 disables the cache)
+DOCUMENT_EXTRACTION_CACHE_MAX_SIZE_MB = os.getenv(
+    "DOCUMENT_EXTRACTION_CACHE_MAX_SIZE_MB", "1024"
+)
+
+try:
+    DOCUMENT_EXTRACTION_CACHE_MAX_SIZE_MB = int(DOCUMENT_EXTRACTION_CACHE_MAX_SIZE_MB)
+except Exception:
+    DOCUMENT_EXTRACTION_CACHE_MAX_SIZE_MB = 1024
+
 DATALAB_MARKER_API_KEY = PersistentConfig(
     "DATALAB_MARKER_API_KEY",
     "rag.datalab_marker_api_key",
@@ -2913,6 +3011,25 @@ ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS = PersistentConfig(
     == "true",
 )
 
+# Route queries to the knowledge bases whose name/description embedding scores
+# highest against the query, when more than this many are attached (0 disables).
+# Knowledge bases scoring below the threshold are skipped.
+RAG_KNOWLEDGE_ROUTING_TOP_N = os.environ.get("RAG_KNOWLEDGE_ROUTING_TOP_N", "0")
+
+try:
+    RAG_KNOWLEDGE_ROUTING_TOP_N = int(RAG_KNOWLEDGE_ROUTING_TOP_N)
+except Exception:
+    RAG_KNOWLEDGE_ROUTING_TOP_N = 0
+
+RAG_KNOWLEDGE_ROUTING_THRESHOLD = os.environ.get(
+    "RAG_KNOWLEDGE_ROUTING_THRESHOLD", "0.0"
+)
+
+try:
+    RAG_KNOWLEDGE_ROUTING_THRESHOLD = float(RAG_KNOWLEDGE_ROUTING_THRESHOLD)
+except Exception:
+    RAG_KNOWLEDGE_ROUTING_THRESHOLD = 0.0
+
 RAG_FULL_CONTEXT = PersistentConfig(
     "RAG_FULL_CONTEXT",
     "rag.full_context",
@@ -3024,6 +3141,15 @@ RAG_EMBEDDING_PREFIX_FIELD_NAME = os.environ.get(
     "RAG_EMBEDDING_PREFIX_FIELD_NAME", None
 )
 
+# Truncate embeddings to this many dimensions (Matryoshka models only, 0 keeps
+# the full embedding). Existing vectors must be re-encoded after changing it.
+RAG_EMBEDDING_DIMENSIONS = os.environ.get("RAG_EMBEDDING_DIMENSIONS", "0")
+
+try:
+    RAG_EMBEDDING_DIMENSIONS = int(RAG_EMBEDDING_DIMENSIONS)
+except Exception:
+    RAG_EMBEDDING_DIMENSIONS = 0
+
 RAG_RERANKING_ENGINE = PersistentConfig(
     "RAG_RERANKING_ENGINE",
     "rag.reranking_engine",
@@ -3066,6 +3192,16 @@ RAG_EXTERNAL_RERANKER_TIMEOUT = PersistentConfig(
     os.environ.get("RAG_EXTERNAL_RERANKER_TIMEOUT", ""),
 )
 
+# Max number of (reranker, query, chunk) scores kept in memory; 0 disables the cache
+RAG_RERANKING_SCORE_CACHE_SIZE = os.environ.get(
+    "RAG_RERANKING_SCORE_CACHE_SIZE", "10000"
+)
+
+try:
+    RAG_RERANKING_SCORE_CACHE_SIZE = int(RAG_RERANKING_SCORE_CACHE_SIZE)
+except Exception:
+    RAG_RERANKING_SCORE_CACHE_SIZE = 10000
+
 
 RAG_TEXT_SPLITTER = PersistentConfig(
     "RAG_TEXT_SPLITTER",
@@ -3104,6 +3240,41 @@ CHUNK_OVERLAP = PersistentConfig(
     int(os.environ.get("CHUNK_OVERLAP", "100")),
 )
 
+# Stream split -> embed -> insert through bounded queues instead of
+# materializing every chunk and embedding of a document at once
+ENABLE_RAG_PIPELINED_INGESTION = (
+    os.environ.get("ENABLE_RAG_PIPELINED_INGESTION", "False").lower() == "true"
+)
+
+RAG_PIPELINED_INGESTION_BATCH_SIZE = os.environ.get(
+    "RAG_PIPELINED_INGESTION_BATCH_SIZE", "256"
+)
+try:
+    RAG_PIPELINED_INGESTION_BATCH_SIZE = max(1, int(RAG_PIPELINED_INGESTION_BATCH_SIZE))
+except Exception:
+    RAG_PIPELINED_INGESTION_BATCH_SIZE = 256
+
+RAG_PIPELINED_INGESTION_QUEUE_SIZE = os.environ.get(
+    "RAG_PIPELINED_INGESTION_QUEUE_SIZE", "2"
+)
+try:
+    RAG_PIPELINED_INGESTION_QUEUE_SIZE = max(1, int(RAG_PIPELINED_INGESTION_QUEUE_SIZE))
+except Exception:
+    RAG_PIPELINED_INGESTION_QUEUE_SIZE = 2
+
+# Background knowledge reindex: parallel files and pause between files per worker
+KNOWLEDGE_REINDEX_WORKERS = os.environ.get("KNOWLEDGE_REINDEX_WORKERS", "2")
+try:
+    KNOWLEDGE_REINDEX_WORKERS = max(1, int(KNOWLEDGE_REINDEX_WORKERS))
+except Exception:
+    KNOWLEDGE_REINDEX_WORKERS = 2
+
+KNOWLEDGE_REINDEX_THROTTLE_MS = os.environ.get("KNOWLEDGE_REINDEX_THROTTLE_MS", "250")
+try:
+    KNOWLEDGE_REINDEX_THROTTLE_MS = max(0, int(KNOWLEDGE_REINDEX_THROTTLE_MS))
+except Exception:
+    KNOWLEDGE_REINDEX_THROTTLE_MS = 250
+
 DEFAULT_RAG_TEMPLATE = """### Task:
 Respond to the user query using the provided context, incorporating inline citations in the format [id] **only when the <source> tag includes an explicit id attribute** (e.g., <source id="1">).
 
@@ -3248,6 +3419,85 @@ WEB_SEARCH_RESULT_COUNT = PersistentConfig(
     int(os.getenv("WEB_SEARCH_RESULT_COUNT", "3")),
 )
 
+# Drop web search pages whose estimated shingle (Jaccard) similarity to an
+# earlier result is at least this value, before they are embedded (0 disables)
+WEB_SEARCH_NEAR_DUPLICATE_THRESHOLD = os.getenv(
+    "WEB_SEARCH_NEAR_DUPLICATE_THRESHOLD", "0.85"
+)
+
+try:
+    WEB_SEARCH_NEAR_DUPLICATE_THRESHOLD = float(WEB_SEARCH_NEAR_DUPLICATE_THRESHOLD)
+except Exception:
+    WEB_SEARCH_NEAR_DUPLICATE_THRESHOLD = 0.85
+
+# Search engine results are shared across users for this many seconds (0
+# disables), in Redis when REDIS_URL is set and in memory otherwise
+WEB_SEARCH_CACHE_TTL = os.getenv("WEB_SEARCH_CACHE_TTL", "600")
+
+try:
+    WEB_SEARCH_CACHE_TTL = int(WEB_SEARCH_CACHE_TTL)
+except Exception:
+    WEB_SEARCH_CACHE_TTL = 600
+
+# Per-engine TTLs overriding WEB_SEARCH_CACHE_TTL, e.g. {"searxng": 3600, "tavily": 0}
+try:
+    WEB_SEARCH_CACHE_ENGINE_TTLS = {
+        engine: int(ttl)
+        for engine, ttl in json.loads(
+            os.getenv("WEB_SEARCH_CACHE_ENGINE_TTLS", "{}")
+        ).items()
+    }
+except Exception as e:
+    log.exception(f"Error loading WEB_SEARCH_CACHE_ENGINE_TTLS: {e}")
+    WEB_SEARCH_CACHE_ENGINE_TTLS = {}
+
+WEB_SEARCH_CACHE_MAX_SIZE = os.getenv("WEB_SEARCH_CACHE_MAX_SIZE", "1000")
+
+try:
+    WEB_SEARCH_CACHE_MAX_SIZE = int(WEB_SEARCH_CACHE_MAX_SIZE)
+except Exception:
+    WEB_SEARCH_CACHE_MAX_SIZE = 1000
+
+# Connections kept by the HTTP client shared by the search engine adapters
+WEB_SEARCH_CLIENT_POOL_SIZE = os.getenv("WEB_SEARCH_CLIENT_POOL_SIZE", "100")
+
+try:
+    WEB_SEARCH_CLIENT_POOL_SIZE = int(WEB_SEARCH_CLIENT_POOL_SIZE)
+except Exception:
+    WEB_SEARCH_CLIENT_POOL_SIZE = 100
+
+# Seconds a search engine request may take, unless the engine sets its own
+WEB_SEARCH_CLIENT_TIMEOUT = os.getenv("WEB_SEARCH_CLIENT_TIMEOUT", "60")
+
+try:
+    WEB_SEARCH_CLIENT_TIMEOUT = float(WEB_SEARCH_CLIENT_TIMEOUT)
+except Exception:
+    WEB_SEARCH_CLIENT_TIMEOUT = 60.0
+
+# Engines the "federated" web search engine queries concurrently, e.g.
+# "searxng,brave,tavily"
+WEB_SEARCH_FEDERATED_ENGINES = [
+    engine.strip()
+    for engine in os.environ.get("WEB_SEARCH_FEDERATED_ENGINES", "").split(",")
+    if engine.strip()
+]
+
+# Seconds a federated search waits for the engines before using what answered
+WEB_SEARCH_FEDERATED_DEADLINE = os.getenv("WEB_SEARCH_FEDERATED_DEADLINE", "10")
+
+try:
+    WEB_SEARCH_FEDERATED_DEADLINE = float(WEB_SEARCH_FEDERATED_DEADLINE)
+except Exception:
+    WEB_SEARCH_FEDERATED_DEADLINE = 10.0
+
+# Engines that must answer before a federated search returns without the rest
+WEB_SEARCH_FEDERATED_QUORUM = os.getenv("WEB_SEARCH_FEDERATED_QUORUM", "2")
+
+try:
+    WEB_SEARCH_FEDERATED_QUORUM = int(WEB_SEARCH_FEDERATED_QUORUM)
+except Exception:
+    WEB_SEARCH_FEDERATED_QUORUM = 2
+
 
 # You can provide a list of your own websites to filter after performing a web search.
 # This ensures the highest level of safety and reliability of the information sources.
@@ -3288,6 +3538,53 @@ WEB_LOADER_TIMEOUT = PersistentConfig(
     os.getenv("WEB_LOADER_TIMEOUT", ""),
 )
 
+# Text extracted from fetched pages is kept on disk and served for this many
+# seconds, then revalidated with a conditional GET (0 disables the cache)
+WEB_LOADER_CACHE_TTL = os.getenv("WEB_LOADER_CACHE_TTL", "3600")
+
+try:
+    WEB_LOADER_CACHE_TTL = int(WEB_LOADER_CACHE_TTL)
+except Exception:
+    WEB_LOADER_CACHE_TTL = 3600
+
+# Least recently used pages are evicted beyond this size
+WEB_LOADER_CACHE_MAX_SIZE_MB = os.getenv("WEB_LOADER_CACHE_MAX_SIZE_MB", "256")
+
+try:
+    WEB_LOADER_CACHE_MAX_SIZE_MB = int(WEB_LOADER_CACHE_MAX_SIZE_MB)
+except Exception:
+    WEB_LOADER_CACHE_MAX_SIZE_MB = 256
+
+# Pages fetched at once from a single host, on top of the overall limit of
+# WEB_LOADER_CONCURRENT_REQUESTS
+WEB_LOADER_CONCURRENT_REQUESTS_PER_HOST = os.getenv(
+    "WEB_LOADER_CONCURRENT_REQUESTS_PER_HOST", "2"
+)
+
+try:
+    WEB_LOADER_CONCURRENT_REQUESTS_PER_HOST = int(
+        WEB_LOADER_CONCURRENT_REQUESTS_PER_HOST
+    )
+except Exception:
+    WEB_LOADER_CONCURRENT_REQUESTS_PER_HOST = 2
+
+# Only the first this many bytes of a page are read (0 for no limit)
+WEB_LOADER_MAX_PAGE_SIZE_MB = os.getenv("WEB_LOADER_MAX_PAGE_SIZE_MB", "5")
+
+try:
+    WEB_LOADER_MAX_PAGE_SIZE_MB = float(WEB_LOADER_MAX_PAGE_SIZE_MB)
+except Exception:
+    WEB_LOADER_MAX_PAGE_SIZE_MB = 5.0
+
+# Seconds a page may take, including the wait for a free connection, before
+# it is left out of the results (0 for no deadline)
+WEB_LOADER_URL_DEADLINE = os.getenv("WEB_LOADER_URL_DEADLINE", "30")
+
+try:
+    WEB_LOADER_URL_DEADLINE = float(WEB_LOADER_URL_DEADLINE)
+except Exception:
+    WEB_LOADER_URL_DEADLINE = 30.0
+
 
 ENABLE_WEB_LOADER_SSL_VERIFICATION = PersistentConfig(
     "ENABLE_WEB_LOADER_SSL_VERIFICATION",
@@ -3452,6 +3749,19 @@ JINA_OUTPUT_MODE = PersistentConfig(
     os.getenv("JINA_OUTPUT_MODE", "legacy"),
 )
 
+# Enhanced search issues its query variants one at a time, and stops once
+# enough results score at least the threshold
+JINA_ADAPTIVE_SEARCH_ENABLED = (
+    os.getenv("JINA_ADAPTIVE_SEARCH_ENABLED", "False").lower() == "true"
+)
+
+JINA_ADAPTIVE_SEARCH_THRESHOLD = os.getenv("JINA_ADAPTIVE_SEARCH_THRESHOLD", "0.7")
+
+try:
+    JINA_ADAPTIVE_SEARCH_THRESHOLD = float(JINA_ADAPTIVE_SEARCH_THRESHOLD)
+except Exception:
+    JINA_ADAPTIVE_SEARCH_THRESHOLD = 0.7
+
 SEARCHAPI_API_KEY = PersistentConfig(
     "SEARCHAPI_API_KEY",
     "rag.web.search.searchapi_api_key",
@@ -3574,6 +3884,32 @@ PLAYWRIGHT_TIMEOUT = PersistentConfig(
     int(os.environ.get("PLAYWRIGHT_TIMEOUT", "10000")),
 )
 
+# Browser contexts kept open for Playwright page loads, which also bounds
+# the pages loaded in parallel
+PLAYWRIGHT_CONTEXT_POOL_SIZE = os.environ.get("PLAYWRIGHT_CONTEXT_POOL_SIZE", "4")
+
+try:
+    PLAYWRIGHT_CONTEXT_POOL_SIZE = max(int(PLAYWRIGHT_CONTEXT_POOL_SIZE), 1)
+except Exception:
+    PLAYWRIGHT_CONTEXT_POOL_SIZE = 4
+
+# A context is closed and replaced after loading this many pages
+PLAYWRIGHT_CONTEXT_MAX_USES = os.environ.get("PLAYWRIGHT_CONTEXT_MAX_USES", "50")
+
+try:
+    PLAYWRIGHT_CONTEXT_MAX_USES = int(PLAYWRIGHT_CONTEXT_MAX_USES)
+except Exception:
+    PLAYWRIGHT_CONTEXT_MAX_USES = 50
+
+# Resource types not downloaded when loading pages, as Playwright names them
+PLAYWRIGHT_BLOCKED_RESOURCE_TYPES = [
+    resource_type.strip()
+    for resource_type in os.environ.get(
+        "PLAYWRIGHT_BLOCKED_RESOURCE_TYPES", "image,font,media"
+    ).split(",")
+    if resource_type.strip()
+]
+
 FIRECRAWL_API_KEY = PersistentConfig(
     "FIRECRAWL_API_KEY",
     "rag.web.loader.firecrawl_api_key",
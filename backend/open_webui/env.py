@@ -813,6 +813,33 @@ SENTENCE_TRANSFORMERS_CROSS_ENCODER_SIGMOID_ACTIVATION_FUNCTION = (
     == "true"
 )
 
+# Cross-request micro-batching for local (sentence-transformers) embedding and
+# reranking models. Requests from concurrent coroutines are queued and grouped
+# into batches bounded by a max size (in items) and a max wait time.
+ENABLE_RAG_LOCAL_MODEL_BATCHING = (
+    os.environ.get("ENABLE_RAG_LOCAL_MODEL_BATCHING", "True").lower() == "true"
+)
+
+RAG_LOCAL_MODEL_BATCH_MAX_SIZE = os.environ.get("RAG_LOCAL_MODEL_BATCH_MAX_SIZE", "64")
+try:
+    RAG_LOCAL_MODEL_BATCH_MAX_SIZE = max(1, int(RAG_LOCAL_MODEL_BATCH_MAX_SIZE))
+except Exception:
+    RAG_LOCAL_MODEL_BATCH_MAX_SIZE = 64
+
+RAG_LOCAL_MODEL_BATCH_MAX_WAIT_MS = os.environ.get(
+    "RAG_LOCAL_MODEL_BATCH_MAX_WAIT_MS", "10"
+)
+try:
+    RAG_LOCAL_MODEL_BATCH_MAX_WAIT_MS = max(0, int(RAG_LOCAL_MODEL_BATCH_MAX_WAIT_MS))
+except Exception:
+    RAG_LOCAL_MODEL_BATCH_MAX_WAIT_MS = 10
+
+RAG_LOCAL_MODEL_BATCH_WORKERS = os.environ.get("RAG_LOCAL_MODEL_BATCH_WORKERS", "1")
+try:
+    RAG_LOCAL_MODEL_BATCH_WORKERS = max(1, int(RAG_LOCAL_MODEL_BATCH_WORKERS))
+except Exception:
+    RAG_LOCAL_MODEL_BATCH_WORKERS = 1
+
 ####################################
 # OFFLINE_MODE
 ####################################
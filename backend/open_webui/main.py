@@ -103,6 +103,8 @@ from open_webui.routers.retrieval import (
     get_ef,
     get_rf,
 )
+from open_webui.retrieval.web.browser_pool import close_browser_context_pools
+from open_webui.retrieval.web.client import SEARCH_CLIENT
 
 
 from sqlalchemy.orm import Session
@@ -671,6 +673,9 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, "redis_task_command_listener"):
         app.state.redis_task_command_listener.cancel()
 
+    await close_browser_context_pools()
+    await SEARCH_CLIENT.close()
+
 
 app = FastAPI(
     title="Open WebUI",
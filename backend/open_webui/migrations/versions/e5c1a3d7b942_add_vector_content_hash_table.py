@@ -0,0 +1,107 @@
+"""Add vector_content_hash table
+
+Revision ID: e5c1a3d7b942
+Revises: 8257b99d21e3
+Create Date: 2026-10-18 22:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import json
+import time
+
+# revision identifiers, used by Alembic.
+revision: str = "e5c1a3d7b942"
+down_revision: Union[str, None] = "8257b99d21e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "vector_content_hash",
+        sa.Column("collection_name", sa.Text(), primary_key=True),
+        sa.Column("file_id", sa.Text(), primary_key=True),
+        sa.Column("hash", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.BigInteger(), nullable=True),
+        # indexes
+        sa.Index("ix_vector_content_hash_collection_hash", "collection_name", "hash"),
+        sa.Index("ix_vector_content_hash_file_id", "file_id"),
+    )
+
+    connection = op.get_bind()
+
+    file_table = sa.Table(
+        "file",
+        sa.MetaData(),
+        sa.Column("id", sa.Text()),
+        sa.Column("hash", sa.Text()),
+        sa.Column("meta", sa.JSON()),
+    )
+    kf_table = sa.Table(
+        "knowledge_file",
+        sa.MetaData(),
+        sa.Column("knowledge_id", sa.Text()),
+        sa.Column("file_id", sa.Text()),
+    )
+    hash_table = sa.Table(
+        "vector_content_hash",
+        sa.MetaData(),
+        sa.Column("collection_name", sa.Text()),
+        sa.Column("file_id", sa.Text()),
+        sa.Column("hash", sa.Text()),
+        sa.Column("created_at", sa.BigInteger()),
+    )
+
+    now = int(time.time())
+    rows = []
+
+    # Files that were embedded into their own collection
+    results = connection.execute(
+        sa.select(file_table.c.id, file_table.c.hash, file_table.c.meta).where(
+            file_table.c.hash.isnot(None)
+        )
+    ).fetchall()
+    for file_id, hash, meta in results:
+        if isinstance(meta, str):
+            try:
+                meta = json.loads(meta)
+            except Exception:
+                continue  # skip invalid JSON
+
+        if isinstance(meta, dict) and meta.get("collection_name"):
+            rows.append(
+                {
+                    "collection_name": f"file-{file_id}",
+                    "file_id": file_id,
+                    "hash": hash,
+                    "created_at": now,
+                }
+            )
+
+    # Files added to knowledge bases
+    results = connection.execute(
+        sa.select(kf_table.c.knowledge_id, file_table.c.id, file_table.c.hash)
+        .select_from(kf_table.join(file_table, kf_table.c.file_id == file_table.c.id))
+        .where(file_table.c.hash.isnot(None))
+    ).fetchall()
+    for knowledge_id, file_id, hash in results:
+        rows.append(
+            {
+                "collection_name": knowledge_id,
+                "file_id": file_id,
+                "hash": hash,
+                "created_at": now,
+            }
+        )
+
+    if rows:
+        op.bulk_insert(hash_table, rows)
+
+
+def downgrade() -> None:
+    op.drop_table("vector_content_hash")
@@ -0,0 +1,139 @@
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy.orm import Session
+from open_webui.internal.db import Base, get_db_context
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import BigInteger, Column, Index, Text
+
+log = logging.getLogger(__name__)
+
+####################
+# VectorContentHash DB Schema
+####################
+
+
+class VectorContentHash(Base):
+    """
+    Content hash of each file stored in a vector DB collection.
+
+    Mirrors the ``hash`` chunk metadata so that duplicate content checks are a
+    single indexed lookup instead of a metadata scan in the vector DB.
+    """
+
+    __tablename__ = "vector_content_hash"
+
+    collection_name = Column(Text, primary_key=True)
+    file_id = Column(Text, primary_key=True)
+    hash = Column(Text, nullable=False)
+    created_at = Column(BigInteger)
+
+    __table_args__ = (
+        Index("ix_vector_content_hash_collection_hash", "collection_name", "hash"),
+        Index("ix_vector_content_hash_file_id", "file_id"),
+    )
+
+
+class VectorContentHashModel(BaseModel):
+    collection_name: str
+    file_id: str
+    hash: str
+    created_at: int  # timestamp in epoch
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class VectorContentHashesTable:
+    def has_hash(
+        self,
+        collection_name: str,
+        hash: str,
+        exclude_file_id: Optional[str] = None,
+        db: Optional[Session] = None,
+    ) -> bool:
+        with get_db_context(db) as db:
+            query = db.query(VectorContentHash.file_id).filter_by(
+                collection_name=collection_name, hash=hash
+            )
+            if exclude_file_id is not None:
+                query = query.filter(VectorContentHash.file_id != exclude_file_id)
+            return query.first() is not None
+
+    def upsert_hash(
+        self,
+        collection_name: str,
+        file_id: str,
+        hash: str,
+        db: Optional[Session] = None,
+    ) -> Optional[VectorContentHashModel]:
+        with get_db_context(db) as db:
+            try:
+                entry = db.get(VectorContentHash, (collection_name, file_id))
+                if entry:
+                    entry.hash = hash
+                else:
+                    entry = VectorContentHash(
+                        collection_name=collection_name,
+                        file_id=file_id,
+                        hash=hash,
+                        created_at=int(time.time()),
+                    )
+                    db.add(entry)
+                db.commit()
+                return VectorContentHashModel.model_validate(entry)
+            except Exception as e:
+                log.exception(f"Error recording content hash: {e}")
+                db.rollback()
+                return None
+
+    def delete_by_file_id(
+        self, collection_name: str, file_id: str, db: Optional[Session] = None
+    ) -> bool:
+        with get_db_context(db) as db:
+            try:
+                db.query(VectorContentHash).filter_by(
+                    collection_name=collection_name, file_id=file_id
+                ).delete()
+                db.commit()
+                return True
+            except Exception:
+                return False
+
+    def delete_by_hash(
+        self, collection_name: str, hash: str, db: Optional[Session] = None
+    ) -> bool:
+        with get_db_context(db) as db:
+            try:
+                db.query(VectorContentHash).filter_by(
+                    collection_name=collection_name, hash=hash
+                ).delete()
+                db.commit()
+                return True
+            except Exception:
+                return False
+
+    def delete_by_collection_name(
+        self, collection_name: str, db: Optional[Session] = None
+    ) -> bool:
+        with get_db_context(db) as db:
+            try:
+                db.query(VectorContentHash).filter_by(
+                    collection_name=collection_name
+                ).delete()
+                db.commit()
+                return True
+            except Exception:
+                return False
+
+    def delete_all(self, db: Optional[Session] = None) -> bool:
+        with get_db_context(db) as db:
+            try:
+                db.query(VectorContentHash).delete()
+                db.commit()
+                return True
+            except Exception:
+                return False
+
+
+VectorContentHashes = VectorContentHashesTable()
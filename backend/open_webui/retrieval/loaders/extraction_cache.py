@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.documents import Document
+
+from open_webui.config import CACHE_DIR, DOCUMENT_EXTRACTION_CACHE_MAX_SIZE_MB
+
+log = logging.getLogger(__name__)
+
+####################################
+#
+# On-disk cache of documents extracted from files
+#
+####################################
+
+
+class ExtractionCache:
+    """
+    Documents extracted from a file, keyed by the file's SHA-256, the
+    extraction engine and the engine settings that affect the result. A file's
+    content never changes under its hash, so entries do not expire; the least
+    recently used entries are evicted once the cache grows beyond ``max_size``
+    bytes.
+    """
+
+    def __init__(self, path: Path, max_size: int):
+        self.path = Path(path)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            with self._lock, connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS extraction (
+                        key TEXT PRIMARY KEY,
+                        documents TEXT NOT NULL,
+                        image_refs TEXT,
+                        accessed_at REAL NOT NULL,
+                        size INTEGER NOT NULL
+                    )
+                    """
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS extraction_accessed_at "
+                    "ON extraction (accessed_at)"
+                )
+                self._initialized = True
+        return connection
+
+    def get_key(self, file_hash: str, engine: str, params: dict) -> str:
+        key = json.dumps([file_hash, engine, params], sort_keys=True, default=str)
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[list[Document], Optional[list[str]]]]:
+        """The cached documents and image refs (None if the loader had none)."""
+        if not self.enabled:
+            return None
+
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT documents, image_refs FROM extraction WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE extraction SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+        documents, image_refs = row
+        return (
+            [Document(**document) for document in json.loads(documents)],
+            json.loads(image_refs) if image_refs is not None else None,
+        )
+
+    def set(
+        self,
+        key: str,
+        documents: list[Document],
+        image_refs: Optional[list[str]] = None,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        documents = json.dumps(
+            [
+                {"page_content": document.page_content, "metadata": document.metadata}
+                for document in documents
+            ],
+            default=str,
+        )
+        image_refs = json.dumps(image_refs) if image_refs is not None else None
+        size = len(documents.encode("utf-8")) + len(image_refs or "")
+        if size > self.max_size:
+            return
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO extraction "
+                "(key, documents, image_refs, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, documents, image_refs, time.time(), size),
+            )
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM extraction"
+        ).fetchone()
+        if total <= self.max_size:
+            return
+
+        evicted = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM extraction ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM extraction WHERE key = ?", evicted)
+        log.debug(f"Evicted {len(evicted)} entries from the extraction cache")
+
+
+EXTRACTION_CACHE_DIR = CACHE_DIR / "extraction"
+EXTRACTION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+EXTRACTION_CACHE = ExtractionCache(
+    EXTRACTION_CACHE_DIR / "documents.db",
+    max_size=DOCUMENT_EXTRACTION_CACHE_MAX_SIZE_MB * 1024 * 1024,
+)
@@ -1,5 +1,6 @@
 import requests
 import logging
+import os
 import ftfy
 import sys
 import json
@@ -28,8 +29,11 @@ from open_webui.retrieval.loaders.external_document import ExternalDocumentLoade
 from open_webui.retrieval.loaders.mistral import MistralLoader
 from open_webui.retrieval.loaders.datalab_marker import DatalabMarkerLoader
 from open_webui.retrieval.loaders.mineru import MinerULoader
+from open_webui.retrieval.loaders.extraction_cache import EXTRACTION_CACHE
 
+from open_webui.config import PDF_EXTRACT_IMAGES_DIR
 from open_webui.env import GLOBAL_LOG_LEVEL, REQUESTS_VERIFY
+from open_webui.utils.misc import calculate_sha256
 
 logging.basicConfig(stream=sys.stdout, level=GLOBAL_LOG_LEVEL)
 log = logging.getLogger(__name__)
@@ -105,6 +109,24 @@ known_source_ext = {
     "yml",
 }
 
+# Loader settings that affect what each engine extracts, by name prefix. API
+# keys are left out, so rotating a key keeps the cached extractions.
+EXTRACTION_SETTING_PREFIXES = {
+    "web": ("EXTERNAL_DOCUMENT_LOADER_",),
+    "external": ("EXTERNAL_DOCUMENT_LOADER_",),
+    "azure_document_intelligence": (
+        "AZURE_DOCUMENT_INTELLIGENCE_",
+        "DOCUMENT_INTELLIGENCE_",
+    ),
+    "document_intelligence": ("AZURE_DOCUMENT_INTELLIGENCE_", "DOCUMENT_INTELLIGENCE_"),
+    "tika": ("TIKA_",),
+    "docling": ("DOCLING_",),
+    "mistral": ("MISTRAL_",),
+    "mistral_ocr": ("MISTRAL_",),
+    "datalab_marker": ("DATALAB_MARKER_",),
+    "mineru": ("MINERU_",),
+}
+
 
 class TikaLoader:
     def __init__(self, url, file_path, mime_type=None, extract_images=None):
@@ -281,15 +303,99 @@ class Loader:
         self.kwargs = kwargs
 
     def load(
-        self, filename: str, file_content_type: str, file_path: str
+        self,
+        filename: str,
+        file_content_type: str,
+        file_path: str,
+        force_refresh: bool = False,
     ) -> list[Document] | tuple[list[Document], list[str]]:
         """
         Load a document and optionally extract images.
-        
+
+        Extractions are cached by the file's hash, the engine and its settings,
+        so reprocessing an unchanged file skips the engine. force_refresh
+        extracts the file again, replacing the cached extraction.
+
         Returns:
             Either a list of Documents, or a tuple of (documents, image_refs)
             if the loader supports image extraction.
         """
+        cache_key = self._get_cache_key(filename, file_content_type, file_path)
+        if cache_key is not None and not force_refresh:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+
+        result = self._load(filename, file_content_type, file_path)
+
+        if cache_key is not None:
+            docs, image_refs = result if isinstance(result, tuple) else (result, None)
+            # Empty extractions are more likely a transient failure than a result
+            if docs:
+                try:
+                    EXTRACTION_CACHE.set(cache_key, docs, image_refs)
+                except Exception as e:
+                    log.warning(f"Error writing the extraction cache: {e}")
+        return result
+
+    def _get_cache_key(
+        self, filename: str, file_content_type: str, file_path: str
+    ) -> str | None:
+        engine = (self.engine or "").strip().lower()
+        if (
+            not EXTRACTION_CACHE.enabled
+            or engine == "youtube"
+            or not os.path.isfile(file_path)
+        ):
+            return None
+
+        prefixes = EXTRACTION_SETTING_PREFIXES.get(engine, ())
+        settings = {
+            name: value
+            for name, value in self.kwargs.items()
+            if (name.startswith(prefixes) and not name.endswith("KEY"))
+            or name == "PDF_EXTRACT_IMAGES"
+        }
+        # Without an engine the loader is picked by file type
+        settings["file_ext"] = filename.split(".")[-1].lower()
+        settings["content_type"] = file_content_type
+        try:
+            file_hash = calculate_sha256(file_path, 1024 * 1024)
+        except OSError as e:
+            log.warning(f"Error hashing {file_path} for the extraction cache: {e}")
+            return None
+        return EXTRACTION_CACHE.get_key(file_hash, engine, settings)
+
+    def _get_cached(
+        self, cache_key: str
+    ) -> list[Document] | tuple[list[Document], list[str]] | None:
+        try:
+            cached = EXTRACTION_CACHE.get(cache_key)
+        except Exception as e:
+            log.warning(f"Error reading the extraction cache: {e}")
+            return None
+        if cached is None:
+            return None
+
+        docs, image_refs = cached
+        if image_refs is None:
+            log.info(f"Loader.load: Returning {len(docs)} cached docs")
+            return docs
+        # The images are shared with the file first extracted, and must still exist
+        if not all(
+            (PDF_EXTRACT_IMAGES_DIR / os.path.basename(ref)).is_file()
+            for ref in image_refs
+        ):
+            return None
+        log.info(
+            f"Loader.load: Returning {len(docs)} cached docs and "
+            f"{len(image_refs)} image_refs"
+        )
+        return docs, image_refs
+
+    def _load(
+        self, filename: str, file_content_type: str, file_path: str
+    ) -> list[Document] | tuple[list[Document], list[str]]:
         loader = self._get_loader(filename, file_content_type, file_path)
         log.info(
             f"Loader.load: engine='{self.engine}', loader_type={type(loader).__name__}"
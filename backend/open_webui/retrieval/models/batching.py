@@ -0,0 +1,360 @@
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Optional
+
+from opentelemetry import metrics
+
+from open_webui.env import (
+    RAG_LOCAL_MODEL_BATCH_MAX_SIZE,
+    RAG_LOCAL_MODEL_BATCH_MAX_WAIT_MS,
+    RAG_LOCAL_MODEL_BATCH_WORKERS,
+)
+
+log = logging.getLogger(__name__)
+
+####################################
+#
+# Cross-request micro-batching for local models
+#
+####################################
+
+# Model objects are only referenced weakly so that unloading a model
+# (e.g. when the embedding model is changed from the admin panel) also
+# retires its batcher and worker threads.
+_BATCHERS: "weakref.WeakKeyDictionary[Any, MicroBatcher]" = weakref.WeakKeyDictionary()
+_BATCHERS_LOCK = threading.Lock()
+
+# Idle workers re-check whether their model is still alive at this interval.
+_IDLE_POLL_SECONDS = 1.0
+
+meter = metrics.get_meter(__name__)
+
+batch_size_histogram = meter.create_histogram(
+    name="webui.rag.local_model.batch.size",
+    description="Number of items per local model batch",
+    unit="1",
+)
+batch_requests_histogram = meter.create_histogram(
+    name="webui.rag.local_model.batch.requests",
+    description="Number of coalesced requests per local model batch",
+    unit="1",
+)
+queue_wait_histogram = meter.create_histogram(
+    name="webui.rag.local_model.queue.wait",
+    description="Time a request waited in the local model queue",
+    unit="ms",
+)
+
+
+def _observe_queue_depth(
+    options: metrics.CallbackOptions,
+) -> list[metrics.Observation]:
+    with _BATCHERS_LOCK:
+        batchers = list(_BATCHERS.values())
+    return [
+        metrics.Observation(
+            value=batcher.queue_depth, attributes={"model": batcher.name}
+        )
+        for batcher in batchers
+    ]
+
+
+meter.create_observable_gauge(
+    name="webui.rag.local_model.queue.depth",
+    callbacks=[_observe_queue_depth],
+    description="Items waiting to be batched for a local model",
+    unit="1",
+)
+
+
+class _PendingRequest:
+    __slots__ = ("items", "results", "dispatched", "completed", "future", "enqueued_at")
+
+    def __init__(self, items: list):
+        self.items = items
+        self.results: list = [None] * len(items)
+        # Items handed to a batch, and items whose results are in
+        self.dispatched = 0
+        self.completed = 0
+        self.future: Future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class MicroBatcher:
+    """
+    Coalesces model calls coming from many threads/coroutines into batches.
+
+    Requests are grouped by ``key`` (e.g. the embedding prefix), since only
+    requests sharing the same call arguments can be merged. A batch is
+    dispatched once it holds ``max_batch_size`` items or its oldest request
+    has waited ``max_wait_ms``. Requests larger than the max batch size are
+    split across batches, taking turns with the requests queued behind them so
+    that a large ingestion does not hold up small interactive requests.
+
+    Batches run on dedicated worker threads, so callers only block on a
+    future and the model is never invoked concurrently from arbitrary
+    threadpool threads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model: Any,
+        run_batch: Callable[[Any, list, Hashable], list],
+        max_batch_size: int = RAG_LOCAL_MODEL_BATCH_MAX_SIZE,
+        max_wait_ms: int = RAG_LOCAL_MODEL_BATCH_MAX_WAIT_MS,
+        workers: int = RAG_LOCAL_MODEL_BATCH_WORKERS,
+    ):
+        self.name = name
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0, int(max_wait_ms)) / 1000
+
+        self._model_ref = weakref.ref(model)
+        self._run_batch = run_batch
+
+        self._condition = threading.Condition()
+        self._queues: dict[Hashable, deque[_PendingRequest]] = {}
+        self._queued_items: dict[Hashable, int] = {}
+        self._closed = False
+
+        self._stats = {
+            "requests": 0,
+            "items": 0,
+            "batches": 0,
+            "errors": 0,
+            "max_queue_depth": 0,
+        }
+
+        self._threads = [
+            threading.Thread(
+                target=self._worker,
+                name=f"{name}-batcher-{idx}",
+                daemon=True,
+            )
+            for idx in range(max(1, int(workers)))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(self._queued_items.values())
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                "name": self.name,
+                "queue_depth": self.queue_depth,
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": int(self.max_wait * 1000),
+                "avg_batch_size": (
+                    self._stats["items"] / self._stats["batches"]
+                    if self._stats["batches"]
+                    else 0
+                ),
+                **self._stats,
+            }
+
+    def submit(self, items: list, key: Hashable = None) -> Future:
+        """Queue ``items`` for batching and return a future of their results."""
+        request = _PendingRequest(list(items))
+        if not request.items:
+            request.future.set_result([])
+            return request.future
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f"{self.name} batcher is closed")
+
+            self._queues.setdefault(key, deque()).append(request)
+            self._queued_items[key] = self._queued_items.get(key, 0) + len(
+                request.items
+            )
+
+            self._stats["requests"] += 1
+            self._stats["max_queue_depth"] = max(
+                self._stats["max_queue_depth"], self.queue_depth
+            )
+            self._condition.notify()
+
+        return request.future
+
+    async def run(self, items: list, key: Hashable = None) -> list:
+        return await asyncio.wrap_future(self.submit(items, key))
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _next_batch(self) -> Optional[tuple[Hashable, list[_PendingRequest]]]:
+        with self._condition:
+            while True:
+                pending = [(key, queue) for key, queue in self._queues.items() if queue]
+
+                if not pending:
+                    if self._closed:
+                        return None
+                    if self._model_ref() is None:
+                        # The model has been unloaded, nothing left to serve.
+                        self._closed = True
+                        self._condition.notify_all()
+                        return None
+                    self._condition.wait(timeout=_IDLE_POLL_SECONDS)
+                    continue
+
+                # Serve the key whose oldest request has waited the longest
+                key, queue = min(pending, key=lambda kv: kv[1][0].enqueued_at)
+                deadline = queue[0].enqueued_at + self.max_wait
+                now = time.monotonic()
+
+                if (
+                    self._queued_items[key] < self.max_batch_size
+                    and now < deadline
+                    and not self._closed
+                ):
+                    self._condition.wait(timeout=deadline - now)
+                    continue
+
+                batch: list[tuple[_PendingRequest, int, int]] = []
+                batch_items = 0
+                while queue and batch_items < self.max_batch_size:
+                    request = queue.popleft()
+                    if request.dispatched == 0:
+                        if not request.future.set_running_or_notify_cancel():
+                            # Caller went away while waiting in the queue
+                            self._queued_items[key] -= len(request.items)
+                            continue
+                    elif request.future.done():
+                        # An earlier slice of the request failed
+                        self._queued_items[key] -= (
+                            len(request.items) - request.dispatched
+                        )
+                        continue
+
+                    start = request.dispatched
+                    end = min(
+                        len(request.items),
+                        start + self.max_batch_size - batch_items,
+                    )
+                    request.dispatched = end
+                    self._queued_items[key] -= end - start
+                    batch.append((request, start, end))
+                    batch_items += end - start
+                    if end < len(request.items):
+                        # The rest waits behind the requests queued after it
+                        queue.append(request)
+
+                if batch:
+                    return key, batch
+
+    def _worker(self) -> None:
+        while True:
+            next_batch = self._next_batch()
+            if next_batch is None:
+                return
+
+            key, batch = next_batch
+            items = [
+                item
+                for request, start, end in batch
+                for item in request.items[start:end]
+            ]
+
+            dispatched_at = time.monotonic()
+            for request, start, _ in batch:
+                if start == 0:
+                    queue_wait_histogram.record(
+                        (dispatched_at - request.enqueued_at) * 1000,
+                        {"model": self.name},
+                    )
+            batch_size_histogram.record(len(items), {"model": self.name})
+            batch_requests_histogram.record(len(batch), {"model": self.name})
+
+            try:
+                model = self._model_ref()
+                if model is None:
+                    raise RuntimeError(f"{self.name} model has been unloaded")
+
+                results = list(self._run_batch(model, items, key))
+                del model
+
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"{self.name} batch returned {len(results)} results for {len(items)} items"
+                    )
+
+                offset = 0
+                finished = []
+                with self._condition:
+                    for request, start, end in batch:
+                        request.results[start:end] = results[
+                            offset : offset + end - start
+                        ]
+                        offset += end - start
+                        request.completed += end - start
+                        if request.completed == len(request.items):
+                            finished.append(request)
+
+                    self._stats["batches"] += 1
+                    self._stats["items"] += len(items)
+
+                for request in finished:
+                    if not request.future.done():
+                        request.future.set_result(request.results)
+            except Exception as e:
+                log.exception(f"Error running {self.name} batch: {e}")
+                with self._condition:
+                    self._stats["errors"] += 1
+                for request, _, _ in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+
+def get_local_model_batcher(
+    model: Any,
+    name: str,
+    run_batch: Callable[[Any, list, Hashable], list],
+) -> MicroBatcher:
+    """Return the shared batcher serving ``model``, creating it if needed."""
+    with _BATCHERS_LOCK:
+        batcher = _BATCHERS.get(model)
+        if batcher is None or batcher.closed:
+            batcher = MicroBatcher(name, model, run_batch)
+            _BATCHERS[model] = batcher
+            log.info(
+                f"Started {name} batcher (max_batch_size={batcher.max_batch_size}, "
+                f"max_wait_ms={int(batcher.max_wait * 1000)})"
+            )
+        return batcher
+
+
+def get_local_model_batcher_stats() -> list[dict]:
+    with _BATCHERS_LOCK:
+        batchers = list(_BATCHERS.values())
+    return [batcher.stats() for batcher in batchers]
+
+
+def encode_batch(model: Any, texts: list[str], key: Hashable) -> list:
+    """Run a SentenceTransformer over a batch; ``key`` is (prefix, batch_size)."""
+    prefix, batch_size = key
+    return model.encode(
+        texts,
+        batch_size=int(batch_size),
+        **({"prompt": prefix} if prefix else {}),
+    ).tolist()
+
+
+def predict_batch(model: Any, pairs: list[tuple[str, str]], key: Hashable) -> list:
+    """Score (query, document) pairs with a CrossEncoder."""
+    scores = model.predict(pairs)
+    return scores.tolist() if hasattr(scores, "tolist") else list(scores)
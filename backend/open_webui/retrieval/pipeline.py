@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from langchain_core.documents import Document
+
+from open_webui.config import (
+    RAG_PIPELINED_INGESTION_BATCH_SIZE,
+    RAG_PIPELINED_INGESTION_QUEUE_SIZE,
+)
+
+log = logging.getLogger(__name__)
+
+####################################
+#
+# Pipelined ingestion: split -> embed -> insert
+#
+####################################
+
+STAGES = ("split", "embed", "insert")
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+class IngestionProgress:
+    """
+    Per-stage counters for a running ingestion, reported through ``on_progress``.
+
+    Reports are throttled to one per ``interval`` seconds, except for stage
+    transitions and the final report, which are always delivered.
+    """
+
+    def __init__(
+        self,
+        on_progress: Optional[Callable[[dict], None]] = None,
+        interval: float = 1.0,
+    ):
+        self.on_progress = on_progress
+        self.interval = interval
+
+        self._lock = threading.Lock()
+        # Serializes on_progress, so reports are delivered in update order
+        self._report_lock = threading.Lock()
+        self._last_report = 0.0
+        self._version = 0
+        self._reported_version = 0
+        self.stages = {stage: {"status": "pending", "done": 0} for stage in STAGES}
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return self._snapshot()
+
+    def _snapshot(self) -> dict:
+        return {stage: dict(data) for stage, data in self.stages.items()}
+
+    def update(self, stage: str, done: int = 0, status: Optional[str] = None) -> None:
+        with self._lock:
+            self.stages[stage]["done"] += done
+            self._version += 1
+            force = status is not None and status != self.stages[stage]["status"]
+            if status is not None:
+                self.stages[stage]["status"] = status
+            elif self.stages[stage]["status"] == "pending":
+                self.stages[stage]["status"] = "running"
+                force = True
+
+            now = time.monotonic()
+            if not force and now - self._last_report < self.interval:
+                return
+            self._last_report = now
+            version, snapshot = self._version, self._snapshot()
+
+        self._deliver(version, snapshot)
+
+    def _deliver(self, version: int, snapshot: dict) -> None:
+        if self.on_progress is None:
+            return
+        with self._report_lock:
+            # A thread that was overtaken must not overwrite a newer report
+            if version < self._reported_version:
+                return
+            self._reported_version = version
+            try:
+                self.on_progress(snapshot)
+            except Exception as e:
+                log.warning(f"Failed to report ingestion progress: {e}")
+
+
+class _Stop(Exception):
+    pass
+
+
+class IngestionPipeline:
+    """
+    Runs split, embed and insert as concurrent stages joined by bounded queues.
+
+    Documents are split one at a time and chunks are grouped into batches of
+    ``batch_size``. Each batch is embedded while the previous one is being
+    inserted, and at most ``queue_size`` batches wait between two stages, so
+    memory stays flat regardless of document size.
+    """
+
+    def __init__(
+        self,
+        split: Callable[[Document], list[Document]],
+        embed: Callable[[list[Document]], Awaitable[list[list[float]]]],
+        insert: Callable[[list[Document], list[list[float]]], None],
+        batch_size: int = RAG_PIPELINED_INGESTION_BATCH_SIZE,
+        queue_size: int = RAG_PIPELINED_INGESTION_QUEUE_SIZE,
+        progress: Optional[IngestionProgress] = None,
+    ):
+        self.split = split
+        self.embed = embed
+        self.insert = insert
+        self.batch_size = max(1, int(batch_size))
+        self.progress = progress or IngestionProgress()
+
+        self._embed_queue: queue.Queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._insert_queue: queue.Queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._error_stage: Optional[str] = None
+        self._inserted = 0
+
+    def run(self, docs: Iterable[Document]) -> int:
+        """Ingest ``docs`` and return the number of chunks inserted."""
+        threads = [
+            threading.Thread(
+                target=self._guard,
+                args=("embed", self._embed_stage),
+                name="ingest-embed",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._guard,
+                args=("insert", self._insert_stage),
+                name="ingest-insert",
+                daemon=True,
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+
+        # Splitting runs on the calling thread so that lazily loaded
+        # documents are pulled only as fast as the later stages drain.
+        self._guard("split", self._split_stage, docs)
+
+        for thread in threads:
+            thread.join()
+
+        if self._error is not None:
+            self.progress.update(self._error_stage, status="failed")
+            raise self._error
+
+        return self._inserted
+
+    def _guard(self, stage: str, func: Callable, *args) -> None:
+        try:
+            func(*args)
+            self.progress.update(stage, status="completed")
+        except _Stop:
+            pass
+        except BaseException as e:
+            log.exception(f"Ingestion {stage} stage failed: {e}")
+            if self._error is None:
+                self._error = e
+                self._error_stage = stage
+            self._stop.set()
+
+    def _put(self, q: queue.Queue, item: Any) -> None:
+        while True:
+            if self._stop.is_set():
+                raise _Stop()
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, q: queue.Queue) -> Any:
+        while True:
+            if self._stop.is_set():
+                raise _Stop()
+            try:
+                return q.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+    def _split_stage(self, docs: Iterable[Document]) -> None:
+        batch: list[Document] = []
+        for doc in docs:
+            chunks = self.split(doc)
+            self.progress.update("split", done=len(chunks))
+
+            for chunk in chunks:
+                batch.append(chunk)
+                if len(batch) >= self.batch_size:
+                    self._put(self._embed_queue, batch)
+                    batch = []
+
+        if batch:
+            self._put(self._embed_queue, batch)
+        self._put(self._embed_queue, _DONE)
+
+    def _embed_stage(self) -> None:
+        # One event loop for the whole run, so async embedding clients can
+        # reuse connections across batches.
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                batch = self._get(self._embed_queue)
+                if batch is _DONE:
+                    break
+
+                embeddings = loop.run_until_complete(self.embed(batch))
+                if len(embeddings) != len(batch):
+                    raise ValueError(
+                        f"Expected {len(batch)} embeddings, got {len(embeddings)}"
+                    )
+
+                self.progress.update("embed", done=len(batch))
+                self._put(self._insert_queue, (batch, embeddings))
+        finally:
+            loop.close()
+
+        self._put(self._insert_queue, _DONE)
+
+    def _insert_stage(self) -> None:
+        while True:
+            item = self._get(self._insert_queue)
+            if item is _DONE:
+                return
+
+            batch, embeddings = item
+            self.insert(batch, embeddings)
+            self._inserted += len(batch)
+            self.progress.update("insert", done=len(batch))
@@ -6,7 +6,6 @@ import requests
 import aiohttp
 import asyncio
 import hashlib
-from concurrent.futures import ThreadPoolExecutor
 import time
 import re
 
@@ -30,6 +29,7 @@ from open_webui.models.knowledge import Knowledges
 from open_webui.models.chats import Chats
 from open_webui.models.notes import Notes
 
+from open_webui.retrieval.cache import LRUCache
 from open_webui.retrieval.vector.main import GetResult
 from open_webui.utils.access_control import has_access
 from open_webui.utils.headers import include_user_info_headers
@@ -37,6 +37,12 @@ from open_webui.utils.misc import get_message_list
 
 from open_webui.retrieval.web.utils import get_web_loader
 from open_webui.retrieval.loaders.youtube import YoutubeLoader
+from open_webui.retrieval.models.base_reranker import BaseReranker
+from open_webui.retrieval.models.batching import (
+    encode_batch,
+    get_local_model_batcher,
+    predict_batch,
+)
 
 
 from open_webui.env import (
@@ -44,15 +50,23 @@ from open_webui.env import (
     OFFLINE_MODE,
     ENABLE_FORWARD_USER_INFO_HEADERS,
     AIOHTTP_CLIENT_SESSION_SSL,
+    ENABLE_RAG_LOCAL_MODEL_BATCHING,
 )
 from open_webui.config import (
     RAG_EMBEDDING_QUERY_PREFIX,
     RAG_EMBEDDING_CONTENT_PREFIX,
     RAG_EMBEDDING_PREFIX_FIELD_NAME,
+    RAG_EMBEDDING_DIMENSIONS,
+    RAG_KNOWLEDGE_ROUTING_THRESHOLD,
+    RAG_KNOWLEDGE_ROUTING_TOP_N,
+    RAG_RERANKING_SCORE_CACHE_SIZE,
 )
 
 log = logging.getLogger(__name__)
 
+# Reranker scores keyed by (reranker, normalized query hash, chunk content hash)
+RERANK_SCORE_CACHE = LRUCache(RAG_RERANKING_SCORE_CACHE_SIZE)
+
 
 from typing import Any
 
@@ -218,6 +232,7 @@ async def query_doc_with_hybrid_search(
     r: float,
     hybrid_bm25_weight: float,
     enable_enriched_texts: bool = False,
+    reranking_model: Optional[str] = None,
 ) -> dict:
     try:
         # First check if collection_result has the required attributes
@@ -277,6 +292,7 @@ async def query_doc_with_hybrid_search(
             top_n=k_reranker,
             reranking_function=reranking_function,
             r_score=r,
+            reranking_model=reranking_model,
         )
 
         compression_retriever = ContextualCompressionRetriever(
@@ -411,13 +427,14 @@ async def query_collection(
     results = []
     error = False
 
-    def process_query_collection(collection_name, query_embedding):
+    async def process_query_collection(collection_name, query_embedding):
         try:
             if collection_name:
-                result = query_doc(
+                log.debug(f"query_collection:doc {collection_name}")
+                result = await VECTOR_DB_CLIENT.asearch(
                     collection_name=collection_name,
-                    k=k,
-                    query_embedding=query_embedding,
+                    vectors=[query_embedding],
+                    limit=k,
                 )
                 if result is not None:
                     return result.model_dump(), None
@@ -434,15 +451,13 @@ async def query_collection(
         f"query_collection: processing {len(queries)} queries across {len(collection_names)} collections"
     )
 
-    with ThreadPoolExecutor() as executor:
-        future_results = []
-        for query_embedding in query_embeddings:
-            for collection_name in collection_names:
-                result = executor.submit(
-                    process_query_collection, collection_name, query_embedding
-                )
-                future_results.append(result)
-        task_results = [future.result() for future in future_results]
+    task_results = await asyncio.gather(
+        *[
+            process_query_collection(collection_name, query_embedding)
+            for query_embedding in query_embeddings
+            for collection_name in collection_names
+        ]
+    )
 
     for result, err in task_results:
         if err is not None:
@@ -466,23 +481,34 @@ async def query_collection_with_hybrid_search(
     r: float,
     hybrid_bm25_weight: float,
     enable_enriched_texts: bool = False,
+    reranking_model: Optional[str] = None,
 ) -> dict:
     results = []
     error = False
-    # Fetch collection data once per collection sequentially
+
+    # Fetch collection data once per collection
     # Avoid fetching the same data multiple times later
-    collection_results = {}
-    for collection_name in collection_names:
+    async def fetch_collection(collection_name):
         try:
             log.debug(
-                f"query_collection_with_hybrid_search:VECTOR_DB_CLIENT.get:collection {collection_name}"
-            )
-            collection_results[collection_name] = VECTOR_DB_CLIENT.get(
-                collection_name=collection_name
+                f"query_collection_with_hybrid_search:VECTOR_DB_CLIENT.aget:collection {collection_name}"
             )
+            return await VECTOR_DB_CLIENT.aget(collection_name=collection_name)
         except Exception as e:
             log.exception(f"Failed to fetch collection {collection_name}: {e}")
-            collection_results[collection_name] = None
+            return None
+
+    collection_results = dict(
+        zip(
+            collection_names,
+            await asyncio.gather(
+                *[
+                    fetch_collection(collection_name)
+                    for collection_name in collection_names
+                ]
+            ),
+        )
+    )
 
     log.info(
         f"Starting hybrid search for {len(queries)} queries in {len(collection_names)} collections..."
@@ -501,6 +527,7 @@ async def query_collection_with_hybrid_search(
                 r=r,
                 hybrid_bm25_weight=hybrid_bm25_weight,
                 enable_enriched_texts=enable_enriched_texts,
+                reranking_model=reranking_model,
             )
             return result, None
         except Exception as e:
@@ -786,6 +813,27 @@ async def agenerate_ollama_batch_embeddings(
         return None
 
 
+def truncate_embeddings(embeddings, dimensions: int):
+    """
+    Truncate Matryoshka embeddings to their first ``dimensions`` components and
+    re-normalize them so cosine and dot-product scores stay comparable.
+
+    Accepts a single embedding or a list of embeddings.
+    """
+    if not dimensions or not embeddings:
+        return embeddings
+
+    if not isinstance(embeddings[0], (list, tuple)):
+        return truncate_embeddings([embeddings], dimensions)[0]
+
+    truncated = []
+    for embedding in embeddings:
+        embedding = list(embedding[:dimensions])
+        norm = sum(value * value for value in embedding) ** 0.5
+        truncated.append([value / norm for value in embedding] if norm else embedding)
+    return truncated
+
+
 def get_embedding_function(
     embedding_engine,
     embedding_model,
@@ -795,8 +843,54 @@ def get_embedding_function(
     embedding_batch_size,
     azure_api_version=None,
     enable_async=True,
+) -> Awaitable:
+    func = _get_embedding_function(
+        embedding_engine,
+        embedding_model,
+        embedding_function,
+        url,
+        key,
+        embedding_batch_size,
+        azure_api_version=azure_api_version,
+        enable_async=enable_async,
+    )
+    if not RAG_EMBEDDING_DIMENSIONS:
+        return func
+
+    async def truncated_embedding_function(query, prefix=None, user=None):
+        embeddings = await func(query, prefix=prefix, user=user)
+        return truncate_embeddings(embeddings, RAG_EMBEDDING_DIMENSIONS)
+
+    return truncated_embedding_function
+
+
+def _get_embedding_function(
+    embedding_engine,
+    embedding_model,
+    embedding_function,
+    url,
+    key,
+    embedding_batch_size,
+    azure_api_version=None,
+    enable_async=True,
 ) -> Awaitable:
     if embedding_engine == "":
+        if ENABLE_RAG_LOCAL_MODEL_BATCHING and embedding_function is not None:
+            # Sentence transformers: queue into the shared batcher so concurrent
+            # requests are encoded together on the model's dedicated worker
+            batcher = get_local_model_batcher(
+                embedding_function, "embedding", encode_batch
+            )
+
+            async def async_embedding_function(query, prefix=None, user=None):
+                texts = query if isinstance(query, list) else [query]
+                embeddings = await batcher.run(
+                    texts, key=(prefix, int(embedding_batch_size))
+                )
+                return embeddings if isinstance(query, list) else embeddings[0]
+
+            return async_embedding_function
+
         # Sentence transformers: CPU-bound sync operation
         async def async_embedding_function(query, prefix=None, user=None):
             return await asyncio.to_thread(
@@ -918,6 +1012,33 @@ async def generate_embeddings(
         return embeddings[0] if isinstance(text, str) else embeddings
 
 
+def get_reranking_cache_namespace(
+    reranking_engine: str, reranking_model: str
+) -> Optional[str]:
+    """
+    Identify the active reranker for the score cache.
+    Returns None when scores of a (query, chunk) pair are not cacheable.
+    """
+    if not reranking_model or RAG_RERANKING_SCORE_CACHE_SIZE <= 0:
+        return None
+
+    # ColBERT softmax-normalizes scores across the whole candidate set,
+    # so a pair's score depends on the other documents it was ranked with
+    if "jinaai/jina-colbert-v2" in reranking_model:
+        return None
+
+    return f"{reranking_engine}:{reranking_model}"
+
+
+def get_rerank_score_cache_key(reranking_model: str, query: str, content: str) -> tuple:
+    normalized_query = " ".join(query.lower().split())
+    return (
+        reranking_model,
+        hashlib.sha256(normalized_query.encode()).hexdigest(),
+        hashlib.sha256(content.encode()).hexdigest(),
+    )
+
+
 def get_reranking_function(reranking_engine, reranking_model, reranking_function):
     if reranking_function is None:
         return None
@@ -925,12 +1046,89 @@ def get_reranking_function(reranking_engine, reranking_model, reranking_function
         return lambda query, documents, user=None: reranking_function.predict(
             [(query, doc.page_content) for doc in documents], user=user
         )
+    elif ENABLE_RAG_LOCAL_MODEL_BATCHING and not isinstance(
+        reranking_function, BaseReranker
+    ):
+        # CrossEncoder: pairs from concurrent requests are scored together.
+        # ColBERT is excluded as it scores all pairs against a single query.
+        batcher = get_local_model_batcher(
+            reranking_function, "reranking", predict_batch
+        )
+        return lambda query, documents, user=None: batcher.submit(
+            [(query, doc.page_content) for doc in documents]
+        ).result()
     else:
         return lambda query, documents, user=None: reranking_function.predict(
             [(query, doc.page_content) for doc in documents]
         )
 
 
+async def route_knowledge_bases(
+    knowledge_base_ids: list[str],
+    query_embeddings: list[list[float]],
+    top_n: int,
+    threshold: float = 0.0,
+) -> set[str]:
+    """
+    Select the knowledge bases worth searching for the queries.
+
+    Scores the name/description embedding of every knowledge base against the
+    query embeddings and keeps the top_n with the best similarity to any query,
+    dropping those below threshold. Knowledge bases that were not scored, such
+    as those without a metadata embedding, are always kept.
+    """
+    from open_webui.routers.knowledge import KNOWLEDGE_BASES_COLLECTION
+
+    # One search per query, as some backends only score the first vector
+    results = await asyncio.gather(
+        *[
+            VECTOR_DB_CLIENT.asearch(
+                collection_name=KNOWLEDGE_BASES_COLLECTION,
+                vectors=[query_embedding],
+                filter={"knowledge_base_id": {"$in": knowledge_base_ids}},
+                limit=len(knowledge_base_ids),
+            )
+            for query_embedding in query_embeddings
+        ]
+    )
+
+    # Most backends ignore the filter, so knowledge bases that were not asked
+    # for are dropped here
+    allowed = set(knowledge_base_ids)
+    scores = {}
+    for result in results:
+        if result is None or not result.ids or not result.distances:
+            continue
+        for knowledge_base_id, distance in zip(result.ids[0], result.distances[0]):
+            if knowledge_base_id in allowed:
+                scores[knowledge_base_id] = max(
+                    distance, scores.get(knowledge_base_id, distance)
+                )
+
+    ranked = sorted(
+        (id for id, score in scores.items() if score >= threshold),
+        key=lambda id: scores[id],
+        reverse=True,
+    )
+    unscored = [id for id in knowledge_base_ids if id not in scores]
+    return set(ranked[:top_n]) | set(unscored)
+
+
+def with_query_embeddings(embedding_function, queries, query_embeddings):
+    """Reuse already computed query embeddings for later calls with the queries."""
+    cached = dict(zip(queries, query_embeddings))
+
+    async def func(query, prefix=None):
+        if prefix == RAG_EMBEDDING_QUERY_PREFIX:
+            if isinstance(query, str) and query in cached:
+                return cached[query]
+            if isinstance(query, list) and all(q in cached for q in query):
+                return [cached[q] for q in query]
+        return await embedding_function(query, prefix=prefix)
+
+    return func
+
+
 async def get_sources_from_items(
     request,
     items,
@@ -952,7 +1150,54 @@ async def get_sources_from_items(
     extracted_collections = []
     query_results = []
 
+    # Knowledge bases searched by vector similarity, candidates for routing
+    knowledge_base_ids = list(
+        dict.fromkeys(
+            item["id"]
+            for item in items
+            if item.get("type") == "collection"
+            and not item.get("legacy")
+            and item.get("context") != "full"
+        )
+    )
+
+    skipped_knowledge_base_ids = set()
+    if (
+        RAG_KNOWLEDGE_ROUTING_TOP_N > 0
+        and len(knowledge_base_ids) > RAG_KNOWLEDGE_ROUTING_TOP_N
+        and queries
+        and not full_context
+        and not request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL
+    ):
+        try:
+            query_embeddings = await embedding_function(
+                queries, prefix=RAG_EMBEDDING_QUERY_PREFIX
+            )
+            embedding_function = with_query_embeddings(
+                embedding_function, queries, query_embeddings
+            )
+            routed_ids = await route_knowledge_bases(
+                knowledge_base_ids,
+                query_embeddings,
+                RAG_KNOWLEDGE_ROUTING_TOP_N,
+                RAG_KNOWLEDGE_ROUTING_THRESHOLD,
+            )
+            skipped_knowledge_base_ids = set(knowledge_base_ids) - routed_ids
+            log.debug(
+                f"knowledge base routing: searching {len(routed_ids)} of "
+                f"{len(knowledge_base_ids)} knowledge bases"
+            )
+        except Exception as e:
+            log.warning(f"Knowledge base routing failed, searching all: {e}")
+
     for item in items:
+        if (
+            item.get("type") == "collection"
+            and item.get("id") in skipped_knowledge_base_ids
+        ):
+            log.debug(f"skipping knowledge base {item['id']} not selected by routing")
+            continue
+
         query_result = None
         collection_names = []
 
@@ -1165,6 +1410,10 @@ async def get_sources_from_items(
                                 r=r,
                                 hybrid_bm25_weight=hybrid_bm25_weight,
                                 enable_enriched_texts=request.app.state.config.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS,
+                                reranking_model=get_reranking_cache_namespace(
+                                    request.app.state.config.RAG_RERANKING_ENGINE,
+                                    request.app.state.config.RAG_RERANKING_MODEL,
+                                ),
                             )
                         except Exception as e:
                             log.debug(
@@ -1261,6 +1510,7 @@ class RerankCompressor(BaseDocumentCompressor):
     top_n: int
     reranking_function: Any
     r_score: float
+    reranking_model: Optional[str] = None
 
     class Config:
         extra = "forbid"
@@ -1295,7 +1545,7 @@ class RerankCompressor(BaseDocumentCompressor):
 
         scores = None
         if reranking:
-            scores = await asyncio.to_thread(self.reranking_function, query, documents)
+            scores = await self.arerank(query, documents)
         else:
             from sentence_transformers import util
 
@@ -1335,3 +1585,37 @@ class RerankCompressor(BaseDocumentCompressor):
                 "No valid scores found, check your reranking function. Returning original documents."
             )
             return documents
+
+    async def arerank(
+        self, query: str, documents: Sequence[Document]
+    ) -> Optional[list[float]]:
+        """Score documents against the query, only sending cache misses to the reranker."""
+        if not self.reranking_model or not RERANK_SCORE_CACHE.enabled:
+            return await asyncio.to_thread(self.reranking_function, query, documents)
+
+        keys = [
+            get_rerank_score_cache_key(self.reranking_model, query, doc.page_content)
+            for doc in documents
+        ]
+        scores = [RERANK_SCORE_CACHE.get(key) for key in keys]
+        misses = [idx for idx, score in enumerate(scores) if score is None]
+
+        log.debug(
+            f"rerank score cache: {len(documents) - len(misses)} hits, {len(misses)} misses"
+        )
+
+        if misses:
+            miss_scores = await asyncio.to_thread(
+                self.reranking_function, query, [documents[idx] for idx in misses]
+            )
+            if miss_scores is None:
+                return None
+
+            if not isinstance(miss_scores, list):
+                miss_scores = miss_scores.tolist()
+
+            for idx, score in zip(misses, miss_scores):
+                scores[idx] = float(score)
+                RERANK_SCORE_CACHE.set(keys[idx], scores[idx])
+
+        return scores
@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable
+
+from opentelemetry import metrics
+
+from open_webui.config import (
+    VECTOR_DB_BATCH_CONCURRENCY,
+    VECTOR_DB_BATCH_MAX_RETRIES,
+)
+
+log = logging.getLogger(__name__)
+
+####################################
+#
+# Concurrent batch submission for HTTP vector DBs
+#
+####################################
+
+meter = metrics.get_meter(__name__)
+
+throughput_histogram = meter.create_histogram(
+    name="webui.vector_db.batch.throughput",
+    description="Items written per second by a batched vector DB operation",
+    unit="1/s",
+)
+retry_counter = meter.create_counter(
+    name="webui.vector_db.batch.retries",
+    description="Vector DB write batches retried after a failure",
+    unit="1",
+)
+
+RETRYABLE_ERROR_CODES = {
+    "RequestLimitExceeded",
+    "ServiceUnavailableException",
+    "ThrottlingException",
+    "TooManyRequestsException",
+}
+# Network errors of HTTP clients that do not derive from the builtin
+# ConnectionError and TimeoutError (requests, httpx, urllib3, botocore)
+RETRYABLE_ERROR_TYPES = {
+    "ConnectError",
+    "ConnectionClosedError",
+    "ConnectionError",
+    "ConnectTimeout",
+    "ConnectTimeoutError",
+    "EndpointConnectionError",
+    "NetworkError",
+    "ProtocolError",
+    "ReadTimeout",
+    "ReadTimeoutError",
+    "Timeout",
+    "TimeoutException",
+}
+# Only for errors that carry neither a status nor an error code. Plain
+# substrings such as "500" or "connection" also match permanent errors.
+RETRYABLE_ERROR_PHRASES = (
+    "rate limit",
+    "throttl",
+    "too many requests",
+    "internal server error",
+    "bad gateway",
+    "service unavailable",
+    "gateway timeout",
+)
+
+
+def _is_retryable_status(status: Any) -> bool:
+    return status == 429 or (isinstance(status, int) and status >= 500)
+
+
+def is_retryable_error(e: Exception) -> bool:
+    """Rate limits, timeouts and server side errors are worth retrying."""
+    response = getattr(e, "response", None)
+    if isinstance(response, dict):
+        # botocore ClientError carries the error code in its response
+        if response.get("Error", {}).get("Code") in RETRYABLE_ERROR_CODES:
+            return True
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    elif response is not None:
+        # HTTP client errors carry the response object
+        status = getattr(response, "status_code", None) or getattr(
+            response, "status", None
+        )
+    else:
+        # API client errors (e.g. Pinecone) carry the status themselves
+        status = getattr(e, "status", None) or getattr(e, "status_code", None)
+    if isinstance(status, int):
+        return _is_retryable_status(status)
+
+    if isinstance(e, (ConnectionError, TimeoutError)) or any(
+        cls.__name__ in RETRYABLE_ERROR_TYPES for cls in type(e).__mro__
+    ):
+        return True
+    message = str(e).lower()
+    return any(phrase in message for phrase in RETRYABLE_ERROR_PHRASES)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter: ~0.5s, 1s, 2s, ..."""
+    return 0.5 * 2**attempt + random.uniform(0, 0.5)
+
+
+def make_batches(items: list, batch_size: int) -> list[list]:
+    return [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+
+def _record(name: str, count: int, batches: int, start: float) -> None:
+    elapsed = time.perf_counter() - start
+    throughput = count / elapsed if elapsed > 0 else 0.0
+    throughput_histogram.record(throughput, {"operation": name})
+    log.info(
+        f"{name}: {count} items in {batches} batches, "
+        f"{elapsed:.2f}s ({throughput:.0f} items/s)"
+    )
+
+
+def _call_with_retry(name: str, operation: Callable[[list], Any], batch: list):
+    for attempt in range(VECTOR_DB_BATCH_MAX_RETRIES + 1):
+        try:
+            return operation(batch)
+        except Exception as e:
+            if attempt == VECTOR_DB_BATCH_MAX_RETRIES or not is_retryable_error(e):
+                raise
+            delay = backoff_delay(attempt)
+            retry_counter.add(1, {"operation": name})
+            log.warning(
+                f"{name} batch failed (attempt {attempt + 1}/"
+                f"{VECTOR_DB_BATCH_MAX_RETRIES + 1}), retrying in {delay:.2f}s: {e}"
+            )
+            time.sleep(delay)
+
+
+def submit_batches(
+    name: str,
+    operation: Callable[[list], Any],
+    items: list,
+    batch_size: int,
+) -> None:
+    """
+    Run ``operation`` on every batch of ``items``, at most
+    VECTOR_DB_BATCH_CONCURRENCY batches at a time, retrying each batch with
+    backoff. Raises the first error once the batches in flight have finished.
+    """
+    if not items:
+        return
+
+    start = time.perf_counter()
+    batches = make_batches(items, batch_size)
+    workers = min(VECTOR_DB_BATCH_CONCURRENCY, len(batches))
+
+    if workers == 1:
+        for batch in batches:
+            _call_with_retry(name, operation, batch)
+    else:
+        # A pool per call, since callers may already run on the shared vector
+        # DB executor and must not wait on their own workers
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="vector-db-batch"
+        ) as executor:
+            futures = [
+                executor.submit(_call_with_retry, name, operation, batch)
+                for batch in batches
+            ]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in done:
+                future.result()
+
+    _record(name, len(items), len(batches), start)
+
+
+async def asubmit_batches(
+    name: str,
+    operation: Callable[[list], Awaitable[Any]],
+    items: list,
+    batch_size: int,
+) -> None:
+    """Async variant of submit_batches for coroutine operations."""
+    if not items:
+        return
+
+    start = time.perf_counter()
+    batches = make_batches(items, batch_size)
+    semaphore = asyncio.Semaphore(VECTOR_DB_BATCH_CONCURRENCY)
+
+    async def run(batch: list):
+        async with semaphore:
+            for attempt in range(VECTOR_DB_BATCH_MAX_RETRIES + 1):
+                try:
+                    return await operation(batch)
+                except Exception as e:
+                    if attempt == VECTOR_DB_BATCH_MAX_RETRIES:
+                        raise
+                    if not is_retryable_error(e):
+                        raise
+                    retry_counter.add(1, {"operation": name})
+                    await asyncio.sleep(backoff_delay(attempt))
+
+    tasks = [asyncio.ensure_future(run(batch)) for batch in batches]
+    try:
+        await asyncio.gather(*tasks)
+    except Exception:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    _record(name, len(items), len(batches), start)
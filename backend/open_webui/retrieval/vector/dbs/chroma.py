@@ -126,6 +126,27 @@ class ChromaClient(VectorDBBase):
         except:
             return None
 
+    def query_vectors(
+        self, collection_name: str, filter: Optional[dict]
+    ) -> Optional[list[VectorItem]]:
+        try:
+            collection = self.client.get_collection(name=collection_name)
+            result = collection.get(
+                where=filter, include=["documents", "metadatas", "embeddings"]
+            )
+        except:
+            return None
+
+        return [
+            {
+                "id": id,
+                "text": result["documents"][idx],
+                "vector": list(result["embeddings"][idx]),
+                "metadata": result["metadatas"][idx],
+            }
+            for idx, id in enumerate(result["ids"])
+        ]
+
     def get(self, collection_name: str) -> Optional[GetResult]:
         # Get all the items in the collection.
         collection = self.client.get_collection(name=collection_name)
@@ -1,7 +1,7 @@
-from elasticsearch import Elasticsearch, BadRequestError
+from elasticsearch import AsyncElasticsearch, Elasticsearch, BadRequestError
 from typing import Optional
 import ssl
-from elasticsearch.helpers import bulk, scan
+from elasticsearch.helpers import async_scan, bulk, scan
 
 from open_webui.retrieval.vector.utils import process_metadata
 from open_webui.retrieval.vector.main import (
@@ -32,18 +32,23 @@ class ElasticsearchClient(VectorDBBase):
 
     def __init__(self):
         self.index_prefix = ELASTICSEARCH_INDEX_PREFIX
-        self.client = Elasticsearch(
-            hosts=[ELASTICSEARCH_URL],
-            ca_certs=ELASTICSEARCH_CA_CERTS,
-            api_key=ELASTICSEARCH_API_KEY,
-            cloud_id=ELASTICSEARCH_CLOUD_ID,
-            basic_auth=(
+        self.client_kwargs = {
+            "hosts": [ELASTICSEARCH_URL],
+            "ca_certs": ELASTICSEARCH_CA_CERTS,
+            "api_key": ELASTICSEARCH_API_KEY,
+            "cloud_id": ELASTICSEARCH_CLOUD_ID,
+            "basic_auth": (
                 (ELASTICSEARCH_USERNAME, ELASTICSEARCH_PASSWORD)
                 if ELASTICSEARCH_USERNAME and ELASTICSEARCH_PASSWORD
                 else None
             ),
-            ssl_assert_fingerprint=SSL_ASSERT_FINGERPRINT,
-        )
+            "ssl_assert_fingerprint": SSL_ASSERT_FINGERPRINT,
+        }
+        self.client = Elasticsearch(**self.client_kwargs)
+
+    @property
+    def async_client(self) -> AsyncElasticsearch:
+        return self._get_async_client(lambda: AsyncElasticsearch(**self.client_kwargs))
 
     # Status: works
     def _get_index_name(self, dimension: int) -> str:
@@ -159,7 +164,17 @@ class ElasticsearchClient(VectorDBBase):
         filter: Optional[dict] = None,
         limit: int = 10,
     ) -> Optional[SearchResult]:
-        query = {
+        result = self.client.search(
+            index=self._get_index_name(len(vectors[0])),
+            body=self._search_body(collection_name, vectors, limit),
+        )
+
+        return self._result_to_search_result(result)
+
+    def _search_body(
+        self, collection_name: str, vectors: list[list[float]], limit: int
+    ) -> dict:
+        return {
             "size": limit,
             "_source": ["text", "metadata"],
             "query": {
@@ -177,12 +192,6 @@ class ElasticsearchClient(VectorDBBase):
             },
         }
 
-        result = self.client.search(
-            index=self._get_index_name(len(vectors[0])), body=query
-        )
-
-        return self._result_to_search_result(result)
-
     # Status: only tested halfwat
     def query(
         self, collection_name: str, filter: dict, limit: Optional[int] = None
@@ -190,6 +199,31 @@ class ElasticsearchClient(VectorDBBase):
         if not self.has_collection(collection_name):
             return None
 
+        try:
+            if not limit:
+                # Unbounded queries (e.g. all chunks of a file) must not be
+                # truncated to the default page size
+                results = list(
+                    scan(
+                        self.client,
+                        index=f"{self.index_prefix}*",
+                        query=self._query_body(collection_name, filter),
+                    )
+                )
+                return self._scan_result_to_get_result(results)
+
+            result = self.client.search(
+                index=f"{self.index_prefix}*",
+                body=self._query_body(collection_name, filter),
+                size=limit,
+            )
+
+            return self._result_to_get_result(result)
+
+        except Exception as e:
+            return None
+
+    def _query_body(self, collection_name: str, filter: dict) -> dict:
         query_body = {
             "query": {"bool": {"filter": []}},
             "_source": ["text", "metadata"],
@@ -200,19 +234,7 @@ class ElasticsearchClient(VectorDBBase):
         query_body["query"]["bool"]["filter"].append(
             {"term": {"collection": collection_name}}
         )
-        size = limit if limit else 10
-
-        try:
-            result = self.client.search(
-                index=f"{self.index_prefix}*",
-                body=query_body,
-                size=size,
-            )
-
-            return self._result_to_get_result(result)
-
-        except Exception as e:
-            return None
+        return query_body
 
     # Status: works
     def _has_index(self, dimension: int):
@@ -235,6 +257,67 @@ class ElasticsearchClient(VectorDBBase):
 
         return self._scan_result_to_get_result(results)
 
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        result = await self.async_client.search(
+            index=self._get_index_name(len(vectors[0])),
+            body=self._search_body(collection_name, vectors, limit),
+        )
+
+        return self._result_to_search_result(result)
+
+    async def aquery(
+        self, collection_name: str, filter: dict, limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        try:
+            result = await self.async_client.count(
+                index=f"{self.index_prefix}*",
+                body={"query": {"term": {"collection": collection_name}}},
+            )
+            if not result.body["count"]:
+                return None
+
+            if not limit:
+                results = [
+                    hit
+                    async for hit in async_scan(
+                        self.async_client,
+                        index=f"{self.index_prefix}*",
+                        query=self._query_body(collection_name, filter),
+                    )
+                ]
+                return self._scan_result_to_get_result(results)
+
+            result = await self.async_client.search(
+                index=f"{self.index_prefix}*",
+                body=self._query_body(collection_name, filter),
+                size=limit,
+            )
+
+            return self._result_to_get_result(result)
+
+        except Exception as e:
+            return None
+
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        query = {
+            "query": {"bool": {"filter": [{"term": {"collection": collection_name}}]}},
+            "_source": ["text", "metadata"],
+        }
+        results = [
+            hit
+            async for hit in async_scan(
+                self.async_client, index=f"{self.index_prefix}*", query=query
+            )
+        ]
+
+        return self._scan_result_to_get_result(results)
+
     # Status: works
     def insert(self, collection_name: str, items: list[VectorItem]):
         if not self._has_index(dimension=len(items[0]["vector"])):
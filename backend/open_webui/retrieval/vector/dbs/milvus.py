@@ -128,9 +128,17 @@ class MilvusClient(VectorDBBase):
                 "efConstruction": MILVUS_HNSW_EFCONSTRUCTION,
             }
             log.info(f"HNSW params: {index_creation_params}")
-        elif index_type == "IVF_FLAT":
+        elif index_type == "HNSW_SQ":
+            # HNSW over 8-bit scalar quantized vectors (Milvus 2.6+)
+            index_creation_params = {
+                "M": MILVUS_HNSW_M,
+                "efConstruction": MILVUS_HNSW_EFCONSTRUCTION,
+                "sq_type": "SQ8",
+            }
+            log.info(f"HNSW_SQ params: {index_creation_params}")
+        elif index_type in ["IVF_FLAT", "IVF_SQ8"]:
             index_creation_params = {"nlist": MILVUS_IVF_FLAT_NLIST}
-            log.info(f"IVF_FLAT params: {index_creation_params}")
+            log.info(f"{index_type} params: {index_creation_params}")
         elif index_type == "DISKANN":
             index_creation_params = {
                 "max_degree": MILVUS_DISKANN_MAX_DEGREE,
@@ -142,7 +150,7 @@ class MilvusClient(VectorDBBase):
         else:
             log.warning(
                 f"Unsupported MILVUS_INDEX_TYPE: '{index_type}'. "
-                f"Supported types: HNSW, IVF_FLAT, DISKANN, FLAT, AUTOINDEX. "
+                f"Supported types: HNSW, HNSW_SQ, IVF_FLAT, IVF_SQ8, DISKANN, FLAT, AUTOINDEX. "
                 f"Milvus will use its default for the collection if this type is not directly supported for index creation."
             )
             # For unsupported types, pass the type directly to Milvus; it might handle it or use a default.
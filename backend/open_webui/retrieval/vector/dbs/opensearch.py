@@ -1,4 +1,4 @@
-from opensearchpy import OpenSearch
+from opensearchpy import AsyncOpenSearch, OpenSearch
 from opensearchpy.helpers import bulk
 from typing import Optional
 
@@ -21,12 +21,17 @@ from open_webui.config import (
 class OpenSearchClient(VectorDBBase):
     def __init__(self):
         self.index_prefix = "open_webui"
-        self.client = OpenSearch(
-            hosts=[OPENSEARCH_URI],
-            use_ssl=OPENSEARCH_SSL,
-            verify_certs=OPENSEARCH_CERT_VERIFY,
-            http_auth=(OPENSEARCH_USERNAME, OPENSEARCH_PASSWORD),
-        )
+        self.client_kwargs = {
+            "hosts": [OPENSEARCH_URI],
+            "use_ssl": OPENSEARCH_SSL,
+            "verify_certs": OPENSEARCH_CERT_VERIFY,
+            "http_auth": (OPENSEARCH_USERNAME, OPENSEARCH_PASSWORD),
+        }
+        self.client = OpenSearch(**self.client_kwargs)
+
+    @property
+    def async_client(self) -> AsyncOpenSearch:
+        return self._get_async_client(lambda: AsyncOpenSearch(**self.client_kwargs))
 
     def _get_index_name(self, collection_name: str) -> str:
         return f"{self.index_prefix}_{collection_name}"
@@ -123,25 +128,9 @@ class OpenSearchClient(VectorDBBase):
             if not self.has_collection(collection_name):
                 return None
 
-            query = {
-                "size": limit,
-                "_source": ["text", "metadata"],
-                "query": {
-                    "script_score": {
-                        "query": {"match_all": {}},
-                        "script": {
-                            "source": "(cosineSimilarity(params.query_value, doc[params.field]) + 1.0) / 2.0",
-                            "params": {
-                                "field": "vector",
-                                "query_value": vectors[0],
-                            },  # Assuming single query vector
-                        },
-                    }
-                },
-            }
-
             result = self.client.search(
-                index=self._get_index_name(collection_name), body=query
+                index=self._get_index_name(collection_name),
+                body=self._search_body(vectors, limit),
             )
 
             return self._result_to_search_result(result)
@@ -149,12 +138,43 @@ class OpenSearchClient(VectorDBBase):
         except Exception as e:
             return None
 
+    def _search_body(self, vectors: list[list[float | int]], limit: int) -> dict:
+        return {
+            "size": limit,
+            "_source": ["text", "metadata"],
+            "query": {
+                "script_score": {
+                    "query": {"match_all": {}},
+                    "script": {
+                        "source": "(cosineSimilarity(params.query_value, doc[params.field]) + 1.0) / 2.0",
+                        "params": {
+                            "field": "vector",
+                            "query_value": vectors[0],
+                        },  # Assuming single query vector
+                    },
+                }
+            },
+        }
+
     def query(
         self, collection_name: str, filter: dict, limit: Optional[int] = None
     ) -> Optional[GetResult]:
         if not self.has_collection(collection_name):
             return None
 
+        try:
+            result = self.client.search(
+                index=self._get_index_name(collection_name),
+                body=self._query_body(filter),
+                size=limit if limit else 10000,
+            )
+
+            return self._result_to_get_result(result)
+
+        except Exception as e:
+            return None
+
+    def _query_body(self, filter: dict) -> dict:
         query_body = {
             "query": {"bool": {"filter": []}},
             "_source": ["text", "metadata"],
@@ -165,28 +185,60 @@ class OpenSearchClient(VectorDBBase):
                 {"term": {"metadata." + str(field) + ".keyword": value}}
             )
 
-        size = limit if limit else 10000
+        return query_body
 
+    def _create_index_if_not_exists(self, collection_name: str, dimension: int):
+        if not self.has_collection(collection_name):
+            self._create_index(collection_name, dimension)
+
+    def get(self, collection_name: str) -> Optional[GetResult]:
+        query = {"query": {"match_all": {}}, "_source": ["text", "metadata"]}
+
+        result = self.client.search(
+            index=self._get_index_name(collection_name), body=query
+        )
+        return self._result_to_get_result(result)
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
         try:
-            result = self.client.search(
-                index=self._get_index_name(collection_name),
-                body=query_body,
-                size=size,
+            index = self._get_index_name(collection_name)
+            if not await self.async_client.indices.exists(index=index):
+                return None
+
+            result = await self.async_client.search(
+                index=index, body=self._search_body(vectors, limit)
             )
+            return self._result_to_search_result(result)
+        except Exception as e:
+            return None
 
-            return self._result_to_get_result(result)
+    async def aquery(
+        self, collection_name: str, filter: dict, limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        index = self._get_index_name(collection_name)
+        if not await self.async_client.indices.exists(index=index):
+            return None
 
+        try:
+            result = await self.async_client.search(
+                index=index,
+                body=self._query_body(filter),
+                size=limit if limit else 10000,
+            )
+            return self._result_to_get_result(result)
         except Exception as e:
             return None
 
-    def _create_index_if_not_exists(self, collection_name: str, dimension: int):
-        if not self.has_collection(collection_name):
-            self._create_index(collection_name, dimension)
-
-    def get(self, collection_name: str) -> Optional[GetResult]:
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
         query = {"query": {"match_all": {}}, "_source": ["text", "metadata"]}
 
-        result = self.client.search(
+        result = await self.async_client.search(
             index=self._get_index_name(collection_name), body=query
         )
         return self._result_to_get_result(result)
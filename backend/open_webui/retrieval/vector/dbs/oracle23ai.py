@@ -24,6 +24,8 @@ ORACLE_VECTOR_LENGTH = 768
 ORACLE_DB_POOL_MIN = 2
 ORACLE_DB_POOL_MAX = 10
 ORACLE_DB_POOL_INCREMENT = 1
+
+ORACLE_DB_BATCH_SIZE = 500
 """
 
 from typing import Optional, List, Dict, Any, Union
@@ -54,6 +56,7 @@ from open_webui.config import (
     ORACLE_DB_POOL_MIN,
     ORACLE_DB_POOL_MAX,
     ORACLE_DB_POOL_INCREMENT,
+    ORACLE_DB_BATCH_SIZE,
 )
 
 log = logging.getLogger(__name__)
@@ -397,6 +400,44 @@ class Oracle23aiClient(VectorDBBase):
         """
         return json.loads(json_str) if json_str else {}
 
+    def _bind_rows(self, collection_name: str, items: List[VectorItem]) -> List[Dict]:
+        """
+        Build the executemany() bind rows for a list of items.
+
+        Vectors are converted to array.array("f") buffers once here, so every
+        batch binds them directly as VECTOR values.
+
+        Args:
+            collection_name (str): Name of the collection
+            items (List[VectorItem]): List of vector items
+
+        Returns:
+            List[Dict]: One dictionary of bind values per item
+        """
+        return [
+            {
+                "id": item["id"],
+                "collection_name": collection_name,
+                "text": item["text"],
+                "metadata": self._metadata_to_json(item["metadata"]),
+                "vector": self._vector_to_blob(item["vector"]),
+            }
+            for item in items
+        ]
+
+    def _batches(self, rows: List) -> List[List]:
+        """
+        Split rows into executemany() batches of ORACLE_DB_BATCH_SIZE.
+
+        Args:
+            rows (List): Bind rows
+
+        Returns:
+            List[List]: The batches
+        """
+        batch_size = max(1, ORACLE_DB_BATCH_SIZE)
+        return [rows[i : i + batch_size] for i in range(0, len(rows), batch_size)]
+
     def insert(self, collection_name: str, items: List[VectorItem]) -> None:
         """
         Insert vector items into the database.
@@ -418,26 +459,19 @@ class Oracle23aiClient(VectorDBBase):
         """
         log.info(f"Inserting {len(items)} items into collection '{collection_name}'.")
 
+        rows = self._bind_rows(collection_name, items)
+
         with self.get_connection() as connection:
             try:
                 with connection.cursor() as cursor:
-                    for item in items:
-                        vector_blob = self._vector_to_blob(item["vector"])
-                        metadata_json = self._metadata_to_json(item["metadata"])
-
-                        cursor.execute(
+                    for batch in self._batches(rows):
+                        cursor.executemany(
                             """
                             INSERT INTO document_chunk 
                             (id, collection_name, text, vmetadata, vector) 
                             VALUES (:id, :collection_name, :text, :metadata, :vector)
                         """,
-                            {
-                                "id": item["id"],
-                                "collection_name": collection_name,
-                                "text": item["text"],
-                                "metadata": metadata_json,
-                                "vector": vector_blob,
-                            },
+                            batch,
                         )
 
                 connection.commit()
@@ -474,14 +508,20 @@ class Oracle23aiClient(VectorDBBase):
         """
         log.info(f"Upserting {len(items)} items into collection '{collection_name}'.")
 
+        rows = [
+            {
+                "merge_id": row["id"],
+                **{f"upd_{key}": value for key, value in row.items() if key != "id"},
+                **{f"ins_{key}": value for key, value in row.items()},
+            }
+            for row in self._bind_rows(collection_name, items)
+        ]
+
         with self.get_connection() as connection:
             try:
                 with connection.cursor() as cursor:
-                    for item in items:
-                        vector_blob = self._vector_to_blob(item["vector"])
-                        metadata_json = self._metadata_to_json(item["metadata"])
-
-                        cursor.execute(
+                    for batch in self._batches(rows):
+                        cursor.executemany(
                             """
                             MERGE INTO document_chunk d
                             USING (SELECT :merge_id as id FROM dual) s
@@ -496,18 +536,7 @@ class Oracle23aiClient(VectorDBBase):
                                 INSERT (id, collection_name, text, vmetadata, vector)
                                 VALUES (:ins_id, :ins_collection_name, :ins_text, :ins_metadata, :ins_vector)
                         """,
-                            {
-                                "merge_id": item["id"],
-                                "upd_collection_name": collection_name,
-                                "upd_text": item["text"],
-                                "upd_metadata": metadata_json,
-                                "upd_vector": vector_blob,
-                                "ins_id": item["id"],
-                                "ins_collection_name": collection_name,
-                                "ins_text": item["text"],
-                                "ins_metadata": metadata_json,
-                                "ins_vector": vector_blob,
-                            },
+                            batch,
                         )
 
                 connection.commit()
@@ -796,13 +825,6 @@ class Oracle23aiClient(VectorDBBase):
             )
             params = {"collection_name": collection_name}
 
-            if ids:
-                # 🔧 FIXED: Use proper parameterized query to prevent SQL injection
-                placeholders = ",".join([f":id_{i}" for i in range(len(ids))])
-                query += f" AND id IN ({placeholders})"
-                for i, id_val in enumerate(ids):
-                    params[f"id_{i}"] = id_val
-
             if filter:
                 for i, (key, value) in enumerate(filter.items()):
                     param_name = f"value_{i}"
@@ -811,8 +833,19 @@ class Oracle23aiClient(VectorDBBase):
 
             with self.get_connection() as connection:
                 with connection.cursor() as cursor:
-                    cursor.execute(query, params)
-                    deleted = cursor.rowcount
+                    if ids:
+                        # One array-bound statement per batch instead of an IN
+                        # list, which Oracle caps at 1000 expressions
+                        deleted = 0
+                        for batch in self._batches(ids):
+                            cursor.executemany(
+                                f"{query} AND id = :id",
+                                [{**params, "id": id_val} for id_val in batch],
+                            )
+                            deleted += cursor.rowcount
+                    else:
+                        cursor.execute(query, params)
+                        deleted = cursor.rowcount
                 connection.commit()
 
             log.info(f"Deleted {deleted} items from collection '{collection_name}'.")
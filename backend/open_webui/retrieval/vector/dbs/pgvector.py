@@ -1,4 +1,5 @@
 from typing import Optional, List, Dict, Any, Tuple
+import io
 import logging
 import json
 from sqlalchemy import (
@@ -21,11 +22,19 @@ from sqlalchemy.sql import true
 from sqlalchemy.pool import NullPool, QueuePool
 
 from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
-from sqlalchemy.dialects.postgresql import JSONB, array
-from pgvector.sqlalchemy import Vector, HALFVEC
+from sqlalchemy.dialects.postgresql import JSONB, array, insert as pg_insert
+from pgvector.sqlalchemy import Vector, HALFVEC, BIT
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.exc import NoSuchTableError
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
+try:
+    import asyncpg  # noqa: F401
+
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
 
 from open_webui.retrieval.vector.utils import process_metadata
 from open_webui.retrieval.vector.main import (
@@ -49,6 +58,12 @@ from open_webui.config import (
     PGVECTOR_HNSW_EF_CONSTRUCTION,
     PGVECTOR_IVFFLAT_LISTS,
     PGVECTOR_USE_HALFVEC,
+    PGVECTOR_INSERT_BATCH_SIZE,
+    PGVECTOR_USE_COPY,
+    PGVECTOR_PARTITION_COUNT,
+    PGVECTOR_PARTITION_MIGRATE,
+    PGVECTOR_INDEX_QUANTIZATION,
+    PGVECTOR_QUANTIZATION_OVERSAMPLING,
 )
 
 
@@ -57,11 +72,44 @@ USE_HALFVEC = PGVECTOR_USE_HALFVEC
 
 VECTOR_TYPE_FACTORY = HALFVEC if USE_HALFVEC else Vector
 VECTOR_OPCLASS = "halfvec_cosine_ops" if USE_HALFVEC else "vector_cosine_ops"
+
+# A halfvec column is already stored at half precision, so only binary
+# quantization changes what the index is built on
+INDEX_QUANTIZATION = (
+    ""
+    if USE_HALFVEC and PGVECTOR_INDEX_QUANTIZATION == "halfvec"
+    else PGVECTOR_INDEX_QUANTIZATION
+)
 Base = declarative_base()
 
 log = logging.getLogger(__name__)
 
 
+def quantize(vector_expr, quantization: str):
+    """Cast a vector expression to the representation the index is built on."""
+    if quantization == "halfvec":
+        return cast(vector_expr, HALFVEC(VECTOR_LENGTH))
+    if quantization == "bit":
+        return cast(func.binary_quantize(vector_expr), BIT(VECTOR_LENGTH))
+    return vector_expr
+
+
+def quantized_distance(vector_expr, query_expr, quantization: str):
+    vector_expr = quantize(vector_expr, quantization)
+    query_expr = quantize(query_expr, quantization)
+    if quantization == "bit":
+        return vector_expr.hamming_distance(query_expr)
+    return vector_expr.cosine_distance(query_expr)
+
+
+def vector_index_expression(quantization: str) -> str:
+    if quantization == "halfvec":
+        return f"((vector::halfvec({VECTOR_LENGTH})) halfvec_cosine_ops)"
+    if quantization == "bit":
+        return f"((binary_quantize(vector)::bit({VECTOR_LENGTH})) bit_hamming_ops)"
+    return f"(vector {VECTOR_OPCLASS})"
+
+
 def pgcrypto_encrypt(val, key):
     return func.pgp_sym_encrypt(val, literal(key))
 
@@ -70,6 +118,77 @@ def pgcrypto_decrypt(col, key, outtype="text"):
     return func.cast(func.pgp_sym_decrypt(col, literal(key)), outtype)
 
 
+COPY_STATEMENT = (
+    "COPY document_chunk (id, vector, collection_name, text, vmetadata) FROM STDIN"
+)
+
+
+def async_db_url(db_url: str) -> URL:
+    """The asyncpg form of a psycopg2 database URL."""
+    url = make_url(db_url)
+    query = dict(url.query)
+    if "sslmode" in query:
+        # asyncpg names this connect argument "ssl"
+        query["ssl"] = query.pop("sslmode")
+    return url.set(drivername="postgresql+asyncpg", query=query)
+
+
+def _copy_field(value: Optional[str]) -> str:
+    if value is None:
+        return "\\N"
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_text(rows: list[dict]) -> str:
+    """Serialize chunk rows in the COPY text format."""
+    lines = []
+    for row in rows:
+        fields = [
+            row["id"],
+            "[" + ",".join(str(float(value)) for value in row["vector"]) + "]",
+            row["collection_name"],
+            row["text"],
+            json.dumps(row["vmetadata"]) if row["vmetadata"] is not None else None,
+        ]
+        lines.append("\t".join(_copy_field(field) for field in fields) + "\n")
+    return "".join(lines)
+
+
+def encrypted_insert_statement(
+    count: int, upsert: bool = False, conflict_columns: Tuple[str, ...] = ("id",)
+):
+    """Multi-row INSERT for ``count`` encrypted chunks."""
+    rows = ",\n".join(
+        f"(:id_{idx}, :vector_{idx}, :collection_name, "
+        f"pgp_sym_encrypt(:text_{idx}, :key), "
+        f"pgp_sym_encrypt(:metadata_text_{idx}, :key))"
+        for idx in range(count)
+    )
+    conflict_target = ", ".join(conflict_columns)
+    if upsert:
+        on_conflict = f"""ON CONFLICT ({conflict_target}) DO UPDATE SET
+              vector = EXCLUDED.vector,
+              collection_name = EXCLUDED.collection_name,
+              text = EXCLUDED.text,
+              vmetadata = EXCLUDED.vmetadata"""
+    else:
+        on_conflict = f"ON CONFLICT ({conflict_target}) DO NOTHING"
+
+    return text(
+        f"""
+        INSERT INTO document_chunk
+        (id, vector, collection_name, text, vmetadata)
+        VALUES {rows}
+        {on_conflict}
+        """
+    )
+
+
 class DocumentChunk(Base):
     __tablename__ = "document_chunk"
 
@@ -117,6 +236,14 @@ class PgvectorClient(VectorDBBase):
             )
             self.session = scoped_session(SessionLocal)
 
+        # Async reads use asyncpg when it is installed (the "postgres" extra),
+        # and otherwise run the sync methods on the shared executor
+        self.async_db_url = (
+            async_db_url(PGVECTOR_DB_URL)
+            if PGVECTOR_DB_URL and ASYNCPG_AVAILABLE
+            else None
+        )
+
         try:
             # Ensure the pgvector extension is available
             # Use a conditional check to avoid permission issues on Azure PostgreSQL
@@ -158,6 +285,14 @@ class PgvectorClient(VectorDBBase):
             # Check vector length consistency
             self.check_vector_length()
 
+            # Partitioned tables need the partition key in every unique
+            # constraint, so the primary key becomes (id, collection_name)
+            self.conflict_columns: Tuple[str, ...] = ("id",)
+            if PGVECTOR_PARTITION_COUNT > 0:
+                self._ensure_partitioned_table()
+            if self._table_kind() == "p":
+                self.conflict_columns = ("id", "collection_name")
+
             # Create the tables if they do not exist
             # Base.metadata.create_all requires a bind (engine or connection)
             # Get the connection from the session
@@ -180,6 +315,115 @@ class PgvectorClient(VectorDBBase):
             log.exception(f"Error during initialization: {e}")
             raise
 
+    def _table_kind(self) -> Optional[str]:
+        """relkind of document_chunk: 'r' for a plain table, 'p' if partitioned."""
+        return self.session.execute(
+            text(
+                """
+                SELECT c.relkind
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = current_schema()
+                  AND c.relname = 'document_chunk'
+                """
+            )
+        ).scalar()
+
+    def _ensure_partitioned_table(self) -> None:
+        kind = self._table_kind()
+
+        if kind == "p":
+            partitions = self.session.execute(
+                text(
+                    "SELECT count(*) FROM pg_inherits "
+                    "WHERE inhparent = 'document_chunk'::regclass"
+                )
+            ).scalar()
+            if partitions != PGVECTOR_PARTITION_COUNT:
+                raise RuntimeError(
+                    f"Table 'document_chunk' has {partitions} partitions but PGVECTOR_PARTITION_COUNT "
+                    f"is {PGVECTOR_PARTITION_COUNT}. Changing the partition count requires moving every "
+                    "row; restore the previous value before restarting Open WebUI."
+                )
+            return
+
+        if kind == "r":
+            if not PGVECTOR_PARTITION_MIGRATE:
+                raise RuntimeError(
+                    "PGVECTOR_PARTITION_COUNT is set but 'document_chunk' is an existing unpartitioned table. "
+                    "Set PGVECTOR_PARTITION_MIGRATE=true to move its rows into partitions on startup "
+                    "(this rewrites the table and rebuilds the vector index), or unset PGVECTOR_PARTITION_COUNT."
+                )
+            self._migrate_to_partitioned_table()
+            return
+
+        self._create_partitioned_table()
+
+    def _create_partitioned_table(self) -> None:
+        vector_type = f"{'halfvec' if USE_HALFVEC else 'vector'}({VECTOR_LENGTH})"
+        text_type, metadata_type = (
+            ("bytea", "bytea") if PGVECTOR_PGCRYPTO else ("text", "jsonb")
+        )
+
+        self.session.execute(
+            text(
+                f"""
+                CREATE TABLE document_chunk (
+                    id text NOT NULL,
+                    vector {vector_type},
+                    collection_name text NOT NULL,
+                    text {text_type},
+                    vmetadata {metadata_type},
+                    PRIMARY KEY (id, collection_name)
+                ) PARTITION BY HASH (collection_name)
+                """
+            )
+        )
+        for remainder in range(PGVECTOR_PARTITION_COUNT):
+            self.session.execute(
+                text(
+                    f"CREATE TABLE document_chunk_p{remainder} "
+                    f"PARTITION OF document_chunk FOR VALUES WITH "
+                    f"(MODULUS {PGVECTOR_PARTITION_COUNT}, REMAINDER {remainder})"
+                )
+            )
+        log.info(
+            f"Created 'document_chunk' with {PGVECTOR_PARTITION_COUNT} hash partitions."
+        )
+
+    def _migrate_to_partitioned_table(self) -> None:
+        log.info("Migrating 'document_chunk' to a partitioned table...")
+
+        # Free the table and index names for the partitioned table; the
+        # vector index is rebuilt once after the rows have been copied.
+        self.session.execute(
+            text("ALTER TABLE document_chunk RENAME TO document_chunk_unpartitioned")
+        )
+        for index_name in (
+            "document_chunk_pkey",
+            "idx_document_chunk_vector",
+            "idx_document_chunk_collection_name",
+        ):
+            self.session.execute(
+                text(
+                    f"ALTER INDEX IF EXISTS {index_name} "
+                    f"RENAME TO {index_name.replace('document_chunk', 'document_chunk_unpartitioned')}"
+                )
+            )
+
+        self._create_partitioned_table()
+        migrated = self.session.execute(
+            text(
+                """
+                INSERT INTO document_chunk (id, vector, collection_name, text, vmetadata)
+                SELECT id, vector, collection_name, text, vmetadata
+                FROM document_chunk_unpartitioned
+                """
+            )
+        ).rowcount
+        self.session.execute(text("DROP TABLE document_chunk_unpartitioned"))
+        log.info(f"Moved {migrated} rows into the partitioned 'document_chunk' table.")
+
     @staticmethod
     def _extract_index_method(index_def: Optional[str]) -> Optional[str]:
         if not index_def:
@@ -213,6 +457,17 @@ class PgvectorClient(VectorDBBase):
 
         return index_method, index_options
 
+    @staticmethod
+    def _extract_index_quantization(index_def: Optional[str]) -> str:
+        if not index_def:
+            return ""
+        index_def = index_def.lower()
+        if "bit_hamming_ops" in index_def:
+            return "bit"
+        if "::halfvec" in index_def:
+            return "halfvec"
+        return ""
+
     def _ensure_vector_index(self, index_method: str, index_options: str) -> None:
         index_name = "idx_document_chunk_vector"
         existing_index_def = self.session.execute(
@@ -237,19 +492,39 @@ class PgvectorClient(VectorDBBase):
                 "and recreate it with the new method before restarting Open WebUI."
             )
 
+        # Searches must order by the expression the index was built on, so an
+        # existing index keeps being used as is until it is rebuilt
+        self.index_quantization = INDEX_QUANTIZATION
+        if existing_index_def:
+            self.index_quantization = self._extract_index_quantization(
+                existing_index_def
+            )
+            if self.index_quantization != INDEX_QUANTIZATION:
+                log.warning(
+                    f"Existing pgvector index '{index_name}' uses quantization "
+                    f"'{self.index_quantization or 'none'}' but PGVECTOR_INDEX_QUANTIZATION is "
+                    f"'{INDEX_QUANTIZATION or 'none'}'. Run 'open-webui reencode --quantize' to rebuild it."
+                )
+
         if not existing_index_def:
             index_sql = (
                 f"CREATE INDEX IF NOT EXISTS {index_name} "
-                f"ON document_chunk USING {index_method} (vector {VECTOR_OPCLASS})"
+                f"ON document_chunk USING {index_method} "
+                f"{vector_index_expression(INDEX_QUANTIZATION)}"
             )
             if index_options:
                 index_sql = f"{index_sql} {index_options}"
             self.session.execute(text(index_sql))
             log.info(
-                "Ensured vector index '%s' using %s%s.",
+                "Ensured vector index '%s' using %s%s%s.",
                 index_name,
                 index_method,
                 f" {index_options}" if index_options else "",
+                (
+                    f" over {INDEX_QUANTIZATION} quantized vectors"
+                    if INDEX_QUANTIZATION
+                    else ""
+                ),
             )
 
     def check_vector_length(self) -> None:
@@ -301,55 +576,81 @@ class PgvectorClient(VectorDBBase):
             vector = vector[:VECTOR_LENGTH]
         return vector
 
+    def _batches(self, items: list) -> list:
+        batch_size = max(1, PGVECTOR_INSERT_BATCH_SIZE)
+        return [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+    def _encrypted_insert(
+        self, collection_name: str, items: List[VectorItem], upsert: bool = False
+    ) -> None:
+        for batch in self._batches(items):
+            if upsert:
+                # A row may only be updated once per statement
+                batch = list({item["id"]: item for item in batch}.values())
+
+            params = {"collection_name": collection_name, "key": PGVECTOR_PGCRYPTO_KEY}
+            for idx, item in enumerate(batch):
+                params[f"id_{idx}"] = item["id"]
+                params[f"vector_{idx}"] = self.adjust_vector_length(item["vector"])
+                params[f"text_{idx}"] = item["text"]
+                # Ensure metadata is converted to its JSON text representation
+                params[f"metadata_text_{idx}"] = json.dumps(item["metadata"])
+
+            self.session.execute(
+                encrypted_insert_statement(
+                    len(batch), upsert=upsert, conflict_columns=self.conflict_columns
+                ),
+                params,
+            )
+
+    def _copy_insert(self, rows: list[dict]) -> bool:
+        """
+        Bulk load rows with COPY on the session's connection. Returns False if
+        the driver does not expose COPY, so the caller can use INSERT instead.
+        """
+        dbapi_connection = self.session.connection().connection.driver_connection
+        cursor = dbapi_connection.cursor()
+        try:
+            if hasattr(cursor, "copy_expert"):
+                # psycopg2
+                for batch in self._batches(rows):
+                    cursor.copy_expert(COPY_STATEMENT, io.StringIO(copy_text(batch)))
+            elif hasattr(cursor, "copy"):
+                # psycopg 3
+                for batch in self._batches(rows):
+                    with cursor.copy(COPY_STATEMENT) as copy:
+                        copy.write(copy_text(batch))
+            else:
+                return False
+        finally:
+            cursor.close()
+        return True
+
     def insert(self, collection_name: str, items: List[VectorItem]) -> None:
         try:
             if PGVECTOR_PGCRYPTO:
-                for item in items:
-                    vector = self.adjust_vector_length(item["vector"])
-                    # Use raw SQL for BYTEA/pgcrypto
-                    # Ensure metadata is converted to its JSON text representation
-                    json_metadata = json.dumps(item["metadata"])
-                    self.session.execute(
-                        text(
-                            """
-                            INSERT INTO document_chunk
-                            (id, vector, collection_name, text, vmetadata)
-                            VALUES (
-                                :id, :vector, :collection_name,
-                                pgp_sym_encrypt(:text, :key),
-                                pgp_sym_encrypt(:metadata_text, :key)
-                            )
-                            ON CONFLICT (id) DO NOTHING
-                        """
-                        ),
-                        {
-                            "id": item["id"],
-                            "vector": vector,
-                            "collection_name": collection_name,
-                            "text": item["text"],
-                            "metadata_text": json_metadata,
-                            "key": PGVECTOR_PGCRYPTO_KEY,
-                        },
-                    )
+                # Use raw SQL for BYTEA/pgcrypto
+                self._encrypted_insert(collection_name, items)
                 self.session.commit()
                 log.info(f"Encrypted & inserted {len(items)} into '{collection_name}'")
 
             else:
-                new_items = []
-                for item in items:
-                    vector = self.adjust_vector_length(item["vector"])
-                    new_chunk = DocumentChunk(
-                        id=item["id"],
-                        vector=vector,
-                        collection_name=collection_name,
-                        text=item["text"],
-                        vmetadata=process_metadata(item["metadata"]),
-                    )
-                    new_items.append(new_chunk)
-                self.session.bulk_save_objects(new_items)
+                rows = [
+                    {
+                        "id": item["id"],
+                        "vector": self.adjust_vector_length(item["vector"]),
+                        "collection_name": collection_name,
+                        "text": item["text"],
+                        "vmetadata": process_metadata(item["metadata"]),
+                    }
+                    for item in items
+                ]
+                if not (PGVECTOR_USE_COPY and self._copy_insert(rows)):
+                    for batch in self._batches(rows):
+                        self.session.execute(DocumentChunk.__table__.insert(), batch)
                 self.session.commit()
                 log.info(
-                    f"Inserted {len(new_items)} items into collection '{collection_name}'."
+                    f"Inserted {len(rows)} items into collection '{collection_name}'."
                 )
         except Exception as e:
             self.session.rollback()
@@ -359,61 +660,36 @@ class PgvectorClient(VectorDBBase):
     def upsert(self, collection_name: str, items: List[VectorItem]) -> None:
         try:
             if PGVECTOR_PGCRYPTO:
-                for item in items:
-                    vector = self.adjust_vector_length(item["vector"])
-                    json_metadata = json.dumps(item["metadata"])
-                    self.session.execute(
-                        text(
-                            """
-                            INSERT INTO document_chunk
-                            (id, vector, collection_name, text, vmetadata)
-                            VALUES (
-                                :id, :vector, :collection_name,
-                                pgp_sym_encrypt(:text, :key),
-                                pgp_sym_encrypt(:metadata_text, :key)
-                            )
-                            ON CONFLICT (id) DO UPDATE SET
-                              vector = EXCLUDED.vector,
-                              collection_name = EXCLUDED.collection_name,
-                              text = EXCLUDED.text,
-                              vmetadata = EXCLUDED.vmetadata
-                        """
-                        ),
-                        {
-                            "id": item["id"],
-                            "vector": vector,
-                            "collection_name": collection_name,
-                            "text": item["text"],
-                            "metadata_text": json_metadata,
-                            "key": PGVECTOR_PGCRYPTO_KEY,
-                        },
-                    )
+                self._encrypted_insert(collection_name, items, upsert=True)
                 self.session.commit()
                 log.info(f"Encrypted & upserted {len(items)} into '{collection_name}'")
             else:
-                for item in items:
-                    vector = self.adjust_vector_length(item["vector"])
-                    existing = (
-                        self.session.query(DocumentChunk)
-                        .filter(DocumentChunk.id == item["id"])
-                        .first()
+                for batch in self._batches(items):
+                    # A row may only be updated once per statement
+                    batch = list({item["id"]: item for item in batch}.values())
+                    stmt = pg_insert(DocumentChunk.__table__).values(
+                        [
+                            {
+                                "id": item["id"],
+                                "vector": self.adjust_vector_length(item["vector"]),
+                                "collection_name": collection_name,
+                                "text": item["text"],
+                                "vmetadata": process_metadata(item["metadata"]),
+                            }
+                            for item in batch
+                        ]
                     )
-                    if existing:
-                        existing.vector = vector
-                        existing.text = item["text"]
-                        existing.vmetadata = process_metadata(item["metadata"])
-                        existing.collection_name = (
-                            collection_name  # Update collection_name if necessary
-                        )
-                    else:
-                        new_chunk = DocumentChunk(
-                            id=item["id"],
-                            vector=vector,
-                            collection_name=collection_name,
-                            text=item["text"],
-                            vmetadata=process_metadata(item["metadata"]),
+                    self.session.execute(
+                        stmt.on_conflict_do_update(
+                            index_elements=list(self.conflict_columns),
+                            set_={
+                                "vector": stmt.excluded.vector,
+                                "collection_name": stmt.excluded.collection_name,
+                                "text": stmt.excluded.text,
+                                "vmetadata": stmt.excluded.vmetadata,
+                            },
                         )
-                        self.session.add(new_chunk)
+                    )
                 self.session.commit()
                 log.info(
                     f"Upserted {len(items)} items into collection '{collection_name}'."
@@ -436,142 +712,157 @@ class PgvectorClient(VectorDBBase):
 
             # Adjust query vectors to VECTOR_LENGTH
             vectors = [self.adjust_vector_length(vector) for vector in vectors]
-            num_queries = len(vectors)
-
-            def vector_expr(vector):
-                return cast(array(vector), VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
-
-            # Create the values for query vectors
-            qid_col = column("qid", Integer)
-            q_vector_col = column("q_vector", VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
-            query_vectors = (
-                values(qid_col, q_vector_col)
-                .data(
-                    [(idx, vector_expr(vector)) for idx, vector in enumerate(vectors)]
-                )
-                .alias("query_vectors")
-            )
+            stmt = self._search_statement(collection_name, vectors, filter, limit)
 
-            result_fields = [
-                DocumentChunk.id,
-            ]
-            if PGVECTOR_PGCRYPTO:
-                result_fields.append(
-                    pgcrypto_decrypt(
-                        DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text
-                    ).label("text")
-                )
-                result_fields.append(
-                    pgcrypto_decrypt(
-                        DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
-                    ).label("vmetadata")
-                )
-            else:
-                result_fields.append(DocumentChunk.text)
-                result_fields.append(DocumentChunk.vmetadata)
+            results = self.session.execute(stmt).all()
+
+            self.session.rollback()  # read-only transaction
+            return self._rows_to_search_result(results, len(vectors))
+        except Exception as e:
+            self.session.rollback()
+            log.exception(f"Error during search: {e}")
+            return None
+
+    def _search_statement(
+        self,
+        collection_name: str,
+        vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = 10,
+    ):
+        def vector_expr(vector):
+            return cast(array(vector), VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
+
+        # Create the values for query vectors
+        qid_col = column("qid", Integer)
+        q_vector_col = column("q_vector", VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
+        query_vectors = (
+            values(qid_col, q_vector_col)
+            .data([(idx, vector_expr(vector)) for idx, vector in enumerate(vectors)])
+            .alias("query_vectors")
+        )
+
+        result_fields = [
+            DocumentChunk.id,
+        ]
+        if PGVECTOR_PGCRYPTO:
             result_fields.append(
-                (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector)).label(
-                    "distance"
+                pgcrypto_decrypt(DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text).label(
+                    "text"
                 )
             )
-
-            # Build the lateral subquery for each query vector
-            where_clauses = [DocumentChunk.collection_name == collection_name]
-
-            # Apply metadata filter if provided
-            if filter:
-                for key, value in filter.items():
-                    if isinstance(value, dict) and "$in" in value:
-                        # Handle $in operator: {"field": {"$in": [values]}}
-                        in_values = value["$in"]
-                        if PGVECTOR_PGCRYPTO:
-                            where_clauses.append(
-                                pgcrypto_decrypt(
-                                    DocumentChunk.vmetadata,
-                                    PGVECTOR_PGCRYPTO_KEY,
-                                    JSONB,
-                                )[key].astext.in_([str(v) for v in in_values])
-                            )
-                        else:
-                            where_clauses.append(
-                                DocumentChunk.vmetadata[key].astext.in_(
-                                    [str(v) for v in in_values]
-                                )
-                            )
+            result_fields.append(
+                pgcrypto_decrypt(
+                    DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
+                ).label("vmetadata")
+            )
+        else:
+            result_fields.append(DocumentChunk.text)
+            result_fields.append(DocumentChunk.vmetadata)
+        result_fields.append(
+            (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector)).label(
+                "distance"
+            )
+        )
+
+        # Build the lateral subquery for each query vector
+        where_clauses = [DocumentChunk.collection_name == collection_name]
+
+        # Apply metadata filter if provided
+        if filter:
+            for key, value in filter.items():
+                if isinstance(value, dict) and "$in" in value:
+                    # Handle $in operator: {"field": {"$in": [values]}}
+                    in_values = value["$in"]
+                    if PGVECTOR_PGCRYPTO:
+                        where_clauses.append(
+                            pgcrypto_decrypt(
+                                DocumentChunk.vmetadata,
+                                PGVECTOR_PGCRYPTO_KEY,
+                                JSONB,
+                            )[key].astext.in_([str(v) for v in in_values])
+                        )
                     else:
-                        # Handle simple equality: {"field": "value"}
-                        if PGVECTOR_PGCRYPTO:
-                            where_clauses.append(
-                                pgcrypto_decrypt(
-                                    DocumentChunk.vmetadata,
-                                    PGVECTOR_PGCRYPTO_KEY,
-                                    JSONB,
-                                )[key].astext
-                                == str(value)
-                            )
-                        else:
-                            where_clauses.append(
-                                DocumentChunk.vmetadata[key].astext == str(value)
+                        where_clauses.append(
+                            DocumentChunk.vmetadata[key].astext.in_(
+                                [str(v) for v in in_values]
                             )
+                        )
+                else:
+                    # Handle simple equality: {"field": "value"}
+                    if PGVECTOR_PGCRYPTO:
+                        where_clauses.append(
+                            pgcrypto_decrypt(
+                                DocumentChunk.vmetadata,
+                                PGVECTOR_PGCRYPTO_KEY,
+                                JSONB,
+                            )[key].astext
+                            == str(value)
+                        )
+                    else:
+                        where_clauses.append(
+                            DocumentChunk.vmetadata[key].astext == str(value)
+                        )
 
-            subq = (
-                select(*result_fields)
-                .where(*where_clauses)
-                .order_by(
-                    (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector))
+        subq = select(*result_fields).where(*where_clauses)
+        if self.index_quantization and limit is not None:
+            # Walk the compact index for an oversampled candidate set, then
+            # rank the candidates by their full precision distance
+            candidates = (
+                subq.order_by(
+                    quantized_distance(
+                        DocumentChunk.vector,
+                        query_vectors.c.q_vector,
+                        self.index_quantization,
+                    )
                 )
+                .limit(limit * max(1, PGVECTOR_QUANTIZATION_OVERSAMPLING))
+                .correlate(query_vectors)
+                .subquery("candidates")
+            )
+            subq = select(candidates).order_by(candidates.c.distance).limit(limit)
+        else:
+            subq = subq.order_by(
+                (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector))
             )
             if limit is not None:
                 subq = subq.limit(limit)
-            subq = subq.lateral("result")
-
-            # Build the main query by joining query_vectors and the lateral subquery
-            stmt = (
-                select(
-                    query_vectors.c.qid,
-                    subq.c.id,
-                    subq.c.text,
-                    subq.c.vmetadata,
-                    subq.c.distance,
-                )
-                .select_from(query_vectors)
-                .join(subq, true())
-                .order_by(query_vectors.c.qid, subq.c.distance)
+        subq = subq.lateral("result")
+
+        # Build the main query by joining query_vectors and the lateral subquery
+        stmt = (
+            select(
+                query_vectors.c.qid,
+                subq.c.id,
+                subq.c.text,
+                subq.c.vmetadata,
+                subq.c.distance,
             )
+            .select_from(query_vectors)
+            .join(subq, true())
+            .order_by(query_vectors.c.qid, subq.c.distance)
+        )
+        return stmt
 
-            result_proxy = self.session.execute(stmt)
-            results = result_proxy.all()
-
-            ids = [[] for _ in range(num_queries)]
-            distances = [[] for _ in range(num_queries)]
-            documents = [[] for _ in range(num_queries)]
-            metadatas = [[] for _ in range(num_queries)]
-
-            if not results:
-                return SearchResult(
-                    ids=ids,
-                    distances=distances,
-                    documents=documents,
-                    metadatas=metadatas,
-                )
-
-            for row in results:
-                qid = int(row.qid)
-                ids[qid].append(row.id)
-                # normalize and re-orders pgvec distance from [2, 0] to [0, 1] score range
-                # https://github.com/pgvector/pgvector?tab=readme-ov-file#querying
-                distances[qid].append((2.0 - row.distance) / 2.0)
-                documents[qid].append(row.text)
-                metadatas[qid].append(row.vmetadata)
-
-            self.session.rollback()  # read-only transaction
-            return SearchResult(
-                ids=ids, distances=distances, documents=documents, metadatas=metadatas
-            )
-        except Exception as e:
-            self.session.rollback()
-            log.exception(f"Error during search: {e}")
-            return None
+    @staticmethod
+    def _rows_to_search_result(results, num_queries: int) -> SearchResult:
+        ids = [[] for _ in range(num_queries)]
+        distances = [[] for _ in range(num_queries)]
+        documents = [[] for _ in range(num_queries)]
+        metadatas = [[] for _ in range(num_queries)]
+
+        for row in results:
+            qid = int(row.qid)
+            ids[qid].append(row.id)
+            # normalize and re-orders pgvec distance from [2, 0] to [0, 1] score range
+            # https://github.com/pgvector/pgvector?tab=readme-ov-file#querying
+            distances[qid].append((2.0 - row.distance) / 2.0)
+            documents[qid].append(row.text)
+            metadatas[qid].append(row.vmetadata)
+
+        return SearchResult(
+            ids=ids, distances=distances, documents=documents, metadatas=metadatas
+        )
 
     def query(
         self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
@@ -633,6 +924,34 @@ class PgvectorClient(VectorDBBase):
             log.exception(f"Error during query: {e}")
             return None
 
+    def query_vectors(
+        self, collection_name: str, filter: Optional[Dict[str, Any]]
+    ) -> Optional[List[VectorItem]]:
+        try:
+            stmt = select(*self._chunk_fields(), DocumentChunk.vector).where(
+                DocumentChunk.collection_name == collection_name,
+                *[
+                    self._metadata_field(key) == str(value)
+                    for key, value in (filter or {}).items()
+                ],
+            )
+            results = self.session.execute(stmt).all()
+            self.session.rollback()  # read-only transaction
+        except Exception as e:
+            self.session.rollback()
+            log.exception(f"Error during query_vectors: {e}")
+            return None
+
+        return [
+            {
+                "id": row.id,
+                "text": row.text,
+                "vector": [float(value) for value in row.vector],
+                "metadata": row.vmetadata,
+            }
+            for row in results
+        ]
+
     def get(
         self, collection_name: str, limit: Optional[int] = None
     ) -> Optional[GetResult]:
@@ -677,6 +996,114 @@ class PgvectorClient(VectorDBBase):
             log.exception(f"Error during get: {e}")
             return None
 
+    @property
+    def async_engine(self) -> AsyncEngine:
+        def create_engine_for_loop():
+            if not isinstance(PGVECTOR_POOL_SIZE, int):
+                return create_async_engine(self.async_db_url, pool_pre_ping=True)
+            if PGVECTOR_POOL_SIZE <= 0:
+                return create_async_engine(
+                    self.async_db_url, pool_pre_ping=True, poolclass=NullPool
+                )
+            return create_async_engine(
+                self.async_db_url,
+                pool_size=PGVECTOR_POOL_SIZE,
+                max_overflow=PGVECTOR_POOL_MAX_OVERFLOW,
+                pool_timeout=PGVECTOR_POOL_TIMEOUT,
+                pool_recycle=PGVECTOR_POOL_RECYCLE,
+                pool_pre_ping=True,
+            )
+
+        return self._get_async_client(create_engine_for_loop)
+
+    async def _afetch(self, stmt) -> list:
+        async with self.async_engine.connect() as connection:
+            return (await connection.execute(stmt)).all()
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        if self.async_db_url and vectors:
+            try:
+                vectors = [self.adjust_vector_length(vector) for vector in vectors]
+                results = await self._afetch(
+                    self._search_statement(collection_name, vectors, filter, limit)
+                )
+                return self._rows_to_search_result(results, len(vectors))
+            except Exception as e:
+                log.exception(f"Error during async search, retrying sync: {e}")
+        return await super().asearch(collection_name, vectors, filter, limit)
+
+    async def aquery(
+        self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        if self.async_db_url:
+            try:
+                stmt = select(*self._chunk_fields()).where(
+                    DocumentChunk.collection_name == collection_name,
+                    *[
+                        self._metadata_field(key) == str(value)
+                        for key, value in filter.items()
+                    ],
+                )
+                if limit is not None:
+                    stmt = stmt.limit(limit)
+                results = await self._afetch(stmt)
+                if not results:
+                    return None
+                return self._rows_to_get_result(results)
+            except Exception as e:
+                log.exception(f"Error during async query, retrying sync: {e}")
+        return await super().aquery(collection_name, filter, limit)
+
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        if self.async_db_url:
+            try:
+                results = await self._afetch(
+                    select(*self._chunk_fields()).where(
+                        DocumentChunk.collection_name == collection_name
+                    )
+                )
+                # Same as get: only the pgcrypto path returns an empty result
+                if not results and not PGVECTOR_PGCRYPTO:
+                    return None
+                return self._rows_to_get_result(results)
+            except Exception as e:
+                log.exception(f"Error during async get, retrying sync: {e}")
+        return await super().aget(collection_name)
+
+    @staticmethod
+    def _rows_to_get_result(results) -> GetResult:
+        return GetResult(
+            ids=[[row.id for row in results]],
+            documents=[[row.text for row in results]],
+            metadatas=[[row.vmetadata for row in results]],
+        )
+
+    def _chunk_fields(self) -> list:
+        if PGVECTOR_PGCRYPTO:
+            return [
+                DocumentChunk.id,
+                pgcrypto_decrypt(DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text).label(
+                    "text"
+                ),
+                pgcrypto_decrypt(
+                    DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
+                ).label("vmetadata"),
+            ]
+        return [DocumentChunk.id, DocumentChunk.text, DocumentChunk.vmetadata]
+
+    def _metadata_field(self, key: str):
+        if PGVECTOR_PGCRYPTO:
+            return pgcrypto_decrypt(
+                DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
+            )[key].astext
+        return DocumentChunk.vmetadata[key].astext
+
     def delete(
         self,
         collection_name: str,
@@ -718,6 +1145,18 @@ class PgvectorClient(VectorDBBase):
             log.exception(f"Error during delete: {e}")
             raise
 
+    def update_quantization(self) -> bool:
+        try:
+            # Rebuilding the index can take a long time on large tables
+            self.session.execute(text("DROP INDEX IF EXISTS idx_document_chunk_vector"))
+            self._ensure_vector_index(*self._vector_index_configuration())
+            self.session.commit()
+            return True
+        except Exception as e:
+            self.session.rollback()
+            log.exception(f"Error rebuilding the vector index: {e}")
+            raise
+
     def reset(self) -> None:
         try:
             deleted = self.session.query(DocumentChunk).delete()
@@ -12,9 +12,7 @@ except ImportError:
     GRPC_AVAILABLE = False
 
 import asyncio  # for async upserts
-import functools  # for partial binding in async tasks
 
-import concurrent.futures  # for parallel batch upserts
 import random  # for jitter in retry backoff
 
 from open_webui.retrieval.vector.main import (
@@ -32,6 +30,11 @@ from open_webui.config import (
     PINECONE_CLOUD,
 )
 from open_webui.retrieval.vector.utils import process_metadata
+from open_webui.retrieval.vector.batching import (
+    asubmit_batches,
+    is_retryable_error,
+    submit_batches,
+)
 
 
 NO_LIMIT = 10000  # Reasonable limit to avoid overwhelming the system
@@ -75,9 +78,6 @@ class PineconeClient(VectorDBBase):
             self.using_grpc = False
             log.info("Using Pinecone HTTP client (gRPC not available)")
 
-        # Persistent executor for batch operations
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
-
         # Create index if it doesn't exist
         self._initialize_index()
 
@@ -132,25 +132,8 @@ class PineconeClient(VectorDBBase):
             try:
                 return operation_func()
             except Exception as e:
-                error_str = str(e).lower()
                 # Check if it's a retryable error (rate limits, network issues, timeouts)
-                is_retryable = any(
-                    keyword in error_str
-                    for keyword in [
-                        "rate limit",
-                        "quota",
-                        "timeout",
-                        "network",
-                        "connection",
-                        "unavailable",
-                        "internal error",
-                        "429",
-                        "500",
-                        "502",
-                        "503",
-                        "504",
-                    ]
-                )
+                is_retryable = is_retryable_error(e)
 
                 if not is_retryable or attempt == max_retries - 1:
                     # Don't retry for non-retryable errors or on final attempt
@@ -268,27 +251,22 @@ class PineconeClient(VectorDBBase):
             log.warning("No items to insert")
             return
 
-        start_time = time.time()
-
         collection_name_with_prefix = self._get_collection_name_with_prefix(
             collection_name
         )
         points = self._create_points(items, collection_name_with_prefix)
 
-        # Parallelize batch inserts for performance
-        executor = self._executor
-        futures = []
-        for i in range(0, len(points), BATCH_SIZE):
-            batch = points[i : i + BATCH_SIZE]
-            futures.append(executor.submit(self.index.upsert, vectors=batch))
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                future.result()
-            except Exception as e:
-                log.error(f"Error inserting batch: {e}")
-                raise
-        elapsed = time.time() - start_time
-        log.debug(f"Insert of {len(points)} vectors took {elapsed:.2f} seconds")
+        # Concurrent batch inserts, each retried with backoff
+        try:
+            submit_batches(
+                "pinecone.insert",
+                lambda batch: self.index.upsert(vectors=batch),
+                points,
+                BATCH_SIZE,
+            )
+        except Exception as e:
+            log.error(f"Error inserting batch: {e}")
+            raise
         log.info(
             f"Successfully inserted {len(points)} vectors in parallel batches "
             f"into '{collection_name_with_prefix}'"
@@ -300,34 +278,29 @@ class PineconeClient(VectorDBBase):
             log.warning("No items to upsert")
             return
 
-        start_time = time.time()
-
         collection_name_with_prefix = self._get_collection_name_with_prefix(
             collection_name
         )
         points = self._create_points(items, collection_name_with_prefix)
 
-        # Parallelize batch upserts for performance
-        executor = self._executor
-        futures = []
-        for i in range(0, len(points), BATCH_SIZE):
-            batch = points[i : i + BATCH_SIZE]
-            futures.append(executor.submit(self.index.upsert, vectors=batch))
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                future.result()
-            except Exception as e:
-                log.error(f"Error upserting batch: {e}")
-                raise
-        elapsed = time.time() - start_time
-        log.debug(f"Upsert of {len(points)} vectors took {elapsed:.2f} seconds")
+        # Concurrent batch upserts, each retried with backoff
+        try:
+            submit_batches(
+                "pinecone.upsert",
+                lambda batch: self.index.upsert(vectors=batch),
+                points,
+                BATCH_SIZE,
+            )
+        except Exception as e:
+            log.error(f"Error upserting batch: {e}")
+            raise
         log.info(
             f"Successfully upserted {len(points)} vectors in parallel batches "
             f"into '{collection_name_with_prefix}'"
         )
 
     async def insert_async(self, collection_name: str, items: List[VectorItem]) -> None:
-        """Async version of insert using asyncio and run_in_executor for improved performance."""
+        """Async version of insert with bounded concurrent batches."""
         if not items:
             log.warning("No items to insert")
             return
@@ -337,29 +310,23 @@ class PineconeClient(VectorDBBase):
         )
         points = self._create_points(items, collection_name_with_prefix)
 
-        # Create batches
-        batches = [
-            points[i : i + BATCH_SIZE] for i in range(0, len(points), BATCH_SIZE)
-        ]
-        loop = asyncio.get_event_loop()
-        tasks = [
-            loop.run_in_executor(
-                None, functools.partial(self.index.upsert, vectors=batch)
+        try:
+            await asubmit_batches(
+                "pinecone.insert",
+                lambda batch: asyncio.to_thread(self.index.upsert, vectors=batch),
+                points,
+                BATCH_SIZE,
             )
-            for batch in batches
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        for result in results:
-            if isinstance(result, Exception):
-                log.error(f"Error in async insert batch: {result}")
-                raise result
+        except Exception as e:
+            log.error(f"Error in async insert batch: {e}")
+            raise
         log.info(
             f"Successfully async inserted {len(points)} vectors in batches "
             f"into '{collection_name_with_prefix}'"
         )
 
     async def upsert_async(self, collection_name: str, items: List[VectorItem]) -> None:
-        """Async version of upsert using asyncio and run_in_executor for improved performance."""
+        """Async version of upsert with bounded concurrent batches."""
         if not items:
             log.warning("No items to upsert")
             return
@@ -369,22 +336,16 @@ class PineconeClient(VectorDBBase):
         )
         points = self._create_points(items, collection_name_with_prefix)
 
-        # Create batches
-        batches = [
-            points[i : i + BATCH_SIZE] for i in range(0, len(points), BATCH_SIZE)
-        ]
-        loop = asyncio.get_event_loop()
-        tasks = [
-            loop.run_in_executor(
-                None, functools.partial(self.index.upsert, vectors=batch)
+        try:
+            await asubmit_batches(
+                "pinecone.upsert",
+                lambda batch: asyncio.to_thread(self.index.upsert, vectors=batch),
+                points,
+                BATCH_SIZE,
             )
-            for batch in batches
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        for result in results:
-            if isinstance(result, Exception):
-                log.error(f"Error in async upsert batch: {result}")
-                raise result
+        except Exception as e:
+            log.error(f"Error in async upsert batch: {e}")
+            raise
         log.info(
             f"Successfully async upserted {len(points)} vectors in batches "
             f"into '{collection_name_with_prefix}'"
@@ -525,16 +486,15 @@ class PineconeClient(VectorDBBase):
 
         try:
             if ids:
-                # Delete by IDs (in batches for large deletions)
-                for i in range(0, len(ids), BATCH_SIZE):
-                    batch_ids = ids[i : i + BATCH_SIZE]
-                    # Note: When deleting by ID, we can't filter by collection_name
-                    # This is a limitation of Pinecone - be careful with ID uniqueness
-                    self.index.delete(ids=batch_ids)
-                    log.debug(
-                        f"Deleted batch of {len(batch_ids)} vectors by ID "
-                        f"from '{collection_name_with_prefix}'"
-                    )
+                # Delete by IDs (in concurrent batches for large deletions)
+                # Note: When deleting by ID, we can't filter by collection_name
+                # This is a limitation of Pinecone - be careful with ID uniqueness
+                submit_batches(
+                    "pinecone.delete",
+                    lambda batch_ids: self.index.delete(ids=batch_ids),
+                    ids,
+                    BATCH_SIZE,
+                )
                 log.info(
                     f"Successfully deleted {len(ids)} vectors by ID "
                     f"from '{collection_name_with_prefix}'"
@@ -574,7 +534,6 @@ class PineconeClient(VectorDBBase):
             pass
         except Exception as e:
             log.warning(f"Failed to clean up Pinecone resources: {e}")
-        self._executor.shutdown(wait=True)
 
     def __enter__(self):
         """Enter context manager."""
@@ -2,7 +2,7 @@ from typing import Optional
 import logging
 from urllib.parse import urlparse
 
-from qdrant_client import QdrantClient as Qclient
+from qdrant_client import AsyncQdrantClient, QdrantClient as Qclient
 from qdrant_client.http.models import PointStruct
 from qdrant_client.models import models
 
@@ -21,6 +21,8 @@ from open_webui.config import (
     QDRANT_COLLECTION_PREFIX,
     QDRANT_TIMEOUT,
     QDRANT_HNSW_M,
+    QDRANT_QUANTIZATION,
+    QDRANT_QUANTIZATION_OVERSAMPLING,
 )
 
 NO_LIMIT = 999999999
@@ -28,6 +30,35 @@ NO_LIMIT = 999999999
 log = logging.getLogger(__name__)
 
 
+def get_quantization_config():
+    """Quantization for new collections; the quantized vectors are kept in RAM."""
+    if QDRANT_QUANTIZATION == "scalar":
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True,
+            )
+        )
+    if QDRANT_QUANTIZATION == "binary":
+        return models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=True)
+        )
+    return None
+
+
+def get_search_params():
+    """Search the quantized vectors and rescore the oversampled candidates."""
+    if not QDRANT_QUANTIZATION:
+        return None
+    return models.SearchParams(
+        quantization=models.QuantizationSearchParams(
+            rescore=True,
+            oversampling=QDRANT_QUANTIZATION_OVERSAMPLING,
+        )
+    )
+
+
 class QdrantClient(VectorDBBase):
     def __init__(self):
         self.collection_prefix = QDRANT_COLLECTION_PREFIX
@@ -49,20 +80,25 @@ class QdrantClient(VectorDBBase):
         http_port = parsed.port or 6333  # default REST port
 
         if self.PREFER_GRPC:
-            self.client = Qclient(
-                host=host,
-                port=http_port,
-                grpc_port=self.GRPC_PORT,
-                prefer_grpc=self.PREFER_GRPC,
-                api_key=self.QDRANT_API_KEY,
-                timeout=self.QDRANT_TIMEOUT,
-            )
+            self.client_kwargs = {
+                "host": host,
+                "port": http_port,
+                "grpc_port": self.GRPC_PORT,
+                "prefer_grpc": self.PREFER_GRPC,
+                "api_key": self.QDRANT_API_KEY,
+                "timeout": self.QDRANT_TIMEOUT,
+            }
         else:
-            self.client = Qclient(
-                url=self.QDRANT_URI,
-                api_key=self.QDRANT_API_KEY,
-                timeout=QDRANT_TIMEOUT,
-            )
+            self.client_kwargs = {
+                "url": self.QDRANT_URI,
+                "api_key": self.QDRANT_API_KEY,
+                "timeout": QDRANT_TIMEOUT,
+            }
+        self.client = Qclient(**self.client_kwargs)
+
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        return self._get_async_client(lambda: AsyncQdrantClient(**self.client_kwargs))
 
     def _result_to_get_result(self, points) -> GetResult:
         ids = []
@@ -95,6 +131,7 @@ class QdrantClient(VectorDBBase):
             hnsw_config=models.HnswConfigDiff(
                 m=self.QDRANT_HNSW_M,
             ),
+            quantization_config=get_quantization_config(),
         )
 
         # Create payload indexes for efficient filtering
@@ -152,21 +189,43 @@ class QdrantClient(VectorDBBase):
         limit: int = 10,
     ) -> Optional[SearchResult]:
         # Search for the nearest neighbor items based on the vectors and return 'limit' number of results.
-        if limit is None:
-            limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
-
         query_response = self.client.query_points(
-            collection_name=f"{self.collection_prefix}_{collection_name}",
-            query=vectors[0],
-            limit=limit,
+            **self._search_kwargs(collection_name, vectors, filter, limit)
         )
-        get_result = self._result_to_get_result(query_response.points)
+        return self._points_to_search_result(query_response.points)
+
+    def _search_kwargs(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        filter: Optional[dict],
+        limit: Optional[int],
+    ) -> dict:
+        conditions = []
+        for key, value in (filter or {}).items():
+            if isinstance(value, dict) and "$in" in value:
+                match = models.MatchAny(any=value["$in"])
+            else:
+                match = models.MatchValue(value=value)
+            conditions.append(models.FieldCondition(key=f"metadata.{key}", match=match))
+
+        return {
+            "collection_name": f"{self.collection_prefix}_{collection_name}",
+            "query": vectors[0],
+            "query_filter": models.Filter(must=conditions) if conditions else None,
+            # otherwise qdrant would set limit to 10!
+            "limit": NO_LIMIT if limit is None else limit,
+            "search_params": get_search_params(),
+        }
+
+    def _points_to_search_result(self, points) -> SearchResult:
+        get_result = self._result_to_get_result(points)
         return SearchResult(
             ids=get_result.ids,
             documents=get_result.documents,
             metadatas=get_result.metadatas,
             # qdrant distance is [-1, 1], normalize to [0, 1]
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
+            distances=[[(point.score + 1.0) / 2.0 for point in points]],
         )
 
     def query(self, collection_name: str, filter: dict, limit: Optional[int] = None):
@@ -174,33 +233,103 @@ class QdrantClient(VectorDBBase):
         if not self.has_collection(collection_name):
             return None
         try:
-            if limit is None:
-                limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
+            points = self.client.scroll(
+                **self._query_kwargs(collection_name, filter, limit)
+            )
+            return self._result_to_get_result(points[0])
+        except Exception as e:
+            log.exception(f"Error querying a collection '{collection_name}': {e}")
+            return None
 
-            field_conditions = []
-            for key, value in filter.items():
-                field_conditions.append(
+    def _query_kwargs(
+        self, collection_name: str, filter: dict, limit: Optional[int]
+    ) -> dict:
+        field_conditions = []
+        for key, value in filter.items():
+            field_conditions.append(
+                models.FieldCondition(
+                    key=f"metadata.{key}", match=models.MatchValue(value=value)
+                )
+            )
+
+        return {
+            "collection_name": f"{self.collection_prefix}_{collection_name}",
+            "scroll_filter": models.Filter(should=field_conditions),
+            # otherwise qdrant would set limit to 10!
+            "limit": NO_LIMIT if limit is None else limit,
+        }
+
+    def query_vectors(
+        self, collection_name: str, filter: Optional[dict]
+    ) -> Optional[list[VectorItem]]:
+        if not self.has_collection(collection_name):
+            return None
+
+        points, _ = self.client.scroll(
+            collection_name=f"{self.collection_prefix}_{collection_name}",
+            scroll_filter=models.Filter(
+                must=[
                     models.FieldCondition(
                         key=f"metadata.{key}", match=models.MatchValue(value=value)
                     )
-                )
+                    for key, value in (filter or {}).items()
+                ]
+            ),
+            limit=NO_LIMIT,
+            with_vectors=True,
+        )
+        return [
+            {
+                "id": str(point.id),
+                "text": point.payload["text"],
+                "vector": point.vector,
+                "metadata": point.payload["metadata"],
+            }
+            for point in points
+        ]
 
-            points = self.client.scroll(
-                collection_name=f"{self.collection_prefix}_{collection_name}",
-                scroll_filter=models.Filter(should=field_conditions),
-                limit=limit,
+    def get(self, collection_name: str) -> Optional[GetResult]:
+        # Get all the items in the collection.
+        points = self.client.scroll(**self._get_kwargs(collection_name))
+        return self._result_to_get_result(points[0])
+
+    def _get_kwargs(self, collection_name: str) -> dict:
+        return {
+            "collection_name": f"{self.collection_prefix}_{collection_name}",
+            "limit": NO_LIMIT,  # otherwise qdrant would set limit to 10!
+        }
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        query_response = await self.async_client.query_points(
+            **self._search_kwargs(collection_name, vectors, filter, limit)
+        )
+        return self._points_to_search_result(query_response.points)
+
+    async def aquery(
+        self, collection_name: str, filter: dict, limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        try:
+            if not await self.async_client.collection_exists(
+                f"{self.collection_prefix}_{collection_name}"
+            ):
+                return None
+
+            points = await self.async_client.scroll(
+                **self._query_kwargs(collection_name, filter, limit)
             )
             return self._result_to_get_result(points[0])
         except Exception as e:
             log.exception(f"Error querying a collection '{collection_name}': {e}")
             return None
 
-    def get(self, collection_name: str) -> Optional[GetResult]:
-        # Get all the items in the collection.
-        points = self.client.scroll(
-            collection_name=f"{self.collection_prefix}_{collection_name}",
-            limit=NO_LIMIT,  # otherwise qdrant would set limit to 10!
-        )
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        points = await self.async_client.scroll(**self._get_kwargs(collection_name))
         return self._result_to_get_result(points[0])
 
     def insert(self, collection_name: str, items: list[VectorItem]):
@@ -222,17 +351,14 @@ class QdrantClient(VectorDBBase):
         filter: Optional[dict] = None,
     ):
         # Delete the items from the collection based on the ids.
-        field_conditions = []
-
         if ids:
-            for id_value in ids:
-                field_conditions.append(
-                    models.FieldCondition(
-                        key="metadata.id",
-                        match=models.MatchValue(value=id_value),
-                    ),
-                ),
-        elif filter:
+            return self.client.delete(
+                collection_name=f"{self.collection_prefix}_{collection_name}",
+                points_selector=models.PointIdsList(points=ids),
+            )
+
+        field_conditions = []
+        if filter:
             for key, value in filter.items():
                 field_conditions.append(
                     models.FieldCondition(
@@ -248,6 +374,17 @@ class QdrantClient(VectorDBBase):
             ),
         )
 
+    def update_quantization(self) -> bool:
+        # Qdrant re-quantizes the stored vectors in the background
+        for collection in self.client.get_collections().collections:
+            if collection.name.startswith(self.collection_prefix):
+                self.client.update_collection(
+                    collection_name=collection.name,
+                    quantization_config=get_quantization_config()
+                    or models.Disabled.DISABLED,
+                )
+        return True
+
     def reset(self):
         # Resets the database. This will delete all collections and item entries.
         collection_names = self.client.get_collections().collections
@@ -19,11 +19,16 @@ from open_webui.retrieval.vector.main import (
     VectorDBBase,
     VectorItem,
 )
-from qdrant_client import QdrantClient as Qclient
+from qdrant_client import AsyncQdrantClient, QdrantClient as Qclient
 from qdrant_client.http.exceptions import UnexpectedResponse
 from qdrant_client.http.models import PointStruct
 from qdrant_client.models import models
 
+from open_webui.retrieval.vector.dbs.qdrant import (
+    get_quantization_config,
+    get_search_params,
+)
+
 NO_LIMIT = 999999999
 TENANT_ID_FIELD = "tenant_id"
 DEFAULT_DIMENSION = 384
@@ -38,6 +43,10 @@ def _tenant_filter(tenant_id: str) -> models.FieldCondition:
 
 
 def _metadata_filter(key: str, value: Any) -> models.FieldCondition:
+    if isinstance(value, dict) and "$in" in value:
+        return models.FieldCondition(
+            key=f"metadata.{key}", match=models.MatchAny(any=value["$in"])
+        )
     return models.FieldCondition(
         key=f"metadata.{key}", match=models.MatchValue(value=value)
     )
@@ -64,22 +73,23 @@ class QdrantClient(VectorDBBase):
         host = parsed.hostname or self.QDRANT_URI
         http_port = parsed.port or 6333  # default REST port
 
-        self.client = (
-            Qclient(
-                host=host,
-                port=http_port,
-                grpc_port=self.GRPC_PORT,
-                prefer_grpc=self.PREFER_GRPC,
-                api_key=self.QDRANT_API_KEY,
-                timeout=self.QDRANT_TIMEOUT,
-            )
+        self.client_kwargs = (
+            {
+                "host": host,
+                "port": http_port,
+                "grpc_port": self.GRPC_PORT,
+                "prefer_grpc": self.PREFER_GRPC,
+                "api_key": self.QDRANT_API_KEY,
+                "timeout": self.QDRANT_TIMEOUT,
+            }
             if self.PREFER_GRPC
-            else Qclient(
-                url=self.QDRANT_URI,
-                api_key=self.QDRANT_API_KEY,
-                timeout=self.QDRANT_TIMEOUT,
-            )
+            else {
+                "url": self.QDRANT_URI,
+                "api_key": self.QDRANT_API_KEY,
+                "timeout": self.QDRANT_TIMEOUT,
+            }
         )
+        self.client = Qclient(**self.client_kwargs)
 
         # Main collection types for multi-tenancy
         self.MEMORY_COLLECTION = f"{self.collection_prefix}_memories"
@@ -88,6 +98,10 @@ class QdrantClient(VectorDBBase):
         self.WEB_SEARCH_COLLECTION = f"{self.collection_prefix}_web-search"
         self.HASH_BASED_COLLECTION = f"{self.collection_prefix}_hash-based"
 
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        return self._get_async_client(lambda: AsyncQdrantClient(**self.client_kwargs))
+
     def _result_to_get_result(self, points) -> GetResult:
         ids, documents, metadatas = [], [], []
         for point in points:
@@ -153,6 +167,7 @@ class QdrantClient(VectorDBBase):
                 payload_m=self.QDRANT_HNSW_M,
                 m=0,
             ),
+            quantization_config=get_quantization_config(),
         )
         log.info(
             f"Multi-tenant collection {mt_collection_name} created with dimension {dimension}!"
@@ -240,16 +255,15 @@ class QdrantClient(VectorDBBase):
             return None
 
         must_conditions = [_tenant_filter(tenant_id)]
-        should_conditions = []
         if ids:
-            should_conditions = [_metadata_filter("id", id_value) for id_value in ids]
+            must_conditions.append(models.HasIdCondition(has_id=ids))
         elif filter:
             must_conditions += [_metadata_filter(k, v) for k, v in filter.items()]
 
         return self.client.delete(
             collection_name=mt_collection,
             points_selector=models.FilterSelector(
-                filter=models.Filter(must=must_conditions, should=should_conditions)
+                filter=models.Filter(must=must_conditions)
             ),
         )
 
@@ -270,19 +284,37 @@ class QdrantClient(VectorDBBase):
             log.debug(f"Collection {mt_collection} doesn't exist, search returns None")
             return None
 
-        tenant_filter = _tenant_filter(tenant_id)
         query_response = self.client.query_points(
-            collection_name=mt_collection,
-            query=vectors[0],
-            limit=limit,
-            query_filter=models.Filter(must=[tenant_filter]),
+            **self._search_kwargs(mt_collection, tenant_id, vectors, filter, limit)
         )
-        get_result = self._result_to_get_result(query_response.points)
+        return self._points_to_search_result(query_response.points)
+
+    def _search_kwargs(
+        self,
+        mt_collection: str,
+        tenant_id: str,
+        vectors: List[List[float | int]],
+        filter: Optional[Dict],
+        limit: int,
+    ) -> Dict[str, Any]:
+        field_conditions = [_metadata_filter(k, v) for k, v in (filter or {}).items()]
+        return {
+            "collection_name": mt_collection,
+            "query": vectors[0],
+            "limit": limit,
+            "query_filter": models.Filter(
+                must=[_tenant_filter(tenant_id), *field_conditions]
+            ),
+            "search_params": get_search_params(),
+        }
+
+    def _points_to_search_result(self, points) -> SearchResult:
+        get_result = self._result_to_get_result(points)
         return SearchResult(
             ids=get_result.ids,
             documents=get_result.documents,
             metadatas=get_result.metadatas,
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
+            distances=[[(point.score + 1.0) / 2.0 for point in points]],
         )
 
     def query(
@@ -297,18 +329,57 @@ class QdrantClient(VectorDBBase):
         if not self.client.collection_exists(collection_name=mt_collection):
             log.debug(f"Collection {mt_collection} doesn't exist, query returns None")
             return None
-        if limit is None:
-            limit = NO_LIMIT
-        tenant_filter = _tenant_filter(tenant_id)
-        field_conditions = [_metadata_filter(k, v) for k, v in filter.items()]
-        combined_filter = models.Filter(must=[tenant_filter, *field_conditions])
         points = self.client.scroll(
-            collection_name=mt_collection,
-            scroll_filter=combined_filter,
-            limit=limit,
+            **self._query_kwargs(mt_collection, tenant_id, filter, limit)
         )
         return self._result_to_get_result(points[0])
 
+    def _query_kwargs(
+        self,
+        mt_collection: str,
+        tenant_id: str,
+        filter: Dict[str, Any],
+        limit: Optional[int],
+    ) -> Dict[str, Any]:
+        field_conditions = [_metadata_filter(k, v) for k, v in filter.items()]
+        return {
+            "collection_name": mt_collection,
+            "scroll_filter": models.Filter(
+                must=[_tenant_filter(tenant_id), *field_conditions]
+            ),
+            "limit": NO_LIMIT if limit is None else limit,
+        }
+
+    def query_vectors(
+        self, collection_name: str, filter: Optional[Dict[str, Any]]
+    ) -> Optional[List[VectorItem]]:
+        """
+        Query points with filters and tenant isolation, including their vectors.
+        """
+        if not self.client:
+            return None
+        mt_collection, tenant_id = self._get_collection_and_tenant_id(collection_name)
+        if not self.client.collection_exists(collection_name=mt_collection):
+            return None
+        field_conditions = [_metadata_filter(k, v) for k, v in (filter or {}).items()]
+        points, _ = self.client.scroll(
+            collection_name=mt_collection,
+            scroll_filter=models.Filter(
+                must=[_tenant_filter(tenant_id), *field_conditions]
+            ),
+            limit=NO_LIMIT,
+            with_vectors=True,
+        )
+        return [
+            {
+                "id": str(point.id),
+                "text": point.payload["text"],
+                "vector": point.vector,
+                "metadata": point.payload["metadata"],
+            }
+            for point in points
+        ]
+
     def get(self, collection_name: str) -> Optional[GetResult]:
         """
         Get all items in a collection with tenant isolation.
@@ -319,11 +390,67 @@ class QdrantClient(VectorDBBase):
         if not self.client.collection_exists(collection_name=mt_collection):
             log.debug(f"Collection {mt_collection} doesn't exist, get returns None")
             return None
-        tenant_filter = _tenant_filter(tenant_id)
-        points = self.client.scroll(
-            collection_name=mt_collection,
-            scroll_filter=models.Filter(must=[tenant_filter]),
-            limit=NO_LIMIT,
+        points = self.client.scroll(**self._get_kwargs(mt_collection, tenant_id))
+        return self._result_to_get_result(points[0])
+
+    def _get_kwargs(self, mt_collection: str, tenant_id: str) -> Dict[str, Any]:
+        return {
+            "collection_name": mt_collection,
+            "scroll_filter": models.Filter(must=[_tenant_filter(tenant_id)]),
+            "limit": NO_LIMIT,
+        }
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: List[List[float | int]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        """
+        Async variant of search, using the native async Qdrant client.
+        """
+        if not self.client or not vectors:
+            return None
+        mt_collection, tenant_id = self._get_collection_and_tenant_id(collection_name)
+        if not await self.async_client.collection_exists(collection_name=mt_collection):
+            log.debug(f"Collection {mt_collection} doesn't exist, search returns None")
+            return None
+
+        query_response = await self.async_client.query_points(
+            **self._search_kwargs(mt_collection, tenant_id, vectors, filter, limit)
+        )
+        return self._points_to_search_result(query_response.points)
+
+    async def aquery(
+        self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
+    ):
+        """
+        Async variant of query, using the native async Qdrant client.
+        """
+        if not self.client:
+            return None
+        mt_collection, tenant_id = self._get_collection_and_tenant_id(collection_name)
+        if not await self.async_client.collection_exists(collection_name=mt_collection):
+            log.debug(f"Collection {mt_collection} doesn't exist, query returns None")
+            return None
+        points = await self.async_client.scroll(
+            **self._query_kwargs(mt_collection, tenant_id, filter, limit)
+        )
+        return self._result_to_get_result(points[0])
+
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        """
+        Async variant of get, using the native async Qdrant client.
+        """
+        if not self.client:
+            return None
+        mt_collection, tenant_id = self._get_collection_and_tenant_id(collection_name)
+        if not await self.async_client.collection_exists(collection_name=mt_collection):
+            log.debug(f"Collection {mt_collection} doesn't exist, get returns None")
+            return None
+        points = await self.async_client.scroll(
+            **self._get_kwargs(mt_collection, tenant_id)
         )
         return self._result_to_get_result(points[0])
 
@@ -346,6 +473,21 @@ class QdrantClient(VectorDBBase):
         """
         return self.upsert(collection_name, items)
 
+    def update_quantization(self) -> bool:
+        """
+        Apply the configured quantization to the shared collections.
+        """
+        if not self.client:
+            return False
+        for collection in self.client.get_collections().collections:
+            if collection.name.startswith(self.collection_prefix):
+                self.client.update_collection(
+                    collection_name=collection.name,
+                    quantization_config=get_quantization_config()
+                    or models.Disabled.DISABLED,
+                )
+        return True
+
     def reset(self):
         """
         Reset the database by deleting all collections.
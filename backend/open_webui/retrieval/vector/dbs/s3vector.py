@@ -1,4 +1,5 @@
 from open_webui.retrieval.vector.utils import process_metadata
+from open_webui.retrieval.vector.batching import submit_batches
 from open_webui.retrieval.vector.main import (
     VectorDBBase,
     VectorItem,
@@ -12,6 +13,9 @@ import boto3
 
 log = logging.getLogger(__name__)
 
+# S3 Vectors accepts at most 500 vectors per PutVectors/DeleteVectors call
+BATCH_SIZE = 500
+
 
 class S3VectorClient(VectorDBBase):
     """
@@ -148,6 +152,28 @@ class S3VectorClient(VectorDBBase):
             log.error(f"Error deleting collection '{collection_name}': {e}")
             raise
 
+    def _put_vectors(self, index_name: str, vectors: List[Dict[str, Any]]) -> None:
+        self.client.put_vectors(
+            vectorBucketName=self.bucket_name,
+            indexName=index_name,
+            vectors=vectors,
+        )
+
+    def _delete_vectors(self, index_name: str, keys: List[str]) -> None:
+        """
+        Delete vectors by key in concurrent batches of the API limit.
+        """
+        submit_batches(
+            "s3vector.delete",
+            lambda batch: self.client.delete_vectors(
+                vectorBucketName=self.bucket_name,
+                indexName=index_name,
+                keys=batch,
+            ),
+            keys,
+            BATCH_SIZE,
+        )
+
     def insert(self, collection_name: str, items: List[VectorItem]) -> None:
         """
         Insert vector items into the S3 Vector index. Create index if it does not exist.
@@ -197,18 +223,13 @@ class S3VectorClient(VectorDBBase):
                     }
                 )
 
-            # Insert vectors in batches of 500 (S3 Vector API limit)
-            batch_size = 500
-            for i in range(0, len(vectors), batch_size):
-                batch = vectors[i : i + batch_size]
-                self.client.put_vectors(
-                    vectorBucketName=self.bucket_name,
-                    indexName=collection_name,
-                    vectors=batch,
-                )
-                log.info(
-                    f"Inserted batch {i//batch_size + 1}: {len(batch)} vectors into index '{collection_name}'."
-                )
+            # Insert vectors in concurrent batches, each retried with backoff
+            submit_batches(
+                "s3vector.insert",
+                lambda batch: self._put_vectors(collection_name, batch),
+                vectors,
+                BATCH_SIZE,
+            )
 
             log.info(
                 f"Completed insertion of {len(vectors)} vectors into index '{collection_name}'."
@@ -268,24 +289,16 @@ class S3VectorClient(VectorDBBase):
                     }
                 )
 
-            # Upsert vectors in batches of 500 (S3 Vector API limit)
-            batch_size = 500
-            for i in range(0, len(vectors), batch_size):
-                batch = vectors[i : i + batch_size]
-                if i == 0:  # Log sample info for first batch only
-                    log.info(
-                        f"Upserting batch 1: {len(batch)} vectors. First vector sample: key={batch[0]['key']}, data_type={type(batch[0]['data']['float32'])}, data_len={len(batch[0]['data']['float32'])}"
-                    )
-                else:
-                    log.info(
-                        f"Upserting batch {i//batch_size + 1}: {len(batch)} vectors."
-                    )
-
-                self.client.put_vectors(
-                    vectorBucketName=self.bucket_name,
-                    indexName=collection_name,
-                    vectors=batch,
-                )
+            log.info(
+                f"Upserting {len(vectors)} vectors. First vector sample: key={vectors[0]['key']}, data_type={type(vectors[0]['data']['float32'])}, data_len={len(vectors[0]['data']['float32'])}"
+            )
+            # Upsert vectors in concurrent batches, each retried with backoff
+            submit_batches(
+                "s3vector.upsert",
+                lambda batch: self._put_vectors(collection_name, batch),
+                vectors,
+                BATCH_SIZE,
+            )
 
             log.info(
                 f"Completed upsert of {len(vectors)} vectors into index '{collection_name}'."
@@ -623,11 +636,7 @@ class S3VectorClient(VectorDBBase):
                 log.info(
                     f"Deleting {len(ids)} vectors by IDs from collection '{collection_name}'"
                 )
-                self.client.delete_vectors(
-                    vectorBucketName=self.bucket_name,
-                    indexName=collection_name,
-                    keys=ids,
-                )
+                self._delete_vectors(collection_name, ids)
                 log.info(f"Deleted {len(ids)} vectors from index '{collection_name}'")
 
             elif filter:
@@ -657,11 +666,7 @@ class S3VectorClient(VectorDBBase):
                     )
 
                     # Delete the matching vectors by ID
-                    self.client.delete_vectors(
-                        vectorBucketName=self.bucket_name,
-                        indexName=collection_name,
-                        keys=matching_ids,
-                    )
+                    self._delete_vectors(collection_name, matching_ids)
                     log.info(
                         f"Deleted {len(matching_ids)} vectors from index '{collection_name}' using filter"
                     )
@@ -1,6 +1,37 @@
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
 from pydantic import BaseModel
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from open_webui.config import VECTOR_DB_EXECUTOR_MAX_WORKERS
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_vector_db_executor() -> ThreadPoolExecutor:
+    """Process-wide, size-bounded pool for blocking vector DB I/O."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=VECTOR_DB_EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="vector-db",
+                )
+    return _executor
+
+
+async def run_in_vector_db_executor(func: Callable, *args, **kwargs) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_vector_db_executor(), functools.partial(func, *args, **kwargs)
+    )
 
 
 class VectorItem(BaseModel):
@@ -88,3 +119,75 @@ class VectorDBBase(ABC):
     def reset(self) -> None:
         """Reset the vector database by removing all collections or those matching a condition."""
         pass
+
+    def query_vectors(
+        self, collection_name: str, filter: Optional[Dict]
+    ) -> Optional[List[VectorItem]]:
+        """
+        Query items matching a metadata filter, including their vectors.
+
+        Used to copy already embedded chunks between collections, or, without a
+        filter, to read back a whole collection for re-encoding. Returns None
+        if the backend does not support reading vectors back, in which case
+        callers re-embed the content instead.
+        """
+        return None
+
+    def update_quantization(self) -> bool:
+        """
+        Apply the configured vector quantization to existing collections.
+
+        Returns False if the backend has no quantization settings.
+        """
+        return False
+
+    # Async variants. Backends with a native async client override these;
+    # the defaults run the sync method on the shared vector DB executor.
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        """Async variant of search."""
+        return await run_in_vector_db_executor(
+            self.search,
+            collection_name=collection_name,
+            vectors=vectors,
+            filter=filter,
+            limit=limit,
+        )
+
+    async def aquery(
+        self, collection_name: str, filter: Dict, limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        """Async variant of query."""
+        return await run_in_vector_db_executor(
+            self.query, collection_name=collection_name, filter=filter, limit=limit
+        )
+
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        """Async variant of get."""
+        return await run_in_vector_db_executor(
+            self.get, collection_name=collection_name
+        )
+
+    def _get_async_client(self, factory: Callable[[], Any]) -> Any:
+        """
+        Return an async client bound to the running event loop.
+
+        Async clients hold loop-bound connection pools, and the app runs some
+        work on short-lived loops (e.g. asyncio.run in worker threads), so one
+        client is kept per loop and released together with it.
+        """
+        loop = asyncio.get_running_loop()
+        clients = self.__dict__.setdefault(
+            "_async_clients", weakref.WeakKeyDictionary()
+        )
+        client = clients.get(loop)
+        if client is None:
+            client = factory()
+            clients[loop] = client
+        return client
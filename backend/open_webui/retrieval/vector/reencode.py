@@ -0,0 +1,140 @@
+"""
+Re-encode stored vectors after changing the compact storage settings.
+
+Truncating to RAG_EMBEDDING_DIMENSIONS reads every collection back with its
+vectors, so it only works on backends that implement ``query_vectors``; the
+shared collections of the Qdrant multi-tenancy mode have a fixed dimension and
+must be re-indexed instead. Run with ``open-webui reencode``.
+
+Each collection is recreated from a truncated copy that is written to a staging
+collection first, so an interrupted run can be resumed without losing data.
+"""
+
+import ast
+import logging
+from typing import Optional
+
+from open_webui.models.files import Files
+from open_webui.models.knowledge import Knowledges
+from open_webui.models.memories import Memories
+from open_webui.retrieval.utils import truncate_embeddings
+from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+
+log = logging.getLogger(__name__)
+
+STAGING_SUFFIX = "-reencode"
+
+
+def get_collection_names() -> list[str]:
+    from open_webui.routers.knowledge import KNOWLEDGE_BASES_COLLECTION
+
+    collection_names = [KNOWLEDGE_BASES_COLLECTION]
+    collection_names.extend(
+        knowledge.id for knowledge in Knowledges.get_knowledge_bases()
+    )
+    collection_names.extend(f"file-{file.id}" for file in Files.get_files())
+    collection_names.extend(
+        f"user-memory-{user_id}"
+        for user_id in sorted({memory.user_id for memory in Memories.get_memories()})
+    )
+    return collection_names
+
+
+def _with_dimensions(embedding_config, dimensions: int):
+    # Some backends store nested metadata as its string representation
+    if isinstance(embedding_config, str):
+        try:
+            embedding_config = ast.literal_eval(embedding_config)
+        except (ValueError, SyntaxError):
+            return embedding_config
+    if isinstance(embedding_config, dict):
+        return {**embedding_config, "dimensions": dimensions}
+    return embedding_config
+
+
+def truncate_collection(collection_name: str, dimensions: int) -> Optional[int]:
+    """
+    Truncate the vectors of a collection to ``dimensions``.
+
+    Returns the number of items written back, or None if the backend cannot
+    read vectors back.
+    """
+    items = VECTOR_DB_CLIENT.query_vectors(collection_name, None)
+    if not items:
+        return None if items is None else 0
+
+    truncated = []
+    for item in items:
+        metadata = dict(item["metadata"] or {})
+        if "embedding_config" in metadata:
+            metadata["embedding_config"] = _with_dimensions(
+                metadata["embedding_config"], dimensions
+            )
+        truncated.append(
+            {
+                **item,
+                "vector": truncate_embeddings(item["vector"], dimensions),
+                "metadata": metadata,
+            }
+        )
+
+    # Collections have a fixed dimension, so they are recreated. The truncated
+    # copy is written first, so the vectors survive a failed re-insert.
+    staging_name = f"{collection_name}{STAGING_SUFFIX}"
+    if VECTOR_DB_CLIENT.has_collection(staging_name):
+        VECTOR_DB_CLIENT.delete_collection(staging_name)
+    VECTOR_DB_CLIENT.upsert(staging_name, truncated)
+
+    VECTOR_DB_CLIENT.delete_collection(collection_name)
+    try:
+        VECTOR_DB_CLIENT.upsert(collection_name, truncated)
+    except Exception:
+        log.exception(
+            f"Re-encoding {collection_name} failed, its vectors are kept in "
+            f"{staging_name} and restored on the next run"
+        )
+        raise
+    VECTOR_DB_CLIENT.delete_collection(staging_name)
+    return len(truncated)
+
+
+def restore_collection(collection_name: str) -> None:
+    """
+    Recreate a collection from the staging copy left by an interrupted run, if
+    the collection holds fewer items than the copy.
+    """
+    staging_name = f"{collection_name}{STAGING_SUFFIX}"
+    if not VECTOR_DB_CLIENT.has_collection(staging_name):
+        return
+
+    items = VECTOR_DB_CLIENT.query_vectors(staging_name, None) or []
+    current = VECTOR_DB_CLIENT.query_vectors(collection_name, None) or []
+    # A copy that is not larger was interrupted while being written, and the
+    # collection itself is still complete
+    if len(current) < len(items):
+        if current:
+            VECTOR_DB_CLIENT.delete_collection(collection_name)
+        VECTOR_DB_CLIENT.upsert(collection_name, items)
+        log.info(f"Restored {collection_name} from an interrupted re-encode")
+    VECTOR_DB_CLIENT.delete_collection(staging_name)
+
+
+def reencode_vectors(dimensions: Optional[int] = None, quantize: bool = False):
+    if dimensions:
+        for collection_name in get_collection_names():
+            restore_collection(collection_name)
+            if not VECTOR_DB_CLIENT.has_collection(collection_name):
+                continue
+            count = truncate_collection(collection_name, dimensions)
+            if count is None:
+                raise RuntimeError(
+                    "The configured vector database cannot read vectors back; "
+                    "re-index the knowledge bases instead."
+                )
+            log.info(f"Truncated {count} vectors in {collection_name}")
+
+    if quantize:
+        if VECTOR_DB_CLIENT.update_quantization():
+            log.info("Applied the vector quantization settings")
+        else:
+            log.info("The configured vector database has no quantization settings")
@@ -2,8 +2,8 @@ import logging
 import os
 from pprint import pprint
 from typing import Optional
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 import argparse
 
 log = logging.getLogger(__name__)
@@ -12,7 +12,7 @@ Documentation: https://docs.microsoft.com/en-us/bing/search-apis/bing-web-search
 """
 
 
-def search_bing(
+async def asearch_bing(
     subscription_key: str,
     endpoint: str,
     locale: str,
@@ -25,12 +25,12 @@ def search_bing(
     headers = {"Ocp-Apim-Subscription-Key": subscription_key}
 
     try:
-        response = requests.get(endpoint, headers=headers, params=params)
+        response = await SEARCH_CLIENT.get(endpoint, headers=headers, params=params)
         response.raise_for_status()
         json_response = response.json()
         results = json_response.get("webPages", {}).get("value", [])
         if filter_list:
-            results = get_filtered_results(results, filter_list)
+            results = await aget_filtered_results(results, filter_list)
         return [
             SearchResult(
                 link=result["url"],
@@ -44,6 +44,20 @@ def search_bing(
         raise ex
 
 
+def search_bing(
+    subscription_key: str,
+    endpoint: str,
+    locale: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+) -> list[SearchResult]:
+    """Blocking variant of asearch_bing."""
+    return SEARCH_CLIENT.run(
+        asearch_bing(subscription_key, endpoint, locale, query, count, filter_list)
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Search Bing from the command line.")
     parser.add_argument(
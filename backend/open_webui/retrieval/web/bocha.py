@@ -1,9 +1,9 @@
 import logging
 from typing import Optional
 
-import requests
 import json
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
@@ -32,7 +32,7 @@ def _parse_response(response):
     return results
 
 
-def search_bocha(
+async def asearch_bocha(
     api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
 ) -> list[SearchResult]:
     """Search using Bocha's Search API and return the results as a list of SearchResult objects.
@@ -48,12 +48,12 @@ def search_bocha(
         {"query": query, "summary": True, "freshness": "noLimit", "count": count}
     )
 
-    response = requests.post(url, headers=headers, data=payload, timeout=5)
+    response = await SEARCH_CLIENT.post(url, headers=headers, data=payload, timeout=5)
     response.raise_for_status()
     results = _parse_response(response.json())
 
     if filter_list:
-        results = get_filtered_results(results, filter_list)
+        results = await aget_filtered_results(results, filter_list)
 
     return [
         SearchResult(
@@ -61,3 +61,10 @@ def search_bocha(
         )
         for result in results[:count]
     ]
+
+
+def search_bocha(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Blocking variant of asearch_bocha."""
+    return SEARCH_CLIENT.run(asearch_bocha(api_key, query, count, filter_list))
@@ -1,14 +1,14 @@
+import asyncio
 import logging
-import time
 from typing import Optional
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_brave(
+async def asearch_brave(
     api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
 ) -> list[SearchResult]:
     """Search using Brave's Search API and return the results as a list of SearchResult objects.
@@ -25,21 +25,21 @@ def search_brave(
     }
     params = {"q": query, "count": count}
 
-    response = requests.get(url, headers=headers, params=params)
+    response = await SEARCH_CLIENT.get(url, headers=headers, params=params)
 
     # Handle 429 rate limiting - Brave free tier allows 1 request/second
     # If rate limited, wait 1 second and retry once before failing
     if response.status_code == 429:
         log.info("Brave Search API rate limited (429), retrying after 1 second...")
-        time.sleep(1)
-        response = requests.get(url, headers=headers, params=params)
+        await asyncio.sleep(1)
+        response = await SEARCH_CLIENT.get(url, headers=headers, params=params)
 
     response.raise_for_status()
 
     json_response = response.json()
     results = json_response.get("web", {}).get("results", [])
     if filter_list:
-        results = get_filtered_results(results, filter_list)
+        results = await aget_filtered_results(results, filter_list)
 
     return [
         SearchResult(
@@ -49,3 +49,10 @@ def search_brave(
         )
         for result in results[:count]
     ]
+
+
+def search_brave(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Blocking variant of asearch_brave."""
+    return SEARCH_CLIENT.run(asearch_brave(api_key, query, count, filter_list))
@@ -0,0 +1,249 @@
+import asyncio
+import json
+import logging
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from opentelemetry import metrics
+
+from open_webui.config import (
+    PLAYWRIGHT_BLOCKED_RESOURCE_TYPES,
+    PLAYWRIGHT_CONTEXT_MAX_USES,
+    PLAYWRIGHT_CONTEXT_POOL_SIZE,
+)
+
+log = logging.getLogger(__name__)
+
+####################################
+#
+# Pool of long-lived Playwright browser contexts
+#
+####################################
+
+# Playwright objects belong to the event loop that created them, so pools are
+# kept per loop and dropped with it
+_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
+meter = metrics.get_meter(__name__)
+
+recycle_counter = meter.create_counter(
+    name="webui.web_loader.browser.recycles",
+    description="Browser contexts closed and replaced, by reason",
+    unit="1",
+)
+
+
+def _get_pools() -> list["BrowserContextPool"]:
+    return [pool for pools in list(_POOLS.values()) for pool in pools.values()]
+
+
+def _observe_contexts(
+    options: metrics.CallbackOptions,
+) -> list[metrics.Observation]:
+    observations = []
+    for pool in _get_pools():
+        health = pool.health()
+        for state in ("idle", "in_use"):
+            observations.append(
+                metrics.Observation(
+                    value=health[state],
+                    attributes={"browser": pool.name, "state": state},
+                )
+            )
+    return observations
+
+
+def _observe_connected(
+    options: metrics.CallbackOptions,
+) -> list[metrics.Observation]:
+    return [
+        metrics.Observation(
+            value=int(pool.health()["connected"]), attributes={"browser": pool.name}
+        )
+        for pool in _get_pools()
+    ]
+
+
+meter.create_observable_gauge(
+    name="webui.web_loader.browser.contexts",
+    callbacks=[_observe_contexts],
+    description="Pooled browser contexts by state (idle, in_use)",
+    unit="1",
+)
+meter.create_observable_gauge(
+    name="webui.web_loader.browser.connected",
+    callbacks=[_observe_connected],
+    description="Whether the pooled browser is connected",
+    unit="1",
+)
+
+
+class _PooledContext:
+    __slots__ = ("context", "browser", "uses")
+
+    def __init__(self, context: Any, browser: Any):
+        self.context = context
+        self.browser = browser
+        self.uses = 0
+
+
+class BrowserContextPool:
+    """
+    Browser contexts shared by Playwright page loads across requests. The
+    browser is launched (or connected to) once, and up to ``size`` contexts are
+    borrowed at a time. Contexts are recycled after ``max_uses`` pages, after a
+    failed load and when the browser disconnects. Requests for the blocked
+    resource types are aborted, as they do not affect the extracted text.
+    """
+
+    def __init__(
+        self,
+        ws_url: Optional[str] = None,
+        headless: bool = True,
+        proxy: Optional[dict] = None,
+        size: int = PLAYWRIGHT_CONTEXT_POOL_SIZE,
+        max_uses: int = PLAYWRIGHT_CONTEXT_MAX_USES,
+        blocked_resource_types: Optional[list[str]] = None,
+    ):
+        self.ws_url = ws_url
+        self.headless = headless
+        self.proxy = proxy
+        self.size = size
+        self.max_uses = max_uses
+        self.blocked_resource_types = set(
+            PLAYWRIGHT_BLOCKED_RESOURCE_TYPES
+            if blocked_resource_types is None
+            else blocked_resource_types
+        )
+        self.name = "remote" if ws_url else "local"
+
+        self._playwright = None
+        self._browser = None
+        self._idle: list[_PooledContext] = []
+        self._in_use = 0
+        self._recycled = 0
+        self._semaphore = asyncio.Semaphore(size)
+        self._lock = asyncio.Lock()
+
+    def health(self) -> dict:
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "recycled": self._recycled,
+            "connected": self._browser is not None and self._browser.is_connected(),
+        }
+
+    async def _launch(self) -> Any:
+        from playwright.async_api import async_playwright
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        if self.ws_url:
+            return await self._playwright.chromium.connect(self.ws_url)
+        return await self._playwright.chromium.launch(
+            headless=self.headless, proxy=self.proxy
+        )
+
+    async def _get_browser(self) -> Any:
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._browser is not None:
+                    log.warning("Pooled browser disconnected, relaunching")
+                self._browser = await self._launch()
+            return self._browser
+
+    async def _route(self, route: Any) -> None:
+        if route.request.resource_type in self.blocked_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _new_context(self) -> _PooledContext:
+        browser = await self._get_browser()
+        context = await browser.new_context()
+        if self.blocked_resource_types:
+            await context.route("**/*", self._route)
+        return _PooledContext(context, browser)
+
+    async def _recycle(self, pooled: _PooledContext, reason: str) -> None:
+        self._recycled += 1
+        recycle_counter.add(1, {"browser": self.name, "reason": reason})
+        try:
+            await pooled.context.close()
+        except Exception as e:
+            log.debug(f"Error closing browser context: {e}")
+
+    @asynccontextmanager
+    async def context(self) -> AsyncIterator[Any]:
+        """Borrow a browser context, waiting while all of them are in use."""
+        async with self._semaphore:
+            pooled = None
+            while self._idle and pooled is None:
+                pooled = self._idle.pop()
+                if not pooled.browser.is_connected():
+                    await self._recycle(pooled, "disconnected")
+                    pooled = None
+            if pooled is None:
+                pooled = await self._new_context()
+
+            self._in_use += 1
+            failed = False
+            try:
+                yield pooled.context
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                self._in_use -= 1
+                pooled.uses += 1
+                if failed:
+                    await self._recycle(pooled, "error")
+                elif not pooled.browser.is_connected():
+                    await self._recycle(pooled, "disconnected")
+                elif self.max_uses and pooled.uses >= self.max_uses:
+                    await self._recycle(pooled, "max_uses")
+                else:
+                    self._idle.append(pooled)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            try:
+                await pooled.context.close()
+            except Exception:
+                pass
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+def get_browser_context_pool(
+    ws_url: Optional[str] = None,
+    headless: bool = True,
+    proxy: Optional[dict] = None,
+) -> BrowserContextPool:
+    """The pool of the running event loop for this browser configuration."""
+    pools = _POOLS.setdefault(asyncio.get_running_loop(), {})
+    key = (ws_url or "", headless, json.dumps(proxy, sort_keys=True))
+    if key not in pools:
+        pools[key] = BrowserContextPool(ws_url=ws_url, headless=headless, proxy=proxy)
+    return pools[key]
+
+
+async def close_browser_context_pools() -> None:
+    pools = _POOLS.pop(asyncio.get_running_loop(), {})
+    for pool in pools.values():
+        try:
+            await pool.close()
+        except Exception as e:
+            log.warning(f"Error closing browser context pool: {e}")
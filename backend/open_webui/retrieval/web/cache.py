@@ -0,0 +1,223 @@
+import hashlib
+import json
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from opentelemetry import metrics
+
+from open_webui.config import (
+    WEB_SEARCH_CACHE_ENGINE_TTLS,
+    WEB_SEARCH_CACHE_MAX_SIZE,
+    WEB_SEARCH_CACHE_TTL,
+)
+from open_webui.env import (
+    REDIS_CLUSTER,
+    REDIS_KEY_PREFIX,
+    REDIS_SENTINEL_HOSTS,
+    REDIS_SENTINEL_PORT,
+    REDIS_URL,
+)
+from open_webui.retrieval.cache import LRUCache
+from open_webui.retrieval.web.main import SearchResult
+from open_webui.utils.redis import get_redis_connection, get_sentinels_from_env
+
+log = logging.getLogger(__name__)
+
+####################################
+#
+# Search engine result cache, shared across users
+#
+####################################
+
+meter = metrics.get_meter(__name__)
+
+request_counter = meter.create_counter(
+    name="webui.web_search.cache.requests",
+    description="Web search engine calls by cache result (hit, miss, bypass)",
+    unit="1",
+)
+latency_saved_histogram = meter.create_histogram(
+    name="webui.web_search.cache.latency_saved",
+    description="Search engine latency avoided by a cache hit",
+    unit="s",
+)
+
+
+def normalize_query(query: str) -> str:
+    return " ".join((query or "").lower().split())
+
+
+class SearchResultCache:
+    """
+    Search engine results keyed by engine, normalized query, result count,
+    domain filter and the engine settings that affect its results. Entries are
+    stored in Redis when available, so all instances share them, and in an
+    in-process LRU cache otherwise.
+    """
+
+    def __init__(
+        self,
+        ttl: int,
+        engine_ttls: Optional[dict[str, int]] = None,
+        maxsize: int = 1000,
+        redis=None,
+        key_prefix: str = "open-webui",
+    ):
+        self.ttl = ttl
+        self.engine_ttls = engine_ttls or {}
+        self.memory = LRUCache(maxsize)
+        self.redis = redis
+        self.key_prefix = f"{key_prefix}:web_search_cache"
+
+    def get_ttl(self, engine: str) -> int:
+        return self.engine_ttls.get(engine, self.ttl)
+
+    def get_key(
+        self,
+        engine: str,
+        query: str,
+        count: int,
+        filter_list: Optional[list[str]] = None,
+        settings: Optional[dict] = None,
+    ) -> str:
+        key = json.dumps(
+            [
+                engine,
+                normalize_query(query),
+                count,
+                sorted(filter_list or []),
+                settings or {},
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        if self.redis is not None:
+            value = self.redis.get(f"{self.key_prefix}:{key}")
+            return json.loads(value) if value else None
+        return self.memory.get(key)
+
+    def set(self, key: str, entry: dict, ttl: int) -> None:
+        if self.redis is not None:
+            self.redis.set(f"{self.key_prefix}:{key}", json.dumps(entry), ex=ttl)
+        else:
+            self.memory.set(key, entry, ttl=ttl)
+
+    def _lookup(
+        self,
+        engine: str,
+        query: str,
+        count: int,
+        filter_list: Optional[list[str]],
+        settings: Optional[dict],
+        bypass: bool,
+    ) -> tuple[Optional[str], Optional[list[SearchResult]]]:
+        """The cache key to store results under (None to skip) and any hit."""
+        ttl = self.get_ttl(engine)
+        if bypass or ttl <= 0:
+            request_counter.add(1, {"engine": engine, "result": "bypass"})
+            return None, None
+
+        key = self.get_key(engine, query, count, filter_list, settings)
+        try:
+            entry = self.get(key)
+        except Exception as e:
+            log.warning(f"Error reading the web search cache: {e}")
+            entry = None
+
+        if entry is not None:
+            request_counter.add(1, {"engine": engine, "result": "hit"})
+            latency_saved_histogram.record(entry["latency"], {"engine": engine})
+            return key, [SearchResult(**result) for result in entry["results"]]
+
+        request_counter.add(1, {"engine": engine, "result": "miss"})
+        return key, None
+
+    def _store(
+        self, engine: str, key: str, results: list[SearchResult], latency: float
+    ) -> None:
+        # Empty results are more likely a transient failure than an answer
+        if results:
+            try:
+                self.set(
+                    key,
+                    {
+                        "results": [result.model_dump() for result in results],
+                        "latency": latency,
+                    },
+                    self.get_ttl(engine),
+                )
+            except Exception as e:
+                log.warning(f"Error writing the web search cache: {e}")
+
+    def search(
+        self,
+        engine: str,
+        query: str,
+        count: int,
+        filter_list: Optional[list[str]],
+        search: Callable[[], list[SearchResult]],
+        bypass: bool = False,
+        settings: Optional[dict] = None,
+    ) -> list[SearchResult]:
+        """Return cached results of the search, or run it and cache them."""
+        key, results = self._lookup(engine, query, count, filter_list, settings, bypass)
+        if results is not None:
+            return results
+        if key is None:
+            return search()
+
+        start = time.perf_counter()
+        results = search()
+        self._store(engine, key, results, time.perf_counter() - start)
+        return results
+
+    async def asearch(
+        self,
+        engine: str,
+        query: str,
+        count: int,
+        filter_list: Optional[list[str]],
+        search: Callable[[], Awaitable[list[SearchResult]]],
+        bypass: bool = False,
+        settings: Optional[dict] = None,
+    ) -> list[SearchResult]:
+        """
+        Async variant of search, for searches that return a coroutine. The
+        cache is read and written in the threadpool, as Redis calls block.
+        """
+        key, results = await run_in_threadpool(
+            self._lookup, engine, query, count, filter_list, settings, bypass
+        )
+        if results is not None:
+            return results
+        if key is None:
+            return await search()
+
+        start = time.perf_counter()
+        results = await search()
+        await run_in_threadpool(
+            self._store, engine, key, results, time.perf_counter() - start
+        )
+        return results
+
+
+SEARCH_RESULT_CACHE = SearchResultCache(
+    ttl=WEB_SEARCH_CACHE_TTL,
+    engine_ttls=WEB_SEARCH_CACHE_ENGINE_TTLS,
+    maxsize=WEB_SEARCH_CACHE_MAX_SIZE,
+    redis=(
+        get_redis_connection(
+            REDIS_URL,
+            get_sentinels_from_env(REDIS_SENTINEL_HOSTS, REDIS_SENTINEL_PORT),
+            REDIS_CLUSTER,
+        )
+        if REDIS_URL
+        else None
+    ),
+    key_prefix=REDIS_KEY_PREFIX,
+)
@@ -0,0 +1,167 @@
+import asyncio
+import json
+import logging
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+import aiohttp
+import requests
+
+from open_webui.config import WEB_SEARCH_CLIENT_POOL_SIZE, WEB_SEARCH_CLIENT_TIMEOUT
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+####################################
+#
+# Pooled async HTTP client shared by the search engine adapters
+#
+####################################
+
+
+def encode_params(params: Optional[dict]) -> Optional[list[tuple[str, str]]]:
+    """Query parameters encoded the way requests does: None values are left
+    out, lists repeat their key and other values are formatted with str()."""
+    if params is None:
+        return None
+    encoded = []
+    for key, value in params.items():
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            if item is not None:
+                encoded.append((key, str(item)))
+    return encoded
+
+
+class SearchResponse:
+    """
+    A response read in full, with the parts of the requests API the adapters
+    use. raise_for_status raises requests.HTTPError, as the adapters did.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        reason: Optional[str],
+        headers: Any,
+        content: bytes,
+        encoding: Optional[str] = None,
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(
+                f"{self.status_code} Error: {self.reason} for url: {self.url}",
+                response=self,
+            )
+
+
+class SearchClient:
+    """
+    An aiohttp session per event loop, so concurrent searches share pooled
+    connections without holding a threadpool thread each. Sync callers run
+    their searches on a background event loop owned by the client.
+    """
+
+    def __init__(self, pool_size: int, timeout: float):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # Sessions of closed loops cannot be used any more
+            for other in [other for other in self._sessions if other.is_closed()]:
+                del self._sessions[other]
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trust_env=True,
+            )
+            self._sessions[loop] = session
+        return session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        json: Any = None,
+        data: Any = None,
+        auth: Optional[aiohttp.BasicAuth] = None,
+        middlewares: tuple = (),
+        timeout: Optional[float] = None,
+    ) -> SearchResponse:
+        kwargs = {}
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        if middlewares:
+            kwargs["middlewares"] = middlewares
+
+        async with self._get_session().request(
+            method,
+            url,
+            params=encode_params(params),
+            headers=headers,
+            json=json,
+            data=data,
+            auth=auth,
+            **kwargs,
+        ) as response:
+            content = await response.read()
+            return SearchResponse(
+                str(response.url),
+                response.status,
+                response.reason,
+                response.headers,
+                content,
+                response.charset,
+            )
+
+    async def get(self, url: str, **kwargs) -> SearchResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> SearchResponse:
+        return await self.request("POST", url, **kwargs)
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a search coroutine to completion from sync code."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="web-search-client",
+                    daemon=True,
+                ).start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def close(self) -> None:
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+
+SEARCH_CLIENT = SearchClient(
+    pool_size=WEB_SEARCH_CLIENT_POOL_SIZE, timeout=WEB_SEARCH_CLIENT_TIMEOUT
+)
@@ -2,7 +2,7 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
-import requests
+from open_webui.retrieval.web.client import SEARCH_CLIENT
 from open_webui.retrieval.web.main import SearchResult
 
 log = logging.getLogger(__name__)
@@ -17,7 +17,7 @@ class ExaResult:
     text: str
 
 
-def search_exa(
+async def asearch_exa(
     api_key: str,
     query: str,
     count: int,
@@ -44,7 +44,7 @@ def search_exa(
     }
 
     try:
-        response = requests.post(
+        response = await SEARCH_CLIENT.post(
             f"{EXA_API_BASE}/search", headers=headers, json=payload
         )
         response.raise_for_status()
@@ -72,3 +72,13 @@ def search_exa(
     except Exception as e:
         log.error(f"Error searching Exa: {e}")
         return []
+
+
+def search_exa(
+    api_key: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+) -> list[SearchResult]:
+    """Blocking variant of asearch_exa."""
+    return SEARCH_CLIENT.run(asearch_exa(api_key, query, count, filter_list))
@@ -1,19 +1,18 @@
 import logging
 from typing import Optional, List
 
-import requests
-
 from fastapi import Request
 
 
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 from open_webui.utils.headers import include_user_info_headers
 
 
 log = logging.getLogger(__name__)
 
 
-def search_external(
+async def asearch_external(
     request: Request,
     external_url: str,
     external_api_key: str,
@@ -33,7 +32,7 @@ def search_external(
         if chat_id:
             headers["X-OpenWebUI-Chat-Id"] = str(chat_id)
 
-        response = requests.post(
+        response = await SEARCH_CLIENT.post(
             external_url,
             headers=headers,
             json={
@@ -44,7 +43,7 @@ def search_external(
         response.raise_for_status()
         results = response.json()
         if filter_list:
-            results = get_filtered_results(results, filter_list)
+            results = await aget_filtered_results(results, filter_list)
         results = [
             SearchResult(
                 link=result.get("link"),
@@ -58,3 +57,26 @@ def search_external(
     except Exception as e:
         log.error(f"Error in External search: {e}")
         return []
+
+
+def search_external(
+    request: Request,
+    external_url: str,
+    external_api_key: str,
+    query: str,
+    count: int,
+    filter_list: Optional[List[str]] = None,
+    user=None,
+) -> List[SearchResult]:
+    """Blocking variant of asearch_external."""
+    return SEARCH_CLIENT.run(
+        asearch_external(
+            request,
+            external_url,
+            external_api_key,
+            query,
+            count,
+            filter_list,
+            user=user,
+        )
+    )
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+from opentelemetry import metrics
+
+from open_webui.config import (
+    WEB_SEARCH_FEDERATED_DEADLINE,
+    WEB_SEARCH_FEDERATED_QUORUM,
+)
+from open_webui.retrieval.web.main import SearchResult
+from open_webui.retrieval.web.quality import (
+    canonicalize_url,
+    compute_source_quality_score,
+    infer_source_type,
+)
+
+log = logging.getLogger(__name__)
+
+####################################
+#
+# Federated search over several engines
+#
+####################################
+
+# Rank offset of reciprocal-rank fusion, damping the weight of the top ranks
+RRF_K = 60
+# Share of the fused score given to the source quality score
+QUALITY_WEIGHT = 0.5
+
+meter = metrics.get_meter(__name__)
+
+engine_counter = meter.create_counter(
+    name="webui.web_search.federated.engines",
+    description="Engine searches of federated searches, by outcome "
+    "(answered, failed, late)",
+    unit="1",
+)
+duration_histogram = meter.create_histogram(
+    name="webui.web_search.federated.duration",
+    description="Time until a federated search had its answers",
+    unit="s",
+)
+
+
+def fuse_results(
+    query: str,
+    rankings: list[list[SearchResult]],
+    count: int,
+    strict_authority: bool = False,
+    k: int = RRF_K,
+    quality_weight: float = QUALITY_WEIGHT,
+) -> list[SearchResult]:
+    """
+    Merge the rankings of several engines with reciprocal-rank fusion. Results
+    for the same canonical URL are merged, and each is ranked by its fusion
+    score (normalized to the best possible) blended with its source quality
+    score, computed from the snippet for engines that do not provide one.
+    """
+    if not rankings:
+        return []
+
+    fused: dict[str, dict] = {}
+    for ranking in rankings:
+        for rank, result in enumerate(ranking, start=1):
+            if not result.link:
+                continue
+            key = canonicalize_url(result.link)
+            item = fused.get(key)
+            if item is None:
+                fused[key] = {"result": result, "rrf": 1 / (k + rank)}
+                continue
+            item["rrf"] += 1 / (k + rank)
+            # Keep the best ranked result, filling in what it is missing
+            best = item["result"]
+            item["result"] = best.model_copy(
+                update={
+                    field: value
+                    for field, value in result.model_dump().items()
+                    if value is not None and getattr(best, field) is None
+                }
+            )
+
+    best_rrf = len(rankings) / (k + 1)
+    scored = []
+    for item in fused.values():
+        result = item["result"]
+        quality = result.source_quality_score
+        if quality is None:
+            quality = compute_source_quality_score(
+                query=query,
+                url=result.link,
+                content=result.snippet or "",
+                published_date=result.published_date,
+                strict_authority=strict_authority,
+            )
+            result = result.model_copy(
+                update={
+                    "source_quality_score": quality,
+                    "source_type": result.source_type or infer_source_type(result.link),
+                }
+            )
+        score = (1 - quality_weight) * item["rrf"] / best_rrf + quality_weight * quality
+        scored.append((score, result))
+
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [result for _, result in scored[:count]]
+
+
+async def search_federated(
+    engines: list[str],
+    query: str,
+    count: int,
+    search: Callable[[str], Awaitable[list[SearchResult]]],
+    deadline: float = WEB_SEARCH_FEDERATED_DEADLINE,
+    quorum: int = WEB_SEARCH_FEDERATED_QUORUM,
+    strict_authority: bool = False,
+) -> list[SearchResult]:
+    """
+    Search every engine at once and fuse the results. The search returns as
+    soon as ``quorum`` engines have answered, or at ``deadline`` with the
+    answers so far; engines still searching then are cancelled. Raises the
+    first error if no engine answered.
+    """
+    if not engines:
+        raise Exception("No engines configured for federated web search")
+
+    start = time.perf_counter()
+    tasks = {asyncio.ensure_future(search(engine)): engine for engine in engines}
+    quorum = min(max(quorum, 1), len(engines))
+    rankings: dict[str, list[SearchResult]] = {}
+    errors: list[Exception] = []
+
+    pending = set(tasks)
+    loop = asyncio.get_running_loop()
+    end = loop.time() + deadline
+    try:
+        while pending and len(rankings) < quorum:
+            timeout = end - loop.time()
+            if timeout <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                engine = tasks[task]
+                try:
+                    rankings[engine] = task.result() or []
+                    engine_counter.add(1, {"engine": engine, "outcome": "answered"})
+                except Exception as e:
+                    log.warning(f"Federated search with {engine} failed: {e}")
+                    errors.append(e)
+                    engine_counter.add(1, {"engine": engine, "outcome": "failed"})
+    finally:
+        for task in pending:
+            task.cancel()
+            engine_counter.add(1, {"engine": tasks[task], "outcome": "late"})
+
+    duration_histogram.record(time.perf_counter() - start)
+    if not rankings:
+        if errors:
+            raise errors[0]
+        raise Exception(f"No search engine answered within {deadline} seconds")
+
+    log.debug(
+        f"Federated search answered by {list(rankings)}, "
+        f"{len(pending)} of {len(engines)} engines cut off"
+    )
+    # Fuse in configuration order, so ties do not depend on answer order
+    return fuse_results(
+        query,
+        [rankings[engine] for engine in engines if engine in rankings],
+        count,
+        strict_authority=strict_authority,
+    )
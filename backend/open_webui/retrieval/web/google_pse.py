@@ -1,13 +1,13 @@
 import logging
 from typing import Optional
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_google_pse(
+async def asearch_google_pse(
     api_key: str,
     search_engine_id: str,
     query: str,
@@ -46,7 +46,7 @@ def search_google_pse(
             "num": num_results_this_page,
             "start": start_index,
         }
-        response = requests.request("GET", url, headers=headers, params=params)
+        response = await SEARCH_CLIENT.get(url, headers=headers, params=params)
         response.raise_for_status()
         json_response = response.json()
         results = json_response.get("items", [])
@@ -60,7 +60,7 @@ def search_google_pse(
             break  # No more results from Google PSE, break the loop
 
     if filter_list:
-        all_results = get_filtered_results(all_results, filter_list)
+        all_results = await aget_filtered_results(all_results, filter_list)
 
     return [
         SearchResult(
@@ -70,3 +70,19 @@ def search_google_pse(
         )
         for result in all_results
     ]
+
+
+def search_google_pse(
+    api_key: str,
+    search_engine_id: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+    referer: Optional[str] = None,
+) -> list[SearchResult]:
+    """Blocking variant of asearch_google_pse."""
+    return SEARCH_CLIENT.run(
+        asearch_google_pse(
+            api_key, search_engine_id, query, count, filter_list, referer=referer
+        )
+    )
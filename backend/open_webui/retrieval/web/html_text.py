@@ -0,0 +1,141 @@
+import codecs
+from email.message import Message
+from html.parser import HTMLParser
+from typing import Optional
+
+####################################
+#
+# Streaming HTML to text extraction
+#
+####################################
+
+# Bytes read from the response at a time
+CHUNK_SIZE = 64 * 1024
+
+# Elements whose text BeautifulSoup.get_text() leaves out
+SKIPPED_TAGS = {"script", "style", "template"}
+# Elements whose whitespace-only text BeautifulSoup keeps as is
+PREFORMATTED_TAGS = {"pre", "textarea"}
+# The whitespace BeautifulSoup collapses; other spaces such as &nbsp; are text
+ASCII_SPACES = frozenset("\x20\x0a\x09\x0c\x0d")
+
+
+def get_charset(content_type: Optional[str]) -> Optional[str]:
+    """The charset parameter of a Content-Type header, if any."""
+    message = Message()
+    message["Content-Type"] = content_type or ""
+    return message.get_content_charset()
+
+
+class HTMLTextExtractor(HTMLParser):
+    """
+    Extracts the text and metadata of a page while its body is being read, so
+    only the text is kept in memory rather than the body and a parse tree.
+    Reading stops at ``max_bytes`` (0 for no limit), keeping the text so far.
+    The text and metadata match BeautifulSoup.get_text() and extract_metadata.
+    """
+
+    def __init__(self, max_bytes: int = 0, encoding: Optional[str] = None):
+        super().__init__(convert_charrefs=True)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.truncated = False
+
+        try:
+            decoder = codecs.getincrementaldecoder(encoding or "utf-8")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")
+        self._decoder = decoder(errors="replace")
+
+        self._strings: list[str] = []
+        # Text of the current node, which may arrive over several chunks
+        self._string: list[str] = []
+        self._skip_depth = 0
+        self._preformatted_depth = 0
+        self._title: Optional[list[str]] = None
+        self._in_title = False
+        self._description: Optional[str] = None
+        self._language: Optional[str] = None
+
+    def feed_bytes(self, chunk: bytes) -> bool:
+        """Feed the next chunk of the body, False once the byte limit is reached."""
+        if self.max_bytes:
+            remaining = self.max_bytes - self.size
+            if len(chunk) > remaining:
+                chunk = chunk[:remaining]
+                self.truncated = True
+        self.size += len(chunk)
+        self.feed(self._decoder.decode(chunk))
+        return not self.truncated
+
+    def close(self) -> None:
+        self.feed(self._decoder.decode(b"", final=True))
+        super().close()
+        self._end_string()
+
+    def _end_string(self) -> None:
+        if self._string:
+            string = "".join(self._string)
+            self._string = []
+            # Whitespace between elements collapses to a single character
+            if not self._preformatted_depth and ASCII_SPACES.issuperset(string):
+                string = "\n" if "\n" in string else " "
+            self._strings.append(string)
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        self._end_string()
+        if tag in PREFORMATTED_TAGS:
+            self._preformatted_depth += 1
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "title" and self._title is None:
+            self._title = []
+            self._in_title = True
+        elif tag == "html" and self._language is None:
+            self._language = dict(attrs).get("lang", "No language found.")
+        elif tag == "meta" and self._description is None:
+            attrs = dict(attrs)
+            if attrs.get("name") == "description":
+                self._description = attrs.get("content", "No description found.")
+
+    def handle_endtag(self, tag: str) -> None:
+        self._end_string()
+        if tag in PREFORMATTED_TAGS:
+            self._preformatted_depth = max(self._preformatted_depth - 1, 0)
+        if tag in SKIPPED_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        self._string.append(data)
+        if self._in_title:
+            self._title.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._end_string()
+
+    def handle_decl(self, decl: str) -> None:
+        self._end_string()
+
+    def handle_pi(self, data: str) -> None:
+        self._end_string()
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        strings = self._strings
+        if strip:
+            strings = [string.strip() for string in strings]
+            strings = [string for string in strings if string]
+        return separator.join(strings)
+
+    def get_metadata(self, source: str) -> dict:
+        metadata = {"source": source}
+        if self._title is not None:
+            metadata["title"] = "".join(self._title)
+        if self._description is not None:
+            metadata["description"] = self._description
+        if self._language is not None:
+            metadata["language"] = self._language
+        return metadata
@@ -1,15 +1,16 @@
+import asyncio
 import logging
 from datetime import datetime, timezone
 
-import requests
+from fastapi.concurrency import run_in_threadpool
+from open_webui.retrieval.web.client import SEARCH_CLIENT
 from open_webui.retrieval.web.main import SearchResult
 from open_webui.retrieval.web.quality import (
+    analyze_document,
     build_query_pack,
-    clean_content,
     compute_source_quality_score,
     dedupe_candidates,
     extract_evidence_spans,
-    extract_published_date,
     infer_source_type,
 )
 from yarl import URL
@@ -17,7 +18,61 @@ from yarl import URL
 log = logging.getLogger(__name__)
 
 
-def search_jina(
+def _score_results(
+    data: list[dict], query: str, strict_authority: bool
+) -> list[SearchResult]:
+    results = []
+    for result in data:
+        url_value = result.get("url")
+        if not url_value:
+            continue
+        document = analyze_document(result.get("content") or "")
+        published_date = document.published_date
+        source_quality_score = compute_source_quality_score(
+            query=query,
+            url=url_value,
+            content=document,
+            published_date=published_date,
+            strict_authority=strict_authority,
+        )
+        results.append(
+            SearchResult(
+                link=url_value,
+                title=result.get("title"),
+                snippet=document.content,
+                source_quality_score=source_quality_score,
+                source_type=infer_source_type(url_value),
+                published_date=published_date,
+                retrieved_at=datetime.now(timezone.utc).isoformat(),
+            )
+        )
+    return results
+
+
+async def _asearch_variant(
+    url: str, headers: dict, variant: str, count: int
+) -> list[dict]:
+    payload = {"q": variant, "count": count}
+    try:
+        response = await SEARCH_CLIENT.post(
+            url, headers=headers, json=payload, timeout=60
+        )
+        response.raise_for_status()
+        return [
+            {
+                "url": result.get("url", ""),
+                "title": result.get("title"),
+                "content": result.get("content") or "",
+                "query_variant": variant,
+            }
+            for result in response.json().get("data", [])
+        ]
+    except Exception as e:
+        log.warning("Jina enhanced query variant failed (%s): %s", variant, e)
+        return []
+
+
+async def asearch_jina(
     api_key: str,
     query: str,
     count: int,
@@ -26,6 +81,8 @@ def search_jina(
     strict_authority: bool = False,
     max_candidates: int = 24,
     max_evidence_items: int = 8,
+    adaptive_mode: bool = False,
+    adaptive_threshold: float = 0.7,
 ) -> list[SearchResult]:
     """
     Search using Jina's Search API and return the results as a list of SearchResult objects.
@@ -34,6 +91,8 @@ def search_jina(
         query (str): The query to search for
         count (int): The number of results to return
         base_url (str): Optional custom base URL for the Jina API
+        adaptive_mode (bool): In enhanced mode, search the query variants one at
+            a time and stop once ``count`` results score ``adaptive_threshold``
 
     Returns:
         list[SearchResult]: A list of search results
@@ -53,88 +112,83 @@ def search_jina(
     url = str(URL(jina_search_endpoint))
     if not enhanced_mode:
         payload = {"q": query, "count": count if count <= 10 else 10}
-        response = requests.post(url, headers=headers, json=payload, timeout=60)
+        response = await SEARCH_CLIENT.post(
+            url, headers=headers, json=payload, timeout=60
+        )
         response.raise_for_status()
         data = response.json()
+        # Scoring analyzes every page, so it runs off the event loop
+        return await run_in_threadpool(
+            _score_results, data.get("data", []), query, strict_authority
+        )
+
+    query_pack = build_query_pack(query=query, max_variants=5)
+    max_candidates = max(max_candidates, count)
+    per_query_count = min(10, max(1, max_candidates // max(len(query_pack), 1)))
+
+    seen_urls: set[str] = set()
+    seen_hashes: set[str] = set()
+    scored = []
 
-        results = []
-        for result in data.get("data", []):
-            url_value = result.get("url")
-            if not url_value:
-                continue
-            content = clean_content(result.get("content") or "")
-            published_date = extract_published_date(content)
-            source_quality_score = compute_source_quality_score(
+    def score_candidates(raw_candidates: list[dict]) -> None:
+        for candidate in dedupe_candidates(raw_candidates, seen_urls, seen_hashes):
+            # Analyzed once by dedupe_candidates and shared by scoring and evidence
+            document = candidate.pop("document")
+            published_date = document.published_date
+            score = compute_source_quality_score(
                 query=query,
-                url=url_value,
-                content=content,
+                url=candidate["canonical_url"],
+                content=document,
                 published_date=published_date,
                 strict_authority=strict_authority,
             )
-            results.append(
-                SearchResult(
-                    link=url_value,
-                    title=result.get("title"),
-                    snippet=content,
-                    source_quality_score=source_quality_score,
-                    source_type=infer_source_type(url_value),
-                    published_date=published_date,
-                    retrieved_at=datetime.now(timezone.utc).isoformat(),
-                )
+            evidence = extract_evidence_spans(
+                query=query,
+                content=document,
+                source_url=candidate["canonical_url"],
+                published_date=published_date,
+                source_quality_score=score,
+                max_items=max_evidence_items,
+            )
+            scored.append(
+                {
+                    **candidate,
+                    "published_date": published_date,
+                    "source_quality_score": score,
+                    "source_type": infer_source_type(candidate["canonical_url"]),
+                    "evidence_spans": evidence,
+                }
             )
-        return results
-
-    query_pack = build_query_pack(query=query, max_variants=5)
-    max_candidates = max(max_candidates, count)
-    per_query_count = min(10, max(1, max_candidates // max(len(query_pack), 1)))
 
-    raw_candidates = []
-    for variant in query_pack:
-        payload = {"q": variant, "count": per_query_count}
-        try:
-            response = requests.post(url, headers=headers, json=payload, timeout=60)
-            response.raise_for_status()
-            for result in response.json().get("data", []):
-                raw_candidates.append(
-                    {
-                        "url": result.get("url", ""),
-                        "title": result.get("title"),
-                        "content": result.get("content") or "",
-                        "query_variant": variant,
-                    }
+    if adaptive_mode:
+        for idx, variant in enumerate(query_pack):
+            # Stop issuing variants once the results already found are good
+            # enough
+            good = sum(
+                1
+                for item in scored
+                if item["source_quality_score"] >= adaptive_threshold
+            )
+            if idx > 0 and good >= count:
+                log.debug(
+                    "Jina adaptive search stopped after %d/%d query variants",
+                    idx,
+                    len(query_pack),
                 )
-        except Exception as e:
-            log.warning("Jina enhanced query variant failed (%s): %s", variant, e)
-
-    candidates = dedupe_candidates(raw_candidates)
-
-    scored = []
-    for candidate in candidates:
-        published_date = extract_published_date(candidate.get("content", ""))
-        score = compute_source_quality_score(
-            query=query,
-            url=candidate["canonical_url"],
-            content=candidate.get("content", ""),
-            published_date=published_date,
-            strict_authority=strict_authority,
-        )
-        evidence = extract_evidence_spans(
-            query=query,
-            content=candidate.get("content", ""),
-            source_url=candidate["canonical_url"],
-            published_date=published_date,
-            source_quality_score=score,
-            max_items=max_evidence_items,
-        )
-        scored.append(
-            {
-                **candidate,
-                "published_date": published_date,
-                "source_quality_score": score,
-                "source_type": infer_source_type(candidate["canonical_url"]),
-                "evidence_spans": evidence,
-            }
-        )
+                break
+            raw_candidates = await _asearch_variant(
+                url, headers, variant, per_query_count
+            )
+            await run_in_threadpool(score_candidates, raw_candidates)
+    else:
+        # Variants are independent, so they are all searched at once
+        for raw_candidates in await asyncio.gather(
+            *[
+                _asearch_variant(url, headers, variant, per_query_count)
+                for variant in query_pack
+            ]
+        ):
+            await run_in_threadpool(score_candidates, raw_candidates)
 
     scored.sort(key=lambda item: item["source_quality_score"], reverse=True)
     top_results = scored[:count]
@@ -158,3 +212,32 @@ def search_jina(
             )
         )
     return results
+
+
+def search_jina(
+    api_key: str,
+    query: str,
+    count: int,
+    base_url: str = "",
+    enhanced_mode: bool = False,
+    strict_authority: bool = False,
+    max_candidates: int = 24,
+    max_evidence_items: int = 8,
+    adaptive_mode: bool = False,
+    adaptive_threshold: float = 0.7,
+) -> list[SearchResult]:
+    """Blocking variant of asearch_jina."""
+    return SEARCH_CLIENT.run(
+        asearch_jina(
+            api_key,
+            query,
+            count,
+            base_url,
+            enhanced_mode,
+            strict_authority,
+            max_candidates,
+            max_evidence_items,
+            adaptive_mode,
+            adaptive_threshold,
+        )
+    )
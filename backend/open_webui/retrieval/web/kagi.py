@@ -1,13 +1,13 @@
 import logging
 from typing import Optional
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_kagi(
+async def asearch_kagi(
     api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
 ) -> list[SearchResult]:
     """Search using Kagi's Search API and return the results as a list of SearchResult objects.
@@ -25,7 +25,7 @@ def search_kagi(
     }
     params = {"q": query, "limit": count}
 
-    response = requests.get(url, headers=headers, params=params)
+    response = await SEARCH_CLIENT.get(url, headers=headers, params=params)
     response.raise_for_status()
     json_response = response.json()
     search_results = json_response.get("data", [])
@@ -41,6 +41,13 @@ def search_kagi(
     print(results)
 
     if filter_list:
-        results = get_filtered_results(results, filter_list)
+        results = await aget_filtered_results(results, filter_list)
 
     return results
+
+
+def search_kagi(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Blocking variant of asearch_kagi."""
+    return SEARCH_CLIENT.run(asearch_kagi(api_key, query, count, filter_list))
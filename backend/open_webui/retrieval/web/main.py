@@ -3,6 +3,7 @@ import validators
 from typing import Optional
 from urllib.parse import urlparse
 
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from open_webui.retrieval.web.utils import resolve_hostname
@@ -40,6 +41,13 @@ def get_filtered_results(results, filter_list):
     return filtered_results
 
 
+async def aget_filtered_results(results, filter_list):
+    """get_filtered_results off the event loop, as it resolves hostnames."""
+    if not filter_list:
+        return results
+    return await run_in_threadpool(get_filtered_results, results, filter_list)
+
+
 class SearchResult(BaseModel):
     link: str
     title: Optional[str]
@@ -1,13 +1,13 @@
 import logging
 from typing import Optional
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_mojeek(
+async def asearch_mojeek(
     api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
 ) -> list[SearchResult]:
     """Search using Mojeek's Search API and return the results as a list of SearchResult objects.
@@ -22,13 +22,13 @@ def search_mojeek(
     }
     params = {"q": query, "api_key": api_key, "fmt": "json", "t": count}
 
-    response = requests.get(url, headers=headers, params=params)
+    response = await SEARCH_CLIENT.get(url, headers=headers, params=params)
     response.raise_for_status()
     json_response = response.json()
     results = json_response.get("response", {}).get("results", [])
     print(results)
     if filter_list:
-        results = get_filtered_results(results, filter_list)
+        results = await aget_filtered_results(results, filter_list)
 
     return [
         SearchResult(
@@ -36,3 +36,10 @@ def search_mojeek(
         )
         for result in results
     ]
+
+
+def search_mojeek(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Blocking variant of asearch_mojeek."""
+    return SEARCH_CLIENT.run(asearch_mojeek(api_key, query, count, filter_list))
@@ -0,0 +1,147 @@
+import logging
+import zlib
+from collections import defaultdict
+from typing import Callable, Optional, TypeVar
+
+import numpy as np
+
+from open_webui.retrieval.web.quality import TOKEN_PATTERN, clean_content
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+####################################
+#
+# Near-duplicate detection with MinHash LSH
+#
+####################################
+
+NUM_PERM = 128
+SHINGLE_SIZE = 5
+# Shingles hashed per numpy block, bounds memory for very large pages
+BLOCK_SIZE = 4096
+
+# Multiply-shift hash functions of 32-bit shingle hashes, with wrapping uint64
+# arithmetic standing in for random permutations
+_rng = np.random.default_rng(0x5EED)
+HASH_A = _rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64) * 2 + 1
+HASH_B = _rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64)
+# Odd multiplier combining the token hashes of a shingle
+SHINGLE_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+FINALIZER_MULTIPLIER = np.uint64(0xFF51AFD7ED558CCD)
+
+
+def get_shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """32-bit hashes of the distinct word n-grams of the cleaned, lowercased text."""
+    tokens = TOKEN_PATTERN.findall(clean_content(text).lower())
+    if not tokens:
+        return np.empty(0, dtype=np.uint64)
+
+    token_hashes = np.fromiter(
+        (zlib.crc32(token.encode("utf-8")) for token in tokens),
+        dtype=np.uint64,
+        count=len(tokens),
+    )
+    size = min(size, len(tokens))
+    count = len(tokens) - size + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    for offset in range(size):
+        hashes = hashes * SHINGLE_MULTIPLIER + token_hashes[offset : offset + count]
+    # Mix the low bits, where the last tokens landed, into the kept high bits
+    hashes ^= hashes >> np.uint64(33)
+    hashes *= FINALIZER_MULTIPLIER
+    hashes ^= hashes >> np.uint64(33)
+    return np.unique(hashes >> np.uint64(32))
+
+
+def minhash_signature(shingle_hashes: np.ndarray) -> np.ndarray:
+    signature = np.full(NUM_PERM, np.iinfo(np.uint64).max, dtype=np.uint64)
+    for i in range(0, len(shingle_hashes), BLOCK_SIZE):
+        block = shingle_hashes[i : i + BLOCK_SIZE, None]
+        np.minimum(
+            signature,
+            ((block * HASH_A + HASH_B) >> np.uint64(32)).min(axis=0),
+            out=signature,
+        )
+    return signature
+
+
+def get_lsh_bands(threshold: float, num_perm: int = NUM_PERM) -> tuple[int, int]:
+    """
+    Split the signature into bands of rows, so that pairs at the similarity
+    threshold almost always share a band. Picks the largest LSH threshold
+    (1/bands)**(1/rows) that is still below the requested one.
+    """
+    options = [
+        (num_perm // rows, rows)
+        for rows in range(1, num_perm + 1)
+        if num_perm % rows == 0
+    ]
+    below = [
+        (bands, rows)
+        for bands, rows in options
+        if (1 / bands) ** (1 / rows) <= threshold
+    ]
+    return max(below, key=lambda option: option[1]) if below else options[0]
+
+
+class NearDuplicateIndex:
+    """
+    Texts added so far, bucketed by bands of their MinHash signature. Texts
+    sharing a bucket are compared on their full signatures, which estimate the
+    Jaccard similarity of their shingle sets.
+    """
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self.bands, self.rows = get_lsh_bands(threshold)
+        self.buckets = [defaultdict(list) for _ in range(self.bands)]
+        self.signatures: list[np.ndarray] = []
+
+    def add(self, text: str) -> Optional[int]:
+        """
+        Add the text, unless it is a near duplicate of one added before. Returns
+        the position of that text in the index, or None when the text was added.
+        """
+        shingle_hashes = get_shingle_hashes(text)
+        if not len(shingle_hashes):
+            return None
+
+        signature = minhash_signature(shingle_hashes)
+        keys = [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+        candidates = set()
+        for bucket, key in zip(self.buckets, keys):
+            candidates.update(bucket.get(key, ()))
+        for candidate in sorted(candidates):
+            similarity = np.mean(self.signatures[candidate] == signature)
+            if similarity >= self.threshold:
+                return candidate
+
+        index = len(self.signatures)
+        self.signatures.append(signature)
+        for bucket, key in zip(self.buckets, keys):
+            bucket[key].append(index)
+        return None
+
+
+def remove_near_duplicates(
+    items: list[T], threshold: float, get_text: Callable[[T], str]
+) -> list[T]:
+    """Keep the first of every group of near-duplicate items, in order."""
+    if threshold <= 0 or len(items) < 2:
+        return items
+
+    index = NearDuplicateIndex(threshold)
+    kept = []
+    for item in items:
+        if index.add(get_text(item) or "") is None:
+            kept.append(item)
+
+    if len(kept) < len(items):
+        log.info(f"Removed {len(items) - len(kept)} near-duplicate web pages")
+    return kept
@@ -2,13 +2,13 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_ollama_cloud(
+async def asearch_ollama_cloud(
     url: str,
     api_key: str,
     query: str,
@@ -29,7 +29,9 @@ def search_ollama_cloud(
     payload = {"query": query, "max_results": count}
 
     try:
-        response = requests.post(f"{url}/api/web_search", headers=headers, json=payload)
+        response = await SEARCH_CLIENT.post(
+            f"{url}/api/web_search", headers=headers, json=payload
+        )
         response.raise_for_status()
         data = response.json()
 
@@ -37,7 +39,7 @@ def search_ollama_cloud(
         log.info(f"Found {len(results)} results")
 
         if filter_list:
-            results = get_filtered_results(results, filter_list)
+            results = await aget_filtered_results(results, filter_list)
 
         return [
             SearchResult(
@@ -50,3 +52,16 @@ def search_ollama_cloud(
     except Exception as e:
         log.error(f"Error searching Ollama: {e}")
         return []
+
+
+def search_ollama_cloud(
+    url: str,
+    api_key: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+) -> list[SearchResult]:
+    """Blocking variant of asearch_ollama_cloud."""
+    return SEARCH_CLIENT.run(
+        asearch_ollama_cloud(url, api_key, query, count, filter_list)
+    )
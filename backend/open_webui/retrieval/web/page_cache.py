@@ -0,0 +1,196 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+from pydantic import BaseModel
+
+from open_webui.config import (
+    CACHE_DIR,
+    WEB_LOADER_CACHE_MAX_SIZE_MB,
+    WEB_LOADER_CACHE_TTL,
+)
+from open_webui.retrieval.web.quality import canonicalize_url
+
+log = logging.getLogger(__name__)
+
+####################################
+#
+# On-disk cache of text extracted from fetched web pages
+#
+####################################
+
+
+class CachedPage(BaseModel):
+    text: str
+    metadata: dict
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float
+
+
+class PageCache:
+    """
+    Extracted page text keyed by canonical URL, with the validators needed to
+    revalidate it. Pages are served as is for ``ttl`` seconds after they were
+    fetched or last revalidated, and the least recently used pages are evicted
+    once the cache grows beyond ``max_size`` bytes.
+    """
+
+    def __init__(self, path: Path, ttl: int, max_size: int):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            with self._lock, connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS page (
+                        key TEXT PRIMARY KEY,
+                        text TEXT NOT NULL,
+                        metadata TEXT NOT NULL,
+                        etag TEXT,
+                        last_modified TEXT,
+                        fetched_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL,
+                        size INTEGER NOT NULL
+                    )
+                    """
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS page_accessed_at ON page (accessed_at)"
+                )
+                self._initialized = True
+        return connection
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        return time.time() - page.fetched_at < self.ttl
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        if not self.enabled:
+            return None
+
+        key = canonicalize_url(url)
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT text, metadata, etag, last_modified, fetched_at "
+                "FROM page WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE page SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+
+        text, metadata, etag, last_modified, fetched_at = row
+        return CachedPage(
+            text=text,
+            metadata=json.loads(metadata),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+        )
+
+    def set(
+        self,
+        url: str,
+        text: str,
+        metadata: dict,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        metadata = json.dumps(metadata)
+        size = len(text.encode("utf-8")) + len(metadata)
+        if size > self.max_size:
+            return
+
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO page "
+                "(key, text, metadata, etag, last_modified, fetched_at, "
+                "accessed_at, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    canonicalize_url(url),
+                    text,
+                    metadata,
+                    etag,
+                    last_modified,
+                    now,
+                    now,
+                    size,
+                ),
+            )
+            self._evict(connection)
+
+    def revalidated(self, url: str) -> None:
+        """The server confirmed the cached page is unchanged (304)."""
+        if not self.enabled:
+            return
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "UPDATE page SET fetched_at = ? WHERE key = ?",
+                (time.time(), canonicalize_url(url)),
+            )
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM page"
+        ).fetchone()
+        if total <= self.max_size:
+            return
+
+        evicted = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM page ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM page WHERE key = ?", evicted)
+        log.debug(f"Evicted {len(evicted)} pages from the web page cache")
+
+
+def is_cacheable(status: int, headers) -> bool:
+    return status == 200 and "no-store" not in headers.get("Cache-Control", "").lower()
+
+
+def get_conditional_headers(page: Optional[CachedPage]) -> dict:
+    """Request headers revalidating the cached page."""
+    headers = {}
+    if page is not None:
+        if page.etag:
+            headers["If-None-Match"] = page.etag
+        if page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+    return headers
+
+
+PAGE_CACHE_DIR = CACHE_DIR / "web"
+PAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+PAGE_CACHE = PageCache(
+    PAGE_CACHE_DIR / "pages.db",
+    ttl=WEB_LOADER_CACHE_TTL,
+    max_size=WEB_LOADER_CACHE_MAX_SIZE_MB * 1024 * 1024,
+)
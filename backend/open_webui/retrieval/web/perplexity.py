@@ -1,8 +1,8 @@
 import logging
 from typing import Optional, Literal
-import requests
 
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 MODELS = Literal[
     "sonar",
@@ -17,7 +17,7 @@ SEARCH_CONTEXT_USAGE_LEVELS = Literal["low", "medium", "high"]
 log = logging.getLogger(__name__)
 
 
-def search_perplexity(
+async def asearch_perplexity(
     api_key: str,
     query: str,
     count: int,
@@ -67,7 +67,7 @@ def search_perplexity(
         }
 
         # Make the API request
-        response = requests.request("POST", url, json=payload, headers=headers)
+        response = await SEARCH_CLIENT.post(url, json=payload, headers=headers)
 
         # Parse the JSON response
         json_response = response.json()
@@ -89,7 +89,7 @@ def search_perplexity(
 
         if filter_list:
 
-            results = get_filtered_results(results, filter_list)
+            results = await aget_filtered_results(results, filter_list)
 
         return [
             SearchResult(
@@ -101,3 +101,24 @@ def search_perplexity(
     except Exception as e:
         log.error(f"Error searching with Perplexity API: {e}")
         return []
+
+
+def search_perplexity(
+    api_key: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+    model: MODELS = "sonar",
+    search_context_usage: SEARCH_CONTEXT_USAGE_LEVELS = "medium",
+) -> list[SearchResult]:
+    """Blocking variant of asearch_perplexity."""
+    return SEARCH_CLIENT.run(
+        asearch_perplexity(
+            api_key,
+            query,
+            count,
+            filter_list,
+            model=model,
+            search_context_usage=search_context_usage,
+        )
+    )
@@ -1,7 +1,7 @@
 import logging
 from typing import Optional, Literal
-import requests
 
+from open_webui.retrieval.web.client import SEARCH_CLIENT
 from open_webui.retrieval.web.main import SearchResult, get_filtered_results
 from open_webui.utils.headers import include_user_info_headers
 
@@ -9,7 +9,7 @@ from open_webui.utils.headers import include_user_info_headers
 log = logging.getLogger(__name__)
 
 
-def search_perplexity_search(
+async def asearch_perplexity_search(
     api_key: str,
     query: str,
     count: int,
@@ -55,7 +55,7 @@ def search_perplexity_search(
             headers = include_user_info_headers(headers, user)
 
         # Make the API request
-        response = requests.request("POST", url, json=payload, headers=headers)
+        response = await SEARCH_CLIENT.post(url, json=payload, headers=headers)
         # Parse the JSON response
         json_response = response.json()
 
@@ -72,3 +72,19 @@ def search_perplexity_search(
     except Exception as e:
         log.error(f"Error searching with Perplexity Search API: {e}")
         return []
+
+
+def search_perplexity_search(
+    api_key: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+    api_url: str = "https://api.perplexity.ai/search",
+    user=None,
+) -> list[SearchResult]:
+    """Blocking variant of asearch_perplexity_search."""
+    return SEARCH_CLIENT.run(
+        asearch_perplexity_search(
+            api_key, query, count, filter_list, api_url=api_url, user=user
+        )
+    )
@@ -1,6 +1,7 @@
 import hashlib
 import re
 from datetime import datetime, timezone
+from functools import cached_property, lru_cache
 from typing import Any, Iterable
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
@@ -58,6 +59,30 @@ OFFICIAL_HINTS = {
 }
 
 
+MARKDOWN_IMAGE_PATTERN = re.compile(r"!\[[^\]]*]\([^)]+\)")
+MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]+)]\([^)]+\)")
+EMPTY_LINK_PATTERN = re.compile(r"\[\]\([^)]+\)")
+URL_PATTERN = re.compile(r"https?://\S+")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+")
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?])\s+")
+NUMBER_PATTERN = re.compile(r"\b\d+(\.\d+)?%?\b")
+# All date formats in one scan. The lookahead also finds dates overlapping an
+# earlier match, and at most one alternative can match at any position.
+DATE_PATTERN = re.compile(
+    r"(?=\b(?P<iso>\d{4}-\d{2}-\d{2})\b"
+    r"|\b(?P<us>\d{2}/\d{2}/\d{4})\b"
+    r"|\b(?P<long>[A-Z][a-z]+ \d{1,2}, \d{4})\b)"
+)
+# In order of preference
+DATE_FORMATS = {"iso": "%Y-%m-%d", "us": "%m/%d/%Y", "long": "%B %d, %Y"}
+
+# Sentences shorter than this are not considered as evidence
+MIN_EVIDENCE_SENTENCE_LENGTH = 35
+# Near-identical pages are detected by hashing the start of their content
+CONTENT_HASH_LENGTH = 6000
+
+
 def canonicalize_url(url: str) -> str:
     try:
         parsed = urlparse(url)
@@ -91,11 +116,11 @@ def canonicalize_url(url: str) -> str:
 
 def clean_content(text: str) -> str:
     text = text or ""
-    text = re.sub(r"!\[[^\]]*]\([^)]+\)", " ", text)
-    text = re.sub(r"\[([^\]]+)]\([^)]+\)", r"\1", text)
-    text = re.sub(r"\[\]\([^)]+\)", " ", text)
-    text = re.sub(r"https?://\S+", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = MARKDOWN_IMAGE_PATTERN.sub(" ", text)
+    text = MARKDOWN_LINK_PATTERN.sub(r"\1", text)
+    text = EMPTY_LINK_PATTERN.sub(" ", text)
+    text = URL_PATTERN.sub(" ", text)
+    text = WHITESPACE_PATTERN.sub(" ", text).strip()
     return text
 
 
@@ -103,25 +128,36 @@ def sha256_text(text: str) -> str:
     return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
 
 
+def _parse_date(value: str | None, fmt: str) -> str | None:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, fmt).date().isoformat()
+    except ValueError:
+        return None
+
+
 def extract_published_date(text: str) -> str | None:
     if not text:
         return None
 
-    patterns = [
-        (r"\b(\d{4})-(\d{2})-(\d{2})\b", "%Y-%m-%d"),
-        (r"\b(\d{2})/(\d{2})/(\d{4})\b", "%m/%d/%Y"),
-        (r"\b([A-Z][a-z]+ \d{1,2}, \d{4})\b", "%B %d, %Y"),
-    ]
-
-    for pattern, fmt in patterns:
-        match = re.search(pattern, text)
-        if not match:
-            continue
-        value = match.group(0)
-        try:
-            return datetime.strptime(value, fmt).date().isoformat()
-        except ValueError:
+    # Only the first match of each format counts. A valid date in the most
+    # preferred format ends the scan early.
+    first_matches: dict[str, str] = {}
+    for match in DATE_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind in first_matches:
             continue
+        first_matches[kind] = match.group(kind)
+        if kind == "iso" and _parse_date(first_matches[kind], DATE_FORMATS[kind]):
+            break
+        if len(first_matches) == len(DATE_FORMATS):
+            break
+
+    for kind, fmt in DATE_FORMATS.items():
+        date = _parse_date(first_matches.get(kind), fmt)
+        if date:
+            return date
 
     return None
 
@@ -167,16 +203,75 @@ def build_query_pack(query: str, max_variants: int = 5) -> list[str]:
     return deduped
 
 
-def _query_terms(query: str) -> set[str]:
-    parts = re.findall(r"[A-Za-z0-9]+", (query or "").lower())
-    return {part for part in parts if part not in STOPWORDS and len(part) >= 3}
+@lru_cache(maxsize=256)
+def _query_terms(query: str) -> frozenset[str]:
+    parts = TOKEN_PATTERN.findall((query or "").lower())
+    return frozenset(part for part in parts if part not in STOPWORDS and len(part) >= 3)
+
+
+class AnalyzedSentence:
+    __slots__ = ("text", "terms", "has_number")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.terms = set(TOKEN_PATTERN.findall(text.lower()))
+        # An ASCII number can only match as a token of digits, so most
+        # sentences skip the regex
+        self.has_number = (
+            not text.isascii() or any(term.isdigit() for term in self.terms)
+        ) and NUMBER_PATTERN.search(text) is not None
+
+
+class AnalyzedDocument:
+    """
+    A page cleaned once, with its terms, sentences, content hash and published
+    date computed on first use, so that scoring, evidence extraction and
+    deduplication do not each redo the work.
+    """
+
+    def __init__(self, content: str):
+        self.content = clean_content(content)
+
+    @cached_property
+    def _all_sentences(self) -> list[AnalyzedSentence]:
+        return [
+            AnalyzedSentence(sentence.strip())
+            for sentence in SENTENCE_BOUNDARY_PATTERN.split(self.content)
+        ]
+
+    @cached_property
+    def terms(self) -> set[str]:
+        # Tokens never span sentences, so the page is not tokenized again
+        return set().union(*(sentence.terms for sentence in self._all_sentences))
+
+    @cached_property
+    def sentences(self) -> list[AnalyzedSentence]:
+        return [
+            sentence
+            for sentence in self._all_sentences
+            if len(sentence.text) >= MIN_EVIDENCE_SENTENCE_LENGTH
+        ]
+
+    @cached_property
+    def content_hash(self) -> str:
+        return sha256_text(self.content[:CONTENT_HASH_LENGTH])
+
+    @cached_property
+    def published_date(self) -> str | None:
+        return extract_published_date(self.content)
+
+
+def analyze_document(content: str | AnalyzedDocument) -> AnalyzedDocument:
+    if isinstance(content, AnalyzedDocument):
+        return content
+    return AnalyzedDocument(content)
 
 
 def compute_source_quality_score(
     *,
     query: str,
     url: str,
-    content: str,
+    content: str | AnalyzedDocument,
     published_date: str | None,
     strict_authority: bool,
 ) -> float:
@@ -191,12 +286,11 @@ def compute_source_quality_score(
     }
     authority = authority_map.get(source_type, 0.5)
 
-    cleaned = clean_content(content)
-    density = min(len(cleaned) / 2200.0, 1.0)
+    document = analyze_document(content)
+    density = min(len(document.content) / 2200.0, 1.0)
 
     terms = _query_terms(query)
-    text_terms = set(re.findall(r"[A-Za-z0-9]+", cleaned.lower()))
-    overlap = len(terms.intersection(text_terms))
+    overlap = len(terms.intersection(document.terms))
     relevance = min(overlap / max(len(terms), 1), 1.0)
 
     freshness = 0.5
@@ -229,29 +323,24 @@ def compute_source_quality_score(
 def extract_evidence_spans(
     *,
     query: str,
-    content: str,
+    content: str | AnalyzedDocument,
     source_url: str,
     published_date: str | None,
     source_quality_score: float,
     max_items: int = 4,
 ) -> list[dict[str, Any]]:
-    cleaned = clean_content(content)
-    sentences = re.split(r"(?<=[.!?])\s+", cleaned)
+    document = analyze_document(content)
     terms = _query_terms(query)
     now_iso = datetime.now(timezone.utc).isoformat()
 
     ranked: list[tuple[float, str]] = []
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if len(sentence) < 35:
-            continue
-        sentence_terms = set(re.findall(r"[A-Za-z0-9]+", sentence.lower()))
-        overlap = len(terms.intersection(sentence_terms))
-        signal = 0.15 if re.search(r"\b\d+(\.\d+)?%?\b", sentence) else 0.0
+    for sentence in document.sentences:
+        overlap = len(terms.intersection(sentence.terms))
+        signal = 0.15 if sentence.has_number else 0.0
         score = overlap + signal
         if score <= 0:
             continue
-        ranked.append((score, sentence))
+        ranked.append((score, sentence.text))
 
     ranked.sort(key=lambda item: item[0], reverse=True)
     evidence: list[dict[str, Any]] = []
@@ -270,17 +359,22 @@ def extract_evidence_spans(
     return evidence
 
 
-def dedupe_candidates(candidates: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
-    seen_urls: set[str] = set()
-    seen_hashes: set[str] = set()
+def dedupe_candidates(
+    candidates: Iterable[dict[str, Any]],
+    seen_urls: set[str] | None = None,
+    seen_hashes: set[str] | None = None,
+) -> list[dict[str, Any]]:
+    # Passing the same sets again dedupes batches against earlier ones
+    seen_urls = set() if seen_urls is None else seen_urls
+    seen_hashes = set() if seen_hashes is None else seen_hashes
     deduped: list[dict[str, Any]] = []
 
     for candidate in candidates:
         canonical_url = canonicalize_url(candidate.get("url", ""))
         if not canonical_url:
             continue
-        content = clean_content(candidate.get("content") or "")
-        content_hash = sha256_text(content[:6000])
+        document = analyze_document(candidate.get("content") or "")
+        content_hash = document.content_hash
 
         if canonical_url in seen_urls or content_hash in seen_hashes:
             continue
@@ -290,7 +384,8 @@ def dedupe_candidates(candidates: Iterable[dict[str, Any]]) -> list[dict[str, An
         enriched = dict(candidate)
         enriched["canonical_url"] = canonical_url
         enriched["content_hash"] = content_hash
-        enriched["content"] = content
+        enriched["content"] = document.content
+        enriched["document"] = document
         deduped.append(enriched)
 
     return deduped
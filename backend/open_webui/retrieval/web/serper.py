@@ -2,13 +2,13 @@ import json
 import logging
 from typing import Optional
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_serper(
+async def asearch_serper(
     api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
 ) -> list[SearchResult]:
     """Search using serper.dev's API and return the results as a list of SearchResult objects.
@@ -22,7 +22,7 @@ def search_serper(
     payload = json.dumps({"q": query})
     headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
 
-    response = requests.request("POST", url, headers=headers, data=payload)
+    response = await SEARCH_CLIENT.post(url, headers=headers, data=payload)
     response.raise_for_status()
 
     json_response = response.json()
@@ -30,7 +30,7 @@ def search_serper(
         json_response.get("organic", []), key=lambda x: x.get("position", 0)
     )
     if filter_list:
-        results = get_filtered_results(results, filter_list)
+        results = await aget_filtered_results(results, filter_list)
     return [
         SearchResult(
             link=result["link"],
@@ -39,3 +39,10 @@ def search_serper(
         )
         for result in results[:count]
     ]
+
+
+def search_serper(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Blocking variant of asearch_serper."""
+    return SEARCH_CLIENT.run(asearch_serper(api_key, query, count, filter_list))
@@ -2,13 +2,13 @@ import logging
 from typing import Optional
 from urllib.parse import urlencode
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_serply(
+async def asearch_serply(
     api_key: str,
     query: str,
     count: int,
@@ -46,7 +46,7 @@ def search_serply(
         "X-Proxy-Location": proxy_location,
     }
 
-    response = requests.request("GET", url, headers=headers)
+    response = await SEARCH_CLIENT.get(url, headers=headers)
     response.raise_for_status()
 
     json_response = response.json()
@@ -56,7 +56,7 @@ def search_serply(
         json_response.get("results", []), key=lambda x: x.get("realPosition", 0)
     )
     if filter_list:
-        results = get_filtered_results(results, filter_list)
+        results = await aget_filtered_results(results, filter_list)
     return [
         SearchResult(
             link=result["link"],
@@ -65,3 +65,28 @@ def search_serply(
         )
         for result in results[:count]
     ]
+
+
+def search_serply(
+    api_key: str,
+    query: str,
+    count: int,
+    hl: str = "us",
+    limit: int = 10,
+    device_type: str = "desktop",
+    proxy_location: str = "US",
+    filter_list: Optional[list[str]] = None,
+) -> list[SearchResult]:
+    """Blocking variant of asearch_serply."""
+    return SEARCH_CLIENT.run(
+        asearch_serply(
+            api_key,
+            query,
+            count,
+            hl=hl,
+            limit=limit,
+            device_type=device_type,
+            proxy_location=proxy_location,
+            filter_list=filter_list,
+        )
+    )
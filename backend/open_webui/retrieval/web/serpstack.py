@@ -1,13 +1,13 @@
 import logging
 from typing import Optional
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_serpstack(
+async def asearch_serpstack(
     api_key: str,
     query: str,
     count: int,
@@ -29,7 +29,7 @@ def search_serpstack(
         "query": query,
     }
 
-    response = requests.request("POST", url, headers=headers, params=params)
+    response = await SEARCH_CLIENT.post(url, headers=headers, params=params)
     response.raise_for_status()
 
     json_response = response.json()
@@ -37,10 +37,25 @@ def search_serpstack(
         json_response.get("organic_results", []), key=lambda x: x.get("position", 0)
     )
     if filter_list:
-        results = get_filtered_results(results, filter_list)
+        results = await aget_filtered_results(results, filter_list)
     return [
         SearchResult(
             link=result["url"], title=result.get("title"), snippet=result.get("snippet")
         )
         for result in results[:count]
     ]
+
+
+def search_serpstack(
+    api_key: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+    https_enabled: bool = True,
+) -> list[SearchResult]:
+    """Blocking variant of asearch_serpstack."""
+    return SEARCH_CLIENT.run(
+        asearch_serpstack(
+            api_key, query, count, filter_list, https_enabled=https_enabled
+        )
+    )
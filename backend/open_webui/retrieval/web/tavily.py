@@ -1,13 +1,13 @@
 import logging
 from typing import Optional
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_tavily(
+async def asearch_tavily(
     api_key: str,
     query: str,
     count: int,
@@ -30,14 +30,14 @@ def search_tavily(
         "Authorization": f"Bearer {api_key}",
     }
     data = {"query": query, "max_results": count}
-    response = requests.post(url, headers=headers, json=data)
+    response = await SEARCH_CLIENT.post(url, headers=headers, json=data)
     response.raise_for_status()
 
     json_response = response.json()
 
     results = json_response.get("results", [])
     if filter_list:
-        results = get_filtered_results(results, filter_list)
+        results = await aget_filtered_results(results, filter_list)
 
     return [
         SearchResult(
@@ -47,3 +47,13 @@ def search_tavily(
         )
         for result in results
     ]
+
+
+def search_tavily(
+    api_key: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+) -> list[SearchResult]:
+    """Blocking variant of asearch_tavily."""
+    return SEARCH_CLIENT.run(asearch_tavily(api_key, query, count, filter_list))
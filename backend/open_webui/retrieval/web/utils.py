@@ -4,10 +4,13 @@ import socket
 import ssl
 import urllib.parse
 import urllib.request
+from collections import defaultdict
 from datetime import datetime, time, timedelta
 from typing import (
     Any,
     AsyncIterator,
+    Awaitable,
+    Callable,
     Dict,
     Iterator,
     List,
@@ -34,6 +37,9 @@ from open_webui.config import (
     PLAYWRIGHT_TIMEOUT,
     WEB_LOADER_ENGINE,
     WEB_LOADER_TIMEOUT,
+    WEB_LOADER_CONCURRENT_REQUESTS_PER_HOST,
+    WEB_LOADER_MAX_PAGE_SIZE_MB,
+    WEB_LOADER_URL_DEADLINE,
     FIRECRAWL_API_BASE_URL,
     FIRECRAWL_API_KEY,
     FIRECRAWL_TIMEOUT,
@@ -43,6 +49,18 @@ from open_webui.config import (
     EXTERNAL_WEB_LOADER_API_KEY,
     WEB_FETCH_FILTER_LIST,
 )
+from open_webui.retrieval.web.browser_pool import get_browser_context_pool
+from open_webui.retrieval.web.html_text import (
+    CHUNK_SIZE,
+    HTMLTextExtractor,
+    get_charset,
+)
+from open_webui.retrieval.web.page_cache import (
+    PAGE_CACHE,
+    CachedPage,
+    get_conditional_headers,
+    is_cacheable,
+)
 from open_webui.utils.misc import is_string_allowed
 
 log = logging.getLogger(__name__)
@@ -143,12 +161,18 @@ def verify_ssl_cert(url: str) -> bool:
 class RateLimitMixin:
     async def _wait_for_rate_limit(self):
         """Wait to respect the rate limit if specified."""
-        if self.requests_per_second and self.last_request_time:
-            min_interval = timedelta(seconds=1.0 / self.requests_per_second)
-            time_since_last = datetime.now() - self.last_request_time
-            if time_since_last < min_interval:
-                await asyncio.sleep((min_interval - time_since_last).total_seconds())
-        self.last_request_time = datetime.now()
+        # Held while waiting, so that concurrent loads are spaced out in turn
+        if getattr(self, "_rate_limit_lock", None) is None:
+            self._rate_limit_lock = asyncio.Lock()
+        async with self._rate_limit_lock:
+            if self.requests_per_second and self.last_request_time:
+                min_interval = timedelta(seconds=1.0 / self.requests_per_second)
+                time_since_last = datetime.now() - self.last_request_time
+                if time_since_last < min_interval:
+                    await asyncio.sleep(
+                        (min_interval - time_since_last).total_seconds()
+                    )
+            self.last_request_time = datetime.now()
 
     def _sync_wait_for_rate_limit(self):
         """Synchronous version of rate limit wait."""
@@ -517,57 +541,122 @@ class SafePlaywrightURLLoader(PlaywrightURLLoader, RateLimitMixin, URLProcessing
             browser.close()
 
     async def alazy_load(self) -> AsyncIterator[Document]:
-        """Safely load URLs asynchronously with support for remote browser."""
-        from playwright.async_api import async_playwright
-
-        async with async_playwright() as p:
-            # Use remote browser if ws_endpoint is provided, otherwise use local browser
-            if self.playwright_ws_url:
-                browser = await p.chromium.connect(self.playwright_ws_url)
-            else:
-                browser = await p.chromium.launch(
-                    headless=self.headless, proxy=self.proxy
-                )
+        """
+        Safely load URLs asynchronously, in parallel on the pooled browser
+        contexts shared across requests.
+        """
+        pool = get_browser_context_pool(
+            self.playwright_ws_url, self.headless, self.proxy
+        )
 
-            for url in self.urls:
-                try:
-                    await self._safe_process_url(url)
-                    page = await browser.new_page()
-                    response = await page.goto(url, timeout=self.playwright_timeout)
-                    if response is None:
-                        raise ValueError(f"page.goto() returned None for url {url}")
+        async def load(url: str) -> Optional[Document]:
+            try:
+                await self._safe_process_url(url)
+                async with pool.context() as context:
+                    page = await context.new_page()
+                    try:
+                        response = await page.goto(url, timeout=self.playwright_timeout)
+                        if response is None:
+                            raise ValueError(f"page.goto() returned None for url {url}")
+
+                        text = await self.evaluator.evaluate_async(
+                            page, context.browser, response
+                        )
+                    finally:
+                        await page.close()
+                return Document(page_content=text, metadata={"source": url})
+            except Exception as e:
+                if self.continue_on_failure:
+                    log.exception(f"Error loading {url}: {e}")
+                    return None
+                raise e
 
-                    text = await self.evaluator.evaluate_async(page, browser, response)
-                    metadata = {"source": url}
-                    yield Document(page_content=text, metadata=metadata)
-                except Exception as e:
-                    if self.continue_on_failure:
-                        log.exception(f"Error loading {url}: {e}")
-                        continue
-                    raise e
-            await browser.close()
+        documents = await asyncio.gather(*[load(url) for url in self.urls])
+        for document in documents:
+            if document is not None:
+                yield document
 
 
 class SafeWebBaseLoader(WebBaseLoader):
     """WebBaseLoader with enhanced error handling for URLs."""
 
-    def __init__(self, trust_env: bool = False, *args, **kwargs):
+    def __init__(
+        self,
+        trust_env: bool = False,
+        *args,
+        requests_per_host: int = WEB_LOADER_CONCURRENT_REQUESTS_PER_HOST,
+        max_page_size: int = int(WEB_LOADER_MAX_PAGE_SIZE_MB * 1024 * 1024),
+        url_deadline: float = WEB_LOADER_URL_DEADLINE,
+        **kwargs,
+    ):
         """Initialize SafeWebBaseLoader
         Args:
             trust_env (bool, optional): set to True if using proxy to make web requests, for example
                 using http(s)_proxy environment variables. Defaults to False.
+            requests_per_host (int): Max number of concurrent requests to a single host.
+            max_page_size (int): Bytes read from a page at most, 0 for no limit.
+            url_deadline (float): Seconds after which a page still loading is left
+                out of the results, 0 for no deadline.
         """
         super().__init__(*args, **kwargs)
         self.trust_env = trust_env
+        self.requests_per_host = requests_per_host
+        self.max_page_size = max_page_size
+        self.url_deadline = url_deadline
 
     async def _fetch(
         self, url: str, retries: int = 3, cooldown: int = 2, backoff: float = 1.5
     ) -> str:
+        return await self._request(
+            url,
+            lambda response: response.text(),
+            retries=retries,
+            cooldown=cooldown,
+            backoff=backoff,
+        )
+
+    async def _fetch_page(
+        self, url: str, headers: Optional[dict] = None
+    ) -> tuple[int, Optional[HTMLTextExtractor], Any]:
+        """
+        Fetch the url, extracting its text while the body is read. Returns the
+        status, the extractor (None when not modified) and response headers.
+        """
+
+        async def read(response):
+            if response.status == 304:
+                return response.status, None, response.headers
+            if self.raise_for_status:
+                response.raise_for_status()
+
+            extractor = HTMLTextExtractor(
+                self.max_page_size, self.encoding or response.charset
+            )
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                if not extractor.feed_bytes(chunk):
+                    log.warning(
+                        f"{url} is larger than {self.max_page_size} bytes, truncating"
+                    )
+                    break
+            extractor.close()
+            return response.status, extractor, response.headers
+
+        return await self._request(url, read, headers=headers)
+
+    async def _request(
+        self,
+        url: str,
+        read: Callable[[aiohttp.ClientResponse], Awaitable[Any]],
+        headers: Optional[dict] = None,
+        retries: int = 3,
+        cooldown: int = 2,
+        backoff: float = 1.5,
+    ) -> Any:
         async with aiohttp.ClientSession(trust_env=self.trust_env) as session:
             for i in range(retries):
                 try:
                     kwargs: Dict = dict(
-                        headers=self.session.headers,
+                        headers={**self.session.headers, **(headers or {})},
                         cookies=self.session.cookies.get_dict(),
                     )
                     if not self.session.verify:
@@ -578,9 +667,7 @@ class SafeWebBaseLoader(WebBaseLoader):
                         **(self.requests_kwargs | kwargs),
                         allow_redirects=False,
                     ) as response:
-                        if self.raise_for_status:
-                            response.raise_for_status()
-                        return await response.text()
+                        return await read(response)
                 except aiohttp.ClientConnectionError as e:
                     if i == retries - 1:
                         raise
@@ -617,36 +704,135 @@ class SafeWebBaseLoader(WebBaseLoader):
         results = await self.fetch_all(urls)
         return self._unpack_fetch_results(results, urls, parser=parser)
 
+    @staticmethod
+    def _cached_document(path: str, page: CachedPage) -> Document:
+        # The cache is keyed by canonical URL, the source is the requested one
+        return Document(
+            page_content=page.text, metadata={**page.metadata, "source": path}
+        )
+
+    def _load_page(self, path: str) -> Document:
+        """Load a page from the cache, revalidating it once it is stale."""
+        cached = PAGE_CACHE.get(path)
+        if cached is not None and PAGE_CACHE.is_fresh(cached):
+            return self._cached_document(path, cached)
+
+        requests_kwargs = dict(self.requests_kwargs)
+        requests_kwargs["headers"] = {
+            **requests_kwargs.get("headers", {}),
+            **get_conditional_headers(cached),
+        }
+        with self.session.get(path, stream=True, **requests_kwargs) as response:
+            if response.status_code == 304:
+                if cached is None:
+                    raise ValueError(f"{path} is not modified, but is not cached")
+                PAGE_CACHE.revalidated(path)
+                return self._cached_document(path, cached)
+
+            if self.raise_for_status:
+                response.raise_for_status()
+
+            extractor = HTMLTextExtractor(
+                self.max_page_size,
+                self.encoding or get_charset(response.headers.get("Content-Type")),
+            )
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if not extractor.feed_bytes(chunk):
+                    log.warning(
+                        f"{path} is larger than {self.max_page_size} bytes, truncating"
+                    )
+                    break
+            extractor.close()
+
+        return self._store_page(path, extractor, response.status_code, response.headers)
+
+    def _store_page(
+        self, path: str, extractor: HTMLTextExtractor, status: Optional[int], headers
+    ) -> Document:
+        text = extractor.get_text(**self.bs_get_text_kwargs)
+        metadata = extractor.get_metadata(path)
+        if is_cacheable(status, headers):
+            PAGE_CACHE.set(
+                path,
+                text,
+                metadata,
+                headers.get("ETag"),
+                headers.get("Last-Modified"),
+            )
+        return Document(page_content=text, metadata=metadata)
+
+    async def _aload_page(
+        self,
+        path: str,
+        semaphore: asyncio.Semaphore,
+        host_semaphore: asyncio.Semaphore,
+    ) -> Document:
+        cached = await run_in_threadpool(PAGE_CACHE.get, path)
+        if cached is not None and PAGE_CACHE.is_fresh(cached):
+            return self._cached_document(path, cached)
+
+        # Wait for the host first, so a busy host does not hold global slots
+        async with host_semaphore, semaphore:
+            try:
+                status, extractor, headers = await self._fetch_page(
+                    path, headers=get_conditional_headers(cached)
+                )
+                if status == 304 and cached is None:
+                    raise ValueError(f"{path} is not modified, but is not cached")
+            except Exception as e:
+                if not self.continue_on_failure:
+                    raise
+                log.warning(f"Error fetching {path}, skipping: {e}")
+                status, extractor, headers = None, HTMLTextExtractor(), {}
+
+        if status == 304:
+            await run_in_threadpool(PAGE_CACHE.revalidated, path)
+            return self._cached_document(path, cached)
+
+        return await run_in_threadpool(
+            self._store_page, path, extractor, status, headers
+        )
+
     def lazy_load(self) -> Iterator[Document]:
         """Lazy load text from the url(s) in web_path with error handling."""
         for path in self.web_paths:
             try:
-                soup = self._scrape(path, bs_kwargs=self.bs_kwargs)
-                text = soup.get_text(**self.bs_get_text_kwargs)
-
-                # Build metadata
-                metadata = extract_metadata(soup, path)
-
-                yield Document(page_content=text, metadata=metadata)
+                yield self._load_page(path)
             except Exception as e:
                 # Log the error and continue with the next URL
                 log.exception(f"Error loading {path}: {e}")
 
     async def alazy_load(self) -> AsyncIterator[Document]:
-        """Async lazy load text from the url(s) in web_path."""
-        results = await self.ascrape_all(self.web_paths)
-        for path, soup in zip(self.web_paths, results):
-            text = soup.get_text(**self.bs_get_text_kwargs)
-            metadata = {"source": path}
-            if title := soup.find("title"):
-                metadata["title"] = title.get_text()
-            if description := soup.find("meta", attrs={"name": "description"}):
-                metadata["description"] = description.get(
-                    "content", "No description found."
+        """
+        Async lazy load text from the url(s) in web_path. Pages still loading
+        at the deadline are left out, so one slow host cannot hold the batch.
+        """
+        semaphore = asyncio.Semaphore(self.requests_per_second)
+        host_semaphores = defaultdict(lambda: asyncio.Semaphore(self.requests_per_host))
+
+        async def load(path: str) -> Optional[Document]:
+            try:
+                return await asyncio.wait_for(
+                    self._aload_page(
+                        path,
+                        semaphore,
+                        host_semaphores[urllib.parse.urlparse(path).netloc],
+                    ),
+                    timeout=self.url_deadline or None,
                 )
-            if html := soup.find("html"):
-                metadata["language"] = html.get("lang", "No language found.")
-            yield Document(page_content=text, metadata=metadata)
+            except asyncio.TimeoutError:
+                if not self.continue_on_failure:
+                    raise
+                log.warning(
+                    f"Loading {path} exceeded the {self.url_deadline}s deadline, "
+                    "skipping"
+                )
+                return None
+
+        documents = await asyncio.gather(*[load(path) for path in self.web_paths])
+        for document in documents:
+            if document is not None:
+                yield document
 
     async def aload(self) -> list[Document]:
         """Load data into Document objects."""
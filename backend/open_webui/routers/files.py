@@ -38,6 +38,7 @@ from open_webui.models.files import (
 from open_webui.models.chats import Chats
 from open_webui.models.knowledge import Knowledges
 from open_webui.models.groups import Groups
+from open_webui.models.vector_content_hashes import VectorContentHashes
 
 
 from open_webui.routers.retrieval import ProcessFileForm, process_file
@@ -480,6 +481,7 @@ async def delete_all_files(
         try:
             Storage.delete_all_files()
             VECTOR_DB_CLIENT.reset()
+            VectorContentHashes.delete_all(db=db)
         except Exception as e:
             log.exception(e)
             log.error("Error deleting files")
@@ -562,6 +564,9 @@ async def get_file_process_status(
                             event = {"status": status}
                             if status == "failed":
                                 event["error"] = data.get("error")
+                            if data.get("progress"):
+                                # Per-stage counters from pipelined ingestion
+                                event["progress"] = data["progress"]
 
                             yield f"data: {json.dumps(event)}\n\n"
                             if status in ("completed", "failed"):
@@ -580,7 +585,14 @@ async def get_file_process_status(
                 media_type="text/event-stream",
             )
         else:
-            return {"status": file.data.get("status", "pending")}
+            return {
+                "status": file.data.get("status", "pending"),
+                **(
+                    {"progress": file.data["progress"]}
+                    if file.data.get("progress")
+                    else {}
+                ),
+            }
     else:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1014,6 +1026,7 @@ async def delete_file_by_id(
             try:
                 Storage.delete_file(file.path)
                 VECTOR_DB_CLIENT.delete(collection_name=f"file-{id}")
+                VectorContentHashes.delete_by_collection_name(f"file-{id}", db=db)
             except Exception as e:
                 log.exception(e)
                 log.error("Error deleting files")
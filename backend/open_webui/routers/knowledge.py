@@ -30,10 +30,12 @@ from open_webui.storage.provider import Storage
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.utils.auth import get_verified_user, get_admin_user
 from open_webui.utils.access_control import has_access, has_permission
+from open_webui.utils.knowledge_reindex import knowledge_reindex_manager
 
 
 from open_webui.config import BYPASS_ADMIN_ACCESS_CONTROL
 from open_webui.models.models import Models, ModelForm
+from open_webui.models.vector_content_hashes import VectorContentHashes
 
 
 log = logging.getLogger(__name__)
@@ -276,64 +278,64 @@ async def create_new_knowledge(
 @router.post("/reindex", response_model=bool)
 async def reindex_knowledge_files(
     request: Request,
+    resume: bool = Query(True),
     user=Depends(get_verified_user),
-    db: Session = Depends(get_session),
 ):
+    """
+    Start reindexing all knowledge base files in the background.
+    Resumes an interrupted or stopped job unless `resume` is false.
+    """
     if user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=ERROR_MESSAGES.UNAUTHORIZED,
         )
 
-    knowledge_bases = Knowledges.get_knowledge_bases(db=db)
+    def list_knowledge_bases() -> list[str]:
+        return [
+            knowledge_base.id for knowledge_base in Knowledges.get_knowledge_bases()
+        ]
+
+    def list_files(knowledge_base_id: str) -> list[str]:
+        return [file.id for file in Knowledges.get_files_by_id(knowledge_base_id)]
 
-    log.info(f"Starting reindexing for {len(knowledge_bases)} knowledge bases")
+    def reset_collection(knowledge_base_id: str):
+        if VECTOR_DB_CLIENT.has_collection(collection_name=knowledge_base_id):
+            VECTOR_DB_CLIENT.delete_collection(collection_name=knowledge_base_id)
+        VectorContentHashes.delete_by_collection_name(knowledge_base_id)
 
-    for knowledge_base in knowledge_bases:
+    def reindex_file(knowledge_base_id: str, file_id: str):
         try:
-            files = Knowledges.get_files_by_id(knowledge_base.id, db=db)
-            try:
-                if VECTOR_DB_CLIENT.has_collection(collection_name=knowledge_base.id):
-                    VECTOR_DB_CLIENT.delete_collection(
-                        collection_name=knowledge_base.id
-                    )
-            except Exception as e:
-                log.error(f"Error deleting collection {knowledge_base.id}: {str(e)}")
-                continue  # Skip, don't raise
-
-            failed_files = []
-            for file in files:
-                try:
-                    await run_in_threadpool(
-                        process_file,
-                        request,
-                        ProcessFileForm(
-                            file_id=file.id, collection_name=knowledge_base.id
-                        ),
-                        user=user,
-                        db=db,
-                    )
-                except Exception as e:
-                    log.error(
-                        f"Error processing file {file.filename} (ID: {file.id}): {str(e)}"
-                    )
-                    failed_files.append({"file_id": file.id, "error": str(e)})
-                    continue
+            process_file(
+                request,
+                ProcessFileForm(file_id=file_id, collection_name=knowledge_base_id),
+                user=user,
+                db=None,
+            )
+        except HTTPException as e:
+            # Already indexed before the job was interrupted
+            if ERROR_MESSAGES.DUPLICATE_CONTENT not in str(e.detail):
+                raise Exception(e.detail)
+
+    if not knowledge_reindex_manager.start(
+        list_knowledge_bases,
+        list_files,
+        reset_collection,
+        reindex_file,
+        resume=resume,
+    ):
+        log.info("Knowledge reindex is already running")
+    return True
 
-        except Exception as e:
-            log.error(f"Error processing knowledge base {knowledge_base.id}: {str(e)}")
-            # Don't raise, just continue
-            continue
 
-        if failed_files:
-            log.warning(
-                f"Failed to process {len(failed_files)} files in knowledge base {knowledge_base.id}"
-            )
-            for failed in failed_files:
-                log.warning(f"File ID: {failed['file_id']}, Error: {failed['error']}")
+@router.get("/reindex/status", response_model=dict)
+async def get_reindex_knowledge_files_status(user=Depends(get_admin_user)):
+    return knowledge_reindex_manager.status()
 
-    log.info(f"Reindexing completed.")
-    return True
+
+@router.post("/reindex/stop", response_model=bool)
+async def stop_reindex_knowledge_files(user=Depends(get_admin_user)):
+    return knowledge_reindex_manager.stop()
 
 
 ############################
@@ -631,16 +633,11 @@ def update_file_from_knowledge_by_id(
             detail=ERROR_MESSAGES.NOT_FOUND,
         )
 
-    # Remove content from the vector database
-    VECTOR_DB_CLIENT.delete(
-        collection_name=knowledge.id, filter={"file_id": form_data.file_id}
-    )
-
-    # Add content to the vector database
+    # Re-index the file's content, replacing only the chunks that changed
     try:
         process_file(
             request,
-            ProcessFileForm(file_id=form_data.file_id, collection_name=id),
+            ProcessFileForm(file_id=form_data.file_id, collection_name=id, update=True),
             user=user,
             db=db,
         )
@@ -712,6 +709,9 @@ def remove_file_from_knowledge_by_id(
         VECTOR_DB_CLIENT.delete(
             collection_name=knowledge.id, filter={"hash": file.hash}
         )  # Remove by hash as well in case of duplicates
+
+        VectorContentHashes.delete_by_file_id(knowledge.id, form_data.file_id, db=db)
+        VectorContentHashes.delete_by_hash(knowledge.id, file.hash, db=db)
     except Exception as e:
         log.debug("This was most likely caused by bypassing embedding processing")
         log.debug(e)
@@ -723,6 +723,7 @@ def remove_file_from_knowledge_by_id(
             file_collection = f"file-{form_data.file_id}"
             if VECTOR_DB_CLIENT.has_collection(collection_name=file_collection):
                 VECTOR_DB_CLIENT.delete_collection(collection_name=file_collection)
+            VectorContentHashes.delete_by_collection_name(file_collection, db=db)
         except Exception as e:
             log.debug("This was most likely caused by bypassing embedding processing")
             log.debug(e)
@@ -804,6 +805,7 @@ async def delete_knowledge_by_id(
     except Exception as e:
         log.debug(e)
         pass
+    VectorContentHashes.delete_by_collection_name(id, db=db)
 
     # Remove knowledge base embedding
     remove_knowledge_base_metadata_embedding(id)
@@ -843,6 +845,7 @@ async def reset_knowledge_by_id(
     except Exception as e:
         log.debug(e)
         pass
+    VectorContentHashes.delete_by_collection_name(id, db=db)
 
     knowledge = Knowledges.reset_knowledge_by_id(id=id, db=db)
     return knowledge
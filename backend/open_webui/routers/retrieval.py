@@ -9,7 +9,7 @@ import re
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator, List, Optional, Sequence, Union, Tuple
+from typing import Callable, Iterator, List, Optional, Sequence, Union, Tuple
 
 from fastapi import (
     Depends,
@@ -38,6 +38,7 @@ from langchain_core.documents import Document
 
 from open_webui.models.files import FileModel, FileUpdateForm, Files
 from open_webui.models.knowledge import Knowledges
+from open_webui.models.vector_content_hashes import VectorContentHashes
 from open_webui.storage.provider import Storage
 from open_webui.internal.db import get_session
 from sqlalchemy.orm import Session
@@ -52,41 +53,47 @@ from open_webui.retrieval.loaders.youtube import YoutubeLoader
 # Web search engines
 from open_webui.retrieval.web.main import SearchResult
 from open_webui.retrieval.web.utils import get_web_loader
-from open_webui.retrieval.web.ollama import search_ollama_cloud
-from open_webui.retrieval.web.perplexity_search import search_perplexity_search
-from open_webui.retrieval.web.brave import search_brave
-from open_webui.retrieval.web.kagi import search_kagi
-from open_webui.retrieval.web.mojeek import search_mojeek
-from open_webui.retrieval.web.bocha import search_bocha
+from open_webui.retrieval.web.near_duplicates import remove_near_duplicates
+from open_webui.retrieval.web.cache import SEARCH_RESULT_CACHE
+from open_webui.retrieval.web.client import SEARCH_CLIENT
+from open_webui.retrieval.web.federated import search_federated
+from open_webui.retrieval.web.ollama import asearch_ollama_cloud
+from open_webui.retrieval.web.perplexity_search import asearch_perplexity_search
+from open_webui.retrieval.web.brave import asearch_brave
+from open_webui.retrieval.web.kagi import asearch_kagi
+from open_webui.retrieval.web.mojeek import asearch_mojeek
+from open_webui.retrieval.web.bocha import asearch_bocha
 from open_webui.retrieval.web.duckduckgo import search_duckduckgo
-from open_webui.retrieval.web.google_pse import search_google_pse
-from open_webui.retrieval.web.jina_search import search_jina
-from open_webui.retrieval.web.searchapi import search_searchapi
-from open_webui.retrieval.web.serpapi import search_serpapi
-from open_webui.retrieval.web.searxng import search_searxng
-from open_webui.retrieval.web.yacy import search_yacy
-from open_webui.retrieval.web.serper import search_serper
-from open_webui.retrieval.web.serply import search_serply
-from open_webui.retrieval.web.serpstack import search_serpstack
-from open_webui.retrieval.web.tavily import search_tavily
-from open_webui.retrieval.web.bing import search_bing
+from open_webui.retrieval.web.google_pse import asearch_google_pse
+from open_webui.retrieval.web.jina_search import asearch_jina
+from open_webui.retrieval.web.searchapi import asearch_searchapi
+from open_webui.retrieval.web.serpapi import asearch_serpapi
+from open_webui.retrieval.web.searxng import asearch_searxng
+from open_webui.retrieval.web.yacy import asearch_yacy
+from open_webui.retrieval.web.serper import asearch_serper
+from open_webui.retrieval.web.serply import asearch_serply
+from open_webui.retrieval.web.serpstack import asearch_serpstack
+from open_webui.retrieval.web.tavily import asearch_tavily
+from open_webui.retrieval.web.bing import asearch_bing
 from open_webui.retrieval.web.azure import search_azure
-from open_webui.retrieval.web.exa import search_exa
-from open_webui.retrieval.web.perplexity import search_perplexity
+from open_webui.retrieval.web.exa import asearch_exa
+from open_webui.retrieval.web.perplexity import asearch_perplexity
 from open_webui.retrieval.web.sougou import search_sougou
 from open_webui.retrieval.web.firecrawl import search_firecrawl
-from open_webui.retrieval.web.external import search_external
+from open_webui.retrieval.web.external import asearch_external
 
 from open_webui.retrieval.utils import (
     get_content_from_url,
     get_embedding_function,
     get_reranking_function,
+    get_reranking_cache_namespace,
     get_model_path,
     query_collection,
     query_collection_with_hybrid_search,
     query_doc,
     query_doc_with_hybrid_search,
 )
+from open_webui.retrieval.pipeline import IngestionPipeline, IngestionProgress
 from open_webui.retrieval.vector.utils import filter_metadata
 from open_webui.utils.misc import (
     calculate_sha256_string,
@@ -104,7 +111,13 @@ from open_webui.config import (
     UPLOAD_DIR,
     DEFAULT_LOCALE,
     RAG_EMBEDDING_CONTENT_PREFIX,
+    RAG_EMBEDDING_DIMENSIONS,
     RAG_EMBEDDING_QUERY_PREFIX,
+    ENABLE_RAG_PIPELINED_INGESTION,
+    WEB_SEARCH_NEAR_DUPLICATE_THRESHOLD,
+    JINA_ADAPTIVE_SEARCH_ENABLED,
+    JINA_ADAPTIVE_SEARCH_THRESHOLD,
+    WEB_SEARCH_FEDERATED_ENGINES,
 )
 from open_webui.env import (
     DEVICE_TYPE,
@@ -253,6 +266,7 @@ class ProcessUrlForm(CollectionNameForm):
 
 class SearchForm(BaseModel):
     queries: List[str]
+    bypass_cache: Optional[bool] = False
 
 
 @router.get("/")
@@ -1374,39 +1388,177 @@ def merge_docs_to_target_size(
         )
         measure_chunk_size = lambda text: len(encoding.encode(text))
 
+    # Each chunk is measured once and merged sizes are tracked as running
+    # totals, instead of re-measuring the accumulated content on every step.
+    # For tokens the sum can differ from encoding the joined text by the odd
+    # BPE merge across a separator, which is fine for a size target.
+    separator = "\n\n"
+    separator_size = measure_chunk_size(separator)
+
     processed_chunks: list[Document] = []
     current_chunk: Document | None = None
-    current_content: str = ""
+    current_parts: list[str] = []
+    current_size = 0
 
     for next_chunk in chunks:
+        next_size = measure_chunk_size(next_chunk.page_content)
+
         if current_chunk is None:
             current_chunk = next_chunk
-            current_content = next_chunk.page_content
+            current_parts = [next_chunk.page_content]
+            current_size = next_size
             continue
 
-        proposed_content = f"{current_content}\n\n{next_chunk.page_content}"
+        proposed_size = current_size + separator_size + next_size
         can_merge = (
             can_merge_chunks(current_chunk, next_chunk)
-            and measure_chunk_size(current_content) < min_chunk_size_target
-            and measure_chunk_size(proposed_content) <= max_chunk_size
+            and current_size < min_chunk_size_target
+            and proposed_size <= max_chunk_size
         )
 
         if can_merge:
-            current_content = proposed_content
+            current_parts.append(next_chunk.page_content)
+            current_size = proposed_size
         else:
             processed_chunks.append(
-                Document(page_content=current_content, metadata={**current_chunk.metadata})
+                Document(
+                    page_content=separator.join(current_parts),
+                    metadata={**current_chunk.metadata},
+                )
             )
             current_chunk = next_chunk
-            current_content = next_chunk.page_content
+            current_parts = [next_chunk.page_content]
+            current_size = next_size
 
     if current_chunk is not None:
         processed_chunks.append(
-            Document(page_content=current_content, metadata={**current_chunk.metadata})
+            Document(
+                page_content=separator.join(current_parts),
+                metadata={**current_chunk.metadata},
+            )
         )
 
     return processed_chunks
 
+
+def split_docs(request: Request, docs: list[Document]) -> list[Document]:
+    if request.app.state.config.TEXT_SPLITTER in ["", "character"]:
+        text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=request.app.state.config.CHUNK_SIZE,
+            chunk_overlap=request.app.state.config.CHUNK_OVERLAP,
+            add_start_index=True,
+        )
+        return text_splitter.split_documents(docs)
+    elif request.app.state.config.TEXT_SPLITTER == "token":
+        log.info(
+            f"Using token text splitter: {request.app.state.config.TIKTOKEN_ENCODING_NAME}"
+        )
+
+        tiktoken.get_encoding(str(request.app.state.config.TIKTOKEN_ENCODING_NAME))
+        text_splitter = TokenTextSplitter(
+            encoding_name=str(request.app.state.config.TIKTOKEN_ENCODING_NAME),
+            chunk_size=request.app.state.config.CHUNK_SIZE,
+            chunk_overlap=request.app.state.config.CHUNK_OVERLAP,
+            add_start_index=True,
+        )
+        return text_splitter.split_documents(docs)
+    elif request.app.state.config.TEXT_SPLITTER == "markdown_header":
+        log.info("Using markdown header text splitter")
+
+        # Define headers to split on - covering most common markdown header levels
+        headers_to_split_on = [
+            ("#", "Header 1"),
+            ("##", "Header 2"),
+            ("###", "Header 3"),
+            ("####", "Header 4"),
+            ("#####", "Header 5"),
+            ("######", "Header 6"),
+        ]
+
+        markdown_splitter = MarkdownHeaderTextSplitter(
+            headers_to_split_on=headers_to_split_on,
+            strip_headers=False,  # Keep headers in content for context
+        )
+
+        md_split_docs = []
+        for doc in docs:
+            md_header_splits = markdown_splitter.split_text(doc.page_content)
+            text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=request.app.state.config.CHUNK_SIZE,
+                chunk_overlap=request.app.state.config.CHUNK_OVERLAP,
+                add_start_index=True,
+            )
+            md_header_splits = text_splitter.split_documents(md_header_splits)
+
+            # Convert back to Document objects, preserving original metadata
+            for split_chunk in md_header_splits:
+                headings_list = []
+                # Extract header values in order based on headers_to_split_on
+                for _, header_meta_key_name in headers_to_split_on:
+                    if header_meta_key_name in split_chunk.metadata:
+                        headings_list.append(split_chunk.metadata[header_meta_key_name])
+
+                md_split_docs.append(
+                    Document(
+                        page_content=split_chunk.page_content,
+                        metadata={**doc.metadata, "headings": headings_list},
+                    )
+                )
+
+        return md_split_docs
+    else:
+        raise ValueError(ERROR_MESSAGES.DEFAULT("Invalid text splitter"))
+
+
+def get_embedding_config(request: Request) -> dict:
+    embedding_config = {
+        "engine": request.app.state.config.RAG_EMBEDDING_ENGINE,
+        "model": request.app.state.config.RAG_EMBEDDING_MODEL,
+    }
+    if RAG_EMBEDDING_DIMENSIONS:
+        embedding_config["dimensions"] = RAG_EMBEDDING_DIMENSIONS
+    return embedding_config
+
+
+def get_chunk_config(request: Request) -> dict:
+    splitter = request.app.state.config.TEXT_SPLITTER or "character"
+    chunk_config = {
+        "splitter": splitter,
+        "chunk_size": request.app.state.config.CHUNK_SIZE,
+        "chunk_overlap": request.app.state.config.CHUNK_OVERLAP,
+    }
+    if splitter == "token":
+        chunk_config["encoding"] = str(request.app.state.config.TIKTOKEN_ENCODING_NAME)
+    return chunk_config
+
+
+def _config_matches(value, config: dict) -> bool:
+    # Some backends store nested metadata as its string representation
+    return value in (config, str(config))
+
+
+def check_duplicate_content(
+    collection_name: str,
+    metadata: Optional[dict],
+    exclude_file_id: Optional[str] = None,
+) -> None:
+    # Check if entries with the same hash (metadata.hash) already exist
+    if metadata and "hash" in metadata:
+        if VectorContentHashes.has_hash(
+            collection_name, metadata["hash"], exclude_file_id=exclude_file_id
+        ):
+            log.info(f"Document with hash {metadata['hash']} already exists")
+            raise ValueError(ERROR_MESSAGES.DUPLICATE_CONTENT)
+
+
+def record_content_hash(collection_name: str, metadata: Optional[dict]) -> None:
+    # Keep the duplicate check index in sync with what was inserted
+    if metadata and "hash" in metadata and "file_id" in metadata:
+        VectorContentHashes.upsert_hash(
+            collection_name, metadata["file_id"], metadata["hash"]
+        )
+
+
 def save_docs_to_vector_db(
     request: Request,
     docs,
@@ -1416,6 +1568,8 @@ def save_docs_to_vector_db(
     split: bool = True,
     add: bool = False,
     user=None,
+    progress_callback: Optional[Callable[[Optional[dict]], None]] = None,
+    check_duplicate: bool = True,
 ) -> bool:
     def _get_docs_info(docs: list[Document]) -> str:
         docs_info = set()
@@ -1437,111 +1591,36 @@ def save_docs_to_vector_db(
         f"save_docs_to_vector_db: document {_get_docs_info(docs)} {collection_name}"
     )
 
-    # Check if entries with the same hash (metadata.hash) already exist
-    if metadata and "hash" in metadata:
-        result = VECTOR_DB_CLIENT.query(
-            collection_name=collection_name,
-            filter={"hash": metadata["hash"]},
-        )
-
-        if result is not None:
-            existing_doc_ids = result.ids[0]
-            if existing_doc_ids:
-                log.info(f"Document with hash {metadata['hash']} already exists")
-                raise ValueError(ERROR_MESSAGES.DUPLICATE_CONTENT)
+    if check_duplicate:
+        check_duplicate_content(collection_name, metadata)
 
-    if split:
-        if request.app.state.config.TEXT_SPLITTER in ["", "character"]:
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=request.app.state.config.CHUNK_SIZE,
-                chunk_overlap=request.app.state.config.CHUNK_OVERLAP,
-                add_start_index=True,
-            )
-            docs = text_splitter.split_documents(docs)
-        elif request.app.state.config.TEXT_SPLITTER == "token":
-            log.info(
-                f"Using token text splitter: {request.app.state.config.TIKTOKEN_ENCODING_NAME}"
-            )
-
-            tiktoken.get_encoding(str(request.app.state.config.TIKTOKEN_ENCODING_NAME))
-            text_splitter = TokenTextSplitter(
-                encoding_name=str(request.app.state.config.TIKTOKEN_ENCODING_NAME),
-                chunk_size=request.app.state.config.CHUNK_SIZE,
-                chunk_overlap=request.app.state.config.CHUNK_OVERLAP,
-                add_start_index=True,
-            )
-            docs = text_splitter.split_documents(docs)
-        elif request.app.state.config.TEXT_SPLITTER == "markdown_header":
-            log.info("Using markdown header text splitter")
-
-            # Define headers to split on - covering most common markdown header levels
-            headers_to_split_on = [
-                ("#", "Header 1"),
-                ("##", "Header 2"),
-                ("###", "Header 3"),
-                ("####", "Header 4"),
-                ("#####", "Header 5"),
-                ("######", "Header 6"),
-            ]
-
-            markdown_splitter = MarkdownHeaderTextSplitter(
-                headers_to_split_on=headers_to_split_on,
-                strip_headers=False,  # Keep headers in content for context
-            )
-
-            md_split_docs = []
-            for doc in docs:
-                md_header_splits = markdown_splitter.split_text(doc.page_content)
-                text_splitter = RecursiveCharacterTextSplitter(
-                    chunk_size=request.app.state.config.CHUNK_SIZE,
-                    chunk_overlap=request.app.state.config.CHUNK_OVERLAP,
-                    add_start_index=True,
-                )
-                md_header_splits = text_splitter.split_documents(md_header_splits)
-
-                # Convert back to Document objects, preserving original metadata
-                for split_chunk in md_header_splits:
-                    headings_list = []
-                    # Extract header values in order based on headers_to_split_on
-                    for _, header_meta_key_name in headers_to_split_on:
-                        if header_meta_key_name in split_chunk.metadata:
-                            headings_list.append(
-                                split_chunk.metadata[header_meta_key_name]
-                            )
-
-                    md_split_docs.append(
-                        Document(
-                            page_content=split_chunk.page_content,
-                            metadata={**doc.metadata, "headings": headings_list},
-                        )
-                    )
-
-            docs = md_split_docs
-        else:
-            raise ValueError(ERROR_MESSAGES.DEFAULT("Invalid text splitter"))
+    pipelined = split and ENABLE_RAG_PIPELINED_INGESTION
+    if split and not pipelined:
+        docs = split_docs(request, docs)
 
     if len(docs) == 0:
         raise ValueError(ERROR_MESSAGES.EMPTY_CONTENT)
 
-    texts = [sanitize_text_for_db(doc.page_content) for doc in docs]
-    metadatas = [
-        {
+    def _get_chunk_metadata(doc: Document) -> dict:
+        return {
             **doc.metadata,
             **(metadata if metadata else {}),
-            "embedding_config": {
-                "engine": request.app.state.config.RAG_EMBEDDING_ENGINE,
-                "model": request.app.state.config.RAG_EMBEDDING_MODEL,
-            },
+            "embedding_config": get_embedding_config(request),
+            "chunk_config": get_chunk_config(request),
         }
-        for doc in docs
-    ]
 
     try:
+        delete_before_insert = False
         if VECTOR_DB_CLIENT.has_collection(collection_name=collection_name):
             log.info(f"collection {collection_name} already exists")
 
-            if overwrite:
+            if overwrite and pipelined:
+                # Deleted right before the first insert, so that a failure
+                # while splitting or embedding keeps the existing collection
+                delete_before_insert = True
+            elif overwrite:
                 VECTOR_DB_CLIENT.delete_collection(collection_name=collection_name)
+                VectorContentHashes.delete_by_collection_name(collection_name)
                 log.info(f"deleting existing collection {collection_name}")
             elif add is False:
                 log.info(
@@ -1580,6 +1659,61 @@ def save_docs_to_vector_db(
             ),
         )
 
+        if pipelined:
+
+            async def embed(chunks: list[Document]) -> list[list[float]]:
+                return await embedding_function(
+                    [
+                        sanitize_text_for_db(chunk.page_content).replace("\n", " ")
+                        for chunk in chunks
+                    ],
+                    prefix=RAG_EMBEDDING_CONTENT_PREFIX,
+                    user=user,
+                )
+
+            def insert(chunks: list[Document], embeddings: list[list[float]]):
+                nonlocal delete_before_insert
+                if delete_before_insert:
+                    VECTOR_DB_CLIENT.delete_collection(collection_name=collection_name)
+                    VectorContentHashes.delete_by_collection_name(collection_name)
+                    log.info(f"deleting existing collection {collection_name}")
+                    delete_before_insert = False
+
+                VECTOR_DB_CLIENT.insert(
+                    collection_name=collection_name,
+                    items=[
+                        {
+                            "id": str(uuid.uuid4()),
+                            "text": sanitize_text_for_db(chunk.page_content),
+                            "vector": embeddings[idx],
+                            "metadata": _get_chunk_metadata(chunk),
+                        }
+                        for idx, chunk in enumerate(chunks)
+                    ],
+                )
+
+            try:
+                inserted = IngestionPipeline(
+                    split=lambda doc: split_docs(request, [doc]),
+                    embed=embed,
+                    insert=insert,
+                    progress=IngestionProgress(progress_callback),
+                ).run(docs)
+            finally:
+                # The counters only describe a running ingestion
+                if progress_callback is not None:
+                    progress_callback(None)
+
+            if inserted == 0:
+                raise ValueError(ERROR_MESSAGES.EMPTY_CONTENT)
+
+            record_content_hash(collection_name, metadata)
+            log.info(f"added {inserted} items to collection {collection_name}")
+            return True
+
+        texts = [sanitize_text_for_db(doc.page_content) for doc in docs]
+        metadatas = [_get_chunk_metadata(doc) for doc in docs]
+
         embeddings = asyncio.run(
             embedding_function(
                 list(map(lambda x: x.replace("\n", " "), texts)),
@@ -1604,6 +1738,7 @@ def save_docs_to_vector_db(
             collection_name=collection_name,
             items=items,
         )
+        record_content_hash(collection_name, metadata)
 
         log.info(f"added {len(items)} items to collection {collection_name}")
         return True
@@ -1612,10 +1747,156 @@ def save_docs_to_vector_db(
         raise e
 
 
+def update_docs_in_vector_db(
+    request: Request,
+    docs,
+    collection_name,
+    metadata: dict,
+    user=None,
+) -> Optional[bool]:
+    """
+    Re-index a file whose chunks are already stored in ``collection_name``.
+
+    The new content is split and each chunk is matched by content hash against
+    the stored chunks of the same file: matching chunks keep their vectors,
+    only new chunks are embedded and stale ones are deleted. Chunks embedded
+    with a different embedding engine or model are never reused.
+
+    Returns None if nothing is stored for the file yet, in which case the
+    caller should fall back to ``save_docs_to_vector_db``.
+    """
+    file_id = metadata["file_id"]
+
+    if not VECTOR_DB_CLIENT.has_collection(collection_name=collection_name):
+        return None
+
+    result = VECTOR_DB_CLIENT.query(
+        collection_name=collection_name, filter={"file_id": file_id}
+    )
+    if result is None or not result.ids[0]:
+        return None
+
+    # Ignore this file's own chunks since they are being replaced
+    check_duplicate_content(collection_name, metadata, exclude_file_id=file_id)
+
+    chunks = split_docs(request, docs)
+    if len(chunks) == 0:
+        raise ValueError(ERROR_MESSAGES.EMPTY_CONTENT)
+
+    embedding_config = get_embedding_config(request)
+
+    existing_ids = {}
+    for id, text, chunk_metadata in zip(
+        result.ids[0], result.documents[0], result.metadatas[0]
+    ):
+        if not _config_matches(
+            (chunk_metadata or {}).get("embedding_config"), embedding_config
+        ):
+            continue
+        existing_ids.setdefault(calculate_sha256_string(text), []).append(id)
+
+    kept_ids = set()
+    new_chunks = []
+    for chunk in chunks:
+        ids = existing_ids.get(
+            calculate_sha256_string(sanitize_text_for_db(chunk.page_content))
+        )
+        if ids:
+            kept_ids.add(ids.pop())
+        else:
+            new_chunks.append(chunk)
+
+    removed_ids = [id for id in result.ids[0] if id not in kept_ids]
+
+    log.info(
+        f"update_docs_in_vector_db: file {file_id} in {collection_name}: "
+        f"{len(kept_ids)} unchanged, {len(new_chunks)} new, {len(removed_ids)} removed"
+    )
+
+    # New chunks are inserted before stale ones are removed, so a failed
+    # embedding leaves the previous version searchable
+    if new_chunks:
+        save_docs_to_vector_db(
+            request,
+            new_chunks,
+            collection_name,
+            metadata=metadata,
+            split=False,
+            add=True,
+            user=user,
+            check_duplicate=False,
+        )
+
+    if removed_ids:
+        VECTOR_DB_CLIENT.delete(collection_name=collection_name, ids=removed_ids)
+
+    record_content_hash(collection_name, metadata)
+    return True
+
+
+def copy_file_vectors_to_collection(
+    request: Request,
+    file_id: str,
+    collection_name: str,
+    metadata: Optional[dict] = None,
+) -> Optional[bool]:
+    """
+    Copy a file's embedded chunks from its ``file-{id}`` collection into
+    ``collection_name`` without re-embedding them.
+
+    Returns None if the vectors cannot be reused, because the backend cannot
+    read vectors back, nothing is stored for the file, or the chunks were
+    produced with a different embedding model or chunking config. The caller
+    should then fall back to ``save_docs_to_vector_db``.
+    """
+    items = VECTOR_DB_CLIENT.query_vectors(
+        collection_name=f"file-{file_id}", filter={"file_id": file_id}
+    )
+    if not items:
+        return None
+
+    embedding_config = get_embedding_config(request)
+    chunk_config = get_chunk_config(request)
+    for item in items:
+        item_metadata = item["metadata"] or {}
+        if not (
+            _config_matches(item_metadata.get("embedding_config"), embedding_config)
+            and _config_matches(item_metadata.get("chunk_config"), chunk_config)
+        ):
+            log.info(
+                f"copy_file_vectors_to_collection: file {file_id} was indexed with "
+                f"a different embedding or chunking config, re-embedding"
+            )
+            return None
+
+    check_duplicate_content(collection_name, metadata)
+
+    VECTOR_DB_CLIENT.insert(
+        collection_name=collection_name,
+        items=[
+            {
+                "id": str(uuid.uuid4()),
+                "text": item["text"],
+                "vector": item["vector"],
+                "metadata": {**item["metadata"], **(metadata if metadata else {})},
+            }
+            for item in items
+        ],
+    )
+    record_content_hash(collection_name, metadata)
+
+    log.info(f"copied {len(items)} items from file-{file_id} to {collection_name}")
+    return True
+
+
 class ProcessFileForm(BaseModel):
     file_id: str
     content: Optional[str] = None
     collection_name: Optional[str] = None
+    # Re-index a file already in the collection, embedding only changed chunks
+    update: bool = False
+    # Extract the file again rather than using a cached extraction
+    force_refresh: bool = False
 
 
 @router.post("/process/file")
@@ -1643,15 +1924,6 @@ def process_file(
                 # Update the content in the file
                 # Usage: /files/{file_id}/data/content/update, /files/ (audio file upload pipeline)
 
-                try:
-                    # /files/{file_id}/data/content/update
-                    VECTOR_DB_CLIENT.delete_collection(
-                        collection_name=f"file-{file.id}"
-                    )
-                except:
-                    # Audio file upload pipeline
-                    pass
-
                 docs = [
                     Document(
                         page_content=form_data.content.replace("<br/>", "\n"),
@@ -1746,7 +2018,10 @@ def process_file(
                         MINERU_PARAMS=request.app.state.config.MINERU_PARAMS,
                     )
                     result = loader.load(
-                        file.filename, file.meta.get("content_type"), file_path
+                        file.filename,
+                        file.meta.get("content_type"),
+                        file_path,
+                        force_refresh=form_data.force_refresh,
                     )
                     log.info(f"process_file: loader.load returned type: {type(result)}")
                     if isinstance(result, tuple):
@@ -1818,18 +2093,50 @@ def process_file(
                 }
             else:
                 try:
-                    result = save_docs_to_vector_db(
-                        request,
-                        docs=docs,
-                        collection_name=collection_name,
-                        metadata={
-                            "file_id": file.id,
-                            "name": file.filename,
-                            "hash": hash,
-                        },
-                        add=(True if form_data.collection_name else False),
-                        user=user,
-                    )
+                    metadata = {
+                        "file_id": file.id,
+                        "name": file.filename,
+                        "hash": hash,
+                    }
+
+                    result = None
+                    updating = bool(form_data.content or form_data.update)
+                    if updating:
+                        # /files/{file_id}/data/content/update, /knowledge/{id}/file/update
+                        result = update_docs_in_vector_db(
+                            request,
+                            docs=docs,
+                            collection_name=collection_name,
+                            metadata=metadata,
+                            user=user,
+                        )
+                    elif form_data.collection_name:
+                        # /knowledge/{id}/file/add
+                        result = copy_file_vectors_to_collection(
+                            request,
+                            file_id=file.id,
+                            collection_name=collection_name,
+                            metadata=metadata,
+                        )
+
+                    if result is None:
+                        # Nothing of this file is stored, but its own collection
+                        # may still exist, e.g. after a failed update: replace it
+                        # rather than skipping the save as already done
+                        overwrite = updating and collection_name == f"file-{file.id}"
+                        result = save_docs_to_vector_db(
+                            request,
+                            docs=docs,
+                            collection_name=collection_name,
+                            metadata=metadata,
+                            overwrite=overwrite,
+                            add=(True if form_data.collection_name else False),
+                            user=user,
+                            check_duplicate=not overwrite,
+                            progress_callback=lambda progress: Files.update_file_data_by_id(
+                                file.id, {"progress": progress}
+                            ),
+                        )
                     log.info(f"added {len(docs)} items to collection {collection_name}")
 
                     if result:
@@ -1966,7 +2273,96 @@ def process_web(
         )
 
 
-def search_web(request: Request, engine: str, query: str, user=None) -> list[SearchResult]:
+# Settings of each engine that change its results, and so are part of the
+# result cache key. API keys are left out, as they do not.
+WEB_SEARCH_ENGINE_SETTINGS = {
+    "searxng": ["SEARXNG_QUERY_URL"],
+    "yacy": ["YACY_QUERY_URL", "YACY_USERNAME"],
+    "google_pse": ["GOOGLE_PSE_ENGINE_ID"],
+    "serpstack": ["SERPSTACK_HTTPS"],
+    "duckduckgo": ["DDGS_BACKEND"],
+    "searchapi": ["SEARCHAPI_ENGINE"],
+    "serpapi": ["SERPAPI_ENGINE"],
+    "jina": [
+        "JINA_API_BASE_URL",
+        "JINA_ENHANCED_SEARCH_ENABLED",
+        "JINA_STRICT_AUTHORITY_MODE",
+        "JINA_MAX_CANDIDATES",
+        "JINA_MAX_EVIDENCE_ITEMS",
+    ],
+    "bing": ["BING_SEARCH_V7_ENDPOINT"],
+    "azure": ["AZURE_AI_SEARCH_ENDPOINT", "AZURE_AI_SEARCH_INDEX_NAME"],
+    "perplexity": ["PERPLEXITY_MODEL", "PERPLEXITY_SEARCH_CONTEXT_USAGE"],
+    "firecrawl": ["FIRECRAWL_API_BASE_URL"],
+}
+
+
+def get_web_search_engine_settings(request: Request, engine: str) -> dict:
+    settings = {
+        name: getattr(request.app.state.config, name)
+        for name in WEB_SEARCH_ENGINE_SETTINGS.get(engine, [])
+    }
+    if engine == "jina":
+        settings["JINA_ADAPTIVE_SEARCH_ENABLED"] = JINA_ADAPTIVE_SEARCH_ENABLED
+        settings["JINA_ADAPTIVE_SEARCH_THRESHOLD"] = JINA_ADAPTIVE_SEARCH_THRESHOLD
+    return settings
+
+
+async def asearch_web(
+    request: Request,
+    engine: str,
+    query: str,
+    user=None,
+    bypass_cache: bool = False,
+) -> list[SearchResult]:
+    """
+    Search the web with the engine, sharing results of identical searches across
+    users for the engine's cache TTL unless bypass_cache is set. The
+    "federated" engine searches WEB_SEARCH_FEDERATED_ENGINES and fuses their
+    results, each engine cached on its own.
+    """
+    if engine == "federated":
+        return await search_federated(
+            [
+                engine
+                for engine in WEB_SEARCH_FEDERATED_ENGINES
+                if engine != "federated"
+            ],
+            query,
+            request.app.state.config.WEB_SEARCH_RESULT_COUNT,
+            lambda engine: asearch_web(
+                request, engine, query, user=user, bypass_cache=bypass_cache
+            ),
+        )
+
+    return await SEARCH_RESULT_CACHE.asearch(
+        engine,
+        query,
+        request.app.state.config.WEB_SEARCH_RESULT_COUNT,
+        request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
+        lambda: _asearch_web(request, engine, query, user=user),
+        # The external engine receives the user, so its results are not shared
+        bypass=bypass_cache or engine == "external",
+        settings=get_web_search_engine_settings(request, engine),
+    )
+
+
+def search_web(
+    request: Request,
+    engine: str,
+    query: str,
+    user=None,
+    bypass_cache: bool = False,
+) -> list[SearchResult]:
+    """Blocking variant of asearch_web."""
+    return SEARCH_CLIENT.run(
+        asearch_web(request, engine, query, user=user, bypass_cache=bypass_cache)
+    )
+
+
+async def _asearch_web(
+    request: Request, engine: str, query: str, user=None
+) -> list[SearchResult]:
     """Search the web using a search engine and return the results as a list of SearchResult objects.
     Will look for a search engine API key in environment variables in the following order:
     - SEARXNG_QUERY_URL
@@ -1987,11 +2383,13 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
     - SERPAPI_API_KEY + SERPAPI_ENGINE (by default `google`)
     Args:
         query (str): The query to search for
+    Engines with an HTTP API are searched on the event loop, SDK based ones in
+    the threadpool.
     """
 
     # TODO: add playwright to search the web
     if engine == "ollama_cloud":
-        return search_ollama_cloud(
+        return await asearch_ollama_cloud(
             "https://ollama.com",
             request.app.state.config.OLLAMA_CLOUD_WEB_SEARCH_API_KEY,
             query,
@@ -2000,7 +2398,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
         )
     elif engine == "perplexity_search":
         if request.app.state.config.PERPLEXITY_API_KEY:
-            return search_perplexity_search(
+            return await asearch_perplexity_search(
                 request.app.state.config.PERPLEXITY_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2010,7 +2408,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             raise Exception("No PERPLEXITY_API_KEY found in environment variables")
     elif engine == "searxng":
         if request.app.state.config.SEARXNG_QUERY_URL:
-            return search_searxng(
+            return await asearch_searxng(
                 request.app.state.config.SEARXNG_QUERY_URL,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2020,7 +2418,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             raise Exception("No SEARXNG_QUERY_URL found in environment variables")
     elif engine == "yacy":
         if request.app.state.config.YACY_QUERY_URL:
-            return search_yacy(
+            return await asearch_yacy(
                 request.app.state.config.YACY_QUERY_URL,
                 request.app.state.config.YACY_USERNAME,
                 request.app.state.config.YACY_PASSWORD,
@@ -2035,7 +2433,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             request.app.state.config.GOOGLE_PSE_API_KEY
             and request.app.state.config.GOOGLE_PSE_ENGINE_ID
         ):
-            return search_google_pse(
+            return await asearch_google_pse(
                 request.app.state.config.GOOGLE_PSE_API_KEY,
                 request.app.state.config.GOOGLE_PSE_ENGINE_ID,
                 query,
@@ -2049,7 +2447,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             )
     elif engine == "brave":
         if request.app.state.config.BRAVE_SEARCH_API_KEY:
-            return search_brave(
+            return await asearch_brave(
                 request.app.state.config.BRAVE_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2059,7 +2457,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             raise Exception("No BRAVE_SEARCH_API_KEY found in environment variables")
     elif engine == "kagi":
         if request.app.state.config.KAGI_SEARCH_API_KEY:
-            return search_kagi(
+            return await asearch_kagi(
                 request.app.state.config.KAGI_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2069,7 +2467,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             raise Exception("No KAGI_SEARCH_API_KEY found in environment variables")
     elif engine == "mojeek":
         if request.app.state.config.MOJEEK_SEARCH_API_KEY:
-            return search_mojeek(
+            return await asearch_mojeek(
                 request.app.state.config.MOJEEK_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2079,7 +2477,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             raise Exception("No MOJEEK_SEARCH_API_KEY found in environment variables")
     elif engine == "bocha":
         if request.app.state.config.BOCHA_SEARCH_API_KEY:
-            return search_bocha(
+            return await asearch_bocha(
                 request.app.state.config.BOCHA_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2089,7 +2487,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             raise Exception("No BOCHA_SEARCH_API_KEY found in environment variables")
     elif engine == "serpstack":
         if request.app.state.config.SERPSTACK_API_KEY:
-            return search_serpstack(
+            return await asearch_serpstack(
                 request.app.state.config.SERPSTACK_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2100,7 +2498,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             raise Exception("No SERPSTACK_API_KEY found in environment variables")
     elif engine == "serper":
         if request.app.state.config.SERPER_API_KEY:
-            return search_serper(
+            return await asearch_serper(
                 request.app.state.config.SERPER_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2110,7 +2508,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             raise Exception("No SERPER_API_KEY found in environment variables")
     elif engine == "serply":
         if request.app.state.config.SERPLY_API_KEY:
-            return search_serply(
+            return await asearch_serply(
                 request.app.state.config.SERPLY_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2119,7 +2517,8 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
         else:
             raise Exception("No SERPLY_API_KEY found in environment variables")
     elif engine == "duckduckgo":
-        return search_duckduckgo(
+        return await run_in_threadpool(
+            search_duckduckgo,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
             request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
@@ -2128,7 +2527,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
         )
     elif engine == "tavily":
         if request.app.state.config.TAVILY_API_KEY:
-            return search_tavily(
+            return await asearch_tavily(
                 request.app.state.config.TAVILY_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2138,7 +2537,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             raise Exception("No TAVILY_API_KEY found in environment variables")
     elif engine == "exa":
         if request.app.state.config.EXA_API_KEY:
-            return search_exa(
+            return await asearch_exa(
                 request.app.state.config.EXA_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2148,7 +2547,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             raise Exception("No EXA_API_KEY found in environment variables")
     elif engine == "searchapi":
         if request.app.state.config.SEARCHAPI_API_KEY:
-            return search_searchapi(
+            return await asearch_searchapi(
                 request.app.state.config.SEARCHAPI_API_KEY,
                 request.app.state.config.SEARCHAPI_ENGINE,
                 query,
@@ -2159,7 +2558,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             raise Exception("No SEARCHAPI_API_KEY found in environment variables")
     elif engine == "serpapi":
         if request.app.state.config.SERPAPI_API_KEY:
-            return search_serpapi(
+            return await asearch_serpapi(
                 request.app.state.config.SERPAPI_API_KEY,
                 request.app.state.config.SERPAPI_ENGINE,
                 query,
@@ -2169,7 +2568,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
         else:
             raise Exception("No SERPAPI_API_KEY found in environment variables")
     elif engine == "jina":
-        return search_jina(
+        return await asearch_jina(
             request.app.state.config.JINA_API_KEY,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2178,9 +2577,11 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             bool(request.app.state.config.JINA_STRICT_AUTHORITY_MODE),
             request.app.state.config.JINA_MAX_CANDIDATES or 24,
             request.app.state.config.JINA_MAX_EVIDENCE_ITEMS or 8,
+            JINA_ADAPTIVE_SEARCH_ENABLED,
+            JINA_ADAPTIVE_SEARCH_THRESHOLD,
         )
     elif engine == "bing":
-        return search_bing(
+        return await asearch_bing(
             request.app.state.config.BING_SEARCH_V7_SUBSCRIPTION_KEY,
             request.app.state.config.BING_SEARCH_V7_ENDPOINT,
             str(DEFAULT_LOCALE),
@@ -2194,7 +2595,8 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             and request.app.state.config.AZURE_AI_SEARCH_ENDPOINT
             and request.app.state.config.AZURE_AI_SEARCH_INDEX_NAME
         ):
-            return search_azure(
+            return await run_in_threadpool(
+                search_azure,
                 request.app.state.config.AZURE_AI_SEARCH_API_KEY,
                 request.app.state.config.AZURE_AI_SEARCH_ENDPOINT,
                 request.app.state.config.AZURE_AI_SEARCH_INDEX_NAME,
@@ -2207,7 +2609,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
                 "AZURE_AI_SEARCH_API_KEY, AZURE_AI_SEARCH_ENDPOINT, and AZURE_AI_SEARCH_INDEX_NAME are required for Azure AI Search"
             )
     elif engine == "perplexity":
-        return search_perplexity(
+        return await asearch_perplexity(
             request.app.state.config.PERPLEXITY_API_KEY,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2220,7 +2622,8 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             request.app.state.config.SOUGOU_API_SID
             and request.app.state.config.SOUGOU_API_SK
         ):
-            return search_sougou(
+            return await run_in_threadpool(
+                search_sougou,
                 request.app.state.config.SOUGOU_API_SID,
                 request.app.state.config.SOUGOU_API_SK,
                 query,
@@ -2232,7 +2635,8 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
                 "No SOUGOU_API_SID or SOUGOU_API_SK found in environment variables"
             )
     elif engine == "firecrawl":
-        return search_firecrawl(
+        return await run_in_threadpool(
+            search_firecrawl,
             request.app.state.config.FIRECRAWL_API_BASE_URL,
             request.app.state.config.FIRECRAWL_API_KEY,
             query,
@@ -2240,7 +2644,7 @@ def search_web(request: Request, engine: str, query: str, user=None) -> list[Sea
             request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
         )
     elif engine == "external":
-        return search_external(
+        return await asearch_external(
             request,
             request.app.state.config.EXTERNAL_WEB_SEARCH_URL,
             request.app.state.config.EXTERNAL_WEB_SEARCH_API_KEY,
@@ -2280,11 +2684,11 @@ async def process_web_search(
         )
 
         search_tasks = [
-            run_in_threadpool(
-                search_web,
+            asearch_web(
                 request,
                 request.app.state.config.WEB_SEARCH_ENGINE,
                 query,
+                bypass_cache=form_data.bypass_cache,
             )
             for query in form_data.queries
         ]
@@ -2350,6 +2754,14 @@ async def process_web_search(
             )
             docs = await loader.aload()
 
+        # Syndicated and mirrored pages would be embedded and cited twice
+        docs = await run_in_threadpool(
+            remove_near_duplicates,
+            docs,
+            WEB_SEARCH_NEAR_DUPLICATE_THRESHOLD,
+            lambda doc: doc.page_content,
+        )
+
         urls = [
             doc.metadata.get("source") for doc in docs if doc.metadata.get("source")
         ]  # only keep the urls returned by the loader
@@ -2481,6 +2893,10 @@ async def query_doc_handler(
                     if form_data.hybrid_bm25_weight
                     else request.app.state.config.HYBRID_BM25_WEIGHT
                 ),
+                reranking_model=get_reranking_cache_namespace(
+                    request.app.state.config.RAG_RERANKING_ENGINE,
+                    request.app.state.config.RAG_RERANKING_MODEL,
+                ),
                 user=user,
             )
         else:
@@ -2554,6 +2970,10 @@ async def query_collection_handler(
                     if form_data.enable_enriched_texts is not None
                     else request.app.state.config.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS
                 ),
+                reranking_model=get_reranking_cache_namespace(
+                    request.app.state.config.RAG_RERANKING_ENGINE,
+                    request.app.state.config.RAG_RERANKING_MODEL,
+                ),
             )
         else:
             return await query_collection(
@@ -2603,6 +3023,7 @@ def delete_entries_from_collection(form_data: DeleteForm, user=Depends(get_admin
                 collection_name=form_data.collection_name,
                 metadata={"hash": hash},
             )
+            VectorContentHashes.delete_by_hash(form_data.collection_name, hash, db=db)
             return {"status": True}
         else:
             return {"status": False}
@@ -2614,6 +3035,7 @@ def delete_entries_from_collection(form_data: DeleteForm, user=Depends(get_admin
 @router.post("/reset/db")
 def reset_vector_db(user=Depends(get_admin_user), db: Session = Depends(get_session)):
     VECTOR_DB_CLIENT.reset()
+    VectorContentHashes.delete_all(db=db)
     Knowledges.delete_all_knowledge(db=db)
 
 
@@ -2682,12 +3104,36 @@ async def process_files_batch(
     file_results: List[BatchProcessFilesResult] = []
     file_errors: List[BatchProcessFilesResult] = []
     file_updates: List[FileUpdateForm] = []
+    copied_results: List[BatchProcessFilesResult] = []
 
     # Prepare all documents first
     all_docs: List[Document] = []
     for file in form_data.files:
         try:
             text_content = file.data.get("content", "")
+            hash = calculate_sha256_string(text_content)
+
+            # Reuse the file's vectors if it was already embedded
+            copied = await run_in_threadpool(
+                copy_file_vectors_to_collection,
+                request,
+                file.id,
+                collection_name,
+                {"file_id": file.id, "name": file.filename, "hash": hash},
+            )
+            if copied:
+                Files.update_file_by_id(
+                    id=file.id,
+                    form_data=FileUpdateForm(
+                        hash=hash,
+                        data={"content": text_content},
+                    ),
+                    db=db,
+                )
+                copied_results.append(
+                    BatchProcessFilesResult(file_id=file.id, status="completed")
+                )
+                continue
 
             docs: List[Document] = [
                 Document(
@@ -2706,7 +3152,7 @@ async def process_files_batch(
 
             file_updates.append(
                 FileUpdateForm(
-                    hash=calculate_sha256_string(text_content),
+                    hash=hash,
                     data={"content": text_content},
                 )
             )
@@ -2737,6 +3183,11 @@ async def process_files_batch(
                 Files.update_file_by_id(
                     id=file_result.file_id, form_data=file_update, db=db
                 )
+                # The batch is inserted without per-file metadata, so the
+                # duplicate check index is updated here
+                VectorContentHashes.upsert_hash(
+                    collection_name, file_result.file_id, file_update.hash, db=db
+                )
                 file_result.status = "completed"
 
         except Exception as e:
@@ -2749,4 +3200,6 @@ async def process_files_batch(
                     BatchProcessFilesResult(file_id=file_result.file_id, error=str(e))
                 )
 
-    return BatchProcessFilesResponse(results=file_results, errors=file_errors)
+    return BatchProcessFilesResponse(
+        results=copied_results + file_results, errors=file_errors
+    )
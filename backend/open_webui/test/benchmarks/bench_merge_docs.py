@@ -0,0 +1,158 @@
+"""
+Benchmark merge_docs_to_target_size on a synthetic 1,000-page document.
+
+Compares the current implementation against the previous one, which
+re-measured the accumulated chunk content on every merge step.
+
+    cd backend && python -m open_webui.test.benchmarks.bench_merge_docs
+"""
+
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+import tiktoken
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from open_webui.routers.retrieval import can_merge_chunks, merge_docs_to_target_size
+
+WORDS = (
+    "retrieval augmented generation embedding vector chunk token document "
+    "knowledge query answer context model index search score page section "
+    "table figure summary result method analysis data system report"
+).split()
+
+
+def make_document(pages: int, words_per_page: int, seed: int = 0) -> list[Document]:
+    rng = random.Random(seed)
+    docs = []
+    for page in range(pages):
+        paragraphs = []
+        for _ in range(rng.randint(4, 8)):
+            paragraphs.append(
+                " ".join(
+                    rng.choice(WORDS)
+                    for _ in range(words_per_page // 6 + rng.randint(-10, 10))
+                )
+            )
+        docs.append(
+            Document(
+                page_content="\n\n".join(paragraphs),
+                metadata={"source": "benchmark.pdf", "file_id": "bench", "page": page},
+            )
+        )
+    return docs
+
+
+def merge_docs_to_target_size_reference(request, chunks: list[Document]):
+    """The previous implementation, kept here as the comparison baseline."""
+    min_chunk_size_target = request.app.state.config.CHUNK_MIN_SIZE_TARGET
+    max_chunk_size = request.app.state.config.CHUNK_SIZE
+
+    measure_chunk_size = len
+    if request.app.state.config.TEXT_SPLITTER == "token":
+        encoding = tiktoken.get_encoding(
+            str(request.app.state.config.TIKTOKEN_ENCODING_NAME)
+        )
+        measure_chunk_size = lambda text: len(encoding.encode(text))
+
+    processed_chunks = []
+    current_chunk = None
+    current_content = ""
+
+    for next_chunk in chunks:
+        if current_chunk is None:
+            current_chunk = next_chunk
+            current_content = next_chunk.page_content
+            continue
+
+        proposed_content = f"{current_content}\n\n{next_chunk.page_content}"
+        can_merge = (
+            can_merge_chunks(current_chunk, next_chunk)
+            and measure_chunk_size(current_content) < min_chunk_size_target
+            and measure_chunk_size(proposed_content) <= max_chunk_size
+        )
+
+        if can_merge:
+            current_content = proposed_content
+        else:
+            processed_chunks.append(
+                Document(
+                    page_content=current_content, metadata={**current_chunk.metadata}
+                )
+            )
+            current_chunk = next_chunk
+            current_content = next_chunk.page_content
+
+    if current_chunk is not None:
+        processed_chunks.append(
+            Document(page_content=current_content, metadata={**current_chunk.metadata})
+        )
+
+    return processed_chunks
+
+
+def timed(func, *args, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--words-per-page", type=int, default=500)
+    parser.add_argument("--splitter", choices=["character", "token"], default="token")
+    parser.add_argument("--encoding", default="cl100k_base")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--min-size-target", type=int, default=800)
+    parser.add_argument("--split-size", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    request = SimpleNamespace(
+        app=SimpleNamespace(
+            state=SimpleNamespace(
+                config=SimpleNamespace(
+                    CHUNK_SIZE=args.chunk_size,
+                    CHUNK_MIN_SIZE_TARGET=args.min_size_target,
+                    TEXT_SPLITTER=args.splitter,
+                    TIKTOKEN_ENCODING_NAME=args.encoding,
+                )
+            )
+        )
+    )
+
+    # Small splits (e.g. from markdown header splitting) are what the merge
+    # step is meant to coalesce back up to the target size.
+    docs = make_document(args.pages, args.words_per_page)
+    chunks = RecursiveCharacterTextSplitter(
+        chunk_size=args.split_size, chunk_overlap=0
+    ).split_documents(docs)
+
+    print(
+        f"{args.pages} pages, {len(chunks)} input chunks, "
+        f"splitter={args.splitter}, chunk_size={args.chunk_size}, "
+        f"min_size_target={args.min_size_target}"
+    )
+
+    reference_time, reference = timed(
+        merge_docs_to_target_size_reference, request, chunks, repeat=args.repeat
+    )
+    current_time, current = timed(
+        merge_docs_to_target_size, request, chunks, repeat=args.repeat
+    )
+
+    print(f"reference: {reference_time * 1000:9.1f} ms -> {len(reference)} chunks")
+    print(f"current:   {current_time * 1000:9.1f} ms -> {len(current)} chunks")
+    print(f"speedup:   {reference_time / current_time:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark Oracle23aiClient insert, upsert and delete against a live Oracle 23ai.
+
+Compares the previous one-execute-per-row statements with the current
+executemany() array binding at several batch sizes. Writes to a throwaway
+collection that is deleted afterwards. A local Oracle Free container works:
+
+    docker run -d -p 1521:1521 -e ORACLE_PASSWORD=Welcome123456 \\
+        gvenzl/oracle-free:23-slim
+    cd backend && VECTOR_DB=oracle23ai ORACLE_DB_USER=system \\
+        ORACLE_DB_PASSWORD=Welcome123456 ORACLE_DB_DSN=localhost:1521/FREEPDB1 \\
+        python -m open_webui.test.benchmarks.bench_oracle23ai_insert
+"""
+
+import argparse
+import random
+import time
+import uuid
+
+from open_webui.retrieval.vector.dbs import oracle23ai
+
+
+def make_items(count: int, dimension: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "text": " ".join(f"word{rng.randint(0, 5000)}" for _ in range(150)),
+            "vector": [rng.uniform(-1, 1) for _ in range(dimension)],
+            "metadata": {"file_id": "bench", "name": "bench.pdf", "start_index": idx},
+        }
+        for idx in range(count)
+    ]
+
+
+def insert_reference(client, collection_name: str, items: list[dict]) -> None:
+    """The previous implementation, kept here as the comparison baseline."""
+    with client.get_connection() as connection:
+        with connection.cursor() as cursor:
+            for item in items:
+                cursor.execute(
+                    """
+                    INSERT INTO document_chunk
+                    (id, collection_name, text, vmetadata, vector)
+                    VALUES (:id, :collection_name, :text, :metadata, :vector)
+                    """,
+                    {
+                        "id": item["id"],
+                        "collection_name": collection_name,
+                        "text": item["text"],
+                        "metadata": client._metadata_to_json(item["metadata"]),
+                        "vector": client._vector_to_blob(item["vector"]),
+                    },
+                )
+        connection.commit()
+
+
+def delete_reference(client, collection_name: str, ids: list[str]) -> None:
+    with client.get_connection() as connection:
+        with connection.cursor() as cursor:
+            for id in ids:
+                cursor.execute(
+                    "DELETE FROM document_chunk "
+                    "WHERE collection_name = :collection_name AND id = :id",
+                    {"collection_name": collection_name, "id": id},
+                )
+        connection.commit()
+
+
+def run(client, func, items: list[dict]) -> float:
+    collection_name = f"bench-{uuid.uuid4()}"
+    # Fresh ids per run, so every run inserts new rows
+    items = [{**item, "id": str(uuid.uuid4())} for item in items]
+    try:
+        start = time.perf_counter()
+        # Functions that need setup return the time of the measured part
+        elapsed = func(client, collection_name, items)
+        return elapsed if elapsed is not None else time.perf_counter() - start
+    finally:
+        client.delete_collection(collection_name)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--dimension", type=int, default=768)
+    parser.add_argument("--batch-sizes", default="100,500,1000,2000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    client = oracle23ai.Oracle23aiClient()
+    items = make_items(args.items, args.dimension)
+
+    print(f"{args.items} items, dimension={args.dimension}")
+
+    def report(label: str, func):
+        best = min(run(client, func, items) for _ in range(args.repeat))
+        print(f"{label:<24} {best * 1000:9.1f} ms  {args.items / best:9.0f} items/s")
+
+    def upsert(client, name, items):
+        # Half of the rows exist already, so both MERGE branches are measured
+        client.insert(name, items[::2])
+        start = time.perf_counter()
+        client.upsert(name, items)
+        return time.perf_counter() - start
+
+    def delete(reference):
+        def func(client, name, items):
+            client.insert(name, items)
+            ids = [item["id"] for item in items]
+            start = time.perf_counter()
+            if reference:
+                delete_reference(client, name, ids)
+            else:
+                client.delete(name, ids=ids)
+            return time.perf_counter() - start
+
+        return func
+
+    report("insert reference", insert_reference)
+    report("delete reference", delete(True))
+    for batch_size in map(int, args.batch_sizes.split(",")):
+        oracle23ai.ORACLE_DB_BATCH_SIZE = batch_size
+        report(
+            f"insert batch={batch_size}",
+            lambda client, name, items: client.insert(name, items),
+        )
+        report(f"upsert batch={batch_size}", upsert)
+        report(f"delete batch={batch_size}", delete(False))
+
+
+if __name__ == "__main__":
+    main()
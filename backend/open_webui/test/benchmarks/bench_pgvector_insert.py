@@ -0,0 +1,123 @@
+"""
+Benchmark PgvectorClient.insert against a live Postgres with pgvector.
+
+Compares the previous one-statement-per-chunk encrypted insert and the
+ORM-based plain insert with the current batched INSERT and COPY paths.
+Writes to a throwaway collection that is deleted afterwards.
+
+    cd backend && PGVECTOR_DB_URL=postgresql://... \\
+        python -m open_webui.test.benchmarks.bench_pgvector_insert
+"""
+
+import argparse
+import json
+import random
+import time
+import uuid
+
+from sqlalchemy import text
+
+from open_webui.retrieval.vector.dbs import pgvector
+from open_webui.retrieval.vector.utils import process_metadata
+
+
+def make_items(count: int, dimension: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "text": " ".join(f"word{rng.randint(0, 5000)}" for _ in range(150)),
+            "vector": [rng.uniform(-1, 1) for _ in range(dimension)],
+            "metadata": {"file_id": "bench", "name": "bench.pdf", "start_index": idx},
+        }
+        for idx in range(count)
+    ]
+
+
+def insert_reference(client, collection_name: str, items: list[dict]) -> None:
+    """The previous implementation, kept here as the comparison baseline."""
+    if pgvector.PGVECTOR_PGCRYPTO:
+        for item in items:
+            client.session.execute(
+                text(
+                    """
+                    INSERT INTO document_chunk
+                    (id, vector, collection_name, text, vmetadata)
+                    VALUES (
+                        :id, :vector, :collection_name,
+                        pgp_sym_encrypt(:text, :key),
+                        pgp_sym_encrypt(:metadata_text, :key)
+                    )
+                    ON CONFLICT (id) DO NOTHING
+                """
+                ),
+                {
+                    "id": item["id"],
+                    "vector": client.adjust_vector_length(item["vector"]),
+                    "collection_name": collection_name,
+                    "text": item["text"],
+                    "metadata_text": json.dumps(item["metadata"]),
+                    "key": pgvector.PGVECTOR_PGCRYPTO_KEY,
+                },
+            )
+    else:
+        client.session.bulk_save_objects(
+            [
+                pgvector.DocumentChunk(
+                    id=item["id"],
+                    vector=client.adjust_vector_length(item["vector"]),
+                    collection_name=collection_name,
+                    text=item["text"],
+                    vmetadata=process_metadata(item["metadata"]),
+                )
+                for item in items
+            ]
+        )
+    client.session.commit()
+
+
+def run(client, func, items: list[dict]) -> float:
+    collection_name = f"bench-{uuid.uuid4()}"
+    # Fresh ids per run, so every run inserts new rows
+    items = [{**item, "id": str(uuid.uuid4())} for item in items]
+    try:
+        start = time.perf_counter()
+        func(client, collection_name, items)
+        return time.perf_counter() - start
+    finally:
+        client.delete_collection(collection_name)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--dimension", type=int, default=768)
+    parser.add_argument("--batch-sizes", default="100,500,1000,2000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    client = pgvector.PgvectorClient()
+    items = make_items(args.items, args.dimension)
+
+    print(
+        f"{args.items} items, dimension={args.dimension}, "
+        f"pgcrypto={pgvector.PGVECTOR_PGCRYPTO}"
+    )
+
+    def report(label: str, func):
+        best = min(run(client, func, items) for _ in range(args.repeat))
+        print(f"{label:<24} {best * 1000:9.1f} ms  {args.items / best:9.0f} items/s")
+
+    report("reference", insert_reference)
+
+    modes = [False] if pgvector.PGVECTOR_PGCRYPTO else [False, True]
+    for use_copy in modes:
+        pgvector.PGVECTOR_USE_COPY = use_copy
+        for batch_size in map(int, args.batch_sizes.split(",")):
+            pgvector.PGVECTOR_INSERT_BATCH_SIZE = batch_size
+            label = f"{'copy' if use_copy else 'insert'} batch={batch_size}"
+            report(label, lambda client, name, items: client.insert(name, items))
+
+
+if __name__ == "__main__":
+    main()
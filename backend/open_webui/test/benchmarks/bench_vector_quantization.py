@@ -0,0 +1,120 @@
+"""
+Benchmark recall and search latency of the compact vector storage modes.
+
+Runs an exact cosine search over float32 vectors as the baseline and compares
+halfvec, int8 scalar and binary quantization (each rescored with the float32
+vectors of an oversampled candidate set, as pgvector and Qdrant do) and
+Matryoshka truncation. The corpus is synthetic with most of the variance in
+the leading dimensions, which is the property truncation relies on; latencies
+are numpy brute force and only indicate the relative cost of each mode.
+
+    cd backend && python -m open_webui.test.benchmarks.bench_vector_quantization
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from open_webui.retrieval.utils import truncate_embeddings
+
+
+def make_corpus(count: int, queries: int, dimension: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    scale = (1 + np.arange(dimension) / (dimension / 8)).astype(np.float32) ** -0.5
+    centers = rng.standard_normal((64, dimension)).astype(np.float32) * scale
+    labels = rng.integers(0, len(centers), count + queries)
+    noise = rng.standard_normal((count + queries, dimension)).astype(np.float32)
+    vectors = centers[labels] + 0.5 * noise * scale
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors[:count], vectors[count:]
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    idx = np.argpartition(-scores, k, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, idx, axis=1), axis=1)
+    return np.take_along_axis(idx, order, axis=1)
+
+
+def rescore(corpus, queries, candidates, k: int) -> np.ndarray:
+    scores = np.einsum("qcd,qd->qc", corpus[candidates], queries)
+    order = np.argsort(-scores, axis=1)[:, :k]
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+def recall(result: np.ndarray, expected: np.ndarray) -> float:
+    hits = sum(len(set(r) & set(e)) for r, e in zip(result, expected))
+    return hits / expected.size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dimension", type=int, default=768)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--oversampling", type=int, default=4)
+    args = parser.parse_args()
+
+    corpus, queries = make_corpus(args.items, args.queries, args.dimension)
+    k, candidates = args.k, args.k * args.oversampling
+    expected = top_k(queries @ corpus.T, k)
+
+    # numpy has no fast float16 matmul, so only the storage precision is kept
+    half = corpus.astype(np.float16).astype(np.float32)
+
+    low, high = np.quantile(corpus, [0.005, 0.995])
+    step = (high - low) / 255
+    int8 = np.clip(np.round((corpus - low) / step) - 128, -128, 127).astype(np.int8)
+
+    bits = np.packbits(corpus > 0, axis=1)
+    query_bits = np.packbits(queries > 0, axis=1)
+    popcount = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(1)
+
+    def search_exact():
+        return top_k(queries @ corpus.T, k)
+
+    def search_half():
+        return top_k(queries @ half.T, k)
+
+    def search_int8():
+        q = np.clip(np.round((queries - low) / step) - 128, -128, 127)
+        scores = q.astype(np.float32) @ int8.T.astype(np.float32)
+        return rescore(corpus, queries, top_k(scores, candidates), k)
+
+    def search_binary():
+        distances = np.stack([popcount[q ^ bits].sum(1) for q in query_bits])
+        return rescore(corpus, queries, top_k(-distances, candidates), k)
+
+    def search_truncated(dimensions):
+        truncated = np.array(truncate_embeddings(corpus.tolist(), dimensions))
+        truncated_queries = np.array(truncate_embeddings(queries.tolist(), dimensions))
+        return lambda: top_k(truncated_queries @ truncated.T, k), truncated.shape[1]
+
+    modes = [
+        ("float32 exact", search_exact, args.dimension * 4),
+        ("halfvec", search_half, args.dimension * 2),
+        (f"int8 + rescore x{args.oversampling}", search_int8, args.dimension),
+        (f"binary + rescore x{args.oversampling}", search_binary, args.dimension // 8),
+    ]
+    for dimensions in (args.dimension // 2, args.dimension // 4):
+        func, dimension = search_truncated(dimensions)
+        modes.append((f"truncated to {dimension}", func, dimension * 4))
+
+    print(
+        f"{args.items} vectors x {args.dimension} dims, "
+        f"{args.queries} queries, recall@{k}"
+    )
+    for label, func, size in modes:
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<22} recall {recall(result, expected):6.3f}  "
+            f"{elapsed * 1000 / args.queries:7.2f} ms/query  "
+            f"{size:5d} bytes/vector"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Benchmark the enhanced web search ranking over a few hundred synthetic pages.
+
+Runs the pipeline of the enhanced Jina search (dedupe, quality score, evidence
+spans and published date per candidate) with the current single-pass
+AnalyzedDocument and with the previous implementation, which cleaned and
+tokenized every page again in each step.
+
+    cd backend && python -m open_webui.test.benchmarks.bench_web_quality
+"""
+
+import argparse
+import random
+import re
+import time
+from datetime import datetime
+
+from open_webui.retrieval.web.quality import (
+    STOPWORDS,
+    canonicalize_url,
+    compute_source_quality_score,
+    dedupe_candidates,
+    extract_evidence_spans,
+    sha256_text,
+)
+
+WORDS = (
+    "tariff duty import export order federal agency rule notice effective "
+    "date commerce trade goods customs rate baseline policy report section "
+    "schedule product country annex amendment review comment period"
+).split()
+HOSTS = [
+    "www.federalregister.gov",
+    "www.reuters.com",
+    "exampleblog.substack.com",
+    "en.wikipedia.org",
+    "www.example.com",
+]
+
+
+def make_page(rng: random.Random, words: int) -> str:
+    parts = [f"![banner](https://cdn.example.com/{rng.randint(0, 999)}.png)"]
+    while words > 0:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 24)))
+        if rng.random() < 0.3:
+            sentence += f" by {rng.randint(1, 99)}% on April {rng.randint(1, 28)}, 2025"
+        if rng.random() < 0.2:
+            sentence += (
+                f" [see notice](https://www.example.com/n/{rng.randint(0, 9999)})"
+            )
+        parts.append(sentence.capitalize() + rng.choice([".", ".", "!", "?"]))
+        if rng.random() < 0.1:
+            parts.append("\n\n## " + " ".join(rng.sample(WORDS, 3)) + "\n")
+        words -= 15
+    return " ".join(parts)
+
+
+def make_candidates(count: int, words: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    candidates = []
+    for idx in range(count):
+        # Query variants return overlapping results, so some pages repeat
+        page = idx if rng.random() > 0.2 else rng.randint(0, max(idx - 1, 0))
+        page_rng = random.Random(page)
+        candidates.append(
+            {
+                "url": f"https://{HOSTS[page % len(HOSTS)]}/doc/{page}?utm_source=x",
+                "content": make_page(page_rng, words),
+            }
+        )
+    return candidates
+
+
+def clean_content_reference(text: str) -> str:
+    text = text or ""
+    text = re.sub(r"!\[[^\]]*]\([^)]+\)", " ", text)
+    text = re.sub(r"\[([^\]]+)]\([^)]+\)", r"\1", text)
+    text = re.sub(r"\[\]\([^)]+\)", " ", text)
+    text = re.sub(r"https?://\S+", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text
+
+
+def query_terms_reference(query: str) -> set[str]:
+    parts = re.findall(r"[A-Za-z0-9]+", (query or "").lower())
+    return {part for part in parts if part not in STOPWORDS and len(part) >= 3}
+
+
+def published_date_reference(text: str) -> str | None:
+    patterns = [
+        (r"\b(\d{4})-(\d{2})-(\d{2})\b", "%Y-%m-%d"),
+        (r"\b(\d{2})/(\d{2})/(\d{4})\b", "%m/%d/%Y"),
+        (r"\b([A-Z][a-z]+ \d{1,2}, \d{4})\b", "%B %d, %Y"),
+    ]
+    for pattern, fmt in patterns:
+        match = re.search(pattern, text or "")
+        if match:
+            try:
+                return datetime.strptime(match.group(0), fmt).date().isoformat()
+            except ValueError:
+                continue
+    return None
+
+
+def rank_reference(query: str, candidates: list[dict]) -> list:
+    """The previous implementation, kept here as the comparison baseline."""
+    seen_urls, seen_hashes, deduped = set(), set(), []
+    for candidate in candidates:
+        canonical_url = canonicalize_url(candidate["url"])
+        content = clean_content_reference(candidate["content"])
+        content_hash = sha256_text(content[:6000])
+        if canonical_url in seen_urls or content_hash in seen_hashes:
+            continue
+        seen_urls.add(canonical_url)
+        seen_hashes.add(content_hash)
+        deduped.append({"canonical_url": canonical_url, "content": content})
+
+    results = []
+    for candidate in deduped:
+        published_date = published_date_reference(candidate["content"])
+        # Quality score: clean and tokenize the page again
+        cleaned = clean_content_reference(candidate["content"])
+        terms = query_terms_reference(query)
+        text_terms = set(re.findall(r"[A-Za-z0-9]+", cleaned.lower()))
+        score = len(terms & text_terms) / max(len(terms), 1)
+        # Evidence spans: clean, split and tokenize every sentence again
+        cleaned = clean_content_reference(candidate["content"])
+        ranked = []
+        for sentence in re.split(r"(?<=[.!?])\s+", cleaned):
+            sentence = sentence.strip()
+            if len(sentence) < 35:
+                continue
+            sentence_terms = set(re.findall(r"[A-Za-z0-9]+", sentence.lower()))
+            signal = 0.15 if re.search(r"\b\d+(\.\d+)?%?\b", sentence) else 0.0
+            if len(query_terms_reference(query) & sentence_terms) + signal > 0:
+                ranked.append(sentence)
+        results.append((candidate["canonical_url"], published_date, score, ranked))
+    return results
+
+
+def rank_current(query: str, candidates: list[dict]) -> list:
+    results = []
+    for candidate in dedupe_candidates(candidates):
+        document = candidate.pop("document")
+        score = compute_source_quality_score(
+            query=query,
+            url=candidate["canonical_url"],
+            content=document,
+            published_date=document.published_date,
+            strict_authority=True,
+        )
+        evidence = extract_evidence_spans(
+            query=query,
+            content=document,
+            source_url=candidate["canonical_url"],
+            published_date=document.published_date,
+            source_quality_score=score,
+            max_items=8,
+        )
+        results.append((candidate["canonical_url"], score, evidence))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--words", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    query = "federal tariff baseline rate effective date"
+    candidates = make_candidates(args.pages, args.words)
+    size = sum(len(c["content"]) for c in candidates) / 1e6
+    print(f"{args.pages} pages, {size:.1f} MB of content")
+
+    for label, func in (("reference", rank_reference), ("analyzed", rank_current)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = func(query, [dict(c) for c in candidates])
+            best = min(best, time.perf_counter() - start)
+        print(
+            f"{label:<10} {best * 1000:8.1f} ms  "
+            f"{best * 1000 / args.pages:6.2f} ms/page  {len(results)} ranked"
+        )
+
+
+if __name__ == "__main__":
+    main()
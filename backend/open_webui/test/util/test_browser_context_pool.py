@@ -0,0 +1,83 @@
+import asyncio
+
+from open_webui.retrieval.web.browser_pool import BrowserContextPool
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.routes = []
+        self.closed = False
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self):
+        self.contexts.append(FakeContext(self))
+        return self.contexts[-1]
+
+
+class FakePool(BrowserContextPool):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.browsers = []
+
+    async def _launch(self):
+        self.browsers.append(FakeBrowser())
+        return self.browsers[-1]
+
+
+def test_contexts_are_reused_bounded_and_recycled():
+    async def run():
+        pool = FakePool(size=2, max_uses=3, blocked_resource_types=["image"])
+        active, peak = [0], [0]
+
+        async def load(fail=False):
+            async with pool.context() as context:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                await asyncio.sleep(0.01)
+                active[0] -= 1
+                if fail:
+                    raise ValueError("page crashed")
+
+        await asyncio.gather(*[load() for _ in range(6)])
+        # Six loads on two contexts, each recycled after three uses
+        browser = pool.browsers[0]
+        assert peak[0] == 2
+        assert len(browser.contexts) == 2
+        assert all(context.closed for context in browser.contexts)
+        assert browser.contexts[0].routes == ["**/*"]
+
+        try:
+            await load(fail=True)
+        except ValueError:
+            pass
+        assert pool.health()["recycled"] == 3
+
+        await load()
+        browser.connected = False
+        await load()
+        # A disconnected browser is relaunched, its contexts dropped
+        assert len(pool.browsers) == 2
+        assert pool.health() == {
+            "size": 2,
+            "idle": 1,
+            "in_use": 0,
+            "recycled": 4,
+            "connected": True,
+        }
+
+    asyncio.run(run())
@@ -0,0 +1,129 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from open_webui.models.files import FileModel
+from open_webui.models.vector_content_hashes import VectorContentHashes
+from open_webui.routers import retrieval
+from open_webui.utils.misc import calculate_sha256_string
+
+
+class FakeVectorDB:
+    def __init__(self, items):
+        self.items = items
+        self.inserted = {}
+
+    def query_vectors(self, collection_name, filter):
+        return self.items if collection_name == "file-f" else None
+
+    def query(self, collection_name, filter, limit=None):
+        return None
+
+    def insert(self, collection_name, items):
+        self.inserted.setdefault(collection_name, []).extend(items)
+
+
+def make_request(chunk_size=100):
+    config = SimpleNamespace(
+        TEXT_SPLITTER="character",
+        CHUNK_SIZE=chunk_size,
+        CHUNK_OVERLAP=0,
+        TIKTOKEN_ENCODING_NAME="cl100k_base",
+        RAG_EMBEDDING_ENGINE="",
+        RAG_EMBEDDING_MODEL="model-a",
+    )
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(config=config)))
+
+
+def stored_items(request):
+    return [
+        {
+            "id": "1",
+            "text": "hello",
+            "vector": [0.1, 0.2],
+            "metadata": {
+                "file_id": "f",
+                "embedding_config": retrieval.get_embedding_config(request),
+                # As stored by backends that stringify nested metadata
+                "chunk_config": str(retrieval.get_chunk_config(request)),
+            },
+        }
+    ]
+
+
+def test_copies_vectors_into_collection(monkeypatch):
+    request = make_request()
+    db = FakeVectorDB(stored_items(request))
+    monkeypatch.setattr(retrieval, "VECTOR_DB_CLIENT", db)
+
+    VectorContentHashes.delete_by_collection_name("kb")
+    try:
+        assert retrieval.copy_file_vectors_to_collection(
+            request, "f", "kb", metadata={"file_id": "f", "hash": "h"}
+        )
+        assert VectorContentHashes.has_hash("kb", "h")
+    finally:
+        VectorContentHashes.delete_by_collection_name("kb")
+
+    [item] = db.inserted["kb"]
+    assert item["id"] != "1"
+    assert item["text"] == "hello"
+    assert item["vector"] == [0.1, 0.2]
+    assert item["metadata"]["hash"] == "h"
+
+
+def test_falls_back_when_chunking_config_differs(monkeypatch):
+    db = FakeVectorDB(stored_items(make_request(chunk_size=100)))
+    monkeypatch.setattr(retrieval, "VECTOR_DB_CLIENT", db)
+
+    assert (
+        retrieval.copy_file_vectors_to_collection(
+            make_request(chunk_size=200), "f", "kb"
+        )
+        is None
+    )
+    assert db.inserted == {}
+
+
+def test_batch_added_files_are_found_by_the_duplicate_check(monkeypatch):
+    request = make_request()
+    db = FakeVectorDB(stored_items(request))
+    monkeypatch.setattr(retrieval, "VECTOR_DB_CLIENT", db)
+    monkeypatch.setattr(retrieval.Files, "update_file_by_id", lambda **kwargs: None)
+    monkeypatch.setattr(retrieval, "save_docs_to_vector_db", lambda *a, **kw: True)
+
+    def file(id, content):
+        return FileModel(
+            id=id,
+            user_id="u",
+            filename=f"{id}.txt",
+            data={"content": content},
+            meta={},
+            created_at=0,
+            updated_at=0,
+        )
+
+    VectorContentHashes.delete_by_collection_name("kb")
+    try:
+        # "f" has stored vectors and is copied, "g" is embedded in the batch
+        response = asyncio.run(
+            retrieval.process_files_batch(
+                request,
+                retrieval.BatchProcessFilesForm(
+                    files=[file("f", "copied"), file("g", "embedded")],
+                    collection_name="kb",
+                ),
+                user=None,
+                db=None,
+            )
+        )
+        assert response.errors == []
+
+        for content in ("copied", "embedded"):
+            with pytest.raises(ValueError):
+                retrieval.check_duplicate_content(
+                    "kb", {"hash": calculate_sha256_string(content)}
+                )
+    finally:
+        VectorContentHashes.delete_by_collection_name("kb")
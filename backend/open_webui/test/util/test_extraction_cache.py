@@ -0,0 +1,62 @@
+from langchain_core.documents import Document
+
+from open_webui.retrieval.loaders import main
+from open_webui.retrieval.loaders.extraction_cache import ExtractionCache
+from open_webui.retrieval.loaders.main import Loader
+
+
+def test_entries_are_evicted_lru(tmp_path):
+    cache = ExtractionCache(tmp_path / "documents.db", max_size=400)
+    key = cache.get_key("hash", "tika", {"TIKA_SERVER_URL": "http://tika"})
+    assert key == cache.get_key("hash", "tika", {"TIKA_SERVER_URL": "http://tika"})
+
+    cache.set("a", [Document(page_content="a" * 100, metadata={"page": 1})])
+    cache.set("b", [Document(page_content="b" * 100)], ["images/b.png"])
+    assert cache.get("a") == (
+        [Document(page_content="a" * 100, metadata={"page": 1})],
+        None,
+    )
+    assert cache.get("b")[1] == ["images/b.png"]
+
+    cache.get("a")
+    # Over the size limit, the least recently used entry goes first
+    cache.set("c", [Document(page_content="c" * 100)])
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_files_are_extracted_once_per_content_and_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        main, "EXTRACTION_CACHE", ExtractionCache(tmp_path / "cache.db", 1 << 20)
+    )
+    extractions = []
+
+    class FakeLoader:
+        def load(self):
+            extractions.append(1)
+            return [Document(page_content=f"extraction {len(extractions)}")]
+
+    monkeypatch.setattr(Loader, "_get_loader", lambda self, *args: FakeLoader())
+
+    for name in ("a.pdf", "copy.pdf"):
+        (tmp_path / name).write_bytes(b"%PDF same content")
+    (tmp_path / "other.pdf").write_bytes(b"%PDF other content")
+
+    def load(name, force_refresh=False, **settings):
+        settings = {"TIKA_SERVER_URL": "http://tika", **settings}
+        docs = Loader("tika", **settings).load(
+            name, "application/pdf", str(tmp_path / name), force_refresh
+        )
+        return docs[0].page_content
+
+    assert load("a.pdf") == "extraction 1"
+    # Same content, or settings the engine does not use, reuse the extraction
+    assert load("copy.pdf") == "extraction 1"
+    assert load("a.pdf", DOCLING_PARAMS={"do_ocr": True}) == "extraction 1"
+    assert load("a.pdf", MISTRAL_OCR_API_KEY="rotated") == "extraction 1"
+
+    assert load("other.pdf") == "extraction 2"
+    assert load("a.pdf", TIKA_SERVER_URL="http://other-tika") == "extraction 3"
+    assert load("a.pdf", force_refresh=True) == "extraction 4"
+    assert load("copy.pdf") == "extraction 4"
@@ -0,0 +1,153 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.documents import Document
+
+from open_webui.retrieval.pipeline import IngestionPipeline, IngestionProgress
+from open_webui.routers import retrieval
+
+
+def split(doc):
+    return [
+        Document(page_content=word, metadata=doc.metadata)
+        for word in doc.page_content.split()
+    ]
+
+
+async def embed(chunks):
+    return [[float(len(chunk.page_content))] for chunk in chunks]
+
+
+def test_pipeline_streams_all_chunks_in_bounded_batches():
+    inserted = []
+    reports = []
+    lock = threading.Lock()
+
+    def insert(chunks, embeddings):
+        with lock:
+            inserted.extend(
+                (chunk.page_content, vector)
+                for chunk, vector in zip(chunks, embeddings)
+            )
+
+    docs = [Document(page_content=f"a{i} bb{i} ccc{i}") for i in range(10)]
+    pipeline = IngestionPipeline(
+        split=split,
+        embed=embed,
+        insert=insert,
+        batch_size=4,
+        queue_size=1,
+        progress=IngestionProgress(reports.append, interval=0),
+    )
+
+    assert pipeline.run(iter(docs)) == 30
+    assert [text for text, _ in inserted] == [
+        chunk.page_content for doc in docs for chunk in split(doc)
+    ]
+    assert inserted[0] == ("a0", [2.0])
+
+    final = reports[-1]
+    assert all(final[stage]["status"] == "completed" for stage in final)
+    assert final["insert"]["done"] == 30
+
+
+def test_pipeline_stops_and_raises_on_stage_failure():
+    inserted = []
+
+    async def failing_embed(chunks):
+        raise RuntimeError("embedding service down")
+
+    pipeline = IngestionPipeline(
+        split=split,
+        embed=failing_embed,
+        insert=lambda chunks, embeddings: inserted.extend(chunks),
+        batch_size=2,
+        queue_size=1,
+    )
+
+    docs = (Document(page_content="x y z") for _ in range(1000))
+    with pytest.raises(RuntimeError, match="embedding service down"):
+        pipeline.run(docs)
+
+    assert inserted == []
+    assert pipeline.progress.snapshot()["embed"]["status"] == "failed"
+
+
+def test_progress_reports_are_delivered_in_order():
+    reports = []
+
+    def on_progress(snapshot):
+        # A slow write lets the other stage's thread overtake this one
+        time.sleep(0.001)
+        reports.append(snapshot)
+
+    progress = IngestionProgress(on_progress, interval=0)
+
+    def run(stage):
+        for _ in range(50):
+            progress.update(stage, done=1)
+
+    threads = [threading.Thread(target=run, args=(s,)) for s in ("embed", "insert")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for stage in ("embed", "insert"):
+        done = [report[stage]["done"] for report in reports]
+        assert done == sorted(done)
+    assert reports[-1]["embed"]["done"] == reports[-1]["insert"]["done"] == 50
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_progress_is_cleared_when_ingestion_ends(monkeypatch, fail):
+    class FakeVectorDB:
+        def has_collection(self, collection_name):
+            return False
+
+        def insert(self, collection_name, items):
+            if fail:
+                raise RuntimeError("vector db down")
+
+    def get_embedding_function(*args, **kwargs):
+        async def embedding_function(texts, prefix=None, user=None):
+            return [[1.0] for _ in texts]
+
+        return embedding_function
+
+    monkeypatch.setattr(retrieval, "ENABLE_RAG_PIPELINED_INGESTION", True)
+    monkeypatch.setattr(retrieval, "VECTOR_DB_CLIENT", FakeVectorDB())
+    monkeypatch.setattr(retrieval, "get_embedding_function", get_embedding_function)
+    config = SimpleNamespace(
+        TEXT_SPLITTER="character",
+        CHUNK_SIZE=100,
+        CHUNK_OVERLAP=0,
+        RAG_EMBEDDING_ENGINE="",
+        RAG_EMBEDDING_MODEL="model-a",
+        RAG_EMBEDDING_BATCH_SIZE=1,
+        RAG_AZURE_OPENAI_BASE_URL=None,
+        RAG_AZURE_OPENAI_API_KEY=None,
+    )
+    request = SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(config=config, ef=None))
+    )
+    reports = []
+
+    def save():
+        return retrieval.save_docs_to_vector_db(
+            request,
+            [Document(page_content="hello world")],
+            "c",
+            progress_callback=reports.append,
+            check_duplicate=False,
+        )
+
+    if fail:
+        with pytest.raises(RuntimeError, match="vector db down"):
+            save()
+    else:
+        assert save()
+
+    assert reports[-1] is None
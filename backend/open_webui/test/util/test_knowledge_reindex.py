@@ -0,0 +1,81 @@
+import threading
+import time
+
+from open_webui.utils.knowledge_reindex import KnowledgeReindexManager
+
+KNOWLEDGE_BASES = {"kb1": ["a", "b", "c"], "kb2": ["d", "e"]}
+
+
+def wait_for(manager, timeout=10):
+    deadline = time.monotonic() + timeout
+    while manager.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def start(manager, process_file, resets):
+    return manager.start(
+        list_knowledge_bases=lambda: list(KNOWLEDGE_BASES),
+        list_files=lambda kb_id: KNOWLEDGE_BASES[kb_id],
+        reset_collection=resets.append,
+        process_file=process_file,
+    )
+
+
+def test_reindex_processes_every_file_and_records_failures(tmp_path):
+    processed = []
+    lock = threading.Lock()
+
+    def process_file(kb_id, file_id):
+        if file_id == "e":
+            raise ValueError("broken file")
+        with lock:
+            processed.append((kb_id, file_id))
+
+    resets = []
+    manager = KnowledgeReindexManager(tmp_path / "job.json", workers=3, throttle_ms=0)
+    assert start(manager, process_file, resets)
+    wait_for(manager)
+
+    status = manager.status()
+    assert status["status"] == "completed"
+    assert status["files_done"] == 4 and status["files_failed"] == 1
+    assert sorted(processed) == [
+        ("kb1", "a"),
+        ("kb1", "b"),
+        ("kb1", "c"),
+        ("kb2", "d"),
+    ]
+    assert resets == ["kb1", "kb2"]
+
+
+def test_reindex_resumes_from_checkpoint(tmp_path):
+    checkpoint = tmp_path / "job.json"
+    processed = []
+    resets = []
+    release = threading.Event()
+
+    def stalling_process_file(kb_id, file_id):
+        if file_id == "b":
+            release.wait(5)
+        processed.append(file_id)
+
+    manager = KnowledgeReindexManager(checkpoint, workers=1, throttle_ms=0)
+    start(manager, stalling_process_file, resets)
+    while "a" not in processed:
+        time.sleep(0.01)
+    manager.stop()
+    release.set()
+    wait_for(manager)
+    assert manager.status()["status"] == "stopped"
+
+    # A new process picks the job up from the checkpoint file
+    resumed = KnowledgeReindexManager(checkpoint, workers=2, throttle_ms=0)
+    processed.clear()
+    start(resumed, lambda kb_id, file_id: processed.append(file_id), resets)
+    wait_for(resumed)
+
+    assert resumed.status()["status"] == "completed"
+    assert "a" not in processed and "b" not in processed
+    assert sorted(processed) == ["c", "d", "e"]
+    # kb1 was already reset by the first run and keeps its collection
+    assert resets == ["kb1", "kb2"]
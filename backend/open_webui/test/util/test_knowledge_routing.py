@@ -0,0 +1,102 @@
+import asyncio
+
+from open_webui.retrieval import utils
+from open_webui.retrieval.vector.main import SearchResult
+
+
+class FakeVectorDB:
+    def __init__(self, scores, ignore_filter=False):
+        self.scores = scores
+        self.ignore_filter = ignore_filter
+        self.calls = []
+
+    async def asearch(self, collection_name, vectors, filter=None, limit=10):
+        self.calls.append((collection_name, filter, limit))
+        # The query embeddings are [1.0] and [2.0], one per query
+        query = [int(vector[0]) - 1 for vector in vectors]
+        ids = [
+            id
+            for id in self.scores
+            if self.ignore_filter or id in filter["knowledge_base_id"]["$in"]
+        ]
+        # Nearest knowledge bases first, like the backends return them
+        ids = sorted(ids, key=lambda id: self.scores[id][query[0]], reverse=True)
+        ids = ids[:limit]
+        # Like Chroma, only the first vector is scored
+        return SearchResult(
+            ids=[ids],
+            distances=[[self.scores[id][query[0]] for id in ids]],
+            documents=[[""] * len(ids)],
+            metadatas=[[{}] * len(ids)],
+        )
+
+
+def test_route_knowledge_bases_keeps_top_n_above_threshold(monkeypatch):
+    # Similarity of each knowledge base to the two queries
+    db = FakeVectorDB({"hr": (0.9, 0.1), "it": (0.2, 0.7), "legal": (0.3, 0.4)})
+    monkeypatch.setattr(utils, "VECTOR_DB_CLIENT", db)
+
+    routed = asyncio.run(
+        utils.route_knowledge_bases(
+            ["hr", "it", "legal", "new"], [[1.0], [2.0]], top_n=2, threshold=0.5
+        )
+    )
+
+    # "new" has no metadata embedding yet, so it cannot be ruled out
+    assert routed == {"hr", "it", "new"}
+    assert (
+        db.calls
+        == [
+            (
+                "knowledge-bases",
+                {"knowledge_base_id": {"$in": ["hr", "it", "legal", "new"]}},
+                4,
+            )
+        ]
+        * 2
+    )
+
+    routed = asyncio.run(
+        utils.route_knowledge_bases(["hr", "it", "legal"], [[1.0], [2.0]], top_n=1)
+    )
+    assert routed == {"hr"}
+
+
+def test_route_knowledge_bases_drops_unrequested_results(monkeypatch):
+    # A backend ignoring the filter returns the nearest knowledge bases overall
+    db = FakeVectorDB(
+        {
+            "other-1": (0.95, 0.95),
+            "other-2": (0.9, 0.9),
+            "hr": (0.8, 0.1),
+            "it": (0.1, 0.6),
+            "legal": (0.2, 0.5),
+        },
+        ignore_filter=True,
+    )
+    monkeypatch.setattr(utils, "VECTOR_DB_CLIENT", db)
+
+    routed = asyncio.run(
+        utils.route_knowledge_bases(
+            ["hr", "it", "legal"], [[1.0], [2.0]], top_n=2, threshold=0.3
+        )
+    )
+    # Results for other knowledge bases do not take the top_n places, and
+    # "legal", cut off by the limit, is kept as unscored
+    assert routed == {"hr", "it", "legal"}
+
+
+def test_query_embeddings_are_reused():
+    calls = []
+
+    async def embedding_function(query, prefix=None):
+        calls.append(query)
+        return [0.0]
+
+    func = utils.with_query_embeddings(embedding_function, ["a", "b"], [[1.0], [2.0]])
+    prefix = utils.RAG_EMBEDDING_QUERY_PREFIX
+
+    assert asyncio.run(func(["a", "b"], prefix=prefix)) == [[1.0], [2.0]]
+    assert asyncio.run(func("b", prefix=prefix)) == [2.0]
+    assert asyncio.run(func("c", prefix=prefix)) == [0.0]
+    assert calls == ["c"]
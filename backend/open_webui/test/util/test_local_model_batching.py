@@ -0,0 +1,87 @@
+import asyncio
+import threading
+
+from open_webui.retrieval.models.batching import MicroBatcher
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def run(self, items, key):
+        with self.lock:
+            self.calls.append((list(items), key))
+        return [f"{key}:{item}" for item in items]
+
+
+def run_batch(model, items, key):
+    return model.run(items, key)
+
+
+def test_concurrent_requests_are_coalesced_into_one_batch():
+    model = FakeModel()
+    batcher = MicroBatcher("test", model, run_batch, max_batch_size=16, max_wait_ms=50)
+
+    async def main():
+        return await asyncio.gather(
+            *[batcher.run([f"q{idx}"], key="p") for idx in range(4)]
+        )
+
+    results = asyncio.run(main())
+    batcher.close()
+
+    assert results == [["p:q0"], ["p:q1"], ["p:q2"], ["p:q3"]]
+    assert len(model.calls) == 1
+    assert batcher.stats()["avg_batch_size"] == 4
+
+
+def test_batches_respect_max_size_and_key():
+    model = FakeModel()
+    batcher = MicroBatcher("test", model, run_batch, max_batch_size=2, max_wait_ms=20)
+
+    futures = [
+        batcher.submit(["a"], key="x"),
+        batcher.submit(["b"], key="y"),
+        batcher.submit(["c"], key="x"),
+        batcher.submit(["d"], key="x"),
+    ]
+    results = [future.result(timeout=5) for future in futures]
+    batcher.close()
+
+    assert results == [["x:a"], ["y:b"], ["x:c"], ["x:d"]]
+    assert all(len(items) <= 2 for items, _ in model.calls)
+    assert (["b"], "y") in model.calls
+
+
+def test_errors_propagate_to_every_request_in_batch():
+    def failing(model, items, key):
+        raise ValueError("boom")
+
+    model = FakeModel()
+    batcher = MicroBatcher("test", model, failing, max_batch_size=8, max_wait_ms=20)
+    futures = [batcher.submit(["a"]), batcher.submit(["b"])]
+    for future in futures:
+        assert isinstance(future.exception(timeout=5), ValueError)
+    batcher.close()
+
+
+def test_large_requests_are_split_so_small_ones_interleave():
+    model = FakeModel()
+    batcher = MicroBatcher(
+        "test", model, run_batch, max_batch_size=4, max_wait_ms=20, workers=1
+    )
+
+    big = batcher.submit([f"d{idx}" for idx in range(10)], key="p")
+    small = batcher.submit(["q"], key="p")
+    assert small.result(timeout=5) == ["p:q"]
+    assert big.result(timeout=5) == [f"p:d{idx}" for idx in range(10)]
+    batcher.close()
+
+    # The query rides along with the second slice, not after all ten items
+    assert [items for items, _ in model.calls] == [
+        ["d0", "d1", "d2", "d3"],
+        ["q", "d4", "d5", "d6"],
+        ["d7", "d8", "d9"],
+    ]
+    assert batcher.stats()["queue_depth"] == 0
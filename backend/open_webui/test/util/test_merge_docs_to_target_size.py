@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+from langchain_core.documents import Document
+
+from open_webui.routers.retrieval import merge_docs_to_target_size
+
+
+def make_request(chunk_size: int, min_size_target: int):
+    config = SimpleNamespace(
+        CHUNK_SIZE=chunk_size,
+        CHUNK_MIN_SIZE_TARGET=min_size_target,
+        TEXT_SPLITTER="character",
+    )
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(config=config)))
+
+
+def doc(text: str, source: str = "a.pdf") -> Document:
+    return Document(page_content=text, metadata={"source": source})
+
+
+def test_merges_small_chunks_up_to_target_and_max_size():
+    chunks = [doc("a" * 10), doc("b" * 10), doc("c" * 10), doc("d" * 30)]
+
+    merged = merge_docs_to_target_size(make_request(36, 20), chunks)
+
+    # 10 + 2 + 10 = 22 reaches the target, 22 + 2 + 10 would exceed the max
+    assert [chunk.page_content for chunk in merged] == [
+        "a" * 10 + "\n\n" + "b" * 10,
+        "c" * 10,
+        "d" * 30,
+    ]
+
+
+def test_does_not_merge_across_sources():
+    chunks = [doc("a", "x.pdf"), doc("b", "x.pdf"), doc("c", "y.pdf")]
+
+    merged = merge_docs_to_target_size(make_request(100, 50), chunks)
+
+    assert [chunk.page_content for chunk in merged] == ["a\n\nb", "c"]
+    assert [chunk.metadata["source"] for chunk in merged] == ["x.pdf", "y.pdf"]
@@ -0,0 +1,90 @@
+import array
+from contextlib import contextmanager
+
+from open_webui.retrieval.vector.dbs import oracle23ai
+
+
+class FakeCursor:
+    def __init__(self, calls):
+        self.calls = calls
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def executemany(self, statement, rows):
+        self.calls.append((statement, rows))
+        self.rowcount = len(rows)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def cursor(self):
+        return FakeCursor(self.calls)
+
+    def commit(self):
+        pass
+
+
+def make_client():
+    client = object.__new__(oracle23ai.Oracle23aiClient)
+    connection = FakeConnection()
+    client.get_connection = lambda: connection
+    return client, connection.calls
+
+
+def make_items(count):
+    return [
+        {"id": str(i), "text": f"t{i}", "vector": [0.5, i], "metadata": {"i": i}}
+        for i in range(count)
+    ]
+
+
+def test_insert_binds_batches_of_rows(monkeypatch):
+    monkeypatch.setattr(oracle23ai, "ORACLE_DB_BATCH_SIZE", 2)
+    client, calls = make_client()
+
+    client.insert("kb", make_items(3))
+
+    assert [len(rows) for _, rows in calls] == [2, 1]
+    row = calls[1][1][0]
+    assert row["id"] == "2"
+    assert row["collection_name"] == "kb"
+    assert row["metadata"] == '{"i": 2}'
+    assert row["vector"] == array.array("f", [0.5, 2.0])
+
+
+def test_upsert_binds_merge_parameters(monkeypatch):
+    monkeypatch.setattr(oracle23ai, "ORACLE_DB_BATCH_SIZE", 500)
+    client, calls = make_client()
+
+    client.upsert("kb", make_items(1))
+
+    [(statement, [row])] = calls
+    assert "MERGE INTO document_chunk" in statement
+    assert row["merge_id"] == row["ins_id"] == "0"
+    assert row["upd_collection_name"] == row["ins_collection_name"] == "kb"
+    assert "upd_id" not in row
+
+
+def test_delete_by_ids_binds_one_row_per_id(monkeypatch):
+    monkeypatch.setattr(oracle23ai, "ORACLE_DB_BATCH_SIZE", 1000)
+    client, calls = make_client()
+
+    client.delete("kb", ids=[str(i) for i in range(1500)])
+
+    assert [len(rows) for _, rows in calls] == [1000, 500]
+    statement, rows = calls[0]
+    assert statement.endswith("AND id = :id")
+    assert rows[0] == {"collection_name": "kb", "id": "0"}
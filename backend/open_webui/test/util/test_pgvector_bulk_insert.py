@@ -0,0 +1,76 @@
+import asyncio
+
+from open_webui.retrieval.vector.dbs import pgvector
+from open_webui.retrieval.vector.main import GetResult
+
+
+def test_copy_text_escapes_fields():
+    rows = [
+        {
+            "id": "1",
+            "vector": [0.5, 1],
+            "collection_name": "kb",
+            "text": "tab\there\nnew line \\ backslash",
+            "vmetadata": {"name": "a.txt"},
+        },
+        {
+            "id": "2",
+            "vector": [0.25],
+            "collection_name": "kb",
+            "text": None,
+            "vmetadata": None,
+        },
+    ]
+
+    assert pgvector.copy_text(rows) == (
+        '1\t[0.5,1.0]\tkb\ttab\\there\\nnew line \\\\ backslash\t{"name": "a.txt"}\n'
+        "2\t[0.25]\tkb\t\\N\t\\N\n"
+    )
+
+
+def test_encrypted_insert_statement_binds_every_row():
+    statement = str(pgvector.encrypted_insert_statement(3, upsert=True))
+
+    for idx in range(3):
+        assert f":id_{idx}" in statement
+        assert f"pgp_sym_encrypt(:metadata_text_{idx}, :key)" in statement
+    assert ":id_3" not in statement
+    assert "DO UPDATE SET" in statement
+
+
+def test_encrypted_insert_statement_uses_conflict_columns():
+    statement = str(
+        pgvector.encrypted_insert_statement(
+            1, conflict_columns=("id", "collection_name")
+        )
+    )
+
+    assert "ON CONFLICT (id, collection_name) DO NOTHING" in statement
+
+
+def test_async_url_uses_asyncpg():
+    url = pgvector.async_db_url("postgresql://u:p@db:5432/app?sslmode=require")
+
+    assert url.drivername == "postgresql+asyncpg"
+    assert url.query == {"ssl": "require"}
+    assert url.database == "app" and url.password == "p"
+
+
+def test_async_reads_fall_back_to_sync(monkeypatch):
+    class FailingEngine:
+        def connect(self):
+            raise OSError("connection refused")
+
+    monkeypatch.setattr(
+        pgvector.PgvectorClient, "async_engine", property(lambda self: FailingEngine())
+    )
+    client = pgvector.PgvectorClient.__new__(pgvector.PgvectorClient)
+    client.query = lambda collection_name, filter, limit=None: GetResult(
+        ids=[["sync"]], documents=[["doc"]], metadatas=[[filter]]
+    )
+
+    # Without asyncpg, and when the asyncpg engine fails, the sync path answers
+    for url in (None, "postgresql+asyncpg://db/app"):
+        client.async_db_url = url
+        result = asyncio.run(client.aquery("kb", {"file_id": "f"}))
+        assert result.ids == [["sync"]]
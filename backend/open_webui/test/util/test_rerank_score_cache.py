@@ -0,0 +1,43 @@
+import asyncio
+
+from langchain_core.documents import Document
+
+from open_webui.retrieval.cache import LRUCache
+from open_webui.retrieval.utils import RERANK_SCORE_CACHE, RerankCompressor
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["hits"] == 3
+
+
+def test_reranker_only_scores_cache_misses():
+    RERANK_SCORE_CACHE.clear()
+    calls = []
+
+    def reranking_function(query, documents):
+        calls.append([doc.page_content for doc in documents])
+        return [float(len(doc.page_content)) for doc in documents]
+
+    compressor = RerankCompressor(
+        embedding_function=None,
+        top_n=10,
+        reranking_function=reranking_function,
+        r_score=0.0,
+        reranking_model="test:model",
+    )
+
+    first = [Document(page_content="aa"), Document(page_content="bbb")]
+    second = [Document(page_content="bbb"), Document(page_content="c")]
+
+    assert asyncio.run(compressor.arerank("Hello  World", first)) == [2.0, 3.0]
+    assert asyncio.run(compressor.arerank("hello world", second)) == [3.0, 1.0]
+    assert calls == [["aa", "bbb"], ["c"]]
@@ -0,0 +1,158 @@
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.documents import Document
+
+from open_webui.models.files import FileForm, Files
+from open_webui.models.vector_content_hashes import VectorContentHashes
+from open_webui.retrieval.vector.main import GetResult
+from open_webui.routers import retrieval
+
+
+class Config(SimpleNamespace):
+    def __getattr__(self, name):
+        return None
+
+
+class FakeVectorDB:
+    def __init__(self):
+        self.items = {}
+        self.deleted = []
+
+    def has_collection(self, collection_name):
+        return bool(self.items)
+
+    def query(self, collection_name, filter, limit=None):
+        items = [
+            item
+            for item in self.items.values()
+            if all(item["metadata"].get(k) == v for k, v in filter.items())
+        ]
+        if not items:
+            return None
+        return GetResult(
+            ids=[[item["id"] for item in items]],
+            documents=[[item["text"] for item in items]],
+            metadatas=[[item["metadata"] for item in items]],
+        )
+
+    def insert(self, collection_name, items):
+        for item in items:
+            self.items[item["id"]] = item
+
+    def delete(self, collection_name, ids=None, filter=None):
+        self.deleted.extend(ids)
+        for id in ids:
+            del self.items[id]
+
+    def delete_collection(self, collection_name):
+        self.items.clear()
+
+
+def make_request(model="model-a"):
+    config = Config(
+        TEXT_SPLITTER="character",
+        CHUNK_SIZE=10,
+        CHUNK_OVERLAP=0,
+        RAG_EMBEDDING_ENGINE="",
+        RAG_EMBEDDING_MODEL=model,
+    )
+    return SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(config=config, ef=None))
+    )
+
+
+def setup(monkeypatch):
+    db = FakeVectorDB()
+    embedded = []
+
+    def get_embedding_function(*args, **kwargs):
+        async def embedding_function(texts, prefix=None, user=None):
+            embedded.extend(texts)
+            return [[0.0] for _ in texts]
+
+        return embedding_function
+
+    monkeypatch.setattr(retrieval, "VECTOR_DB_CLIENT", db)
+    monkeypatch.setattr(retrieval, "get_embedding_function", get_embedding_function)
+    return db, embedded
+
+
+def index(request, content, metadata):
+    docs = [Document(page_content=content, metadata={"file_id": "f"})]
+    result = retrieval.update_docs_in_vector_db(
+        request, docs, "file-f", metadata=metadata
+    )
+    if result is None:
+        retrieval.save_docs_to_vector_db(request, docs, "file-f", metadata=metadata)
+
+
+def texts(db):
+    return sorted(item["text"] for item in db.items.values())
+
+
+def test_only_changed_chunks_are_embedded(monkeypatch):
+    db, embedded = setup(monkeypatch)
+    request = make_request()
+
+    index(request, "aaaa bbbb cccc dddd", {"file_id": "f", "hash": "1"})
+    assert texts(db) == ["aaaa bbbb", "cccc dddd"]
+    kept_id = next(id for id, item in db.items.items() if item["text"] == "aaaa bbbb")
+
+    embedded.clear()
+    index(request, "aaaa bbbb eeee ffff", {"file_id": "f", "hash": "2"})
+
+    assert embedded == ["eeee ffff"]
+    assert texts(db) == ["aaaa bbbb", "eeee ffff"]
+    assert kept_id in db.items
+    assert len(db.deleted) == 1
+
+
+def test_chunks_from_another_embedding_model_are_reembedded(monkeypatch):
+    db, embedded = setup(monkeypatch)
+
+    index(make_request("model-a"), "aaaa bbbb", {"file_id": "f", "hash": "1"})
+    embedded.clear()
+    index(make_request("model-b"), "aaaa bbbb", {"file_id": "f", "hash": "1"})
+
+    assert embedded == ["aaaa bbbb"]
+    assert [
+        item["metadata"]["embedding_config"]["model"] for item in db.items.values()
+    ] == ["model-b"]
+
+
+def test_duplicate_content_from_another_file_is_rejected(monkeypatch):
+    db, embedded = setup(monkeypatch)
+    request = make_request()
+    VectorContentHashes.delete_by_collection_name("file-f")
+
+    try:
+        index(request, "aaaa bbbb", {"file_id": "f", "hash": "1"})
+        # Re-indexing the same file with unchanged content is not a duplicate
+        index(request, "aaaa bbbb", {"file_id": "f", "hash": "1"})
+
+        VectorContentHashes.upsert_hash("file-f", "g", "2")
+        with pytest.raises(ValueError):
+            index(request, "cccc dddd", {"file_id": "f", "hash": "2"})
+    finally:
+        VectorContentHashes.delete_by_collection_name("file-f")
+
+
+def test_content_update_is_saved_when_the_file_has_no_chunks(monkeypatch):
+    db, embedded = setup(monkeypatch)
+    # The file's collection exists, but holds nothing of the file itself
+    db.insert("file-f", [{"id": "x", "text": "stale", "metadata": {"file_id": "g"}}])
+    Files.insert_new_file("u", FileForm(id="f", filename="f.txt", path=""))
+
+    try:
+        result = retrieval.process_file(
+            make_request(),
+            retrieval.ProcessFileForm(file_id="f", content="aaaa bbbb"),
+            user=SimpleNamespace(id="u", role="admin"),
+        )
+    finally:
+        Files.delete_file_by_id("f")
+        VectorContentHashes.delete_by_collection_name("file-f")
+
+    assert result["status"] is True
+    assert texts(db) == ["aaaa bbbb"]
@@ -0,0 +1,45 @@
+import asyncio
+import threading
+
+from open_webui.retrieval.vector.main import GetResult, SearchResult, VectorDBBase
+
+
+class SyncOnlyVectorDB(VectorDBBase):
+    def __init__(self):
+        self.threads = set()
+
+    def search(self, collection_name, vectors, filter=None, limit=10):
+        self.threads.add(threading.current_thread().name)
+        return SearchResult(
+            ids=[[collection_name]],
+            documents=[["doc"]],
+            metadatas=[[{}]],
+            distances=[[float(limit)]],
+        )
+
+    def query(self, collection_name, filter, limit=None):
+        return GetResult(ids=[[filter["hash"]]], documents=[["doc"]], metadatas=[[{}]])
+
+    def get(self, collection_name):
+        self.threads.add(threading.current_thread().name)
+        return GetResult(ids=[[collection_name]], documents=[["doc"]], metadatas=[[{}]])
+
+    has_collection = delete_collection = insert = upsert = delete = reset = None
+
+
+def test_async_methods_fall_back_to_shared_executor():
+    db = SyncOnlyVectorDB()
+
+    async def main():
+        return await asyncio.gather(
+            db.asearch("a", [[0.1]], limit=3),
+            db.aquery("b", {"hash": "h"}),
+            db.aget("c"),
+        )
+
+    search_result, query_result, get_result = asyncio.run(main())
+
+    assert search_result.ids == [["a"]] and search_result.distances == [[3.0]]
+    assert query_result.ids == [["h"]]
+    assert get_result.ids == [["c"]]
+    assert all(name.startswith("vector-db") for name in db.threads)
@@ -0,0 +1,109 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from open_webui.retrieval.vector import batching
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Rate limits the first request of every batch, then accepts it."""
+
+    def do_POST(self):
+        server = self.server
+        batch = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            first = batch[0] not in server.seen
+            server.seen.add(batch[0])
+        time.sleep(0.02)
+        with server.lock:
+            server.active -= 1
+            if not first:
+                server.received.extend(batch)
+        self.send_response(429 if first else 200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.lock = threading.Lock()
+    server.active = server.max_active = 0
+    server.seen, server.received = set(), []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_submit_batches_retries_with_bounded_concurrency(stub_server, monkeypatch):
+    monkeypatch.setattr(batching, "VECTOR_DB_BATCH_CONCURRENCY", 3)
+    monkeypatch.setattr(batching, "backoff_delay", lambda attempt: 0)
+    url = f"http://127.0.0.1:{stub_server.server_port}/vectors/upsert"
+
+    batching.submit_batches(
+        "stub.upsert",
+        lambda batch: requests.post(url, json=batch).raise_for_status(),
+        list(range(100)),
+        10,
+    )
+
+    assert sorted(stub_server.received) == list(range(100))
+    assert 1 < stub_server.max_active <= 3
+
+
+def test_submit_batches_raises_non_retryable_errors(monkeypatch):
+    monkeypatch.setattr(batching, "backoff_delay", lambda attempt: 0)
+    calls = []
+
+    def operation(batch):
+        calls.append(batch)
+        raise ValueError("invalid vector dimension")
+
+    with pytest.raises(ValueError):
+        batching.submit_batches("stub.upsert", operation, [1], 10)
+    assert calls == [[1]]
+
+
+def test_retryable_errors_are_decided_by_status_and_type():
+    class ApiException(Exception):
+        def __init__(self, status, message=""):
+            super().__init__(message)
+            self.status = status
+
+    class ClientError(Exception):
+        def __init__(self, code, status):
+            self.response = {
+                "Error": {"Code": code},
+                "ResponseMetadata": {"HTTPStatusCode": status},
+            }
+
+    retryable = [
+        ApiException(429),
+        ApiException(503, "invalid request"),
+        ClientError("ThrottlingException", 400),
+        ClientError("InternalError", 500),
+        requests.ConnectionError("refused"),
+        requests.ReadTimeout("read timed out"),
+        TimeoutError(),
+        Exception("Rate limit exceeded"),
+    ]
+    permanent = [
+        ApiException(400, "Internal error 500: expected dimension 1500"),
+        ClientError("ValidationException", 400),
+        ValueError("expected dimension 1500"),
+        ValueError("invalid connection string"),
+        KeyError("doc-500"),
+    ]
+
+    assert all(batching.is_retryable_error(e) for e in retryable)
+    assert not any(batching.is_retryable_error(e) for e in permanent)
@@ -0,0 +1,106 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from open_webui.retrieval.utils import truncate_embeddings
+from open_webui.retrieval.vector import reencode
+from open_webui.retrieval.vector.dbs import pgvector
+
+
+def test_truncate_embeddings_renormalizes():
+    [embedding] = truncate_embeddings([[3.0, 4.0, 12.0]], 2)
+    assert embedding == [0.6, 0.8]
+
+    # A single embedding is truncated the same way
+    assert truncate_embeddings([3.0, 4.0, 12.0], 2) == [0.6, 0.8]
+    assert truncate_embeddings([[1.0, 2.0]], 0) == [[1.0, 2.0]]
+
+
+def search_sql(quantization: str) -> str:
+    client = object.__new__(pgvector.PgvectorClient)
+    client.index_quantization = quantization
+    statement = client._search_statement("kb", [[0.1, 0.2]], None, 5)
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_quantized_search_rescores_oversampled_candidates():
+    sql = search_sql("bit")
+
+    assert "binary_quantize(document_chunk.vector)" in sql
+    assert "<~>" in sql
+    assert "ORDER BY candidates.distance" in sql
+    # The inner candidate query is correlated with the outer query vectors
+    assert sql.count("FROM (VALUES") == 1
+
+
+def test_unquantized_search_orders_by_full_distance():
+    sql = search_sql("")
+
+    assert "candidates" not in sql
+    assert "ORDER BY document_chunk.vector <=> query_vectors.q_vector" in sql
+
+
+def test_index_quantization_is_read_from_index_definition():
+    extract = pgvector.PgvectorClient._extract_index_quantization
+    assert (
+        extract(
+            "CREATE INDEX idx ON public.document_chunk USING hnsw "
+            "(((binary_quantize(vector))::bit(1536)) bit_hamming_ops)"
+        )
+        == "bit"
+    )
+    assert (
+        extract(
+            "CREATE INDEX idx ON public.document_chunk USING hnsw "
+            "(((vector)::halfvec(1536)) halfvec_cosine_ops)"
+        )
+        == "halfvec"
+    )
+    assert extract(None) == ""
+
+
+class FakeVectorDB:
+    def __init__(self, collections):
+        self.collections = collections
+        self.fail_upsert = None
+
+    def has_collection(self, collection_name):
+        return collection_name in self.collections
+
+    def query_vectors(self, collection_name, filter):
+        return [dict(item) for item in self.collections.get(collection_name, [])]
+
+    def delete_collection(self, collection_name):
+        self.collections.pop(collection_name, None)
+
+    def upsert(self, collection_name, items):
+        if collection_name == self.fail_upsert:
+            raise ConnectionError("vector db down")
+        self.collections.setdefault(collection_name, []).extend(items)
+
+
+def test_failed_reencode_keeps_the_truncated_copy(monkeypatch):
+    item = {"id": "1", "text": "a", "vector": [3.0, 4.0, 12.0], "metadata": {}}
+    db = FakeVectorDB({"kb": [item]})
+    monkeypatch.setattr(reencode, "VECTOR_DB_CLIENT", db)
+
+    db.fail_upsert = "kb"
+    with pytest.raises(ConnectionError):
+        reencode.truncate_collection("kb", 2)
+    assert "kb" not in db.collections
+
+    # The next run restores the collection from the copy, then truncates it
+    db.fail_upsert = None
+    monkeypatch.setattr(reencode, "get_collection_names", lambda: ["kb"])
+    reencode.reencode_vectors(dimensions=2)
+    assert db.collections == {"kb": [{**item, "vector": [0.6, 0.8]}]}
+
+
+def test_partial_staging_copy_is_discarded(monkeypatch):
+    items = [
+        {"id": str(i), "text": "a", "vector": [1.0], "metadata": {}} for i in range(2)
+    ]
+    db = FakeVectorDB({"kb": items, "kb-reencode": items[:1]})
+    monkeypatch.setattr(reencode, "VECTOR_DB_CLIENT", db)
+
+    reencode.restore_collection("kb")
+    assert db.collections == {"kb": items}
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from bs4 import BeautifulSoup
+
+from open_webui.retrieval.web import utils
+from open_webui.retrieval.web.html_text import HTMLTextExtractor
+from open_webui.retrieval.web.page_cache import PageCache
+from open_webui.retrieval.web.utils import (
+    SafePlaywrightURLLoader,
+    SafeWebBaseLoader,
+    extract_metadata,
+)
+
+PAGE = (
+    "<!DOCTYPE html><html lang='de'><head><title>T &amp; C</title>"
+    "<meta name='description' content='Terms'><style>p {}</style>"
+    "<script>var a = '<b>';</script></head><body><p>Grüße&nbsp;<b>aus</b></p>"
+    "<!-- note -->\n\n<div>  Berlin  </div>&nbsp;   <i>a</i>\u2003<i>b</i>\t"
+    "<pre>  x  </pre></body></html>"
+)
+
+
+def test_streamed_text_matches_beautifulsoup():
+    soup = BeautifulSoup(PAGE, "html.parser")
+    body = PAGE.encode("utf-8")
+    for chunk_size in (1, 5, len(body)):
+        extractor = HTMLTextExtractor()
+        for i in range(0, len(body), chunk_size):
+            extractor.feed_bytes(body[i : i + chunk_size])
+        extractor.close()
+
+        assert extractor.get_text() == soup.get_text()
+        assert extractor.get_text(" ", strip=True) == soup.get_text(" ", strip=True)
+        assert extractor.get_metadata("u") == extract_metadata(soup, "u")
+
+    extractor = HTMLTextExtractor(max_bytes=10)
+    assert extractor.feed_bytes(b"<p>123")
+    assert not extractor.feed_bytes(b"456789")
+    extractor.close()
+    assert extractor.truncated and extractor.get_text() == "1234567"
+
+
+def test_pages_are_limited_per_host_and_by_deadline(monkeypatch):
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(3 if self.path == "/slow" else 0.2)
+            with lock:
+                active[0] -= 1
+
+            body = b"<p>" + (b"x" * 100_000 if self.path == "/big" else b"ok")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    monkeypatch.setattr(utils, "PAGE_CACHE", PageCache("unused", ttl=0, max_size=0))
+
+    loader = SafeWebBaseLoader(
+        web_paths=[f"{base}/{i}" for i in range(4)] + [f"{base}/big", f"{base}/slow"],
+        requests_per_second=10,
+        continue_on_failure=True,
+        requests_per_host=3,
+        max_page_size=1000,
+        url_deadline=1.5,
+    )
+    try:
+        start = time.perf_counter()
+        documents = asyncio.run(loader.aload())
+        elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    # The slow page is dropped at the deadline, the big one truncated
+    assert elapsed < 2.5
+    assert [doc.metadata["source"] for doc in documents] == loader.web_paths[:5]
+    assert len(documents[4].page_content) == 1000 - len("<p>")
+    assert peak[0] == 3
+
+
+def test_not_modified_without_a_cached_page_is_a_failed_fetch(monkeypatch):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(304)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/"
+    monkeypatch.setattr(utils, "PAGE_CACHE", PageCache("unused", ttl=0, max_size=0))
+
+    try:
+        loader = SafeWebBaseLoader(web_paths=[url], continue_on_failure=True)
+        [document] = asyncio.run(loader.aload())
+        assert document.page_content == ""
+
+        loader = SafeWebBaseLoader(web_paths=[url], continue_on_failure=False)
+        with pytest.raises(ValueError, match="not cached"):
+            asyncio.run(loader.aload())
+        assert list(loader.lazy_load()) == []
+    finally:
+        server.shutdown()
+
+
+def test_playwright_loads_respect_the_rate_limit(monkeypatch):
+    starts = []
+
+    class FakePage:
+        async def goto(self, url, timeout=None):
+            starts.append(time.perf_counter())
+            return object()
+
+        async def close(self):
+            pass
+
+    class FakeContext:
+        browser = None
+
+        async def new_page(self):
+            return FakePage()
+
+    class FakePool:
+        @asynccontextmanager
+        async def context(self):
+            yield FakeContext()
+
+    class FakeEvaluator:
+        async def evaluate_async(self, page, browser, response):
+            return "text"
+
+    monkeypatch.setattr(utils, "get_browser_context_pool", lambda *args: FakePool())
+    # Playwright itself is not needed with a fake browser pool
+    loader = SafePlaywrightURLLoader.__new__(SafePlaywrightURLLoader)
+    loader.__dict__.update(
+        urls=[f"https://example.com/{i}" for i in range(5)],
+        verify_ssl=False,
+        requests_per_second=20,
+        last_request_time=None,
+        continue_on_failure=False,
+        headless=True,
+        proxy=None,
+        playwright_ws_url=None,
+        playwright_timeout=1000,
+        evaluator=FakeEvaluator(),
+    )
+
+    documents = asyncio.run(loader.aload())
+
+    assert len(documents) == 5
+    # Loads run concurrently, but start at most 20 per second
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert min(gaps) >= 0.045
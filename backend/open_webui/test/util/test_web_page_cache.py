@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from open_webui.retrieval.web import utils
+from open_webui.retrieval.web.page_cache import PageCache, get_conditional_headers
+from open_webui.retrieval.web.utils import SafeWebBaseLoader
+
+PAGE = b"<html lang='en'><title>Notice</title><body>Tariff notice</body></html>"
+
+
+def test_pages_are_keyed_by_canonical_url_and_evicted_lru(tmp_path):
+    cache = PageCache(tmp_path / "pages.db", ttl=60, max_size=250)
+    cache.set("https://example.com/a?utm_source=x", "a" * 100, {}, etag='"v1"')
+
+    page = cache.get("https://EXAMPLE.com/a")
+    assert page.text == "a" * 100
+    assert cache.is_fresh(page)
+    assert get_conditional_headers(page) == {"If-None-Match": '"v1"'}
+
+    cache.set("https://example.com/b", "b" * 100, {})
+    cache.get("https://example.com/a")
+    # Over the size limit, the least recently used page goes first
+    cache.set("https://example.com/c", "c" * 100, {})
+    assert cache.get("https://example.com/b") is None
+    assert cache.get("https://example.com/a") is not None
+    assert cache.get("https://example.com/c") is not None
+
+
+def test_stale_pages_are_revalidated_with_conditional_requests(tmp_path, monkeypatch):
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.headers.get("If-None-Match"))
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            self.wfile.write(PAGE)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/notice"
+
+    cache = PageCache(tmp_path / "pages.db", ttl=60, max_size=1 << 20)
+    monkeypatch.setattr(utils, "PAGE_CACHE", cache)
+
+    async def load():
+        return [doc async for doc in SafeWebBaseLoader(web_path=[url]).alazy_load()]
+
+    try:
+        first = asyncio.run(load())
+        # Fresh pages are served without a request
+        assert asyncio.run(load()) == first
+        assert list(SafeWebBaseLoader(web_path=[url]).lazy_load()) == first
+        assert requests == [None]
+
+        # Stale pages are revalidated, and kept when unchanged
+        cache.ttl = 0.001
+        assert asyncio.run(load()) == first
+        time.sleep(0.01)
+        assert list(SafeWebBaseLoader(web_path=[url]).lazy_load()) == first
+        assert requests == [None, '"v1"', '"v1"']
+    finally:
+        server.shutdown()
+
+    assert "Tariff notice" in first[0].page_content
+    assert first[0].metadata == {"source": url, "title": "Notice", "language": "en"}
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+
+from open_webui.retrieval.web.cache import SearchResultCache
+from open_webui.retrieval.web.main import SearchResult
+
+
+def make_search(calls, results=None):
+    def search():
+        calls.append(1)
+        if results is not None:
+            return results
+        return [SearchResult(link="https://example.com", title="t", snippet="s")]
+
+    return search
+
+
+def test_identical_searches_are_served_from_cache():
+    cache = SearchResultCache(ttl=60, engine_ttls={"brave": 0})
+    calls = []
+
+    first = cache.search("searxng", "Tariff  News", 3, ["a.com"], make_search(calls))
+    second = cache.search("searxng", "tariff news", 3, ["a.com"], make_search(calls))
+    assert len(calls) == 1
+    assert second == first
+
+    # Another result count, domain filter or engine is another search
+    cache.search("searxng", "tariff news", 5, ["a.com"], make_search(calls))
+    cache.search("searxng", "tariff news", 3, None, make_search(calls))
+    cache.search("tavily", "tariff news", 3, ["a.com"], make_search(calls))
+    assert len(calls) == 4
+
+    # Bypassed and disabled engines always search
+    cache.search("searxng", "tariff news", 3, ["a.com"], make_search(calls), True)
+    cache.search("brave", "tariff news", 3, None, make_search(calls))
+    cache.search("brave", "tariff news", 3, None, make_search(calls))
+    assert len(calls) == 7
+
+
+def test_empty_results_are_not_cached():
+    cache = SearchResultCache(ttl=60)
+    calls = []
+
+    cache.search("searxng", "nothing", 3, None, make_search(calls, []))
+    cache.search("searxng", "nothing", 3, None, make_search(calls, []))
+    assert len(calls) == 2
+
+
+def test_engine_settings_are_part_of_the_key():
+    cache = SearchResultCache(ttl=60)
+    calls, threads = [], []
+
+    get = cache.get
+
+    def blocking_get(key):
+        threads.append(threading.current_thread())
+        return get(key)
+
+    cache.get = blocking_get
+
+    async def search():
+        return make_search(calls)()
+
+    def run(settings):
+        return asyncio.run(
+            cache.asearch("jina", "q", 3, None, search, settings=settings)
+        )
+
+    run({"JINA_ENHANCED_SEARCH_ENABLED": False})
+    run({"JINA_ENHANCED_SEARCH_ENABLED": False})
+    assert len(calls) == 1
+
+    # Changing a setting of the engine is another search
+    run({"JINA_ENHANCED_SEARCH_ENABLED": True})
+    assert len(calls) == 2
+
+    # Cache reads, which may go to Redis, stay off the event loop
+    assert threading.main_thread() not in threads
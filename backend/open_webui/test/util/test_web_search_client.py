@@ -0,0 +1,78 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from open_webui.retrieval.web import searxng
+from open_webui.retrieval.web.client import SearchClient, encode_params
+
+
+def test_params_are_encoded_like_requests():
+    assert encode_params(None) is None
+    assert encode_params({"q": "a b", "n": 3, "skip": None, "f": ["x", "y"]}) == [
+        ("q", "a b"),
+        ("n", "3"),
+        ("f", "x"),
+        ("f", "y"),
+    ]
+
+
+def test_async_and_blocking_searches_share_the_client(monkeypatch):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if "fail" in self.path:
+                self.send_response(503)
+                self.end_headers()
+                return
+
+            body = json.dumps(
+                {
+                    "results": [
+                        {"url": f"https://a.com/{self.path}", "title": "A"},
+                        {"url": "https://b.com/", "content": "B"},
+                    ]
+                }
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    client = SearchClient(pool_size=4, timeout=5)
+    monkeypatch.setattr(searxng, "SEARCH_CLIENT", client)
+
+    async def run():
+        try:
+            return await asyncio.gather(
+                *[
+                    searxng.asearch_searxng(base, f"q{i}", 5, ["a.com"])
+                    for i in range(3)
+                ]
+            )
+        finally:
+            await client.close()
+
+    try:
+        searches = asyncio.run(run())
+        assert [len(results) for results in searches] == [1, 1, 1]
+        assert "q=q1" in searches[1][0].link
+
+        # Sync callers get the same results from the client's own loop
+        results = searxng.search_searxng(base, "q", 5)
+        assert [result.link for result in results][1] == "https://b.com/"
+
+        with pytest.raises(requests.HTTPError) as error:
+            searxng.search_searxng(f"{base}/fail", "q", 5)
+        assert error.value.response.status_code == 503
+    finally:
+        client.run(client.close())
+        server.shutdown()
@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+
+from open_webui.retrieval.web.federated import fuse_results, search_federated
+from open_webui.retrieval.web.main import SearchResult
+
+
+def result(link, score=0.5, snippet=None):
+    return SearchResult(
+        link=link, title=None, snippet=snippet, source_quality_score=score
+    )
+
+
+def test_results_found_by_several_engines_rank_first():
+    fused = fuse_results(
+        "tariff",
+        [
+            [result("https://a.com/"), result("https://b.com/?utm_source=x")],
+            [result("https://b.com/", snippet="B"), result("https://c.com/")],
+        ],
+        count=3,
+    )
+    assert [r.link for r in fused] == [
+        "https://b.com/?utm_source=x",
+        "https://a.com/",
+        "https://c.com/",
+    ]
+    # Merged results keep what either engine returned
+    assert fused[0].snippet == "B"
+
+    # Source quality can outweigh the engines' ranking
+    fused = fuse_results(
+        "tariff", [[result("https://a.com/", 0.1), result("https://b.com/", 0.9)]], 1
+    )
+    assert fused[0].link == "https://b.com/"
+
+
+def test_search_returns_at_quorum_and_deadline():
+    searched = []
+
+    async def search(engine):
+        searched.append(engine)
+        if engine == "broken":
+            raise ValueError("engine down")
+        await asyncio.sleep({"fast": 0.01, "slow": 0.05, "stuck": 10}[engine])
+        return [result(f"https://{engine}.com/")]
+
+    def run(engines, **kwargs):
+        start = time.perf_counter()
+        results = asyncio.run(search_federated(engines, "q", 5, search, **kwargs))
+        return [r.link for r in results], time.perf_counter() - start
+
+    links, elapsed = run(["fast", "broken", "slow", "stuck"], deadline=5, quorum=2)
+    assert links == ["https://fast.com/", "https://slow.com/"]
+    assert elapsed < 1
+    assert searched == ["fast", "broken", "slow", "stuck"]
+
+    # At the deadline the answers so far are used
+    links, elapsed = run(["stuck", "fast"], deadline=0.2, quorum=2)
+    assert links == ["https://fast.com/"] and elapsed < 1
+
+    with pytest.raises(ValueError):
+        run(["broken"], deadline=1, quorum=1)
@@ -1,11 +1,14 @@
+from open_webui.retrieval.web.client import SEARCH_CLIENT
 from open_webui.retrieval.web.jina_search import search_jina
 from open_webui.retrieval.web.quality import (
+    analyze_document,
     build_query_pack,
     canonicalize_url,
     compute_source_quality_score,
     dedupe_candidates,
     extract_evidence_spans,
 )
+from open_webui.retrieval.web.near_duplicates import remove_near_duplicates
 
 
 def test_query_pack_generation_is_deterministic():
@@ -71,6 +74,51 @@ def test_evidence_extraction_returns_claim_with_citation_fields():
     assert "confidence" in first
 
 
+def test_analyzed_document_gives_same_results_as_raw_content():
+    content = (
+        "![logo](https://example.com/logo.png) See [the order](https://example.com). "
+        "Executive Order 14257 took effect on April 2, 2025 for all imports. "
+        "A 10% baseline tariff became effective for most imports."
+    )
+    document = analyze_document(content)
+    assert "https://" not in document.content
+    assert document.published_date == "2025-04-02"
+    assert analyze_document(document) is document
+
+    kwargs = dict(
+        query="tariff baseline effective date",
+        source_url="https://www.whitehouse.gov/example",
+        published_date=None,
+        source_quality_score=0.9,
+    )
+    assert extract_evidence_spans(content=document, **kwargs)[0]["claim_text"] == (
+        extract_evidence_spans(content=content, **kwargs)[0]["claim_text"]
+    )
+    score_kwargs = dict(
+        query="tariff baseline",
+        url="https://www.whitehouse.gov/example",
+        published_date=None,
+        strict_authority=True,
+    )
+    assert compute_source_quality_score(
+        content=document, **score_kwargs
+    ) == compute_source_quality_score(content=content, **score_kwargs)
+
+
+def test_near_duplicate_pages_are_removed():
+    words = [f"word{i}" for i in range(400)]
+    article = " ".join(words)
+    syndicated = "Home | News | Markets " + article + " Copyright 2025 Example"
+    edited = " ".join(words[:200] + ["changed"] + words[201:])
+    unrelated = " ".join(f"other{i}" for i in range(400))
+    pages = [article, unrelated, syndicated, edited, ""]
+
+    kept = remove_near_duplicates(pages, 0.85, lambda page: page)
+    assert kept == [article, unrelated, ""]
+
+    assert remove_near_duplicates(pages, 0.0, lambda page: page) == pages
+
+
 def test_enhanced_jina_search_ranks_official_domain_higher(monkeypatch):
     class _Response:
         def __init__(self, data):
@@ -82,7 +130,7 @@ def test_enhanced_jina_search_ranks_official_domain_higher(monkeypatch):
         def json(self):
             return {"data": self._data}
 
-    def fake_post(*args, **kwargs):
+    async def fake_post(*args, **kwargs):
         return _Response(
             [
                 {
@@ -98,7 +146,7 @@ def test_enhanced_jina_search_ranks_official_domain_higher(monkeypatch):
             ]
         )
 
-    monkeypatch.setattr("open_webui.retrieval.web.jina_search.requests.post", fake_post)
+    monkeypatch.setattr(SEARCH_CLIENT, "post", fake_post)
 
     results = search_jina(
         api_key="",
@@ -114,3 +162,52 @@ def test_enhanced_jina_search_ranks_official_domain_higher(monkeypatch):
     assert results[0].link.startswith("https://www.federalregister.gov/")
     assert results[0].source_quality_score is not None
     assert results[0].evidence_spans is not None
+
+
+def test_adaptive_jina_search_stops_once_results_are_good(monkeypatch):
+    class _Response:
+        def __init__(self, data):
+            self._data = data
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"data": self._data}
+
+    queries = []
+
+    async def fake_post(*args, json=None, **kwargs):
+        queries.append(json["q"])
+        idx = len(queries)
+        return _Response(
+            [
+                {
+                    "url": f"https://www.federalregister.gov/d/2025-{idx}",
+                    "title": "Executive order",
+                    "content": f"US tariff executive order {idx} changes "
+                    "effective April 2, 2025. " * 40,
+                }
+            ]
+        )
+
+    monkeypatch.setattr(SEARCH_CLIENT, "post", fake_post)
+
+    def search(threshold):
+        queries.clear()
+        return search_jina(
+            api_key="",
+            query="US tariff executive order changes",
+            count=2,
+            enhanced_mode=True,
+            adaptive_mode=True,
+            adaptive_threshold=threshold,
+        )
+
+    # Two good results after two variants, the rest are never searched
+    assert len(search(0.5)) == 2
+    assert len(queries) == 2
+
+    # No result is good enough, so every variant is searched
+    assert len(search(1.1)) == 2
+    assert len(queries) == len(build_query_pack("US tariff executive order changes"))
@@ -28,7 +28,7 @@ from open_webui.excel.generation_spec import ExcelGenerateRequest
 from open_webui.models.files import FileForm, Files
 from open_webui.models.users import UserModel
 from open_webui.routers.excel import generate_excel_file
-from open_webui.routers.retrieval import search_web as _search_web
+from open_webui.routers.retrieval import asearch_web as _asearch_web
 from open_webui.retrieval.utils import get_content_from_url
 from open_webui.routers.images import (
     image_generations,
@@ -297,7 +297,7 @@ async def search_web(
         engine = __request__.app.state.config.WEB_SEARCH_ENGINE
         user = UserModel(**__user__) if __user__ else None
 
-        results = _search_web(__request__, engine, query, user)
+        results = await _asearch_web(__request__, engine, query, user)
 
         # Limit results
         results = results[:count] if results else []
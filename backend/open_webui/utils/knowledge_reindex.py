@@ -0,0 +1,301 @@
+"""
+Background, resumable reindexing of knowledge base files.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+from open_webui.config import (
+    CACHE_DIR,
+    KNOWLEDGE_REINDEX_THROTTLE_MS,
+    KNOWLEDGE_REINDEX_WORKERS,
+)
+
+log = logging.getLogger(__name__)
+
+CHECKPOINT_PATH = Path(CACHE_DIR) / "reindex" / "knowledge.json"
+
+# Checkpoints are flushed at most this often while files complete; knowledge
+# base transitions and the end of the job are always flushed.
+CHECKPOINT_INTERVAL_SECONDS = 1.0
+
+
+class KnowledgeReindexManager:
+    """
+    Reindexes every knowledge base on a worker pool in a background thread.
+
+    Progress is checkpointed per knowledge base and per file, so a job that is
+    stopped or interrupted by a restart resumes where it left off: completed
+    knowledge bases are skipped, and a partially processed one keeps its
+    collection and only processes the files that are not done yet.
+    """
+
+    def __init__(
+        self,
+        checkpoint_path: Path = CHECKPOINT_PATH,
+        workers: int = KNOWLEDGE_REINDEX_WORKERS,
+        throttle_ms: int = KNOWLEDGE_REINDEX_THROTTLE_MS,
+    ):
+        self.checkpoint_path = Path(checkpoint_path)
+        self.workers = max(1, int(workers))
+        self.throttle = max(0, int(throttle_ms)) / 1000
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_checkpoint = 0.0
+        self._remaining: dict[str, int] = {}
+        self._state: Optional[dict] = self._load_checkpoint()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _load_checkpoint(self) -> Optional[dict]:
+        try:
+            with open(self.checkpoint_path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f"Ignoring unreadable reindex checkpoint: {e}")
+            return None
+
+        if state.get("status") == "running":
+            # The process running it went away
+            state["status"] = "interrupted"
+        return state
+
+    def _save_checkpoint(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < CHECKPOINT_INTERVAL_SECONDS:
+            return
+        self._last_checkpoint = now
+
+        with self._lock:
+            self._state["updated_at"] = int(time.time())
+            data = json.dumps(self._state)
+
+        try:
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.checkpoint_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, self.checkpoint_path)
+        except Exception as e:
+            log.warning(f"Failed to write reindex checkpoint: {e}")
+
+    def start(
+        self,
+        list_knowledge_bases: Callable[[], list[str]],
+        list_files: Callable[[str], list[str]],
+        reset_collection: Callable[[str], None],
+        process_file: Callable[[str, str], None],
+        resume: bool = True,
+    ) -> bool:
+        """
+        Start (or resume) a reindex job. Returns False if one is already running.
+
+        ``process_file(knowledge_base_id, file_id)`` must be idempotent for
+        files that were indexed right before an interruption.
+        """
+        with self._lock:
+            if self.running:
+                return False
+
+            if not (
+                resume
+                and self._state
+                and self._state.get("status") in ("interrupted", "stopped", "failed")
+            ):
+                self._state = {
+                    "id": str(uuid.uuid4()),
+                    "started_at": int(time.time()),
+                    "finished_at": None,
+                    "knowledge_bases": {},
+                }
+            else:
+                log.info(f"Resuming knowledge reindex {self._state['id']}")
+
+            self._state["status"] = "running"
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(list_knowledge_bases, list_files, reset_collection, process_file),
+                name="knowledge-reindex",
+                daemon=True,
+            )
+            self._thread.start()
+        return True
+
+    def stop(self) -> bool:
+        if not self.running:
+            return False
+        self._stop.set()
+        return True
+
+    def status(self) -> dict:
+        with self._lock:
+            if not self._state:
+                return {"status": "idle"}
+
+            knowledge_bases = self._state["knowledge_bases"]
+            summary = {
+                kb_id: {
+                    "status": kb["status"],
+                    "total": kb["total"],
+                    "done": len(kb["done"]),
+                    "failed": len(kb["failed"]),
+                }
+                for kb_id, kb in knowledge_bases.items()
+            }
+            return {
+                "id": self._state["id"],
+                "status": self._state["status"],
+                "started_at": self._state["started_at"],
+                "updated_at": self._state.get("updated_at"),
+                "finished_at": self._state["finished_at"],
+                "workers": self.workers,
+                "knowledge_bases_total": len(knowledge_bases),
+                "knowledge_bases_completed": sum(
+                    1 for kb in knowledge_bases.values() if kb["status"] == "completed"
+                ),
+                "files_total": sum(kb["total"] for kb in knowledge_bases.values()),
+                "files_done": sum(len(kb["done"]) for kb in knowledge_bases.values()),
+                "files_failed": sum(
+                    len(kb["failed"]) for kb in knowledge_bases.values()
+                ),
+                "knowledge_bases": summary,
+            }
+
+    def _run(self, list_knowledge_bases, list_files, reset_collection, process_file):
+        try:
+            knowledge_base_ids = list_knowledge_bases()
+            log.info(
+                f"Starting reindexing for {len(knowledge_base_ids)} knowledge bases"
+            )
+
+            with ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="knowledge-reindex"
+            ) as executor:
+                # Bounds the number of queued files so that stopping is quick
+                slots = threading.BoundedSemaphore(self.workers * 2)
+
+                for kb_id in knowledge_base_ids:
+                    if self._stop.is_set():
+                        break
+                    self._submit_knowledge_base(
+                        executor,
+                        slots,
+                        kb_id,
+                        list_files,
+                        reset_collection,
+                        process_file,
+                    )
+
+            with self._lock:
+                self._state["status"] = (
+                    "stopped" if self._stop.is_set() else "completed"
+                )
+                if self._state["status"] == "completed":
+                    self._state["finished_at"] = int(time.time())
+            log.info(f"Reindexing {self._state['status']}.")
+        except Exception as e:
+            log.exception(f"Knowledge reindex failed: {e}")
+            with self._lock:
+                self._state["status"] = "failed"
+                self._state["error"] = str(e)
+        finally:
+            self._save_checkpoint(force=True)
+
+    def _submit_knowledge_base(
+        self, executor, slots, kb_id, list_files, reset_collection, process_file
+    ):
+        kb = self._state["knowledge_bases"].get(kb_id)
+        if kb and kb["status"] == "completed":
+            return
+
+        try:
+            file_ids = list_files(kb_id)
+            if kb is None:
+                # First time this knowledge base is visited, start from scratch
+                reset_collection(kb_id)
+        except Exception as e:
+            log.error(f"Error preparing knowledge base {kb_id}: {e}")
+            return
+
+        with self._lock:
+            if kb is None:
+                kb = {"status": "running", "total": 0, "done": [], "failed": {}}
+                self._state["knowledge_bases"][kb_id] = kb
+            kb["status"] = "running"
+            kb["total"] = len(file_ids)
+            kb["failed"] = {}
+            done = set(kb["done"])
+            pending = [file_id for file_id in file_ids if file_id not in done]
+            self._remaining[kb_id] = len(pending)
+
+        self._save_checkpoint(force=True)
+
+        if not pending:
+            self._finish_knowledge_base(kb_id, kb)
+            return
+
+        for file_id in pending:
+            slots.acquire()
+            if self._stop.is_set():
+                slots.release()
+                return
+            future = executor.submit(
+                self._process_file, process_file, kb_id, kb, file_id
+            )
+            future.add_done_callback(lambda _: slots.release())
+
+    def _process_file(self, process_file, kb_id, kb, file_id):
+        if self._stop.is_set():
+            return
+
+        error = None
+        try:
+            process_file(kb_id, file_id)
+        except Exception as e:
+            log.error(f"Error processing file {file_id} in {kb_id}: {e}")
+            error = str(e)
+
+        with self._lock:
+            if error is None:
+                kb["done"].append(file_id)
+            else:
+                kb["failed"][file_id] = error
+            self._remaining[kb_id] -= 1
+            finished = self._remaining[kb_id] == 0
+
+        if finished:
+            self._finish_knowledge_base(kb_id, kb)
+        else:
+            self._save_checkpoint()
+
+        if self.throttle:
+            # Leave room for interactive embedding and vector DB traffic
+            time.sleep(self.throttle)
+
+    def _finish_knowledge_base(self, kb_id, kb):
+        with self._lock:
+            self._remaining.pop(kb_id, None)
+            kb["status"] = "completed"
+
+        if kb["failed"]:
+            log.warning(
+                f"Failed to process {len(kb['failed'])} files in knowledge base {kb_id}"
+            )
+        self._save_checkpoint(force=True)
+
+
+knowledge_reindex_manager = KnowledgeReindexManager()